@@ -294,6 +294,11 @@ NEWS_API_KEY = os.environ.get("NEWS_API_KEY", "")
 
 # --- Google Maps ---
 GOOGLE_MAPS_API_KEY = os.environ.get("GOOGLE_MAPS_API_KEY", "")
+# Persistent response cache; set to an empty string to disable.
+GOOGLE_MAPS_CACHE_PATH = os.environ.get(
+    "GOOGLE_MAPS_CACHE_PATH",
+    str(Path.home() / ".goliath" / "cache" / "google_maps.sqlite3"),
+)
 
 # --- Yelp ---
 YELP_API_KEY = os.environ.get("YELP_API_KEY", "")
@@ -0,0 +1,167 @@
+"""
+Response caching for GOLIATH integrations.
+
+Private module — integrations import from here, callers should not.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from goliath.integrations import _http
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries go stale ``ttl`` seconds after set.
+
+    Stale entries are kept (until evicted by size) so callers can still
+    revalidate them, e.g. by sending their ETag in ``If-None-Match``.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value if present and fresh, else ``default``."""
+        entry = self.get_entry(key)
+        if entry is None or not entry[1]:
+            return default
+        return entry[0]
+
+    def get_entry(self, key) -> tuple | None:
+        """Return ``(value, is_fresh)`` for a cached key, stale or not."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._data.move_to_end(key)
+            value, expires = entry
+            return value, time.monotonic() < expires
+
+    def set(self, key, value) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Remove a key and return its value (fresh or stale)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def pop_matching(self, predicate) -> None:
+        """Remove every key for which ``predicate(key)`` is true."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """Persistent JSON cache backed by a single SQLite file.
+
+    Entries survive restarts and go stale ``ttl`` seconds after set
+    (wall-clock, since they outlive the process). Like :class:`TTLCache`,
+    stale entries stay readable through :meth:`get_entry` for
+    revalidation; rows stale for longer than another ``ttl`` are purged
+    when the cache is opened. ``path`` may be ``":memory:"``.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.ttl = ttl
+        if path != ":memory:":
+            path = str(Path(path).expanduser())
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "DELETE FROM cache WHERE expires < ?", (time.time() - ttl,)
+            )
+
+    def get(self, key: str, default=None):
+        """Return the cached value if present and fresh, else ``default``."""
+        entry = self.get_entry(key)
+        if entry is None or not entry[1]:
+            return default
+        return entry[0]
+
+    def get_entry(self, key: str) -> tuple | None:
+        """Return ``(value, is_fresh)`` for a cached key, stale or not."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return _http.loads(row[0]), time.time() < row[1]
+
+    def set(self, key: str, value) -> None:
+        """Store a JSON-serialisable value."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, _http.dumps(value), time.time() + self.ttl),
+            )
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+
+class SingleFlight:
+    """Coalesce concurrent identical coroutine calls into one.
+
+    While a call for ``key`` is in flight, later callers with the same key
+    await its result instead of starting their own, so a burst of N
+    identical reads costs one request. Every waiter receives the same
+    object, which should be treated as read-only. Event-loop only; not
+    thread-safe.
+    """
+
+    def __init__(self):
+        self._inflight: dict = {}
+
+    async def run(self, key, factory):
+        """Return ``await factory()``, sharing it with concurrent same-key calls."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled does not cancel the others.
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._inflight)
@@ -0,0 +1,155 @@
+"""
+Shared HTTP helpers for GOLIATH integrations.
+
+Private module — integrations import from here, callers should not.
+
+JSON encode/decode goes through orjson when it is installed
+(``pip install goliath-ai[speedups]``) and falls back to the stdlib
+``json`` module otherwise, so behaviour is identical either way. The
+same extra installs h2, which lets the httpx-based clients negotiate
+HTTP/2, and brotli, which lets both requests and httpx accept ``br``
+compressed responses.
+"""
+
+import importlib.util
+import json
+import random
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING as _URLLIB3_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# httpx only negotiates HTTP/2 when the optional h2 package is installed.
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Only advertise encodings urllib3 can decode: "br" is included when
+# brotli/brotlicffi is importable, never otherwise.
+ACCEPT_ENCODING = ", ".join(_URLLIB3_ACCEPT_ENCODING.split(","))
+
+# Transient statuses worth retrying at the transport level. urllib3 only
+# retries idempotent methods by default, so POST/PATCH are never replayed.
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def loads(data: bytes | str):
+    """Decode a JSON document from ``bytes`` or ``str``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def backoff_delay(
+    attempt: int, base: float, retry_after: str | None = None, factor: float = 2.0
+) -> float:
+    """Seconds to wait before retry number ``attempt`` (0-based).
+
+    A numeric ``Retry-After`` header value wins. Otherwise the delay is
+    ``base * factor**attempt`` with equal jitter (half fixed, half random),
+    so clients throttled together do not all retry in the same instant.
+    """
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form; fall back to computed backoff
+    delay = base * factor**attempt
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def encode_json_kwarg(kwargs: dict) -> dict:
+    """Swap a ``json=`` request kwarg for pre-encoded ``data=`` bytes.
+
+    requests and httpx serialize ``json=`` with the stdlib encoder; doing
+    it here lets orjson take over. The JSON Content-Type header is added
+    unless the caller already set one.
+    """
+    if "json" in kwargs:
+        kwargs["data"] = dumps(kwargs.pop("json"))
+        kwargs["headers"] = {
+            "Content-Type": "application/json",
+            **(kwargs.get("headers") or {}),
+        }
+    return kwargs
+
+
+def mount_pooled_adapter(
+    session,
+    pool_connections: int = 32,
+    pool_maxsize: int = 64,
+    prefix: str = "https://",
+    retry_statuses: tuple[int, ...] = _RETRY_STATUSES,
+) -> None:
+    """Mount a larger keep-alive pool with retry/backoff on ``session``.
+
+    The requests default of 10 pooled connections per host is too small
+    for threaded bulk workloads, which then pay a fresh TCP+TLS handshake
+    per request. Retries honour ``Retry-After`` on 429, and the final
+    response is returned as-is so ``raise_for_status`` still applies.
+    A client that retries some statuses itself can mount an adapter for
+    its own host ``prefix`` with those left out of ``retry_statuses``.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=retry_statuses,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session.mount(prefix, adapter)
+
+
+_shared_session: requests.Session | None = None
+_shared_session_lock = threading.Lock()
+
+
+def shared_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use.
+
+    Clients share it so keep-alive connections (and their TLS handshakes)
+    are reused across instances. Credentials therefore belong on each
+    request, never on ``session.headers``.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+            mount_pooled_adapter(session, pool_maxsize=128)
+            _shared_session = session
+        return _shared_session
+
+
+class SharedSessionClient:
+    """Context-manager support for clients built on :func:`shared_session`.
+
+    Closing a client never closes the shared session, which other clients
+    are still using. Subclasses override :meth:`close` to release what
+    they own themselves, such as an on-disk cache.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release this client's own resources."""
@@ -0,0 +1,28 @@
+"""
+Auto-pagination helpers for GOLIATH integrations.
+
+Private module — integrations import from here, callers should not.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+
+def prefetch_pages(
+    fetch: Callable[[Any], tuple[Iterable, Any]], cursor: Any
+) -> Iterator:
+    """Yield every item across pages, fetching page N+1 while N is consumed.
+
+    ``fetch(cursor)`` returns ``(items, next_cursor)``; a ``next_cursor``
+    of None ends the iteration. The next page is requested on a worker
+    thread before the current page's items are yielded, so the round trip
+    overlaps with whatever the caller does per item. Errors raised by
+    ``fetch`` surface from the iterator when their page is reached.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(fetch, cursor)
+        while future is not None:
+            items, cursor = future.result()
+            future = pool.submit(fetch, cursor) if cursor is not None else None
+            yield from items
@@ -0,0 +1,134 @@
+"""
+Client-side rate limiting for GOLIATH integrations.
+
+Private module — integrations import from here, callers should not.
+
+A TokenBucket (or AdaptiveConcurrency) is usually attached as a class
+attribute so that every instance of a client (and every thread using it)
+draws from the same per-API budget.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` calls per ``per`` seconds.
+
+    The bucket starts full, so up to ``rate`` calls may burst before
+    ``acquire`` begins to block.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it.
+
+        The lock is released while sleeping, so other threads,
+        :meth:`observe` and :meth:`acquire_async` are never held up by a
+        waiting caller; the token is re-checked after each sleep.
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.per / self.rate
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Reserve a token and ``asyncio.sleep`` until it has refilled.
+
+        The token is taken immediately (the count may go negative), so
+        concurrent coroutines queue up behind each other in call order
+        instead of all waking at once, and the event loop is never
+        blocked. The lock is only held for the bookkeeping, which keeps
+        the bucket safe to share with threads calling :meth:`acquire`.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            wait = -self._tokens * self.per / self.rate
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def observe(self, remaining: float, reset_after: float | None = None) -> None:
+        """Align the bucket with a server-reported remaining budget.
+
+        Rate-limit headers account for every client sharing the quota,
+        including other processes, so the local token count is capped at
+        ``remaining``. With nothing left and a known ``reset_after`` (in
+        seconds), the next ``acquire`` waits until the server's window
+        resets rather than until the next local refill.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, float(remaining))
+            if remaining < 1 and reset_after is not None and reset_after > 0:
+                self._tokens = min(self._tokens, 1 - reset_after * self.rate / self.per)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self.rate, self._tokens + elapsed * self.rate / self.per)
+        self._updated = now
+
+
+class AdaptiveConcurrency:
+    """Thread-safe AIMD limit on how many calls may be in flight at once.
+
+    Each successful call widens the window by ``1/limit`` (roughly one
+    slot per window's worth of calls) as long as its latency stays within
+    ``latency_tolerance`` times the fastest call seen; slower calls hold
+    the window, an early congestion signal in the style of TCP Vegas. An
+    overload signal such as HTTP 429 halves it.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_tolerance: float = 2.0,
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self._in_flight = 0
+        self._min_latency: float | None = None
+        self._cond = threading.Condition()
+
+    def acquire(self) -> float:
+        """Block until a slot is free, take it, and return the start time."""
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+        return time.monotonic()
+
+    def backoff(self) -> None:
+        """Halve the limit on an overload signal seen outside release()."""
+        with self._cond:
+            self.limit = max(float(self.min_limit), self.limit / 2)
+
+    def release(self, started: float, overloaded: bool = False) -> None:
+        """Free a slot and adjust the limit from the call's outcome."""
+        latency = time.monotonic() - started
+        with self._cond:
+            self._in_flight -= 1
+            if overloaded:
+                self.limit = max(float(self.min_limit), self.limit / 2)
+            else:
+                if self._min_latency is None or latency < self._min_latency:
+                    self._min_latency = latency
+                if latency <= self._min_latency * self.latency_tolerance:
+                    self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._cond.notify_all()
@@ -61,6 +61,7 @@ Usage:
 import requests
 
 from goliath import config
+from goliath.integrations import _http
 
 _API_BASE = "https://api.dropboxapi.com/2"
 _CONTENT_BASE = "https://content.dropboxapi.com/2"
@@ -135,6 +136,8 @@ class DropboxClient:
         Returns:
             Uploaded file metadata dict.
         """
+        # stdlib json on purpose: Dropbox-API-Arg must be ASCII-only, which
+        # json.dumps guarantees via ensure_ascii (orjson emits raw UTF-8).
         import json
 
         mode = "overwrite" if overwrite else "add"
@@ -155,7 +158,7 @@ class DropboxClient:
                 data=f,
             )
         resp.raise_for_status()
-        return resp.json()
+        return _http.loads(resp.content)
 
     def download(self, path: str) -> bytes:
         """Download a file from Dropbox.
@@ -274,4 +277,4 @@ class DropboxClient:
     def _post(self, path: str, **kwargs) -> dict:
         resp = self.session.post(f"{_API_BASE}{path}", **kwargs)
         resp.raise_for_status()
-        return resp.json()
+        return _http.loads(resp.content)
@@ -57,6 +57,8 @@ Usage:
 import requests
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._ratelimit import TokenBucket
 
 _DEFAULT_BASE = "https://api.etherscan.io/api"
 
@@ -64,6 +66,9 @@ _DEFAULT_BASE = "https://api.etherscan.io/api"
 class EtherscanClient:
     """Etherscan API client for Ethereum blockchain data."""
 
+    # Free tier allows 5 calls/second per key; shared by all instances.
+    _bucket = TokenBucket(rate=5, per=1.0)
+
     def __init__(self):
         if not config.ETHERSCAN_API_KEY:
             raise RuntimeError(
@@ -304,9 +309,10 @@ class EtherscanClient:
 
     def _get(self, **params) -> dict | list | str:
         params["apikey"] = self.api_key
+        self._bucket.acquire()
         resp = self.session.get(self.base_url, params=params)
         resp.raise_for_status()
-        body = resp.json()
+        body = _http.loads(resp.content)
         if body.get("status") == "0" and body.get("message") != "No transactions found":
             raise RuntimeError(
                 f"Etherscan API error: {body.get('message', '')} — "
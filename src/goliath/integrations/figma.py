@@ -55,6 +55,8 @@ Usage:
 import requests
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._ratelimit import TokenBucket
 
 _API_BASE = "https://api.figma.com/v1"
 
@@ -62,6 +64,9 @@ _API_BASE = "https://api.figma.com/v1"
 class FigmaClient:
     """Figma REST API client for files, components, comments, and exports."""
 
+    # 30 requests/minute per token; shared by all instances.
+    _bucket = TokenBucket(rate=30, per=60.0)
+
     def __init__(self):
         if not config.FIGMA_ACCESS_TOKEN:
             raise RuntimeError(
@@ -154,6 +159,7 @@ class FigmaClient:
             file_key:   File key.
             comment_id: Comment ID.
         """
+        self._bucket.acquire()
         resp = self.session.delete(
             f"{_API_BASE}/files/{file_key}/comments/{comment_id}"
         )
@@ -255,11 +261,13 @@ class FigmaClient:
     # -- internal helpers --------------------------------------------------
 
     def _get(self, path: str, **kwargs) -> dict:
+        self._bucket.acquire()
         resp = self.session.get(f"{_API_BASE}{path}", **kwargs)
         resp.raise_for_status()
-        return resp.json()
+        return _http.loads(resp.content)
 
     def _post(self, path: str, **kwargs) -> dict:
+        self._bucket.acquire()
         resp = self.session.post(f"{_API_BASE}{path}", **kwargs)
         resp.raise_for_status()
-        return resp.json()
+        return _http.loads(resp.content)
@@ -39,12 +39,29 @@ Usage:
     # Create/set a document
     fb.set_document("users", "user123", {"name": "Jane", "email": "jane@example.com"})
 
+    # Bulk-write documents (batched into as few commit requests as possible)
+    fb.set_documents("users", {"u1": {"name": "Ann"}, "u2": {"name": "Bob"}})
+
+    # Bulk-write as independent concurrent writes (retried on contention)
+    fb.set_documents_parallel("users", {"u1": {"name": "Ann"}}, workers=40)
+
     # Get a document
     doc = fb.get_document("users", "user123")
 
+    # Get many documents in one round trip (documents:batchGet)
+    docs = fb.get_documents("users", ["u1", "u2", "u3"])
+
+    # Copy a document without decoding/re-encoding its fields
+    src = fb.get_document("users", "user123", raw=True)
+    fb.set_document("users_backup", "user123", src["fields"], raw=True)
+
     # Query a collection
     docs = fb.list_documents("users", page_size=10)
 
+    # Walk a whole collection (next page is fetched while you iterate)
+    for doc in fb.iter_documents("users"):
+        print(doc["_id"])
+
     # Delete a document
     fb.delete_document("users", "user123")
 
@@ -66,20 +83,47 @@ Usage:
 
     # Sign in
     user = fb.auth_sign_in(email="new@example.com", password="secret123")
+
+    # -- Async (concurrent bulk reads/writes) --
+
+    from goliath.integrations.firebase import AsyncFirebaseClient
+
+    async with AsyncFirebaseClient() as afb:
+        docs = await afb.get_documents("users", ["user123", "user456"])
 """
 
+import asyncio
 import json as _json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import httpx
 import requests
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._cache import SingleFlight, TTLCache
+from goliath.integrations._pagination import prefetch_pages
 
 _FIRESTORE_BASE = "https://firestore.googleapis.com/v1"
 _AUTH_BASE = "https://identitytoolkit.googleapis.com/v1"
 
+# Firestore commit limits: 500 writes and 10 MiB per request.
+_MAX_COMMIT_WRITES = 500
+_MAX_COMMIT_BYTES = 10 * 1024 * 1024
 
-class FirebaseClient:
-    """Firebase REST API client for Firestore, Realtime Database, and Auth."""
+# Document names per documents:batchGet request, keeping responses bounded.
+_MAX_BATCH_GET = 100
+
+# Per-document write retries: contention, rate limiting, and unavailability.
+_RETRY_STATUSES = (409, 429, 503)
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.5
+
+
+class _FirebaseBase:
+    """Configuration, auth, and Firestore value codec shared by both clients."""
 
     def __init__(self):
         if not config.FIREBASE_PROJECT_ID:
@@ -92,22 +136,216 @@ class FirebaseClient:
         self.project_id = config.FIREBASE_PROJECT_ID
         self.api_key = config.FIREBASE_API_KEY
         self.database_url = config.FIREBASE_DATABASE_URL
-        self._firestore_base = (
-            f"{_FIRESTORE_BASE}/projects/{self.project_id}/databases/(default)/documents"
+        self._document_root = (
+            f"projects/{self.project_id}/databases/(default)/documents"
+        )
+        self._firestore_base = f"{_FIRESTORE_BASE}/{self._document_root}"
+        self._rtdb_template = (
+            self.database_url.rstrip("/") + "/{}.json" if self.database_url else None
         )
-
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
 
         # If a service account file is provided, get an access token
-        self._access_token: str | None = None
+        self._creds = None
+        self._token_request = None
+        self._token_lock = threading.Lock()
         if config.FIREBASE_SERVICE_ACCOUNT_FILE:
             self._load_service_account(config.FIREBASE_SERVICE_ACCOUNT_FILE)
 
+    def _load_service_account(self, path: str) -> None:
+        """Load service account credentials and get an access token via Google OAuth2."""
+        try:
+            from google.oauth2 import service_account as sa
+            from google.auth.transport.requests import Request
+
+            creds = sa.Credentials.from_service_account_file(
+                path,
+                scopes=[
+                    "https://www.googleapis.com/auth/datastore",
+                    "https://www.googleapis.com/auth/firebase",
+                ],
+            )
+            self._token_request = Request()
+            creds.refresh(self._token_request)
+            self._creds = creds
+        except ImportError:
+            raise RuntimeError(
+                "google-auth package is required for service account auth. "
+                "Install it with: pip install google-auth"
+            )
+
+    @property
+    def _access_token(self) -> str | None:
+        """OAuth access token, refreshed just before it expires.
+
+        google-auth marks credentials expired slightly ahead of the real
+        expiry, so long-lived clients never send a stale bearer token.
+        """
+        if self._creds is None:
+            return None
+        if not self._creds.valid:
+            with self._token_lock:
+                if not self._creds.valid:
+                    self._creds.refresh(self._token_request)
+        return self._creds.token
+
+    def _rtdb_url(self, path: str) -> str:
+        """Build a Realtime Database URL."""
+        if self._rtdb_template is None:
+            raise RuntimeError(
+                "FIREBASE_DATABASE_URL is not set. Required for Realtime Database access."
+            )
+        url = self._rtdb_template.format(path.strip("/"))
+        token = self._access_token
+        return f"{url}?auth={token}" if token else url
+
+    def _commit_batches(self, collection: str, documents: dict[str, dict]):
+        """Yield lists of JSON-encoded update writes that fit one commit.
+
+        Each write is serialized exactly once: the bytes used to measure
+        it against the request-size limit are the bytes later sent.
+        """
+        batch: list[bytes] = []
+        size = 0
+        for doc_id, fields in documents.items():
+            write = _http.dumps(
+                {
+                    "update": {
+                        "name": f"{self._document_root}/{collection}/{doc_id}",
+                        "fields": self._encode_fields(fields),
+                    }
+                }
+            )
+            if batch and (
+                len(batch) == _MAX_COMMIT_WRITES
+                or size + len(write) > _MAX_COMMIT_BYTES
+            ):
+                yield batch
+                batch, size = [], 0
+            batch.append(write)
+            size += len(write)
+        if batch:
+            yield batch
+
+    def _batch_get_chunks(self, collection: str, document_ids: list[str]):
+        """Yield batchGet request bodies of at most _MAX_BATCH_GET names."""
+        names = [f"{self._document_root}/{collection}/{i}" for i in document_ids]
+        for start in range(0, len(names), _MAX_BATCH_GET):
+            yield {"documents": names[start : start + _MAX_BATCH_GET]}
+
+    @staticmethod
+    def _found_documents(results: list[dict]) -> dict[str, dict]:
+        """Map document ID to decoded document for a batchGet response.
+
+        The ID comes from the document name: an empty document has no
+        ``fields`` and decodes to the raw document, without an ``_id``.
+        """
+        docs = {}
+        for item in results:
+            if "found" in item:
+                found = item["found"]
+                docs[found["name"].rsplit("/", 1)[-1]] = _FirebaseBase._decode_document(
+                    found
+                )
+        return docs
+
+    @staticmethod
+    def _commit_body(writes: list[bytes]) -> bytes:
+        """Join pre-encoded writes into a documents:commit request body."""
+        return b'{"writes":[' + b",".join(writes) + b"]}"
+
+    @staticmethod
+    def _encode_fields(data: dict) -> dict:
+        """Convert a plain dict to Firestore Value format."""
+        # Exact-type hits (nearly every value) go straight to their encoder;
+        # only subclasses and unknown types take the _encode_value detour.
+        lookup = _ENCODERS.get
+        fallback = _FirebaseBase._encode_value
+        return {
+            key: (lookup(type(value)) or fallback)(value) for key, value in data.items()
+        }
+
+    @staticmethod
+    def _encode_value(value) -> dict:
+        """Encode a single value to Firestore format."""
+        encoder = _ENCODERS.get(type(value))
+        if encoder is None:
+            # Subclasses (IntEnum, str-based enums, ...) miss the exact-type
+            # lookup; fall back to the first isinstance match.
+            for kind, candidate in _ENCODERS.items():
+                if isinstance(value, kind):
+                    return candidate(value)
+            return {"stringValue": str(value)}
+        return encoder(value)
+
+    @staticmethod
+    def _decode_document(doc: dict) -> dict:
+        """Decode a Firestore document to a plain dict."""
+        if not doc or "fields" not in doc:
+            return doc
+        result = {"_id": doc.get("name", "").split("/")[-1]}
+        for key, value in doc.get("fields", {}).items():
+            result[key] = _FirebaseBase._decode_value(value)
+        return result
+
+    @staticmethod
+    def _decode_value(value: dict):
+        """Decode a single Firestore value."""
+        # A Firestore Value has exactly one key naming its type.
+        for kind, inner in value.items():
+            decoder = _DECODERS.get(kind)
+            if decoder is not None:
+                return decoder(inner)
+        return value
+
+
+# Firestore Value encoders keyed by exact Python type. type(True) is bool,
+# so booleans never land in the int branch. Order matters only for the
+# isinstance fallback: bool is listed before int.
+_ENCODERS = {
+    str: lambda v: {"stringValue": v},
+    bool: lambda v: {"booleanValue": v},
+    int: lambda v: {"integerValue": str(v)},
+    float: lambda v: {"doubleValue": v},
+    type(None): lambda v: {"nullValue": None},
+    list: lambda v: {
+        "arrayValue": {"values": [_FirebaseBase._encode_value(x) for x in v]}
+    },
+    dict: lambda v: {"mapValue": {"fields": _FirebaseBase._encode_fields(v)}},
+}
+
+# Decoders keyed by the Firestore Value type name. Types without an entry
+# (timestamps, references, geo points, bytes) are returned undecoded.
+_DECODERS = {
+    "stringValue": lambda v: v,
+    "integerValue": int,
+    "doubleValue": lambda v: v,
+    "booleanValue": lambda v: v,
+    "nullValue": lambda v: None,
+    "arrayValue": lambda v: [
+        _FirebaseBase._decode_value(x) for x in v.get("values", [])
+    ],
+    "mapValue": lambda v: {
+        k: _FirebaseBase._decode_value(x) for k, x in v.get("fields", {}).items()
+    },
+}
+
+
+class FirebaseClient(_FirebaseBase, _http.SharedSessionClient):
+    """Firebase REST API client for Firestore, Realtime Database, and Auth."""
+
+    def __init__(self):
+        super().__init__()
+        self.session = _http.shared_session()
+        self._cache = TTLCache(maxsize=1024, ttl=60)
+
+    def close(self) -> None:
+        """Drop cached documents."""
+        self._cache.clear()
+
     # -- Firestore ---------------------------------------------------------
 
     def set_document(
-        self, collection: str, document_id: str, fields: dict
+        self, collection: str, document_id: str, fields: dict, *, raw: bool = False
     ) -> dict:
         """Create or overwrite a Firestore document.
 
@@ -115,28 +353,138 @@ class FirebaseClient:
             collection:  Collection name.
             document_id: Document ID.
             fields:      Document fields as a plain dict (auto-converted to Firestore format).
+            raw:         If True, ``fields`` is already in Firestore Value
+                         format (e.g. copied from another document's
+                         ``fields``) and is sent without re-encoding.
 
         Returns:
             Firestore document dict.
         """
         url = f"{self._firestore_base}/{collection}/{document_id}"
-        body = {"fields": self._encode_fields(fields)}
+        body = {"fields": fields if raw else self._encode_fields(fields)}
         resp = self._request("PATCH", url, json=body)
+        self._cache.pop(url)
         return self._decode_document(resp)
 
-    def get_document(self, collection: str, document_id: str) -> dict:
+    def set_documents(self, collection: str, documents: dict[str, dict]) -> list[dict]:
+        """Create or overwrite many documents with batched commit requests.
+
+        Writes are packed into as few ``documents:commit`` calls as the
+        Firestore limits allow (500 writes / 10 MiB each), so a bulk load
+        costs one round trip per batch instead of one per document. Each
+        batch is applied atomically.
+
+        Args:
+            collection: Collection name.
+            documents:  Mapping of document ID to plain field dict.
+
+        Returns:
+            List of write-result dicts, in the mapping's iteration order.
+        """
+        results: list[dict] = []
+        for writes in self._commit_batches(collection, documents):
+            results.extend(self._commit(writes))
+        for document_id in documents:
+            self._cache.pop(f"{self._firestore_base}/{collection}/{document_id}")
+        return results
+
+    def set_documents_parallel(
+        self, collection: str, documents: dict[str, dict], workers: int = 40
+    ) -> list[dict]:
+        """Create or overwrite many documents with concurrent PATCH requests.
+
+        Unlike set_documents, every document is an independent write, so
+        one failure does not roll back the others. Writes rejected with
+        409/429/503 are retried with exponential backoff. Around 40 workers
+        is where RTT-bound writes stop scaling.
+
+        Args:
+            collection: Collection name.
+            documents:  Mapping of document ID to plain field dict.
+            workers:    Maximum concurrent requests.
+
+        Returns:
+            Decoded document dicts, in the mapping's iteration order.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    lambda item: self._set_with_retry(collection, *item),
+                    documents.items(),
+                )
+            )
+
+    def get_document(
+        self,
+        collection: str,
+        document_id: str,
+        use_cache: bool = True,
+        *,
+        raw: bool = False,
+    ) -> dict:
         """Get a Firestore document.
 
+        Reads are served from a 60-second in-process cache, which this
+        client's own writes invalidate. Treat the returned dict as
+        read-only, since it is shared with the cache.
+
         Args:
             collection:  Collection name.
             document_id: Document ID.
+            use_cache:   Set False to always fetch from Firestore.
+            raw:         If True, return the Firestore document as sent
+                         (Value-encoded ``fields``), skipping decoding and
+                         the cache. Pair with ``set_document(..., raw=True)``
+                         to copy documents without a codec round trip.
 
         Returns:
             Decoded document dict with fields.
         """
         url = f"{self._firestore_base}/{collection}/{document_id}"
-        resp = self._request("GET", url)
-        return self._decode_document(resp)
+        if raw:
+            return self._request("GET", url)
+        if use_cache:
+            cached = self._cache.get(url)
+            if cached is not None:
+                return cached
+        doc = self._decode_document(self._request("GET", url))
+        self._cache.set(url, doc)
+        return doc
+
+    def get_documents(
+        self, collection: str, document_ids: list[str], use_cache: bool = True
+    ) -> list[dict]:
+        """Get several documents with documents:batchGet.
+
+        One request fetches up to 100 documents, instead of one GET per
+        document. Cached documents are served locally; only the misses
+        are requested.
+
+        Args:
+            collection:   Collection name.
+            document_ids: Document IDs to fetch.
+            use_cache:    Set False to always fetch from Firestore.
+
+        Returns:
+            Decoded document dicts in the order of document_ids. IDs that
+            do not exist are omitted.
+        """
+        base = f"{self._firestore_base}/{collection}"
+        docs: dict[str, dict] = {}
+        if use_cache:
+            for document_id in document_ids:
+                cached = self._cache.get(f"{base}/{document_id}")
+                if cached is not None:
+                    docs[document_id] = cached
+        misses = [i for i in dict.fromkeys(document_ids) if i not in docs]
+        for body in self._batch_get_chunks(collection, misses):
+            found = self._found_documents(
+                self._request("POST", f"{self._firestore_base}:batchGet", json=body)
+            )
+            for document_id, doc in found.items():
+                self._cache.set(f"{base}/{document_id}", doc)
+            docs.update(found)
+        return [docs[i] for i in document_ids if i in docs]
 
     def delete_document(self, collection: str, document_id: str) -> None:
         """Delete a Firestore document.
@@ -147,6 +495,7 @@ class FirebaseClient:
         """
         url = f"{self._firestore_base}/{collection}/{document_id}"
         self._request("DELETE", url)
+        self._cache.pop(url)
 
     def list_documents(
         self, collection: str, page_size: int = 20, page_token: str | None = None
@@ -168,6 +517,35 @@ class FirebaseClient:
         resp = self._request("GET", url, params=params)
         return [self._decode_document(doc) for doc in resp.get("documents", [])]
 
+    def iter_documents(self, collection: str, page_size: int = 100):
+        """Yield every document in a collection, following nextPageToken.
+
+        The next page is fetched in the background while the current one
+        is being consumed.
+
+        Args:
+            collection: Collection name.
+            page_size:  Documents requested per page.
+
+        Yields:
+            Decoded document dicts.
+        """
+        url = f"{self._firestore_base}/{collection}"
+
+        def fetch(page_token: str):
+            params: dict = {"pageSize": page_size}
+            if page_token:
+                params["pageToken"] = page_token
+            resp = self._request("GET", url, params=params)
+            docs = [self._decode_document(doc) for doc in resp.get("documents", [])]
+            return docs, resp.get("nextPageToken") or None
+
+        return prefetch_pages(fetch, "")
+
+    def cache_clear(self) -> None:
+        """Drop every cached document read."""
+        self._cache.clear()
+
     # -- Realtime Database -------------------------------------------------
 
     def rtdb_get(self, path: str) -> dict | list | str | None:
@@ -287,48 +665,45 @@ class FirebaseClient:
 
     # -- internal helpers --------------------------------------------------
 
-    def _load_service_account(self, path: str) -> None:
-        """Load service account credentials and get an access token via Google OAuth2."""
-        try:
-            from google.oauth2 import service_account as sa
-            from google.auth.transport.requests import Request
-
-            creds = sa.Credentials.from_service_account_file(
-                path,
-                scopes=[
-                    "https://www.googleapis.com/auth/datastore",
-                    "https://www.googleapis.com/auth/firebase",
-                ],
-            )
-            creds.refresh(Request())
-            self._access_token = creds.token
-        except ImportError:
-            raise RuntimeError(
-                "google-auth package is required for service account auth. "
-                "Install it with: pip install google-auth"
-            )
-
     def _request(self, method: str, url: str, **kwargs) -> dict:
         """Make an authenticated request."""
+        _http.encode_json_kwarg(kwargs)
         headers = kwargs.pop("headers", {})
-        if self._access_token:
-            headers["Authorization"] = f"Bearer {self._access_token}"
+        token = self._access_token
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
         resp = self.session.request(method, url, headers=headers, **kwargs)
         resp.raise_for_status()
         if resp.status_code == 204 or not resp.content:
             return {}
-        return resp.json()
-
-    def _rtdb_url(self, path: str) -> str:
-        """Build a Realtime Database URL."""
-        if not self.database_url:
-            raise RuntimeError(
-                "FIREBASE_DATABASE_URL is not set. Required for Realtime Database access."
+        return _http.loads(resp.content)
+
+    def _set_with_retry(self, collection: str, document_id: str, fields: dict) -> dict:
+        """set_document with exponential backoff on retryable statuses."""
+        for attempt in range(_RETRY_ATTEMPTS):
+            try:
+                return self.set_document(collection, document_id, fields)
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS - 1:
+                    raise
+                time.sleep(_RETRY_BACKOFF * 2**attempt)
+
+    def _commit(self, writes: list[bytes]) -> list[dict]:
+        """Send one commit request, halving the batch if it is too large."""
+        try:
+            resp = self._request(
+                "POST",
+                f"{self._firestore_base}:commit",
+                data=self._commit_body(writes),
+                headers={"Content-Type": "application/json"},
             )
-        path = path.strip("/")
-        base = self.database_url.rstrip("/")
-        auth_param = f"?auth={self._access_token}" if self._access_token else ""
-        return f"{base}/{path}.json{auth_param}"
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 413 or len(writes) < 2:
+                raise
+            mid = len(writes) // 2
+            return self._commit(writes[:mid]) + self._commit(writes[mid:])
+        return resp.get("writeResults", [])
 
     def _auth_request(self, action: str, **kwargs) -> dict:
         """Make a Firebase Auth REST API request."""
@@ -345,83 +720,202 @@ class FirebaseClient:
         resp.raise_for_status()
         return resp.json()
 
-    @staticmethod
-    def _encode_fields(data: dict) -> dict:
-        """Convert a plain dict to Firestore Value format."""
-        encoded = {}
-        for key, value in data.items():
-            if isinstance(value, str):
-                encoded[key] = {"stringValue": value}
-            elif isinstance(value, bool):
-                encoded[key] = {"booleanValue": value}
-            elif isinstance(value, int):
-                encoded[key] = {"integerValue": str(value)}
-            elif isinstance(value, float):
-                encoded[key] = {"doubleValue": value}
-            elif value is None:
-                encoded[key] = {"nullValue": None}
-            elif isinstance(value, list):
-                encoded[key] = {
-                    "arrayValue": {
-                        "values": [
-                            FirebaseClient._encode_value(v) for v in value
-                        ]
-                    }
-                }
-            elif isinstance(value, dict):
-                encoded[key] = {
-                    "mapValue": {"fields": FirebaseClient._encode_fields(value)}
-                }
-            else:
-                encoded[key] = {"stringValue": str(value)}
-        return encoded
 
-    @staticmethod
-    def _encode_value(value) -> dict:
-        """Encode a single value to Firestore format."""
-        if isinstance(value, str):
-            return {"stringValue": value}
-        if isinstance(value, bool):
-            return {"booleanValue": value}
-        if isinstance(value, int):
-            return {"integerValue": str(value)}
-        if isinstance(value, float):
-            return {"doubleValue": value}
-        if value is None:
-            return {"nullValue": None}
-        return {"stringValue": str(value)}
+class AsyncFirebaseClient(_FirebaseBase):
+    """Async Firestore and Realtime Database client built on httpx.
 
-    @staticmethod
-    def _decode_document(doc: dict) -> dict:
-        """Decode a Firestore document to a plain dict."""
-        if not doc or "fields" not in doc:
-            return doc
-        result = {"_id": doc.get("name", "").split("/")[-1]}
-        for key, value in doc.get("fields", {}).items():
-            result[key] = FirebaseClient._decode_value(value)
-        return result
+    Mirrors the document and RTDB methods of FirebaseClient as coroutines
+    and adds gather-based bulk helpers, so N independent reads or writes
+    cost roughly one round trip instead of N. With h2 installed the
+    concurrent requests are multiplexed over a single HTTP/2 connection.
+    Use it as an async context manager so the pool is closed when done.
+    """
 
-    @staticmethod
-    def _decode_value(value: dict):
-        """Decode a single Firestore value."""
-        if "stringValue" in value:
-            return value["stringValue"]
-        if "integerValue" in value:
-            return int(value["integerValue"])
-        if "doubleValue" in value:
-            return value["doubleValue"]
-        if "booleanValue" in value:
-            return value["booleanValue"]
-        if "nullValue" in value:
+    def __init__(self):
+        super().__init__()
+        self._client = httpx.AsyncClient(
+            http2=_http.HTTP2,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        self._inflight = SingleFlight()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    # -- Firestore ---------------------------------------------------------
+
+    async def set_document(
+        self, collection: str, document_id: str, fields: dict, *, raw: bool = False
+    ) -> dict:
+        """Create or overwrite a Firestore document. See FirebaseClient."""
+        url = f"{self._firestore_base}/{collection}/{document_id}"
+        body = {"fields": fields if raw else self._encode_fields(fields)}
+        resp = await self._request("PATCH", url, json=body)
+        return self._decode_document(resp)
+
+    async def get_document(
+        self, collection: str, document_id: str, *, raw: bool = False
+    ) -> dict:
+        """Get a Firestore document. See FirebaseClient."""
+        url = f"{self._firestore_base}/{collection}/{document_id}"
+        resp = await self._request("GET", url)
+        return resp if raw else self._decode_document(resp)
+
+    async def delete_document(self, collection: str, document_id: str) -> None:
+        """Delete a Firestore document. See FirebaseClient."""
+        url = f"{self._firestore_base}/{collection}/{document_id}"
+        await self._request("DELETE", url)
+
+    async def list_documents(
+        self, collection: str, page_size: int = 20, page_token: str | None = None
+    ) -> list[dict]:
+        """List documents in a Firestore collection. See FirebaseClient."""
+        url = f"{self._firestore_base}/{collection}"
+        params: dict = {"pageSize": page_size}
+        if page_token:
+            params["pageToken"] = page_token
+        resp = await self._request("GET", url, params=params)
+        return [self._decode_document(doc) for doc in resp.get("documents", [])]
+
+    async def get_documents(
+        self, collection: str, document_ids: list[str]
+    ) -> list[dict]:
+        """Get several documents with concurrent documents:batchGet calls.
+
+        Same chunking as FirebaseClient.get_documents, with the chunks
+        sent concurrently.
+
+        Args:
+            collection:   Collection name.
+            document_ids: Document IDs to fetch.
+
+        Returns:
+            Decoded document dicts in the order of document_ids. IDs that
+            do not exist are omitted.
+        """
+        url = f"{self._firestore_base}:batchGet"
+        responses = await asyncio.gather(
+            *(
+                self._request("POST", url, json=body)
+                for body in self._batch_get_chunks(
+                    collection, list(dict.fromkeys(document_ids))
+                )
+            )
+        )
+        docs: dict[str, dict] = {}
+        for results in responses:
+            docs.update(self._found_documents(results))
+        return [docs[i] for i in document_ids if i in docs]
+
+    async def set_documents(
+        self, collection: str, documents: dict[str, dict]
+    ) -> list[dict]:
+        """Create or overwrite many documents with concurrent commit batches.
+
+        Same batching as FirebaseClient.set_documents, with the batches
+        sent concurrently.
+
+        Args:
+            collection: Collection name.
+            documents:  Mapping of document ID to plain field dict.
+
+        Returns:
+            List of write-result dicts, in the mapping's iteration order.
+        """
+        batches = await asyncio.gather(
+            *(self._commit(w) for w in self._commit_batches(collection, documents))
+        )
+        return [result for batch in batches for result in batch]
+
+    # -- Realtime Database -------------------------------------------------
+
+    async def rtdb_get(self, path: str) -> dict | list | str | None:
+        """Get data from the Realtime Database. See FirebaseClient."""
+        return await self._rtdb("GET", path)
+
+    async def rtdb_set(self, path: str, data: dict) -> dict:
+        """Set (overwrite) data at a Realtime Database path. See FirebaseClient."""
+        return await self._rtdb("PUT", path, json=data)
+
+    async def rtdb_update(self, path: str, data: dict) -> dict:
+        """Update (merge) data at a Realtime Database path. See FirebaseClient."""
+        return await self._rtdb("PATCH", path, json=data)
+
+    async def rtdb_push(self, path: str, data: dict) -> dict:
+        """Push data with an auto-generated key. See FirebaseClient."""
+        return await self._rtdb("POST", path, json=data)
+
+    async def rtdb_delete(self, path: str) -> None:
+        """Delete data at a Realtime Database path. See FirebaseClient."""
+        await self._rtdb("DELETE", path)
+
+    async def rtdb_get_many(self, paths: list[str]) -> list:
+        """Get data at several Realtime Database paths concurrently.
+
+        Args:
+            paths: Database paths.
+
+        Returns:
+            Data at each path, in the same order as paths.
+        """
+        return list(await asyncio.gather(*(self.rtdb_get(p) for p in paths)))
+
+    # -- internal helpers --------------------------------------------------
+
+    async def _request(self, method: str, url: str, **kwargs) -> dict:
+        """Make an authenticated request.
+
+        Concurrent identical GETs share a single request.
+        """
+        if method == "GET":
+            params = kwargs.get("params") or {}
+            key = (url, tuple(sorted(params.items())))
+            return await self._inflight.run(
+                key, lambda: self._send(method, url, **kwargs)
+            )
+        return await self._send(method, url, **kwargs)
+
+    async def _send(self, method: str, url: str, **kwargs) -> dict:
+        headers = kwargs.pop("headers", {})
+        token = self._access_token
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        resp = await self._client.request(method, url, headers=headers, **kwargs)
+        resp.raise_for_status()
+        if resp.status_code == 204 or not resp.content:
+            return {}
+        return _http.loads(resp.content)
+
+    async def _commit(self, writes: list[bytes]) -> list[dict]:
+        """Send one commit request, halving the batch if it is too large."""
+        try:
+            resp = await self._request(
+                "POST",
+                f"{self._firestore_base}:commit",
+                content=self._commit_body(writes),
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 413 or len(writes) < 2:
+                raise
+            mid = len(writes) // 2
+            first, second = await asyncio.gather(
+                self._commit(writes[:mid]), self._commit(writes[mid:])
+            )
+            return first + second
+        return resp.get("writeResults", [])
+
+    async def _rtdb(self, method: str, path: str, **kwargs):
+        """Make a Realtime Database request."""
+        resp = await self._client.request(method, self._rtdb_url(path), **kwargs)
+        resp.raise_for_status()
+        if method == "DELETE":
             return None
-        if "arrayValue" in value:
-            return [
-                FirebaseClient._decode_value(v)
-                for v in value["arrayValue"].get("values", [])
-            ]
-        if "mapValue" in value:
-            return {
-                k: FirebaseClient._decode_value(v)
-                for k, v in value["mapValue"].get("fields", {}).items()
-            }
-        return value
+        return _http.loads(resp.content)
@@ -31,6 +31,8 @@ Usage:
 
     # --- Issues ---
     issues = gh.list_issues("owner/repo")
+    for issue in gh.iter_issues("owner/repo", state="all"):  # every page
+        print(issue["number"])
     gh.create_issue("owner/repo", title="Bug report", body="Something broke.")
     gh.comment_on_issue("owner/repo", issue_number=1, body="Looking into this.")
 
@@ -40,6 +42,7 @@ Usage:
 
     # --- Files ---
     content = gh.get_file("owner/repo", "README.md")
+    logo = gh.get_file_raw("owner/repo", "assets/logo.png")  # bytes
     gh.create_or_update_file(
         "owner/repo", "docs/notes.md",
         content="# Notes\\nAutomated by GOLIATH.",
@@ -48,19 +51,32 @@ Usage:
 
     # --- Actions ---
     gh.trigger_workflow("owner/repo", "build.yml", ref="main")
+
+    # --- Async (concurrent bulk reads) ---
+    from goliath.integrations.github import AsyncGitHubClient
+
+    async with AsyncGitHubClient() as agh:
+        repos = await agh.get_repos(["owner/repo", "owner/other"])
+        files = await agh.get_files("owner/repo", ["README.md", "LICENSE"])
 """
 
+import asyncio
 import base64
 
+import httpx
 import requests
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._cache import SingleFlight, TTLCache
+from goliath.integrations._pagination import prefetch_pages
 
 _API_BASE = "https://api.github.com"
+_RAW_MEDIA_TYPE = "application/vnd.github.raw"
 
 
-class GitHubClient:
-    """GitHub API v3 client for repos, issues, PRs, files, and Actions."""
+class _GitHubBase:
+    """Token, owner, and default headers shared by both clients."""
 
     def __init__(self, token: str | None = None):
         self.token = token or config.GITHUB_TOKEN
@@ -71,14 +87,24 @@ class GitHubClient:
                 "See integrations/github.py for setup instructions."
             )
         self.owner = config.GITHUB_OWNER
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {self.token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28",
-            }
-        )
+        self._headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+
+
+class GitHubClient(_GitHubBase, _http.SharedSessionClient):
+    """GitHub API v3 client for repos, issues, PRs, files, and Actions."""
+
+    def __init__(self, token: str | None = None):
+        super().__init__(token)
+        self.session = _http.shared_session()
+        self._cache = TTLCache(maxsize=1024, ttl=60)
+
+    def close(self) -> None:
+        """Drop cached responses."""
+        self._cache.clear()
 
     # -- Repositories ------------------------------------------------------
 
@@ -89,9 +115,15 @@ class GitHubClient:
             return self._get(f"/users/{target}/repos", params={"per_page": per_page})
         return self._get("/user/repos", params={"per_page": per_page})
 
-    def get_repo(self, repo: str) -> dict:
+    def iter_repos(self, owner: str | None = None, per_page: int = 100):
+        """Yield every repository for a user or org, across all pages."""
+        target = owner or self.owner
+        path = f"/users/{target}/repos" if target else "/user/repos"
+        return self._iter_pages(path, {"per_page": per_page})
+
+    def get_repo(self, repo: str, use_cache: bool = True) -> dict:
         """Get repository details. repo format: 'owner/name'."""
-        return self._get(f"/repos/{repo}")
+        return self._get(f"/repos/{repo}", use_cache=use_cache)
 
     def create_repo(
         self,
@@ -126,6 +158,12 @@ class GitHubClient:
             },
         )
 
+    def iter_issues(self, repo: str, state: str = "open", per_page: int = 100):
+        """Yield every issue for a repository, across all pages."""
+        return self._iter_pages(
+            f"/repos/{repo}/issues", {"state": state, "per_page": per_page}
+        )
+
     def create_issue(
         self, repo: str, title: str, body: str = "", labels: list[str] | None = None
     ) -> dict:
@@ -158,6 +196,12 @@ class GitHubClient:
             },
         )
 
+    def iter_pulls(self, repo: str, state: str = "open", per_page: int = 100):
+        """Yield every pull request for a repository, across all pages."""
+        return self._iter_pages(
+            f"/repos/{repo}/pulls", {"state": state, "per_page": per_page}
+        )
+
     def create_pull(
         self,
         repo: str,
@@ -179,19 +223,48 @@ class GitHubClient:
 
     # -- Files -------------------------------------------------------------
 
-    def get_file(self, repo: str, path: str, ref: str | None = None) -> dict:
+    def get_file(
+        self,
+        repo: str,
+        path: str,
+        ref: str | None = None,
+        use_cache: bool = True,
+        include_content: bool = True,
+    ) -> dict:
         """Get a file's content and metadata from a repository.
 
         Returns a dict with 'content' (decoded), 'sha', 'path', etc.
+        Pass include_content=False when only metadata such as 'sha' is
+        needed, to skip base64-decoding the blob. For the file bytes
+        alone (including binary files), use get_file_raw().
         """
         params = {}
         if ref:
             params["ref"] = ref
-        data = self._get(f"/repos/{repo}/contents/{path}", params=params)
-        if data.get("content"):
-            data["decoded_content"] = base64.b64decode(data["content"]).decode("utf-8")
+        data = self._get(
+            f"/repos/{repo}/contents/{path}", params=params, use_cache=use_cache
+        )
+        if include_content and data.get("content"):
+            # A copy: ``data`` is also held by the cache or shared with
+            # concurrent callers, which must not see each other's fields.
+            decoded = base64.b64decode(data["content"]).decode("utf-8")
+            return {**data, "decoded_content": decoded}
         return data
 
+    def get_file_raw(self, repo: str, path: str, ref: str | None = None) -> bytes:
+        """Get a file's raw bytes, without the JSON/base64 envelope.
+
+        Uses the raw media type, so GitHub sends the file body as-is.
+        """
+        params = {"ref": ref} if ref else None
+        resp = self.session.get(
+            f"{_API_BASE}/repos/{repo}/contents/{path}",
+            params=params,
+            headers={**self._headers, "Accept": _RAW_MEDIA_TYPE},
+        )
+        resp.raise_for_status()
+        return resp.content
+
     def create_or_update_file(
         self,
         repo: str,
@@ -213,12 +286,17 @@ class GitHubClient:
 
         # Check if file exists to get its SHA for updates
         try:
-            existing = self.get_file(repo, path, ref=branch)
+            existing = self.get_file(
+                repo, path, ref=branch, use_cache=False, include_content=False
+            )
             payload["sha"] = existing["sha"]
         except requests.HTTPError:
             pass  # File doesn't exist yet — create it
 
-        return self._put(f"/repos/{repo}/contents/{path}", json=payload)
+        result = self._put(f"/repos/{repo}/contents/{path}", json=payload)
+        contents_path = f"/repos/{repo}/contents/{path}"
+        self._cache.pop_matching(lambda key: key[0] == contents_path)
+        return result
 
     # -- Actions -----------------------------------------------------------
 
@@ -245,21 +323,277 @@ class GitHubClient:
             json=payload,
         )
 
+    def cache_clear(self) -> None:
+        """Drop every cached repo and file read."""
+        self._cache.clear()
+
     # -- internal helpers --------------------------------------------------
 
-    def _get(self, path: str, **kwargs) -> dict | list:
-        resp = self.session.get(f"{_API_BASE}{path}", **kwargs)
+    def _with_auth(self, kwargs: dict) -> dict:
+        """Merge the auth/API headers into a request's own headers."""
+        kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+        return kwargs
+
+    def _get(self, path: str, use_cache: bool = False, **kwargs) -> dict | list:
+        if not use_cache:
+            resp = self.session.get(f"{_API_BASE}{path}", **self._with_auth(kwargs))
+            resp.raise_for_status()
+            return _http.loads(resp.content)
+
+        # Fresh hits skip the network; stale entries are revalidated with
+        # their ETag, and a 304 (which GitHub does not count against the
+        # rate limit) re-arms the cached body without transferring it.
+        key = (path, tuple(sorted(kwargs.get("params", {}).items())))
+        entry = self._cache.get_entry(key)
+        if entry is not None:
+            (etag, body), fresh = entry
+            if fresh:
+                return body
+            if etag:
+                kwargs["headers"] = {"If-None-Match": etag}
+        resp = self.session.get(f"{_API_BASE}{path}", **self._with_auth(kwargs))
         resp.raise_for_status()
-        return resp.json()
+        if resp.status_code == 304 and entry is not None:
+            self._cache.set(key, entry[0])
+            return entry[0][1]
+        body = _http.loads(resp.content)
+        self._cache.set(key, (resp.headers.get("ETag"), body))
+        return body
+
+    def _iter_pages(self, path: str, params: dict):
+        """Follow Link rel="next" headers, prefetching the next page."""
+
+        def fetch(cursor: tuple[str, dict | None]):
+            url, page_params = cursor
+            resp = self.session.get(url, params=page_params, headers=self._headers)
+            resp.raise_for_status()
+            next_url = resp.links.get("next", {}).get("url")
+            # The next link already carries the query string.
+            next_cursor = (next_url, None) if next_url else None
+            return _http.loads(resp.content), next_cursor
+
+        return prefetch_pages(fetch, (f"{_API_BASE}{path}", params))
 
     def _post(self, path: str, **kwargs) -> dict:
-        resp = self.session.post(f"{_API_BASE}{path}", **kwargs)
+        _http.encode_json_kwarg(kwargs)
+        resp = self.session.post(f"{_API_BASE}{path}", **self._with_auth(kwargs))
         resp.raise_for_status()
         if resp.status_code == 204 or not resp.content:
             return {"status": "ok"}
-        return resp.json()
+        return _http.loads(resp.content)
 
     def _put(self, path: str, **kwargs) -> dict:
-        resp = self.session.put(f"{_API_BASE}{path}", **kwargs)
+        _http.encode_json_kwarg(kwargs)
+        resp = self.session.put(f"{_API_BASE}{path}", **self._with_auth(kwargs))
         resp.raise_for_status()
-        return resp.json()
+        return _http.loads(resp.content)
+
+
+class AsyncGitHubClient(_GitHubBase):
+    """Async GitHub API v3 client built on httpx.
+
+    Mirrors GitHubClient's methods as coroutines and adds gather-based
+    bulk helpers, so N independent calls cost roughly one round trip
+    instead of N. With h2 installed the concurrent requests are
+    multiplexed over a single HTTP/2 connection. Use it as an async
+    context manager so the pool is closed when done.
+    """
+
+    def __init__(self, token: str | None = None):
+        super().__init__(token)
+        self._client = httpx.AsyncClient(
+            base_url=_API_BASE,
+            http2=_http.HTTP2,
+            headers=self._headers,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        self._inflight = SingleFlight()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    # -- Repositories ------------------------------------------------------
+
+    async def list_repos(
+        self, owner: str | None = None, per_page: int = 30
+    ) -> list[dict]:
+        """List repositories for a user or org."""
+        target = owner or self.owner
+        if target:
+            return await self._request(
+                "GET", f"/users/{target}/repos", params={"per_page": per_page}
+            )
+        return await self._request("GET", "/user/repos", params={"per_page": per_page})
+
+    async def get_repo(self, repo: str) -> dict:
+        """Get repository details. repo format: 'owner/name'."""
+        return await self._request("GET", f"/repos/{repo}")
+
+    async def get_repos(self, repos: list[str]) -> list[dict]:
+        """Get details for several repositories concurrently."""
+        return list(await asyncio.gather(*(self.get_repo(r) for r in repos)))
+
+    async def create_repo(
+        self,
+        name: str,
+        description: str = "",
+        private: bool = False,
+    ) -> dict:
+        """Create a new repository for the authenticated user."""
+        return await self._request(
+            "POST",
+            "/user/repos",
+            json={
+                "name": name,
+                "description": description,
+                "private": private,
+            },
+        )
+
+    # -- Issues ------------------------------------------------------------
+
+    async def list_issues(
+        self,
+        repo: str,
+        state: str = "open",
+        per_page: int = 30,
+    ) -> list[dict]:
+        """List issues for a repository."""
+        return await self._request(
+            "GET",
+            f"/repos/{repo}/issues",
+            params={"state": state, "per_page": per_page},
+        )
+
+    async def create_issue(
+        self, repo: str, title: str, body: str = "", labels: list[str] | None = None
+    ) -> dict:
+        """Create a new issue."""
+        payload: dict = {"title": title, "body": body}
+        if labels:
+            payload["labels"] = labels
+        return await self._request("POST", f"/repos/{repo}/issues", json=payload)
+
+    async def comment_on_issue(self, repo: str, issue_number: int, body: str) -> dict:
+        """Add a comment to an issue or pull request."""
+        return await self._request(
+            "POST",
+            f"/repos/{repo}/issues/{issue_number}/comments",
+            json={"body": body},
+        )
+
+    # -- Pull Requests -----------------------------------------------------
+
+    async def list_pulls(
+        self,
+        repo: str,
+        state: str = "open",
+        per_page: int = 30,
+    ) -> list[dict]:
+        """List pull requests for a repository."""
+        return await self._request(
+            "GET",
+            f"/repos/{repo}/pulls",
+            params={"state": state, "per_page": per_page},
+        )
+
+    async def create_pull(
+        self,
+        repo: str,
+        title: str,
+        head: str,
+        base: str = "main",
+        body: str = "",
+    ) -> dict:
+        """Create a pull request."""
+        return await self._request(
+            "POST",
+            f"/repos/{repo}/pulls",
+            json={"title": title, "head": head, "base": base, "body": body},
+        )
+
+    # -- Files -------------------------------------------------------------
+
+    async def get_file(
+        self,
+        repo: str,
+        path: str,
+        ref: str | None = None,
+        include_content: bool = True,
+    ) -> dict:
+        """Get a file's content and metadata from a repository."""
+        params = {}
+        if ref:
+            params["ref"] = ref
+        data = await self._request(
+            "GET", f"/repos/{repo}/contents/{path}", params=params
+        )
+        if include_content and data.get("content"):
+            # A copy: ``data`` is also held by the cache or shared with
+            # concurrent callers, which must not see each other's fields.
+            decoded = base64.b64decode(data["content"]).decode("utf-8")
+            return {**data, "decoded_content": decoded}
+        return data
+
+    async def get_file_raw(self, repo: str, path: str, ref: str | None = None) -> bytes:
+        """Get a file's raw bytes. See GitHubClient.get_file_raw."""
+        resp = await self._client.get(
+            f"/repos/{repo}/contents/{path}",
+            params={"ref": ref} if ref else None,
+            headers={"Accept": _RAW_MEDIA_TYPE},
+        )
+        resp.raise_for_status()
+        return resp.content
+
+    async def get_files(
+        self, repo: str, paths: list[str], ref: str | None = None
+    ) -> list[dict]:
+        """Get several files from one repository concurrently."""
+        return list(
+            await asyncio.gather(*(self.get_file(repo, p, ref=ref) for p in paths))
+        )
+
+    # -- Actions -----------------------------------------------------------
+
+    async def trigger_workflow(
+        self,
+        repo: str,
+        workflow: str,
+        ref: str = "main",
+        inputs: dict | None = None,
+    ) -> None:
+        """Trigger a GitHub Actions workflow dispatch."""
+        payload: dict = {"ref": ref}
+        if inputs:
+            payload["inputs"] = inputs
+        await self._request(
+            "POST",
+            f"/repos/{repo}/actions/workflows/{workflow}/dispatches",
+            json=payload,
+        )
+
+    # -- internal helpers --------------------------------------------------
+
+    async def _request(self, method: str, path: str, **kwargs) -> dict | list:
+        # Concurrent identical GETs share a single request.
+        if method == "GET":
+            params = kwargs.get("params") or {}
+            key = (path, tuple(sorted(params.items())))
+            return await self._inflight.run(
+                key, lambda: self._send(method, path, **kwargs)
+            )
+        return await self._send(method, path, **kwargs)
+
+    async def _send(self, method: str, path: str, **kwargs) -> dict | list:
+        resp = await self._client.request(method, path, **kwargs)
+        resp.raise_for_status()
+        if resp.status_code == 204 or not resp.content:
+            return {"status": "ok"}
+        return _http.loads(resp.content)
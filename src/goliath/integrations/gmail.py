@@ -28,6 +28,9 @@ IMPORTANT NOTES
 - For Google Workspace accounts, your admin may need to allow
   "Less secure app" access or App Passwords.
 - Attachment size limit is ~25 MB (Gmail's standard limit).
+- The SMTP session is opened on the first send and reused afterwards
+  (checked with NOOP, reconnected if dropped). Call close() or use the
+  client as a context manager when you are done.
 
 Usage:
     from goliath.integrations.gmail import GmailClient
@@ -63,12 +66,18 @@ Usage:
         subject="Team update",
         body="New deployment is live.",
     )
+
+    # Bulk send over one SMTP session (connection closed on exit)
+    with GmailClient() as gm:
+        gm.send_many([
+            {"to": "alice@example.com", "subject": "Hi", "body": "Hello Alice"},
+            {"to": "bob@example.com", "subject": "Hi", "body": "Hello Bob"},
+        ])
 """
 
+import mimetypes
 import smtplib
-from email.mime.application import MIMEApplication
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage
 from pathlib import Path
 
 from goliath import config
@@ -94,6 +103,23 @@ class GmailClient:
             )
         self.address = config.GMAIL_ADDRESS
         self.password = config.GMAIL_APP_PASSWORD
+        self._smtp: smtplib.SMTP | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Log out and close the SMTP session, if one is open."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
 
     # -- public API --------------------------------------------------------
 
@@ -118,11 +144,60 @@ class GmailClient:
             bcc:         BCC recipients.
             attachments: List of file paths to attach.
         """
+        msg, recipients = self._build_message(
+            to, subject, body, html, cc, bcc, attachments
+        )
+        server = self._ensure_connection()
+        server.send_message(msg, from_addr=self.address, to_addrs=recipients)
+
+    def send_many(self, messages: list[dict]) -> None:
+        """Send several emails over a single SMTP session.
+
+        Args:
+            messages: List of dicts, each holding the keyword arguments
+                      for send() (to, subject, body, html, cc, bcc,
+                      attachments).
+        """
+        server = self._ensure_connection()
+        for message in messages:
+            msg, recipients = self._build_message(**message)
+            server.send_message(msg, from_addr=self.address, to_addrs=recipients)
+
+    # -- internal helpers --------------------------------------------------
+
+    def _ensure_connection(self) -> smtplib.SMTP:
+        """Return a live SMTP session, connecting or reconnecting as needed."""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp.close()
+            self._smtp = None
+
+        server = smtplib.SMTP(_SMTP_HOST, _SMTP_PORT)
+        server.starttls()
+        server.login(self.address, self.password)
+        self._smtp = server
+        return server
+
+    def _build_message(
+        self,
+        to: str | list[str],
+        subject: str,
+        body: str,
+        html: bool = False,
+        cc: str | list[str] | None = None,
+        bcc: str | list[str] | None = None,
+        attachments: list[str] | None = None,
+    ) -> tuple[EmailMessage, list[str]]:
+        """Build the MIME message and the full envelope recipient list."""
         to_list = [to] if isinstance(to, str) else list(to)
         cc_list = [cc] if isinstance(cc, str) else list(cc or [])
         bcc_list = [bcc] if isinstance(bcc, str) else list(bcc or [])
 
-        msg = MIMEMultipart()
+        msg = EmailMessage()
         msg["From"] = self.address
         msg["To"] = ", ".join(to_list)
         msg["Subject"] = subject
@@ -130,22 +205,21 @@ class GmailClient:
             msg["Cc"] = ", ".join(cc_list)
 
         # Body
-        content_type = "html" if html else "plain"
-        msg.attach(MIMEText(body, content_type))
+        msg.set_content(body, subtype="html" if html else "plain")
 
-        # Attachments
+        # Attachments — send_message() serializes with BytesGenerator, so
+        # the payload is not copied again into one big string.
         for file_path in attachments or []:
             path = Path(file_path)
             if not path.exists():
                 raise FileNotFoundError(f"Attachment not found: {file_path}")
-            with open(path, "rb") as f:
-                part = MIMEApplication(f.read(), Name=path.name)
-            part["Content-Disposition"] = f'attachment; filename="{path.name}"'
-            msg.attach(part)
-
-        # Send
-        all_recipients = to_list + cc_list + bcc_list
-        with smtplib.SMTP(_SMTP_HOST, _SMTP_PORT) as server:
-            server.starttls()
-            server.login(self.address, self.password)
-            server.sendmail(self.address, all_recipients, msg.as_string())
+            mime_type, _ = mimetypes.guess_type(path.name)
+            maintype, subtype = (mime_type or "application/octet-stream").split("/", 1)
+            msg.add_attachment(
+                path.read_bytes(),
+                maintype=maintype,
+                subtype=subtype,
+                filename=path.name,
+            )
+
+        return msg, to_list + cc_list + bcc_list
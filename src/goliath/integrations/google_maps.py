@@ -24,6 +24,17 @@ IMPORTANT NOTES
 - API docs: https://developers.google.com/maps/documentation
 - All requests use the API key as a query parameter.
 - Place IDs are stable identifiers; prefer them over addresses when possible.
+- Responses are cached on disk for up to 30 days (the Maps Platform terms
+  cap caching at 30 days) in GOOGLE_MAPS_CACHE_PATH, default
+  ~/.goliath/cache/google_maps.sqlite3, with an hour-long in-memory layer
+  in front of it. Set the path to an empty string to keep only the memory
+  layer, or pass GoogleMapsClient(cache=False) to always hit the API.
+  Paginated searches are never cached because page tokens expire within
+  minutes. Cached results are shared, so treat them as read-only.
+  Expired entries that carried an ETag or Last-Modified header are
+  revalidated with a conditional request instead of refetched.
+- GoogleMapsClient(normalize_queries=True) lets text_search reuse cached
+  results for trivially rephrased queries ("Pizza, NYC" / "pizza in nyc").
 
 Usage:
     from goliath.integrations.google_maps import GoogleMapsClient
@@ -42,6 +53,10 @@ Usage:
     # Text search for places
     places = gm.text_search("best pizza in New York")
 
+    # Every result across pages (the next page is fetched while you iterate)
+    for place in gm.iter_nearby(lat=40.7128, lng=-74.0060, keyword="coffee"):
+        print(place["name"])
+
     # Get place details
     details = gm.place_details("ChIJN1t_tDeuEmsRUsoyG83frY4")
 
@@ -53,19 +68,65 @@ Usage:
         origins=["New York, NY", "Philadelphia, PA"],
         destinations=["Boston, MA", "Washington, DC"],
     )
+
+    # Matrices beyond the per-request limits, fetched concurrently
+    matrix = gm.distance_matrix_bulk(origins=stores, destinations=customers)
 """
 
-import requests
+import hashlib
+import re
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._cache import DiskCache, TTLCache
+from goliath.integrations._pagination import prefetch_pages
 
 _API_BASE = "https://maps.googleapis.com/maps/api"
-
-
-class GoogleMapsClient:
+_ENDPOINTS = (
+    "/geocode/json",
+    "/place/nearbysearch/json",
+    "/place/textsearch/json",
+    "/place/details/json",
+    "/place/autocomplete/json",
+    "/directions/json",
+    "/distancematrix/json",
+)
+
+# Google Maps Platform terms allow caching responses for at most 30 days.
+_CACHE_TTL = 30 * 24 * 60 * 60
+_MEMORY_TTL = 60 * 60
+# Request header to send on revalidation -> response header it echoes.
+_VALIDATORS = (("If-None-Match", "ETag"), ("If-Modified-Since", "Last-Modified"))
+_CACHEABLE_STATUSES = frozenset({"OK", "ZERO_RESULTS"})
+
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 1.0
+
+# Words dropped when normalize_queries folds text_search queries together.
+_QUERY_FILLER = frozenset(
+    {"a", "an", "the", "in", "at", "on", "of", "for", "near", "around", "me"}
+)
+_QUERY_TOKEN = re.compile(r"\w+")
+
+# A next_page_token only becomes valid a couple of seconds after it is
+# issued; earlier requests fail with INVALID_REQUEST.
+_PAGE_TOKEN_DELAY = 2.0
+_PAGE_TOKEN_RETRIES = 3
+
+# Distance Matrix per-request limits: 25 origins, 25 destinations and
+# 100 elements (origins x destinations).
+_MATRIX_MAX_SIDE = 25
+_MATRIX_MAX_ELEMENTS = 100
+
+
+class GoogleMapsClient(_http.SharedSessionClient):
     """Google Maps Platform client for geocoding, places, and directions."""
 
-    def __init__(self):
+    def __init__(self, cache: bool = True, normalize_queries: bool = False):
         if not config.GOOGLE_MAPS_API_KEY:
             raise RuntimeError(
                 "GOOGLE_MAPS_API_KEY is not set. "
@@ -74,7 +135,23 @@ class GoogleMapsClient:
             )
 
         self.api_key = config.GOOGLE_MAPS_API_KEY
-        self.session = requests.Session()
+        self.session = _http.shared_session()
+        # Endpoint URLs with the API key already encoded, so each request
+        # only urlencodes its own parameters.
+        key_query = urlencode({"key": self.api_key})
+        self._urls = {path: f"{_API_BASE}{path}?{key_query}" for path in _ENDPOINTS}
+        self._normalize_queries = normalize_queries
+        self._memory = TTLCache(maxsize=4096, ttl=_MEMORY_TTL) if cache else None
+        self._cache = (
+            DiskCache(config.GOOGLE_MAPS_CACHE_PATH, ttl=_CACHE_TTL)
+            if cache and config.GOOGLE_MAPS_CACHE_PATH
+            else None
+        )
+
+    def close(self) -> None:
+        """Close the on-disk response cache."""
+        if self._cache is not None:
+            self._cache.close()
 
     # -- Geocoding ---------------------------------------------------------
 
@@ -89,7 +166,7 @@ class GoogleMapsClient:
         """
         data = self._get(
             "/geocode/json",
-            params={"address": address, "key": self.api_key},
+            params={"address": address},
         )
         return data.get("results", [])
 
@@ -105,7 +182,7 @@ class GoogleMapsClient:
         """
         data = self._get(
             "/geocode/json",
-            params={"latlng": f"{lat},{lng}", "key": self.api_key},
+            params={"latlng": f"{lat},{lng}"},
         )
         return data.get("results", [])
 
@@ -136,7 +213,6 @@ class GoogleMapsClient:
         params: dict = {
             "location": f"{lat},{lng}",
             "radius": radius,
-            "key": self.api_key,
         }
         if keyword:
             params["keyword"] = keyword
@@ -156,10 +232,39 @@ class GoogleMapsClient:
         Returns:
             Dict with "results" list.
         """
-        params: dict = {"query": query, "key": self.api_key}
+        params: dict = {"query": query}
         if page_token:
             params["pagetoken"] = page_token
-        return self._get("/place/textsearch/json", params=params)
+        cache_params = (
+            {**params, "query": _normalize_query(query)}
+            if self._normalize_queries
+            else None
+        )
+        return self._get("/place/textsearch/json", params, cache_params)
+
+    def iter_nearby(
+        self,
+        lat: float,
+        lng: float,
+        radius: int = 1500,
+        keyword: str | None = None,
+        type: str | None = None,
+    ) -> Iterator[dict]:
+        """Yield every nearby_search result across all pages (up to 60).
+
+        Each next page is requested in the background as soon as its token
+        becomes valid, while the caller is still consuming the current one.
+        """
+        return self._iter_pages(
+            lambda token: self.nearby_search(lat, lng, radius, keyword, type, token)
+        )
+
+    def iter_text_search(self, query: str) -> Iterator[dict]:
+        """Yield every text_search result across all pages (up to 60).
+
+        Pages are prefetched as in iter_nearby.
+        """
+        return self._iter_pages(lambda token: self.text_search(query, token))
 
     def place_details(self, place_id: str, fields: str | None = None) -> dict:
         """Get detailed information about a place.
@@ -171,7 +276,7 @@ class GoogleMapsClient:
         Returns:
             Place detail dict.
         """
-        params: dict = {"place_id": place_id, "key": self.api_key}
+        params: dict = {"place_id": place_id}
         if fields:
             params["fields"] = fields
         data = self._get("/place/details/json", params=params)
@@ -187,7 +292,7 @@ class GoogleMapsClient:
         Returns:
             List of prediction dicts.
         """
-        params: dict = {"input": input_text, "key": self.api_key}
+        params: dict = {"input": input_text}
         if types:
             params["types"] = types
         data = self._get("/place/autocomplete/json", params=params)
@@ -220,7 +325,6 @@ class GoogleMapsClient:
             "destination": destination,
             "mode": mode,
             "alternatives": str(alternatives).lower(),
-            "key": self.api_key,
         }
         if waypoints:
             params["waypoints"] = "|".join(waypoints)
@@ -251,13 +355,175 @@ class GoogleMapsClient:
                 "origins": "|".join(origins),
                 "destinations": "|".join(destinations),
                 "mode": mode,
-                "key": self.api_key,
             },
         )
 
+    def distance_matrix_bulk(
+        self,
+        origins: list[str],
+        destinations: list[str],
+        mode: str = "driving",
+        workers: int = 8,
+    ) -> dict:
+        """Distance matrix of any size, split into concurrent sub-requests.
+
+        The matrix is tiled into blocks within the per-request limits,
+        the blocks are fetched in parallel, and their rows are stitched
+        back together in input order. The result has the same shape as
+        distance_matrix; ``status`` is the first non-OK block status, if any.
+        Cells a block did not return are filled with ``{"status": ...}``
+        (the block's status, or UNKNOWN_ERROR for a short OK block), so
+        every element stays in its destination's column.
+
+        Args:
+            origins:      List of origin addresses.
+            destinations: List of destination addresses.
+            mode:         Travel mode.
+            workers:      Maximum concurrent requests.
+
+        Returns:
+            Matrix dict with one row per origin and one element per destination.
+        """
+        rows_per = min(_MATRIX_MAX_SIDE, len(origins)) or 1
+        cols_per = min(_MATRIX_MAX_SIDE, _MATRIX_MAX_ELEMENTS // rows_per)
+        blocks = [
+            (i, j)
+            for i in range(0, len(origins), rows_per)
+            for j in range(0, len(destinations), cols_per)
+        ]
+
+        def fetch(block: tuple[int, int]) -> dict:
+            i, j = block
+            return self.distance_matrix(
+                origins[i : i + rows_per], destinations[j : j + cols_per], mode
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(blocks)))) as pool:
+            results = list(pool.map(fetch, blocks))
+
+        rows: list[dict] = [{"elements": [None] * len(destinations)} for _ in origins]
+        origin_addresses: list = [None] * len(origins)
+        destination_addresses: list = [None] * len(destinations)
+        status = "OK"
+        for (i, j), data in zip(blocks, results):
+            block_status = data.get("status", "OK")
+            if block_status != "OK" and status == "OK":
+                status = block_status
+            missing = block_status if block_status != "OK" else "UNKNOWN_ERROR"
+            block_rows = data.get("rows", [])
+            for r in range(min(rows_per, len(origins) - i)):
+                got = block_rows[r].get("elements", []) if r < len(block_rows) else []
+                cells = rows[i + r]["elements"]
+                for c in range(min(cols_per, len(destinations) - j)):
+                    cells[j + c] = got[c] if c < len(got) else {"status": missing}
+            for offset, address in enumerate(data.get("origin_addresses", [])):
+                origin_addresses[i + offset] = address
+            for offset, address in enumerate(data.get("destination_addresses", [])):
+                destination_addresses[j + offset] = address
+        return {
+            "status": status,
+            "origin_addresses": origin_addresses,
+            "destination_addresses": destination_addresses,
+            "rows": rows,
+        }
+
     # -- internal helpers --------------------------------------------------
 
-    def _get(self, path: str, **kwargs) -> dict:
-        resp = self.session.get(f"{_API_BASE}{path}", **kwargs)
-        resp.raise_for_status()
-        return resp.json()
+    def _get(self, path: str, params: dict, cache_params: dict | None = None) -> dict:
+        """Fetch through the memory and disk caches.
+
+        ``cache_params`` replaces ``params`` when computing the cache key,
+        letting equivalent requests share one entry.
+        """
+        if self._memory is None or "pagetoken" in params:
+            return self._fetch(path, params)[0]
+
+        # Each method fills its params in a fixed order, so the items tuple
+        # is already canonical; only the disk tier needs a hashed string.
+        key = (path, *(cache_params or params).items())
+        data = self._memory.get(key)
+        if data is not None:
+            return data
+        disk_key = self._disk_key(key) if self._cache is not None else None
+        entry = self._cache.get_entry(disk_key) if disk_key is not None else None
+        if entry is not None and entry[1]:
+            data = entry[0]["data"]
+        else:
+            # An expired disk entry is revalidated with its ETag/Last-Modified;
+            # a 304 re-arms it without transferring or parsing a body.
+            validators = entry[0]["validators"] if entry is not None else {}
+            data, validators = self._fetch(path, params, validators)
+            if data is None:
+                data = entry[0]["data"]
+            # Only keep answers worth repeating: not quota/denied errors,
+            # and not first pages whose next_page_token will expire.
+            elif (
+                data.get("status") not in _CACHEABLE_STATUSES
+                or "next_page_token" in data
+            ):
+                return data
+            if disk_key is not None:
+                self._cache.set(disk_key, {"data": data, "validators": validators})
+        self._memory.set(key, data)
+        return data
+
+    def _iter_pages(self, search: Callable[[str | None], dict]) -> Iterator[dict]:
+        def fetch(cursor: tuple[str | None, float]) -> tuple[list, tuple | None]:
+            token, issued = cursor
+            if token is None:
+                data = search(None)
+            else:
+                time.sleep(max(0.0, _PAGE_TOKEN_DELAY - (time.monotonic() - issued)))
+                for _ in range(_PAGE_TOKEN_RETRIES):
+                    data = search(token)
+                    if data.get("status") != "INVALID_REQUEST":
+                        break
+                    time.sleep(_PAGE_TOKEN_DELAY / 2)
+            next_token = data.get("next_page_token")
+            next_cursor = (next_token, time.monotonic()) if next_token else None
+            return data.get("results", []), next_cursor
+
+        return prefetch_pages(fetch, (None, 0.0))
+
+    def _fetch(
+        self, path: str, params: dict, validators: dict | None = None
+    ) -> tuple[dict | None, dict]:
+        """GET an endpoint, optionally as a conditional request.
+
+        Returns ``(data, validators)``: ``data`` is None on 304 Not
+        Modified, and ``validators`` holds the conditional headers to send
+        when revalidating this response later.
+        """
+        # HTTP-level 429/5xx are retried by the pooled adapter; the API also
+        # reports short-term throttling as a 200 with OVER_QUERY_LIMIT.
+        for attempt in range(_RETRY_ATTEMPTS):
+            resp = self.session.get(
+                self._urls[path], params=params, headers=validators or None
+            )
+            resp.raise_for_status()
+            fresh = {
+                header: resp.headers[source]
+                for header, source in _VALIDATORS
+                if resp.headers.get(source)
+            }
+            if resp.status_code == 304:
+                return None, fresh or validators or {}
+            data = _http.loads(resp.content)
+            if data.get("status") != "OVER_QUERY_LIMIT":
+                break
+            if attempt < _RETRY_ATTEMPTS - 1:
+                time.sleep(_http.backoff_delay(attempt, _RETRY_BACKOFF))
+        return data, fresh
+
+    @staticmethod
+    def _disk_key(key: tuple) -> str:
+        """Hash a memory-cache key for SQLite; the API key is never part of it."""
+        return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+def _normalize_query(query: str) -> str:
+    """Fold case, punctuation, filler words and word order out of a query."""
+    words = {
+        w for w in _QUERY_TOKEN.findall(query.casefold()) if w not in _QUERY_FILLER
+    }
+    return " ".join(sorted(words))
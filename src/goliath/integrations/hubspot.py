@@ -43,18 +43,46 @@ Usage:
 
     # List companies
     companies = hs.list_companies(limit=10)
+
+    # Batch endpoints: 100 records per request
+    created = hs.batch_create_contacts([{"email": e} for e in emails])
+    hs.batch_update_deals({deal_id: {"dealstage": "closedwon"}, ...})
+
+    # Run many single-object calls with adaptive concurrency
+    created = hs.bulk(hs.create_contact, [{"email": e} for e in emails])
+    hs.bulk(hs.update_contact, [(contact_id, {"lifecyclestage": "lead"}), ...])
 """
 
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._ratelimit import AdaptiveConcurrency, TokenBucket
 
 _API_BASE = "https://api.hubapi.com/crm/v3"
+_API_HOST = "https://api.hubapi.com/"
+
+_BATCH_SIZE = 100
+_RETRY_ATTEMPTS = 5
+_RETRY_BACKOFF = 1.0
+
+# Marks threads currently running a call inside a bulk() slot.
+_in_bulk_slot = threading.local()
 
 
-class HubSpotClient:
+class HubSpotClient(_http.SharedSessionClient):
     """HubSpot CRM API v3 client for contacts, deals, and companies."""
 
+    # 100 requests/10 seconds per private app; shared by all instances.
+    _bucket = TokenBucket(rate=100, per=10.0)
+    # Bulk calls widen concurrency until HubSpot answers 429 or slows down.
+    _concurrency = AdaptiveConcurrency(initial=4, max_limit=32)
+
     def __init__(self):
         if not config.HUBSPOT_ACCESS_TOKEN:
             raise RuntimeError(
@@ -63,13 +91,15 @@ class HubSpotClient:
                 "See integrations/hubspot.py for setup instructions."
             )
 
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {config.HUBSPOT_ACCESS_TOKEN}",
-                "Content-Type": "application/json",
-            }
-        )
+        self.session = _http.shared_session()
+        # _send retries 429s itself, through the token bucket and the
+        # adaptive window; the shared adapter retrying them as well would
+        # multiply the attempts and bypass both.
+        if _API_HOST not in self.session.adapters:
+            _http.mount_pooled_adapter(
+                self.session, prefix=_API_HOST, retry_statuses=(500, 502, 503, 504)
+            )
+        self._headers = {"Authorization": f"Bearer {config.HUBSPOT_ACCESS_TOKEN}"}
 
     # -- Contacts ----------------------------------------------------------
 
@@ -146,14 +176,64 @@ class HubSpotClient:
         }
         return self._post("/objects/contacts/search", json=body).get("results", [])
 
+    def search_contacts_bulk(
+        self, emails: list[str], properties: list[str] | None = None
+    ) -> dict[str, dict]:
+        """Look up many contacts by email with one search request per 100.
+
+        Each request uses a single ``email IN (...)`` filter, so N lookups
+        cost ceil(N/100) requests instead of N. Chunks are sent concurrently
+        through bulk().
+
+        Args:
+            emails:     Email addresses to look up (matched case-insensitively).
+            properties: Optional property names to include; ``email`` is
+                        always added.
+
+        Returns:
+            Mapping of lowercased email to contact dict, for emails found.
+        """
+        wanted = sorted({e.strip().lower() for e in emails if e.strip()})
+        props = sorted({"email", *(properties or [])})
+        chunks = [
+            wanted[i : i + _BATCH_SIZE] for i in range(0, len(wanted), _BATCH_SIZE)
+        ]
+
+        def search(chunk: list[str]) -> list[dict]:
+            email_in = {"propertyName": "email", "operator": "IN", "values": chunk}
+            body = {
+                "filterGroups": [{"filters": [email_in]}],
+                "properties": props,
+                "limit": _BATCH_SIZE,
+            }
+            results: list[dict] = []
+            after = None
+            while True:
+                page = self._post(
+                    "/objects/contacts/search",
+                    json={**body, "after": after} if after else body,
+                )
+                results.extend(page.get("results", []))
+                after = page.get("paging", {}).get("next", {}).get("after")
+                if not after:
+                    return results
+
+        pages = self.bulk(search, chunks) if len(chunks) > 1 else map(search, chunks)
+        found: dict[str, dict] = {}
+        for page in pages:
+            for contact in page:
+                email = (contact.get("properties", {}).get("email") or "").lower()
+                found.setdefault(email, contact)
+        found.pop("", None)
+        return found
+
     def delete_contact(self, contact_id: str) -> None:
         """Delete a contact.
 
         Args:
             contact_id: HubSpot contact ID.
         """
-        resp = self.session.delete(f"{_API_BASE}/objects/contacts/{contact_id}")
-        resp.raise_for_status()
+        self._send("delete", f"/objects/contacts/{contact_id}")
 
     # -- Deals -------------------------------------------------------------
 
@@ -239,19 +319,225 @@ class HubSpotClient:
             "results", []
         )
 
+    # -- Batch -------------------------------------------------------------
+
+    def batch_create(self, object_type: str, records: list[dict]) -> list[dict]:
+        """Create many CRM objects via ``/objects/{type}/batch/create``.
+
+        Records are sent 100 per request, with the requests themselves
+        issued concurrently under the same adaptive limit as bulk().
+
+        Args:
+            object_type: "contacts", "deals", "companies", etc.
+            records:     Property dicts, one per object to create.
+
+        Returns:
+            Created resource dicts (HubSpot does not guarantee input order).
+        """
+        inputs = [{"properties": props} for props in records]
+        return self._batch(object_type, "create", inputs)
+
+    def batch_update(self, object_type: str, updates: dict[str, dict]) -> list[dict]:
+        """Update many CRM objects via ``/objects/{type}/batch/update``.
+
+        Args:
+            object_type: "contacts", "deals", "companies", etc.
+            updates:     Mapping of object ID to properties to update.
+
+        Returns:
+            Updated resource dicts.
+        """
+        inputs = [{"id": oid, "properties": props} for oid, props in updates.items()]
+        return self._batch(object_type, "update", inputs)
+
+    def batch_read(
+        self,
+        object_type: str,
+        ids: list[str],
+        properties: list[str] | None = None,
+    ) -> list[dict]:
+        """Read many CRM objects via ``/objects/{type}/batch/read``.
+
+        Args:
+            object_type: "contacts", "deals", "companies", etc.
+            ids:         Object IDs to fetch.
+            properties:  Optional property names to include.
+
+        Returns:
+            Resource dicts for the IDs that exist.
+        """
+        extra = {"properties": properties} if properties else {}
+        return self._batch(object_type, "read", [{"id": oid} for oid in ids], extra)
+
+    def batch_delete(self, object_type: str, ids: list[str]) -> None:
+        """Archive many CRM objects via ``/objects/{type}/batch/archive``.
+
+        Args:
+            object_type: "contacts", "deals", "companies", etc.
+            ids:         Object IDs to archive.
+        """
+        self._batch(object_type, "archive", [{"id": oid} for oid in ids])
+
+    def batch_create_contacts(self, records: list[dict]) -> list[dict]:
+        """Create many contacts. See batch_create."""
+        return self.batch_create("contacts", records)
+
+    def batch_update_contacts(self, updates: dict[str, dict]) -> list[dict]:
+        """Update many contacts. See batch_update."""
+        return self.batch_update("contacts", updates)
+
+    def batch_read_contacts(
+        self, ids: list[str], properties: list[str] | None = None
+    ) -> list[dict]:
+        """Read many contacts. See batch_read."""
+        return self.batch_read("contacts", ids, properties)
+
+    def batch_delete_contacts(self, ids: list[str]) -> None:
+        """Archive many contacts. See batch_delete."""
+        self.batch_delete("contacts", ids)
+
+    def batch_create_deals(self, records: list[dict]) -> list[dict]:
+        """Create many deals. See batch_create."""
+        return self.batch_create("deals", records)
+
+    def batch_update_deals(self, updates: dict[str, dict]) -> list[dict]:
+        """Update many deals. See batch_update."""
+        return self.batch_update("deals", updates)
+
+    def batch_read_deals(
+        self, ids: list[str], properties: list[str] | None = None
+    ) -> list[dict]:
+        """Read many deals. See batch_read."""
+        return self.batch_read("deals", ids, properties)
+
+    def batch_delete_deals(self, ids: list[str]) -> None:
+        """Archive many deals. See batch_delete."""
+        self.batch_delete("deals", ids)
+
+    def batch_create_companies(self, records: list[dict]) -> list[dict]:
+        """Create many companies. See batch_create."""
+        return self.batch_create("companies", records)
+
+    def batch_update_companies(self, updates: dict[str, dict]) -> list[dict]:
+        """Update many companies. See batch_update."""
+        return self.batch_update("companies", updates)
+
+    def batch_read_companies(
+        self, ids: list[str], properties: list[str] | None = None
+    ) -> list[dict]:
+        """Read many companies. See batch_read."""
+        return self.batch_read("companies", ids, properties)
+
+    def batch_delete_companies(self, ids: list[str]) -> None:
+        """Archive many companies. See batch_delete."""
+        self.batch_delete("companies", ids)
+
+    # -- Bulk --------------------------------------------------------------
+
+    def bulk(self, method: Callable, items: Iterable, max_workers: int = 32) -> list:
+        """Call a single-object method once per item, concurrently.
+
+        Concurrency starts small and grows additively while responses stay
+        fast, halving whenever HubSpot answers 429 (client methods retry
+        those requests themselves, honouring Retry-After). Requests also
+        draw from the client's 100-per-10-seconds token bucket.
+
+        A bulk() reached from a call already running inside a bulk slot
+        (e.g. ``bulk(hs.batch_create_contacts, ...)`` with more than 100
+        records per call) runs its items in that slot, one after another;
+        waiting on fresh slots there could deadlock the outer bulk().
+
+        Args:
+            method:      Bound client method, e.g. ``hs.create_contact``.
+            items:       Per-call arguments; tuples are unpacked as
+                         positional arguments, anything else is passed as
+                         the single argument.
+            max_workers: Upper bound on threads issuing requests.
+
+        Returns:
+            Results in the same order as ``items``.
+        """
+        nested = getattr(_in_bulk_slot, "held", False)
+
+        def call(item):
+            args = item if isinstance(item, tuple) else (item,)
+            return method(*args) if nested else self._call_adaptive(method, args)
+
+        if nested:
+            return [call(item) for item in items]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(call, items))
+
     # -- internal helpers --------------------------------------------------
 
-    def _get(self, path: str, **kwargs) -> dict:
-        resp = self.session.get(f"{_API_BASE}{path}", **kwargs)
+    def _batch(
+        self, object_type: str, op: str, inputs: list[dict], extra: dict | None = None
+    ) -> list[dict]:
+        """POST ``inputs`` to a batch endpoint in chunks of 100."""
+        path = f"/objects/{object_type}/batch/{op}"
+
+        def send(chunk: list[dict]) -> list[dict]:
+            resp = self._send("post", path, json={"inputs": chunk, **(extra or {})})
+            # archive answers 204 No Content.
+            return _http.loads(resp.content).get("results", []) if resp.content else []
+
+        chunks = [
+            inputs[i : i + _BATCH_SIZE] for i in range(0, len(inputs), _BATCH_SIZE)
+        ]
+        if len(chunks) == 1:
+            return send(chunks[0])
+        return [record for page in self.bulk(send, chunks) for record in page]
+
+    def _call_adaptive(self, method: Callable, args: tuple):
+        """Run one bulk call under the adaptive limit."""
+        started = self._concurrency.acquire()
+        _in_bulk_slot.held = True
+        try:
+            result = method(*args)
+        except requests.HTTPError as e:
+            throttled = e.response is not None and e.response.status_code == 429
+            self._concurrency.release(started, overloaded=throttled)
+            raise
+        except BaseException:
+            self._concurrency.release(started)
+            raise
+        finally:
+            _in_bulk_slot.held = False
+        self._concurrency.release(started)
+        return result
+
+    def _with_auth(self, kwargs: dict) -> dict:
+        """Merge the auth header into a request's own headers."""
+        kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+        return kwargs
+
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a request, retrying 429s with Retry-After or jittered backoff.
+
+        A 429 means HubSpot rejected the request unprocessed, so even
+        POST/PATCH are safe to replay. Each one also narrows the bulk
+        concurrency window.
+        """
+        url = f"{_API_BASE}{path}"
+        for attempt in range(_RETRY_ATTEMPTS):
+            self._bucket.acquire()
+            resp = getattr(self.session, method)(url, **self._with_auth(kwargs))
+            if resp.status_code != 429 or attempt == _RETRY_ATTEMPTS - 1:
+                break
+            self._concurrency.backoff()
+            time.sleep(
+                _http.backoff_delay(
+                    attempt, _RETRY_BACKOFF, resp.headers.get("Retry-After")
+                )
+            )
         resp.raise_for_status()
-        return resp.json()
+        return resp
+
+    def _get(self, path: str, **kwargs) -> dict:
+        return _http.loads(self._send("get", path, **kwargs).content)
 
     def _post(self, path: str, **kwargs) -> dict:
-        resp = self.session.post(f"{_API_BASE}{path}", **kwargs)
-        resp.raise_for_status()
-        return resp.json()
+        return _http.loads(self._send("post", path, **kwargs).content)
 
     def _patch(self, path: str, **kwargs) -> dict:
-        resp = self.session.patch(f"{_API_BASE}{path}", **kwargs)
-        resp.raise_for_status()
-        return resp.json()
+        return _http.loads(self._send("patch", path, **kwargs).content)
@@ -29,6 +29,9 @@ Usage:
     # Generate and save to disk
     path = ig.generate_and_save("A cat wearing a top hat", "cat.png")
 
+    # Generate several and download them all concurrently (dall-e-2 only)
+    paths = ig.generate_and_save_all("Abstract art", "out/", n=4, model="dall-e-2")
+
     # Generate with specific options
     result = ig.generate(
         "Mountain landscape",
@@ -51,15 +54,25 @@ Usage:
     result = ig.variation("photo.png")
 """
 
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 
-import requests
 from openai import OpenAI
 
 from goliath import config
+from goliath.integrations import _http
+
+_VALID_SIZES_DALLE3 = frozenset({"1024x1024", "1792x1024", "1024x1792"})
+_VALID_SIZES_DALLE2 = frozenset({"256x256", "512x512", "1024x1024"})
+_VALID_SIZES = {"dall-e-3": _VALID_SIZES_DALLE3, "dall-e-2": _VALID_SIZES_DALLE2}
+_MAX_IMAGES = {"dall-e-3": 1, "dall-e-2": 10}
+# Only dall-e-3 accepts quality and style; they are not sent for dall-e-2.
+_VALID_QUALITIES_DALLE3 = frozenset({"standard", "hd"})
+_VALID_STYLES_DALLE3 = frozenset({"vivid", "natural"})
 
-_VALID_SIZES_DALLE3 = {"1024x1024", "1792x1024", "1024x1792"}
-_VALID_SIZES_DALLE2 = {"256x256", "512x512", "1024x1024"}
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 
 class ImageGenClient:
@@ -103,6 +116,7 @@ class ImageGenClient:
             or list of dicts when n > 1.
         """
         model = model or self.default_model
+        _check_request(model, size, n, quality, style)
 
         kwargs: dict = {
             "model": model,
@@ -146,6 +160,37 @@ class ImageGenClient:
         url = result["url"] if isinstance(result, dict) else result[0]["url"]
         return self._download(url, save_path)
 
+    def generate_and_save_all(
+        self,
+        prompt: str,
+        save_dir: str,
+        n: int = 2,
+        *,
+        prefix: str = "image",
+        **kwargs,
+    ) -> list[Path]:
+        """Generate ``n`` images and download them all in parallel.
+
+        Files are named ``{prefix}_0.png``, ``{prefix}_1.png``, ... inside
+        ``save_dir``, so the total time is roughly the slowest single
+        download rather than the sum of all of them.
+
+        Args:
+            prompt:   Text description of the desired image.
+            save_dir: Directory to save the images into.
+            n:        Number of images (dall-e-3 only supports 1).
+            prefix:   File name prefix.
+            **kwargs: Additional arguments passed to generate().
+
+        Returns:
+            Paths of the saved files, in generation order.
+        """
+        result = self.generate(prompt, n=n, **kwargs)
+        urls = [r["url"] for r in ([result] if isinstance(result, dict) else result)]
+        paths = [str(Path(save_dir) / f"{prefix}_{i}.png") for i in range(len(urls))]
+        with ThreadPoolExecutor(max_workers=max(1, len(urls))) as pool:
+            return list(pool.map(self._download, urls, paths))
+
     def edit(
         self,
         image: str,
@@ -166,34 +211,27 @@ class ImageGenClient:
         Returns:
             Single dict with "url" key when n=1, or list of dicts when n > 1.
         """
+        _check_request("dall-e-2", size, n)
         image_path = Path(image)
         if not image_path.exists():
             raise FileNotFoundError(f"Image not found: {image}")
 
-        image_file = open(image_path, "rb")
-        mask_file = None
-        try:
+        mask_path = Path(mask) if mask else None
+        if mask_path is not None and not mask_path.exists():
+            raise FileNotFoundError(f"Mask not found: {mask}")
+
+        with ExitStack() as stack:
             kwargs: dict = {
                 "model": "dall-e-2",
-                "image": image_file,
+                "image": stack.enter_context(open(image_path, "rb")),
                 "prompt": prompt,
                 "n": n,
                 "size": size,
             }
-
-            if mask:
-                mask_path = Path(mask)
-                if not mask_path.exists():
-                    image_file.close()
-                    raise FileNotFoundError(f"Mask not found: {mask}")
-                mask_file = open(mask_path, "rb")
-                kwargs["mask"] = mask_file
+            if mask_path is not None:
+                kwargs["mask"] = stack.enter_context(open(mask_path, "rb"))
 
             response = self.client.images.edit(**kwargs)
-        finally:
-            image_file.close()
-            if mask_file:
-                mask_file.close()
 
         results = [{"url": img.url} for img in response.data]
         return results[0] if n == 1 else results
@@ -214,6 +252,7 @@ class ImageGenClient:
         Returns:
             Single dict with "url" key when n=1, or list of dicts when n > 1.
         """
+        _check_request("dall-e-2", size, n)
         image_path = Path(image)
         if not image_path.exists():
             raise FileNotFoundError(f"Image not found: {image}")
@@ -232,14 +271,55 @@ class ImageGenClient:
     # -- internal helpers --------------------------------------------------
 
     def _download(self, url: str, save_path: str) -> Path:
-        """Download an image from a URL to a local file."""
-        resp = requests.get(url, timeout=120)
-        resp.raise_for_status()
+        """Stream an image from a URL to a local file in 64 KB chunks.
 
-        path = Path(save_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        Uses the shared pooled session, so consecutive downloads from the
+        same CDN host reuse one keep-alive connection.
+        """
+        with _http.shared_session().get(url, timeout=120, stream=True) as resp:
+            resp.raise_for_status()
+
+            path = Path(save_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "wb") as f:
-            f.write(resp.content)
+            # Copy from the connection's file object straight into the file,
+            # skipping the iter_content generator layer; urllib3 still
+            # decodes any Content-Encoding the CDN applied.
+            resp.raw.decode_content = True
+            with open(path, "wb") as f:
+                shutil.copyfileobj(resp.raw, f, _DOWNLOAD_CHUNK_SIZE)
 
         return path
+
+
+def _check_request(
+    model: str,
+    size: str,
+    n: int,
+    quality: str | None = None,
+    style: str | None = None,
+) -> None:
+    """Reject arguments the model does not support before making a request.
+
+    Models other than dall-e-2 and dall-e-3 are passed through unchecked.
+    """
+    _check_choice(model, "size", size, _VALID_SIZES.get(model))
+    max_images = _MAX_IMAGES.get(model)
+    if max_images is not None and not 1 <= n <= max_images:
+        raise ValueError(
+            f"Invalid n {n} for {model}. Must be between 1 and {max_images}."
+        )
+    if model == "dall-e-3":
+        _check_choice(model, "quality", quality, _VALID_QUALITIES_DALLE3)
+        _check_choice(model, "style", style, _VALID_STYLES_DALLE3)
+
+
+def _check_choice(
+    model: str, name: str, value: str | None, valid: frozenset | None
+) -> None:
+    """Raise ValueError unless ``value`` is one of ``valid`` (None: any)."""
+    if valid is not None and value not in valid:
+        raise ValueError(
+            f"Invalid {name} {value!r} for {model}. "
+            f"Choose one of: {', '.join(sorted(valid))}."
+        )
@@ -42,6 +42,8 @@ IMPORTANT NOTES
   public hosting.
 - Containers expire after 24 hours if not published.
 - Rate limit: 25 published posts per 24-hour rolling window per account.
+  Graph API calls are paced to ~200/hour and slowed further as the
+  X-App-Usage / X-Business-Use-Case-Usage headers approach 100%.
 - Videos/Reels require processing time — the client polls automatically.
 - For production use, your app must pass Meta's App Review for the
   content_publish permission.
@@ -66,22 +68,132 @@ Usage:
         ],
         caption="Swipe through!",
     )
+
+    # Post several carousels, fanning out every network step across all of them
+    ig.post_carousels([
+        {"items": [{"image_url": a1}, {"image_url": a2}], "caption": "Album A"},
+        {"items": [{"image_url": b1}, {"video_url": b2}], "caption": "Album B"},
+    ])
+
+    # From a webhook handler or job consumer: wake a pending publish early
+    InstagramClient.notify_container(container_id)
 """
 
+import threading
 import time
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._ratelimit import TokenBucket
 
 _API_VERSION = "v21.0"
 _BASE_URL = f"https://graph.facebook.com/{_API_VERSION}"
 
 
-class InstagramClient:
-    """Instagram Graph API client for publishing photos, videos, and carousels."""
+@dataclass(frozen=True)
+class _PollSchedule:
+    """Container status polling: first delay and ceiling (seconds), growth."""
+
+    initial: float
+    cap: float
+    factor: float = 2.0
+
+
+# Images are usually FINISHED within half a second; videos take 30s+.
+_IMAGE_POLL = _PollSchedule(initial=0.2, cap=2.0)
+_VIDEO_POLL = _PollSchedule(initial=2.0, cap=15.0)
+_DEFAULT_POLL = _PollSchedule(initial=0.5, cap=15.0)
+_VIDEO_MEDIA_TYPES = frozenset({"VIDEO", "REELS", "STORIES"})
+
+# Instagram rejects JPEGs larger than 8 MiB.
+_MAX_IMAGE_BYTES = 8 * 1024 * 1024
+
+# Only these answers to a media HEAD prove the URL is bad. Others, such as
+# the 403 an S3/GCS URL presigned for GET gives a HEAD, are inconclusive.
+_MISSING_MEDIA_STATUSES = (404, 410)
+# Object stores' defaults for untyped uploads; they say nothing either way.
+_GENERIC_CONTENT_TYPES = frozenset({"application/octet-stream", "binary/octet-stream"})
+
+
+class _ContainerSignals:
+    """Thread-safe wake-up events for in-progress container waits."""
 
     def __init__(self):
+        self._events: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def register(self, container_id: str) -> threading.Event:
+        with self._lock:
+            return self._events.setdefault(container_id, threading.Event())
+
+    def unregister(self, container_id: str) -> None:
+        with self._lock:
+            self._events.pop(container_id, None)
+
+    def notify(self, container_id: str) -> None:
+        with self._lock:
+            event = self._events.get(container_id)
+        if event is not None:
+            event.set()
+
+
+_signals = _ContainerSignals()
+
+
+def _graph_usage(headers) -> tuple[float, float] | None:
+    """Return (percent of quota used, seconds until it frees up), if reported.
+
+    Reads the X-App-Usage and X-Business-Use-Case-Usage headers Meta adds
+    to Graph API responses; malformed headers are ignored.
+    """
+    percent = None
+    regain_after = 0.0
+    try:
+        raw = headers.get("X-App-Usage")
+        if raw:
+            percent = max(_http.loads(raw).values())
+        raw = headers.get("X-Business-Use-Case-Usage")
+        if raw:
+            for entries in _http.loads(raw).values():
+                for entry in entries:
+                    percent = max(
+                        percent or 0,
+                        entry.get("call_count", 0),
+                        entry.get("total_time", 0),
+                        entry.get("total_cputime", 0),
+                    )
+                    regain_after = max(
+                        regain_after,
+                        60.0 * entry.get("estimated_time_to_regain_access", 0),
+                    )
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return None if percent is None else (float(percent), regain_after)
+
+
+def _poll_schedule(params: dict) -> _PollSchedule:
+    """Pick the polling schedule for a container from its create params."""
+    if params.get("media_type") in _VIDEO_MEDIA_TYPES:
+        return _VIDEO_POLL
+    return _IMAGE_POLL
+
+
+def _media_source(params: dict) -> tuple[str, str]:
+    """Return (url, "image" | "video") for a carousel child's params."""
+    if "image_url" in params:
+        return params["image_url"], "image"
+    return params["video_url"], "video"
+
+
+class InstagramClient(_http.SharedSessionClient):
+    """Instagram Graph API client for publishing photos, videos, and carousels."""
+
+    # ~200 Graph API calls/hour per user; shared by all instances.
+    _bucket = TokenBucket(rate=200, per=3600.0)
+
+    def __init__(self, validate_media: bool = True):
         if not config.INSTAGRAM_ACCESS_TOKEN:
             raise RuntimeError(
                 "INSTAGRAM_ACCESS_TOKEN is not set. "
@@ -96,6 +208,11 @@ class InstagramClient:
 
         self.user_id = config.INSTAGRAM_USER_ID
         self.token = config.INSTAGRAM_ACCESS_TOKEN
+        self.session = _http.shared_session()
+        self._headers = {"Authorization": f"Bearer {self.token}"}
+        self._media_url = f"{_BASE_URL}/{self.user_id}/media"
+        self._publish_url = f"{_BASE_URL}/{self.user_id}/media_publish"
+        self.validate_media = validate_media
 
     # -- public API --------------------------------------------------------
 
@@ -109,7 +226,9 @@ class InstagramClient:
         Returns:
             Dict with the published media ID.
         """
+        self._validate_media_url(image_url, "image")
         container_id = self._create_container(image_url=image_url, caption=caption)
+        self._wait_for_processing(container_id, schedule=_IMAGE_POLL)
         return self._publish(container_id)
 
     def post_video(
@@ -139,8 +258,11 @@ class InstagramClient:
         if cover_url:
             params["cover_url"] = cover_url
 
+        self._validate_media_url(video_url, "video")
+        if cover_url:
+            self._validate_media_url(cover_url, "image")
         container_id = self._create_container(**params)
-        self._wait_for_processing(container_id)
+        self._wait_for_processing(container_id, schedule=_VIDEO_POLL)
         return self._publish(container_id)
 
     def post_carousel(self, items: list[dict], caption: str = "") -> dict:
@@ -153,13 +275,123 @@ class InstagramClient:
         Returns:
             Dict with the published media ID.
         """
+        return self.post_carousels([{"items": items, "caption": caption}])[0]
+
+    def post_carousels(self, carousels: list[dict]) -> list[dict]:
+        """Publish several carousels, batching each step across all of them.
+
+        Every child container of every carousel is created in one
+        concurrent fan-out, then all are polled together, then the carousel
+        containers are created and published together. M carousels of N
+        items therefore take about four rounds of latency (plus the slowest
+        video) instead of M * N. All specs, and every media URL (with
+        concurrent HEAD requests), are validated before any container is
+        created; the first failure raises.
+
+        Args:
+            carousels: Dicts with "items" (as for post_carousel) and an
+                       optional "caption".
+
+        Returns:
+            Publish response dicts, in the same order as ``carousels``.
+        """
+        child_params = [self._carousel_child_params(c["items"]) for c in carousels]
+        flat = [params for group in child_params for params in group]
+
+        with ThreadPoolExecutor(max_workers=min(len(flat), 32) or 1) as pool:
+            sources = [_media_source(params) for params in flat]
+            list(pool.map(lambda src: self._validate_media_url(*src), sources))
+            flat_ids = list(
+                pool.map(lambda params: self._create_container(**params), flat)
+            )
+            # Videos take a while to process; images are usually done at once.
+            list(
+                pool.map(
+                    lambda cid, params: self._wait_for_processing(
+                        cid, schedule=_poll_schedule(params)
+                    ),
+                    flat_ids,
+                    flat,
+                )
+            )
+
+            carousel_params = []
+            offset = 0
+            for spec, group in zip(carousels, child_params):
+                child_ids = flat_ids[offset : offset + len(group)]
+                offset += len(group)
+                carousel_params.append(
+                    {
+                        "media_type": "CAROUSEL",
+                        "children": ",".join(child_ids),
+                        "caption": spec.get("caption", ""),
+                    }
+                )
+            carousel_ids = list(
+                pool.map(
+                    lambda params: self._create_container(**params), carousel_params
+                )
+            )
+            return list(pool.map(self._publish, carousel_ids))
+
+    @staticmethod
+    def notify_container(container_id: str) -> None:
+        """Wake any wait on ``container_id`` so it re-checks the status now.
+
+        Call this from whatever learns out of band that a container has
+        finished processing (a webhook handler, a job queue consumer),
+        so publishing does not sit out the rest of a poll interval.
+        Polling stays in place as the fallback, so a missed or early
+        notification only costs one extra status request.
+        """
+        _signals.notify(container_id)
+
+    # -- internal helpers --------------------------------------------------
+
+    def _validate_media_url(self, url: str, kind: str) -> None:
+        """Fail fast if a media URL is unreachable or not ``kind`` media.
+
+        Instagram fetches the media itself, so a bad URL otherwise only
+        surfaces as a container error, or for videos a poll timeout,
+        minutes later. Only definite problems fail: a 404/410, a specific
+        non-``kind`` Content-Type, or an oversized image. Other error
+        statuses (presigned URLs refusing HEAD, hosts without HEAD) and
+        generic binary types get the benefit of the doubt. No credentials
+        are sent to the media host.
+        """
+        if not self.validate_media:
+            return
+        resp = self.session.head(url, allow_redirects=True, timeout=5)
+        resp.close()
+        if resp.status_code in _MISSING_MEDIA_STATUSES:
+            raise ValueError(f"Media URL {url} returned HTTP {resp.status_code}.")
+        if not resp.ok:
+            return
+        content_type = resp.headers.get("Content-Type", "").split(";")[0].strip()
+        if (
+            content_type
+            and content_type.lower() not in _GENERIC_CONTENT_TYPES
+            and not content_type.startswith(f"{kind}/")
+        ):
+            raise ValueError(
+                f"Media URL {url} serves {content_type!r}, expected {kind}/*."
+            )
+        length = resp.headers.get("Content-Length")
+        if kind == "image" and length and int(length) > _MAX_IMAGE_BYTES:
+            raise ValueError(
+                f"Image at {url} is {int(length)} bytes; Instagram accepts at most "
+                f"{_MAX_IMAGE_BYTES}."
+            )
+
+    @staticmethod
+    def _carousel_child_params(items: list[dict]) -> list[dict]:
+        """Validate carousel items and build their container params."""
         if len(items) < 2:
             raise ValueError("Carousels require at least 2 items.")
         if len(items) > 10:
             raise ValueError("Carousels allow a maximum of 10 items.")
 
-        # Create individual item containers
-        child_ids = []
+        child_params = []
         for item in items:
             params = {"is_carousel_item": "true"}
             if "image_url" in item:
@@ -171,67 +403,88 @@ class InstagramClient:
                 raise ValueError(
                     "Each carousel item must have 'image_url' or 'video_url'."
                 )
-            child_ids.append(self._create_container(**params))
-
-        # Wait for any video items to finish processing
-        for child_id in child_ids:
-            self._wait_for_processing(child_id)
-
-        # Create the carousel container
-        carousel_id = self._create_container(
-            media_type="CAROUSEL",
-            children=",".join(child_ids),
-            caption=caption,
-        )
-        return self._publish(carousel_id)
-
-    # -- internal helpers --------------------------------------------------
+            child_params.append(params)
+        return child_params
+
+    def _send(self, method: str, url: str, **kwargs):
+        """Make an authenticated Graph API call through the shared bucket."""
+        self._bucket.acquire()
+        resp = getattr(self.session, method)(url, headers=self._headers, **kwargs)
+        usage = _graph_usage(resp.headers)
+        if usage is not None:
+            percent, regain_after = usage
+            remaining = self._bucket.rate * max(0.0, 100 - percent) / 100
+            self._bucket.observe(remaining, regain_after or None)
+        return resp
 
     def _create_container(self, **params) -> str:
         """Create a media container and return its ID."""
-        resp = requests.post(
-            f"{_BASE_URL}/{self.user_id}/media",
-            headers={"Authorization": f"Bearer {self.token}"},
-            data=params,
-        )
+        resp = self._send("post", self._media_url, data=params)
         resp.raise_for_status()
-        return resp.json()["id"]
+        return _http.loads(resp.content)["id"]
 
     def _publish(self, container_id: str) -> dict:
         """Publish a media container and return the response."""
-        resp = requests.post(
-            f"{_BASE_URL}/{self.user_id}/media_publish",
-            headers={"Authorization": f"Bearer {self.token}"},
-            data={"creation_id": container_id},
-        )
+        resp = self._send("post", self._publish_url, data={"creation_id": container_id})
         resp.raise_for_status()
-        return resp.json()
-
-    def _wait_for_processing(self, container_id: str, timeout: int = 300):
-        """Poll a container until processing is finished or timeout is reached."""
-        start = time.time()
-        while time.time() - start < timeout:
-            resp = requests.get(
-                f"{_BASE_URL}/{container_id}",
-                headers={"Authorization": f"Bearer {self.token}"},
-                params={"fields": "status_code"},
-            )
-            resp.raise_for_status()
-            status = resp.json().get("status_code")
-
-            if status == "FINISHED":
-                return
-            if status == "ERROR":
-                raise RuntimeError(
-                    f"Instagram media processing failed for container {container_id}."
-                )
-            if status == "EXPIRED":
-                raise RuntimeError(
-                    f"Instagram container {container_id} expired before publishing."
-                )
+        return _http.loads(resp.content)
 
-            # IN_PROGRESS or no status (image) — wait and retry
-            time.sleep(10)
+    def _wait_for_processing(
+        self,
+        container_id: str,
+        timeout: int = 300,
+        schedule: _PollSchedule = _DEFAULT_POLL,
+    ):
+        """Poll a container until processing is finished or timeout is reached.
+
+        Polls back off exponentially (with jitter) along ``schedule``:
+        images start at 0.2s and top out at 2s so they publish in well
+        under a second, while videos start at 2s and top out at 15s so
+        long encodes are not hammered. A 429 waits out Retry-After.
+        A notify_container() call for this container cuts the current
+        wait short and polls straight away.
+        """
+        url = f"{_BASE_URL}/{container_id}"
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        wake = _signals.register(container_id)
+        try:
+            while True:
+                resp = self._send("get", url, params={"fields": "status_code"})
+                retry_after = None
+                if resp.status_code == 429:
+                    retry_after = resp.headers.get("Retry-After") or str(schedule.cap)
+                else:
+                    resp.raise_for_status()
+                    status = _http.loads(resp.content).get("status_code")
+
+                    if status == "FINISHED":
+                        return
+                    if status == "ERROR":
+                        raise RuntimeError(
+                            "Instagram media processing failed for container "
+                            f"{container_id}."
+                        )
+                    if status == "EXPIRED":
+                        raise RuntimeError(
+                            f"Instagram container {container_id} expired "
+                            "before publishing."
+                        )
+
+                # IN_PROGRESS, no status (image) or throttled — back off and retry
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                delay = _http.backoff_delay(
+                    attempt, schedule.initial, retry_after, schedule.factor
+                )
+                if retry_after is None:
+                    delay = min(delay, schedule.cap)
+                if wake.wait(min(delay, remaining)):
+                    wake.clear()
+                attempt += 1
+        finally:
+            _signals.unregister(container_id)
 
         raise TimeoutError(
             f"Instagram media processing timed out after {timeout}s "
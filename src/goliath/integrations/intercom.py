@@ -20,7 +20,8 @@ IMPORTANT NOTES
 ===============
 - Authentication uses a Bearer token.
 - API docs: https://developers.intercom.com/docs/references/rest-api/api.intercom.io/
-- Rate limit: ~1000 requests per minute.
+- Rate limit: ~1000 requests per minute. The client paces itself to this and
+  follows the X-RateLimit-Remaining / X-RateLimit-Reset headers.
 - API version is set via the Intercom-Version header (this client uses 2.10).
 
 Usage:
@@ -47,6 +48,10 @@ Usage:
     # List conversations
     conversations = ic.list_conversations()
 
+    # Stream every contact across all pages
+    for contact in ic.iter_contacts():
+        print(contact["id"])
+
     # Reply to a conversation
     ic.reply_to_conversation(
         conversation_id="99887766",
@@ -56,18 +61,36 @@ Usage:
 
     # Create a note on a contact
     ic.create_note(contact_id="6001abcd", admin_id="12345", body="VIP customer.")
+
+    # --- Async (concurrent bulk operations) ---
+    from goliath.integrations.intercom import AsyncIntercomClient
+
+    async with AsyncIntercomClient() as aic:
+        contacts = await aic.get_contacts(["6001abcd", "6001abce"])
+        await aic.tag_contacts_bulk(["6001abcd", "6001abce"], tag_id="42")
 """
 
+import asyncio
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 import requests
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._pagination import prefetch_pages
+from goliath.integrations._ratelimit import TokenBucket
 
 _API_BASE = "https://api.intercom.io"
 _API_VERSION = "2.10"
+_RETRY_ATTEMPTS = 5
+_RETRY_BACKOFF = 0.25
 
 
-class IntercomClient:
-    """Intercom REST API client for contacts, conversations, and messaging."""
+class _IntercomBase:
+    """Token check and default headers shared by both clients."""
 
     def __init__(self):
         if not config.INTERCOM_ACCESS_TOKEN:
@@ -76,14 +99,23 @@ class IntercomClient:
                 "Add it to .env or export as an environment variable. "
                 "See integrations/intercom.py for setup instructions."
             )
-
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._headers = {
             "Authorization": f"Bearer {config.INTERCOM_ACCESS_TOKEN}",
             "Content-Type": "application/json",
             "Accept": "application/json",
             "Intercom-Version": _API_VERSION,
-        })
+        }
+
+
+class IntercomClient(_IntercomBase, _http.SharedSessionClient):
+    """Intercom REST API client for contacts, conversations, and messaging."""
+
+    # ~1000 requests/minute per app; shared by all instances.
+    _bucket = TokenBucket(rate=1000, per=60.0)
+
+    def __init__(self):
+        super().__init__()
+        self.session = _http.shared_session()
 
     # -- Contacts ----------------------------------------------------------
 
@@ -133,9 +165,7 @@ class IntercomClient:
         Returns:
             Updated contact dict.
         """
-        resp = self.session.put(f"{_API_BASE}/contacts/{contact_id}", json=kwargs)
-        resp.raise_for_status()
-        return resp.json()
+        return self._put(f"/contacts/{contact_id}", json=kwargs)
 
     def search_contacts(
         self, field: str, value: str, operator: str = "="
@@ -170,6 +200,17 @@ class IntercomClient:
         """
         return self._get("/contacts", params={"per_page": per_page}).get("data", [])
 
+    def iter_contacts(self, per_page: int = 150) -> Iterator[dict]:
+        """Yield every contact, following the starting_after cursor.
+
+        Args:
+            per_page: Results per page (max 150).
+
+        Yields:
+            Contact dicts.
+        """
+        return self._iter_pages("/contacts", "data", per_page)
+
     # -- Conversations -----------------------------------------------------
 
     def list_conversations(self, per_page: int = 20) -> list[dict]:
@@ -185,6 +226,17 @@ class IntercomClient:
             "conversations", []
         )
 
+    def iter_conversations(self, per_page: int = 150) -> Iterator[dict]:
+        """Yield every conversation, following the starting_after cursor.
+
+        Args:
+            per_page: Results per page (max 150).
+
+        Yields:
+            Conversation dicts.
+        """
+        return self._iter_pages("/conversations", "conversations", per_page)
+
     def get_conversation(self, conversation_id: str) -> dict:
         """Get a conversation by ID.
 
@@ -296,14 +348,267 @@ class IntercomClient:
             f"/contacts/{contact_id}/tags", json={"id": tag_id}
         )
 
+    def tag_contacts_bulk(
+        self, contact_ids: list[str], tag_id: str, max_workers: int = 16
+    ) -> list[dict]:
+        """Tag many contacts concurrently.
+
+        Args:
+            contact_ids: Contact IDs to tag.
+            tag_id:      Tag ID.
+            max_workers: Maximum concurrent requests.
+
+        Returns:
+            Tag dicts in the order of ``contact_ids``.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda c: self.tag_contact(c, tag_id), contact_ids))
+
     # -- internal helpers --------------------------------------------------
 
-    def _get(self, path: str, **kwargs) -> dict:
-        resp = self.session.get(f"{_API_BASE}{path}", **kwargs)
+    def _with_auth(self, kwargs: dict) -> dict:
+        """Merge the auth/API headers into a request's own headers."""
+        kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+        return kwargs
+
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        _http.encode_json_kwarg(kwargs)
+        self._bucket.acquire()
+        resp = getattr(self.session, method)(
+            f"{_API_BASE}{path}", **self._with_auth(kwargs)
+        )
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        reset = resp.headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset is not None:
+            try:
+                self._bucket.observe(int(remaining), float(reset) - time.time())
+            except ValueError:
+                pass
         resp.raise_for_status()
-        return resp.json()
+        return resp
+
+    def _get(self, path: str, **kwargs) -> dict:
+        return _http.loads(self._send("get", path, **kwargs).content)
+
+    def _iter_pages(self, path: str, key: str, per_page: int) -> Iterator[dict]:
+        """Yield ``key`` items across cursor pages, prefetching the next one."""
+
+        def fetch(starting_after: str):
+            params: dict = {"per_page": per_page}
+            if starting_after:
+                params["starting_after"] = starting_after
+            page = self._get(path, params=params)
+            nxt = (page.get("pages") or {}).get("next") or {}
+            return page.get(key, []), nxt.get("starting_after")
+
+        return prefetch_pages(fetch, "")
 
     def _post(self, path: str, **kwargs) -> dict:
-        resp = self.session.post(f"{_API_BASE}{path}", **kwargs)
+        return _http.loads(self._send("post", path, **kwargs).content)
+
+    def _put(self, path: str, **kwargs) -> dict:
+        return _http.loads(self._send("put", path, **kwargs).content)
+
+
+class AsyncIntercomClient(_IntercomBase):
+    """Async Intercom client built on httpx.
+
+    Mirrors IntercomClient's methods as coroutines and adds gather-based
+    bulk helpers. At most ``max_concurrency`` requests are in flight at
+    once; when the X-RateLimit-Remaining header reaches zero, new requests
+    wait for X-RateLimit-Reset instead of collecting 429s. 429s and 5xx
+    responses to idempotent requests are retried with jittered backoff.
+    Use it as an async context manager so the pool is closed when done.
+    """
+
+    def __init__(self, max_concurrency: int = 16):
+        super().__init__()
+        self._client = httpx.AsyncClient(
+            base_url=_API_BASE,
+            http2=_http.HTTP2,
+            headers=self._headers,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_remaining: int | None = None
+        self._rate_reset = 0.0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    # -- Contacts ----------------------------------------------------------
+
+    async def create_contact(
+        self,
+        role: str = "user",
+        email: str | None = None,
+        name: str | None = None,
+        **kwargs,
+    ) -> dict:
+        """Create a contact (user or lead). See IntercomClient."""
+        data: dict = {"role": role, **kwargs}
+        if email:
+            data["email"] = email
+        if name:
+            data["name"] = name
+        return await self._request("POST", "/contacts", json=data)
+
+    async def get_contact(self, contact_id: str) -> dict:
+        """Get a contact by ID."""
+        return await self._request("GET", f"/contacts/{contact_id}")
+
+    async def get_contacts(self, contact_ids: list[str]) -> list[dict]:
+        """Get several contacts concurrently."""
+        return list(await asyncio.gather(*(self.get_contact(c) for c in contact_ids)))
+
+    async def update_contact(self, contact_id: str, **kwargs) -> dict:
+        """Update a contact's fields."""
+        return await self._request("PUT", f"/contacts/{contact_id}", json=kwargs)
+
+    async def search_contacts(
+        self, field: str, value: str, operator: str = "="
+    ) -> list[dict]:
+        """Search contacts by a single field. See IntercomClient."""
+        payload = {"query": {"field": field, "operator": operator, "value": value}}
+        resp = await self._request("POST", "/contacts/search", json=payload)
+        return resp.get("data", [])
+
+    async def list_contacts(self, per_page: int = 50) -> list[dict]:
+        """List contacts."""
+        resp = await self._request("GET", "/contacts", params={"per_page": per_page})
+        return resp.get("data", [])
+
+    # -- Conversations -----------------------------------------------------
+
+    async def list_conversations(self, per_page: int = 20) -> list[dict]:
+        """List conversations."""
+        resp = await self._request(
+            "GET", "/conversations", params={"per_page": per_page}
+        )
+        return resp.get("conversations", [])
+
+    async def get_conversation(self, conversation_id: str) -> dict:
+        """Get a conversation by ID."""
+        return await self._request("GET", f"/conversations/{conversation_id}")
+
+    async def reply_to_conversation(
+        self,
+        conversation_id: str,
+        admin_id: str,
+        body: str,
+        message_type: str = "comment",
+    ) -> dict:
+        """Reply to a conversation as an admin. See IntercomClient."""
+        return await self._request(
+            "POST",
+            f"/conversations/{conversation_id}/reply",
+            json={
+                "message_type": message_type,
+                "type": "admin",
+                "admin_id": admin_id,
+                "body": body,
+            },
+        )
+
+    # -- Messages ----------------------------------------------------------
+
+    async def send_message(
+        self,
+        from_admin_id: str,
+        to_contact_id: str,
+        body: str,
+        message_type: str = "inapp",
+    ) -> dict:
+        """Send a message from an admin to a contact. See IntercomClient."""
+        return await self._request(
+            "POST",
+            "/messages",
+            json={
+                "message_type": message_type,
+                "body": body,
+                "from": {"type": "admin", "id": from_admin_id},
+                "to": {"type": "user", "id": to_contact_id},
+            },
+        )
+
+    # -- Notes -------------------------------------------------------------
+
+    async def create_note(self, contact_id: str, admin_id: str, body: str) -> dict:
+        """Create a note on a contact."""
+        return await self._request(
+            "POST",
+            f"/contacts/{contact_id}/notes",
+            json={"admin_id": admin_id, "body": body},
+        )
+
+    # -- Tags --------------------------------------------------------------
+
+    async def list_tags(self) -> list[dict]:
+        """List all tags."""
+        return (await self._request("GET", "/tags")).get("data", [])
+
+    async def tag_contact(self, contact_id: str, tag_id: str) -> dict:
+        """Tag a contact."""
+        return await self._request(
+            "POST", f"/contacts/{contact_id}/tags", json={"id": tag_id}
+        )
+
+    async def tag_contacts_bulk(
+        self, contact_ids: list[str], tag_id: str
+    ) -> list[dict]:
+        """Tag several contacts concurrently."""
+        return list(
+            await asyncio.gather(*(self.tag_contact(c, tag_id) for c in contact_ids))
+        )
+
+    # -- internal helpers --------------------------------------------------
+
+    async def _request(self, method: str, path: str, **kwargs) -> dict:
+        _http.encode_json_kwarg(kwargs)
+        kwargs["content"] = kwargs.pop("data", None)
+        retry_5xx = method in ("GET", "PUT", "DELETE")
+        async with self._semaphore:
+            for attempt in range(_RETRY_ATTEMPTS):
+                await self._wait_for_rate_limit()
+                resp = await self._client.request(method, path, **kwargs)
+                self._track_rate_limit(resp.headers)
+                retryable = resp.status_code == 429 or (
+                    retry_5xx and resp.status_code >= 500
+                )
+                if not retryable or attempt == _RETRY_ATTEMPTS - 1:
+                    break
+                await asyncio.sleep(
+                    _http.backoff_delay(
+                        attempt, _RETRY_BACKOFF, resp.headers.get("Retry-After")
+                    )
+                )
         resp.raise_for_status()
-        return resp.json()
+        if resp.status_code == 204 or not resp.content:
+            return {"status": "ok"}
+        return _http.loads(resp.content)
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Sleep until the window resets once the server says it is spent."""
+        if self._rate_remaining is not None and self._rate_remaining <= 0:
+            delay = self._rate_reset - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._rate_remaining = None
+
+    def _track_rate_limit(self, headers) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            self._rate_remaining = int(remaining)
+            self._rate_reset = float(reset)
+        except ValueError:
+            pass
@@ -22,7 +22,8 @@ IMPORTANT NOTES
 - Authentication uses HTTP Basic (email + API token).
 - The JIRA_URL must include the scheme (https://) and your subdomain.
 - API docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/
-- Rate limit: ~100 requests/10 seconds per user.
+- Rate limit: ~100 requests/10 seconds per user. The client paces itself to
+  this and slows down when Jira reports X-RateLimit-NearLimit.
 - JQL (Jira Query Language) is used for searching issues.
 
 Usage:
@@ -39,21 +40,94 @@ Usage:
     # Search issues with JQL
     results = jira.search("project = PROJ AND status = Open")
 
+    # Stream every match, one page in memory at a time
+    for issue in jira.iter_search("project = PROJ"):
+        print(issue["key"])
+
     # Add a comment
     jira.add_comment("PROJ-123", body="Working on this now.")
 
     # Transition an issue (e.g. move to "In Progress")
     jira.transition_issue("PROJ-123", transition_id="31")
+    jira.transition_by_name("PROJ-123", "In Progress")
 """
 
+import base64
+import functools
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 import requests
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._cache import TTLCache
+from goliath.integrations._pagination import prefetch_pages
+from goliath.integrations._ratelimit import TokenBucket
+
+_SEARCH_PAGE_SIZE = 100
+_TRANSITIONS_TTL = 300
+_WORKFLOW_FIELDS = "project,issuetype,status"
+_INTERN_MAX_LEN = 32
+
+
+def _adf(text: str) -> dict:
+    """Wrap plain text in a single-paragraph Atlassian Document Format doc.
+
+    ADF forbids empty text nodes, so empty text yields an empty paragraph.
+    """
+    content = [{"type": "text", "text": text}] if text else []
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": content}],
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _comment_payload(text: str) -> bytes:
+    """Return the encoded add_comment body for ``text``.
+
+    Bots and CI jobs tend to post the same comment over and over, so the
+    ADF document is built and serialised once per distinct text.
+    """
+    return _http.dumps({"body": _adf(text)})
+
+
+def _intern_strings(value):
+    """Intern short strings throughout a decoded JSON value, in place."""
+    if isinstance(value, dict):
+        for k, v in value.items():
+            value[k] = _intern_strings(v)
+    elif isinstance(value, list):
+        for i, v in enumerate(value):
+            value[i] = _intern_strings(v)
+    elif isinstance(value, str) and len(value) < _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
+
+
+def _workflow_key(issue: dict) -> tuple | None:
+    """Return (project, issue type, status) for an issue, if it carries them."""
+    fields = issue.get("fields") or {}
+    try:
+        return (
+            fields["project"]["key"],
+            fields["issuetype"]["id"],
+            fields["status"]["id"],
+        )
+    except (KeyError, TypeError):
+        return None
 
 
-class JiraClient:
+class JiraClient(_http.SharedSessionClient):
     """Jira Cloud REST API client for issues, projects, and boards."""
 
+    # ~100 requests/10 seconds per user; shared by all instances.
+    _bucket = TokenBucket(rate=100, per=10.0)
+
     def __init__(self):
         if not config.JIRA_API_TOKEN:
             raise RuntimeError(
@@ -72,9 +146,16 @@ class JiraClient:
             )
 
         self._base = config.JIRA_URL.rstrip("/") + "/rest/api/3"
-        self.session = requests.Session()
-        self.session.auth = (config.JIRA_EMAIL, config.JIRA_API_TOKEN)
-        self.session.headers.update({"Content-Type": "application/json"})
+        self.session = _http.shared_session()
+        credentials = f"{config.JIRA_EMAIL}:{config.JIRA_API_TOKEN}".encode()
+        self._headers = {
+            "Authorization": f"Basic {base64.b64encode(credentials).decode()}",
+        }
+        self._transitions = TTLCache(maxsize=256, ttl=_TRANSITIONS_TTL)
+
+    def close(self) -> None:
+        """Drop cached workflow transitions."""
+        self._transitions.clear()
 
     # -- Issues ------------------------------------------------------------
 
@@ -105,16 +186,7 @@ class JiraClient:
             **kwargs,
         }
         if description:
-            fields["description"] = {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": description}],
-                    }
-                ],
-            }
+            fields["description"] = _adf(description)
         return self._post("/issue", json={"fields": fields})
 
     def get_issue(self, issue_key: str, fields: str | None = None) -> dict:
@@ -132,6 +204,54 @@ class JiraClient:
             params["fields"] = fields
         return self._get(f"/issue/{issue_key}", params=params)
 
+    def get_issues_bulk(
+        self, issue_keys: list[str], fields: str | None = None, max_workers: int = 8
+    ) -> list[dict]:
+        """Get many issues by key with one JQL search per 100 keys.
+
+        Chunks are searched concurrently. If Jira rejects a chunk's query
+        (e.g. one of its keys no longer exists), that chunk falls back to
+        concurrent get_issue calls.
+
+        Args:
+            issue_keys:  Issue keys (e.g. ["PROJ-1", "PROJ-2"]).
+            fields:      Comma-separated field names to return (None = all).
+            max_workers: Maximum concurrent requests.
+
+        Returns:
+            Issue dicts in the order of ``issue_keys``; keys that do not
+            exist are omitted.
+        """
+        keys = list(dict.fromkeys(issue_keys))
+        chunks = [
+            keys[i : i + _SEARCH_PAGE_SIZE]
+            for i in range(0, len(keys), _SEARCH_PAGE_SIZE)
+        ]
+
+        def fetch_chunk(chunk: list[str]) -> list[dict]:
+            jql = f"key in ({','.join(chunk)})"
+            try:
+                return list(self.iter_search(jql, fields=fields))
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code != 400:
+                    raise
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return [i for i in pool.map(fetch_one, chunk) if i is not None]
+
+        def fetch_one(key: str) -> dict | None:
+            try:
+                return self.get_issue(key, fields=fields)
+            except requests.HTTPError as e:
+                if e.response is not None and e.response.status_code == 404:
+                    return None
+                raise
+
+        found: dict[str, dict] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for issues in pool.map(fetch_chunk, chunks):
+                found.update((issue["key"].upper(), issue) for issue in issues)
+        return [found[k.upper()] for k in keys if k.upper() in found]
+
     def update_issue(self, issue_key: str, **kwargs) -> None:
         """Update an issue's fields.
 
@@ -139,11 +259,7 @@ class JiraClient:
             issue_key: Issue key (e.g. "PROJ-123").
             kwargs:    Fields to update (summary, description, priority, etc.).
         """
-        resp = self.session.put(
-            f"{self._base}/issue/{issue_key}",
-            json={"fields": kwargs},
-        )
-        resp.raise_for_status()
+        self._send_no_content("put", f"/issue/{issue_key}", json={"fields": kwargs})
 
     def delete_issue(self, issue_key: str) -> None:
         """Delete an issue.
@@ -151,8 +267,7 @@ class JiraClient:
         Args:
             issue_key: Issue key (e.g. "PROJ-123").
         """
-        resp = self.session.delete(f"{self._base}/issue/{issue_key}")
-        resp.raise_for_status()
+        self._send_no_content("delete", f"/issue/{issue_key}")
 
     def search(
         self, jql: str, max_results: int = 50, fields: str | None = None
@@ -165,13 +280,88 @@ class JiraClient:
             fields:      Comma-separated field names to return.
 
         Returns:
-            List of issue dicts.
+            List of issue dicts. Short strings that repeat across issues
+            (status, priority and issue type names, account IDs) are
+            interned, so large result sets share one copy of each.
+        """
+        return [
+            _intern_strings(issue)
+            for issue in self.iter_search(
+                jql,
+                page_size=min(max_results, _SEARCH_PAGE_SIZE),
+                fields=fields,
+                limit=max_results,
+            )
+        ]
+
+    def search_columns(
+        self, jql: str, fields: str, max_results: int | None = None
+    ) -> dict[str, list]:
+        """Search issues and return them column-wise instead of as dicts.
+
+        Results are streamed page by page into one list per field, which
+        for large result sets takes far less memory than a list of full
+        issue dicts. Repeating short strings are interned.
+
+        Args:
+            jql:         Jira Query Language string.
+            fields:      Comma-separated field names to return.
+            max_results: Maximum number of results (None = all).
+
+        Returns:
+            Dict mapping "key" and each requested field to a list of
+            values, aligned by index (missing fields are None).
         """
-        data: dict = {"jql": jql, "maxResults": max_results}
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        columns: dict[str, list] = {"key": [], **{name: [] for name in names}}
+        issues = self.iter_search(jql, fields=",".join(names), limit=max_results)
+        for issue in issues:
+            issue = _intern_strings(issue)
+            columns["key"].append(issue["key"])
+            issue_fields = issue.get("fields") or {}
+            for name in names:
+                columns[name].append(issue_fields.get(name))
+        return columns
+
+    def iter_search(
+        self,
+        jql: str,
+        page_size: int = _SEARCH_PAGE_SIZE,
+        fields: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict]:
+        """Yield every issue matching a JQL query, paging with startAt.
+
+        The next page is fetched in the background while the current one
+        is being consumed, and only one page is held in memory at a time.
+
+        Args:
+            jql:       Jira Query Language string.
+            page_size: Issues requested per page (Jira caps this at 100).
+            fields:    Comma-separated field names to return.
+            limit:     Stop after this many issues (None = all).
+
+        Yields:
+            Issue dicts.
+        """
+        body: dict = {"jql": jql, "maxResults": page_size}
         if fields:
-            data["fields"] = fields.split(",")
-        resp = self._post("/search", json=data)
-        return resp.get("issues", [])
+            body["fields"] = fields.split(",")
+
+        def fetch(start_at: int):
+            page = self._post("/search", json={**body, "startAt": start_at})
+            issues = page.get("issues", [])
+            # Jira may return fewer than maxResults per page, so advance by
+            # what actually came back rather than by page_size.
+            next_at = start_at + len(issues)
+            done = (
+                not issues
+                or next_at >= page.get("total", 0)
+                or (limit is not None and next_at >= limit)
+            )
+            return issues, None if done else next_at
+
+        return islice(prefetch_pages(fetch, 0), limit)
 
     def assign_issue(self, issue_key: str, account_id: str) -> None:
         """Assign an issue to a user.
@@ -180,11 +370,9 @@ class JiraClient:
             issue_key:  Issue key (e.g. "PROJ-123").
             account_id: Atlassian account ID of the assignee.
         """
-        resp = self.session.put(
-            f"{self._base}/issue/{issue_key}/assignee",
-            json={"accountId": account_id},
+        self._send_no_content(
+            "put", f"/issue/{issue_key}/assignee", json={"accountId": account_id}
         )
-        resp.raise_for_status()
 
     # -- Transitions -------------------------------------------------------
 
@@ -206,11 +394,52 @@ class JiraClient:
             issue_key:     Issue key (e.g. "PROJ-123").
             transition_id: Transition ID (get from get_transitions()).
         """
-        resp = self.session.post(
-            f"{self._base}/issue/{issue_key}/transitions",
+        self._send_no_content(
+            "post",
+            f"/issue/{issue_key}/transitions",
             json={"transition": {"id": transition_id}},
         )
-        resp.raise_for_status()
+
+    def transition_by_name(self, issue: str | dict, name: str) -> None:
+        """Transition an issue by the transition's name (e.g. "In Progress").
+
+        Available transitions are cached for five minutes per (project,
+        issue type, status). Passing an issue dict that carries those
+        fields (e.g. from search(fields="project,issuetype,status")) skips
+        the lookup entirely on a cache hit, so bulk workflow moves cost
+        one request per issue. Given a key, the issue's workflow fields
+        and transitions are fetched together in one request.
+
+        Args:
+            issue: Issue key (e.g. "PROJ-123") or issue dict.
+            name:  Transition name, matched case-insensitively.
+
+        Raises:
+            ValueError: If the issue has no transition with that name.
+        """
+        cache_key = _workflow_key(issue) if isinstance(issue, dict) else None
+        transitions = self._transitions.get(cache_key) if cache_key else None
+        if transitions is None:
+            key = issue["key"] if isinstance(issue, dict) else issue
+            issue = self._get(
+                f"/issue/{key}",
+                params={"fields": _WORKFLOW_FIELDS, "expand": "transitions"},
+            )
+            transitions = issue.get("transitions", [])
+            cache_key = _workflow_key(issue)
+            if cache_key:
+                self._transitions.set(cache_key, transitions)
+
+        wanted = name.casefold()
+        for transition in transitions:
+            if transition.get("name", "").casefold() == wanted:
+                self.transition_issue(issue["key"], transition["id"])
+                return
+        available = ", ".join(t.get("name", "") for t in transitions)
+        raise ValueError(
+            f"Issue {issue['key']} has no transition named {name!r} "
+            f"(available: {available or 'none'})."
+        )
 
     # -- Comments ----------------------------------------------------------
 
@@ -224,17 +453,11 @@ class JiraClient:
         Returns:
             Created comment dict.
         """
-        adf_body = {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [{"type": "text", "text": body}],
-                }
-            ],
-        }
-        return self._post(f"/issue/{issue_key}/comment", json={"body": adf_body})
+        return self._post(
+            f"/issue/{issue_key}/comment",
+            data=_comment_payload(body),
+            headers={"Content-Type": "application/json"},
+        )
 
     def get_comments(self, issue_key: str) -> list[dict]:
         """Get all comments on an issue.
@@ -259,14 +482,51 @@ class JiraClient:
 
     # -- internal helpers --------------------------------------------------
 
-    def _get(self, path: str, **kwargs) -> dict | list:
-        resp = self.session.get(f"{self._base}{path}", **kwargs)
+    def _with_auth(self, kwargs: dict) -> dict:
+        """Merge the auth header into a request's own headers."""
+        kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+        return kwargs
+
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        _http.encode_json_kwarg(kwargs)
+        self._bucket.acquire()
+        resp = getattr(self.session, method)(
+            f"{self._base}{path}", **self._with_auth(kwargs)
+        )
+        self._observe_rate_limit(resp)
         resp.raise_for_status()
-        return resp.json()
+        return resp
+
+    def _observe_rate_limit(self, resp: requests.Response) -> None:
+        """Tighten the shared bucket from Jira's rate-limit headers.
+
+        Jira flags X-RateLimit-NearLimit once under 20% of the budget is
+        left, and a 429 carries Retry-After.
+        """
+        if resp.status_code == 429:
+            try:
+                self._bucket.observe(0, float(resp.headers.get("Retry-After", "")))
+            except ValueError:
+                self._bucket.observe(0)
+        elif resp.headers.get("X-RateLimit-NearLimit") == "true":
+            self._bucket.observe(self._bucket.rate * 0.2)
+
+    def _send_no_content(self, method: str, path: str, **kwargs) -> None:
+        """Send a request whose response body is ignored.
+
+        The body is streamed, drained without being buffered, and the
+        connection handed straight back to the pool. On an HTTP error the
+        body is left unread for the caller's HTTPError handling.
+        """
+        resp = self._send(method, path, stream=True, **kwargs)
+        resp.raw.drain_conn()
+        resp.raw.release_conn()
+
+    def _get(self, path: str, **kwargs) -> dict | list:
+        return _http.loads(self._send("get", path, **kwargs).content)
 
     def _post(self, path: str, **kwargs) -> dict:
-        resp = self.session.post(f"{self._base}{path}", **kwargs)
-        resp.raise_for_status()
+        resp = self._send("post", path, **kwargs)
         if resp.status_code == 204 or not resp.content:
             return {"status": "ok"}
-        return resp.json()
+        return _http.loads(resp.content)
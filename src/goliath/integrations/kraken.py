@@ -56,29 +56,179 @@ Usage:
 
     # Get open orders (requires auth)
     orders = kr.get_open_orders()
+
+    # Tickers for several pairs in one request
+    tickers = kr.get_tickers(["XBTUSD", "ETHUSD"])
+
+    # --- Async (concurrent market-data polling) ---
+    from goliath.integrations.kraken import AsyncKrakenClient
+
+    async with AsyncKrakenClient() as akr:
+        tickers = await akr.get_tickers(["XBTUSD", "ETHUSD"])
+        books = await akr.get_order_books(["XBTUSD", "ETHUSD"], count=10)
 """
 
+import asyncio
 import base64
+import binascii
 import hashlib
 import hmac
+import threading
 import time
 import urllib.parse
 
-import requests
+import httpx
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._cache import TTLCache
 
 _API_BASE = "https://api.kraken.com"
+# Asset and pair metadata changes rarely (new listings, fee tiers).
+_REFERENCE_TTL = 3600
+# The private endpoints wrapped here are all reads, so transient failures
+# are safe to retry with a fresh nonce.
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.5
+_RETRYABLE_ERRORS = (
+    "EAPI:Invalid nonce",
+    "EAPI:Rate limit exceeded",
+    "EService:Unavailable",
+    "EService:Busy",
+)
+
+
+class _KrakenBase:
+    """Credentials and request signing shared by the sync and async clients."""
+
+    # Kraken rejects a nonce that is not greater than the last one seen for
+    # the key, so every client in the process draws from one counter: two
+    # calls in the same millisecond still get distinct nonces.
+    _nonce = 0
+    _nonce_lock = threading.Lock()
+
+    def __init__(self):
+        self.api_key = getattr(config, "KRAKEN_API_KEY", "") or ""
+        self.api_secret = getattr(config, "KRAKEN_API_SECRET", "") or ""
+        # Decoded once here rather than on every signed request.
+        try:
+            self._api_secret_bytes = base64.b64decode(self.api_secret, validate=True)
+        except binascii.Error:
+            raise RuntimeError(
+                "KRAKEN_API_SECRET is not valid base64. Copy the Private Key "
+                "exactly as shown by Kraken."
+            ) from None
+        # Keyed once; each signature copies it, skipping the key schedule.
+        self._hmac_template = hmac.new(self._api_secret_bytes, None, hashlib.sha512)
+        # Per-endpoint copies that have already absorbed the URI path.
+        self._path_macs: dict[str, hmac.HMAC] = {}
+
+    def _form(self, data: dict | None) -> bytes:
+        """URL-encode a private request's parameters, minus the nonce."""
+        if not self.api_key or not self._api_secret_bytes:
+            raise RuntimeError(
+                "KRAKEN_API_KEY and KRAKEN_API_SECRET are required for "
+                "private endpoints. See integrations/kraken.py for setup."
+            )
+        params = {k: v for k, v in (data or {}).items() if k != "nonce"}
+        return urllib.parse.urlencode(params).encode()
+
+    def _sign(self, path: str, form: bytes) -> tuple[bytes, dict]:
+        """Prefix a fresh nonce to ``form``; return the body and headers."""
+        nonce = str(self._next_nonce()).encode()
+        post_data = b"nonce=" + nonce + (b"&" + form if form else b"")
+        digest = hashlib.sha256(nonce)
+        digest.update(post_data)
 
+        signature = self._path_mac(path).copy()
+        signature.update(digest.digest())
 
-class KrakenClient:
+        headers = {
+            "API-Key": self.api_key,
+            "API-Sign": base64.b64encode(signature.digest()).decode(),
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        return post_data, headers
+
+    def _path_mac(self, path: str) -> hmac.HMAC:
+        """Return the keyed HMAC state primed with ``path``; copy before use."""
+        mac = self._path_macs.get(path)
+        if mac is None:
+            mac = self._hmac_template.copy()
+            mac.update(path.encode())
+            mac = self._path_macs.setdefault(path, mac)
+        return mac
+
+    @staticmethod
+    def _next_nonce() -> int:
+        # Tracking the wall clock (integer milliseconds, no float rounding)
+        # keeps a long-lived process from falling behind a newer process
+        # that signs with the same key. The counter is read and written on
+        # _KrakenBase itself: assigning through a subclass would give that
+        # subclass its own shadowing copy.
+        now = time.time_ns() // 1_000_000
+        with _KrakenBase._nonce_lock:
+            _KrakenBase._nonce = max(_KrakenBase._nonce + 1, now)
+            return _KrakenBase._nonce
+
+
+def _result(body: dict) -> dict:
+    """Unwrap Kraken's ``{"error": [...], "result": ...}`` envelope."""
+    if body.get("error"):
+        raise RuntimeError(f"Kraken API error: {body['error']}")
+    return body.get("result", body)
+
+
+def _transient(status_code: int, body: dict | None) -> bool:
+    """Whether a private call failed in a way worth retrying."""
+    if status_code == 429 or status_code >= 500:
+        return True
+    errors = body.get("error") if body else None
+    return bool(errors) and any(e.startswith(_RETRYABLE_ERRORS) for e in errors)
+
+
+def _pair_rows(result: dict) -> tuple[list, str | None]:
+    """Split an OHLC/Trades result into its row list and "last" cursor.
+
+    The rows are keyed by Kraken's canonical pair name (e.g. "XXBTZUSD"),
+    which may differ from the name that was requested.
+    """
+    last = result.get("last")
+    rows = next((v for k, v in result.items() if k != "last"), [])
+    return rows, last
+
+
+def _float_array(rows: list, columns: int):
+    """Convert Kraken's string-encoded numeric rows in one NumPy call."""
+    try:
+        import numpy as np
+    except ImportError:
+        raise RuntimeError(
+            "numpy is required for the *_array helpers. "
+            "Install it with: pip install numpy"
+        ) from None
+    return np.array(rows, dtype=np.float64).reshape(-1, columns)
+
+
+def _merge(results) -> dict:
+    """Combine per-pair result dicts into one keyed by pair name."""
+    merged: dict = {}
+    for result in results:
+        merged.update(result)
+    return merged
+
+
+class KrakenClient(_KrakenBase, _http.SharedSessionClient):
     """Kraken REST API client for market data and trading."""
 
     def __init__(self):
-        self.api_key = getattr(config, "KRAKEN_API_KEY", "") or ""
-        self.api_secret = getattr(config, "KRAKEN_API_SECRET", "") or ""
+        super().__init__()
+        self.session = _http.shared_session()
+        self._cache = TTLCache(maxsize=64, ttl=_REFERENCE_TTL)
 
-        self.session = requests.Session()
+    def close(self) -> None:
+        """Drop cached reference data."""
+        self._cache.clear()
 
     # -- Public Market Data ----------------------------------------------------
 
@@ -90,11 +240,12 @@ class KrakenClient:
         """
         return self._public_get("/0/public/Time")
 
-    def get_assets(self, assets: str | None = None) -> dict:
+    def get_assets(self, assets: str | None = None, use_cache: bool = True) -> dict:
         """Get asset information.
 
         Args:
-            assets: Comma-separated asset names (e.g. "XBT,ETH"). None for all.
+            assets:    Comma-separated asset names (e.g. "XBT,ETH"). None for all.
+            use_cache: Serve a copy fetched within the last hour.
 
         Returns:
             Dict of asset info keyed by asset name.
@@ -102,13 +253,14 @@ class KrakenClient:
         params: dict = {}
         if assets:
             params["asset"] = assets
-        return self._public_get("/0/public/Assets", params=params)
+        return self._public_get("/0/public/Assets", use_cache=use_cache, params=params)
 
-    def get_asset_pairs(self, pair: str | None = None) -> dict:
+    def get_asset_pairs(self, pair: str | None = None, use_cache: bool = True) -> dict:
         """Get tradable asset pairs.
 
         Args:
-            pair: Comma-separated pair names (e.g. "XBTUSD,ETHUSD"). None for all.
+            pair:      Comma-separated pair names (e.g. "XBTUSD,ETHUSD"). None for all.
+            use_cache: Serve a copy fetched within the last hour.
 
         Returns:
             Dict of pair info keyed by pair name.
@@ -116,7 +268,9 @@ class KrakenClient:
         params: dict = {}
         if pair:
             params["pair"] = pair
-        return self._public_get("/0/public/AssetPairs", params=params)
+        return self._public_get(
+            "/0/public/AssetPairs", use_cache=use_cache, params=params
+        )
 
     def get_ticker(self, pair: str) -> dict:
         """Get ticker information.
@@ -129,6 +283,17 @@ class KrakenClient:
         """
         return self._public_get("/0/public/Ticker", params={"pair": pair})
 
+    def get_tickers(self, pairs: list[str]) -> dict:
+        """Get ticker information for several pairs in one request.
+
+        Args:
+            pairs: Asset pairs (e.g. ["XBTUSD", "ETHUSD"]).
+
+        Returns:
+            Dict of ticker data keyed by pair name.
+        """
+        return self.get_ticker(",".join(pairs))
+
     def get_ohlc(
         self,
         pair: str,
@@ -179,6 +344,42 @@ class KrakenClient:
             params["since"] = since
         return self._public_get("/0/public/Trades", params=params)
 
+    def get_ohlc_array(
+        self,
+        pair: str,
+        interval: int = 1,
+        since: int | None = None,
+    ):
+        """Get OHLC data as a float64 NumPy array (requires numpy).
+
+        Args:
+            pair:     Asset pair.
+            interval: Time frame in minutes.
+            since:    Return data since this UNIX timestamp.
+
+        Returns:
+            Tuple of (array, last). The array has one row per candle with
+            columns time, open, high, low, close, vwap, volume, count; pass
+            ``last`` as ``since`` to poll for newer candles.
+        """
+        rows, last = _pair_rows(self.get_ohlc(pair, interval=interval, since=since))
+        return _float_array(rows, columns=8), last
+
+    def get_recent_trades_array(self, pair: str, since: int | None = None):
+        """Get recent trades as a float64 NumPy array (requires numpy).
+
+        Args:
+            pair:  Asset pair.
+            since: Return trades since this trade ID.
+
+        Returns:
+            Tuple of (array, last). The array has one row per trade with
+            columns price, volume, time; the side and order-type letters
+            are dropped. Pass ``last`` as ``since`` to poll for newer trades.
+        """
+        rows, last = _pair_rows(self.get_recent_trades(pair, since=since))
+        return _float_array([row[:3] for row in rows], columns=3), last
+
     def get_recent_spreads(self, pair: str, since: int | None = None) -> dict:
         """Get recent spread data.
 
@@ -241,41 +442,209 @@ class KrakenClient:
 
     # -- internal helpers ------------------------------------------------------
 
-    def _public_get(self, path: str, **kwargs) -> dict:
+    def cache_clear(self) -> None:
+        """Drop every cached asset and pair lookup."""
+        self._cache.clear()
+
+    def _public_get(self, path: str, use_cache: bool = False, **kwargs) -> dict:
+        if not use_cache:
+            resp = self.session.get(f"{_API_BASE}{path}", **kwargs)
+            resp.raise_for_status()
+            return _result(_http.loads(resp.content))
+
+        # Fresh hits skip the network; stale entries are revalidated with
+        # whichever validator the server sent, and a 304 re-arms the cached
+        # result without downloading or parsing the body again.
+        key = (path, tuple(sorted(kwargs.get("params", {}).items())))
+        entry = self._cache.get_entry(key)
+        if entry is not None:
+            (validators, result), fresh = entry
+            if fresh:
+                return result
+            if validators:
+                kwargs["headers"] = validators
         resp = self.session.get(f"{_API_BASE}{path}", **kwargs)
         resp.raise_for_status()
-        body = resp.json()
-        if body.get("error"):
-            raise RuntimeError(f"Kraken API error: {body['error']}")
-        return body.get("result", body)
+        if resp.status_code == 304 and entry is not None:
+            self._cache.set(key, entry[0])
+            return entry[0][1]
+        result = _result(_http.loads(resp.content))
+        validators = {}
+        if etag := resp.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if modified := resp.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = modified
+        self._cache.set(key, (validators, result))
+        return result
 
     def _private_post(self, path: str, data: dict | None = None) -> dict:
-        if not self.api_key or not self.api_secret:
-            raise RuntimeError(
-                "KRAKEN_API_KEY and KRAKEN_API_SECRET are required for "
-                "private endpoints. See integrations/kraken.py for setup."
+        # Encoded once; each attempt only splices in a new nonce and re-signs.
+        form = self._form(data)
+        for attempt in range(_RETRY_ATTEMPTS):
+            post_data, headers = self._sign(path, form)
+            # Send the exact bytes that were signed rather than re-encoding data.
+            resp = self.session.post(
+                f"{_API_BASE}{path}", data=post_data, headers=headers
             )
+            body = _http.loads(resp.content) if resp.ok else None
+            if attempt == _RETRY_ATTEMPTS - 1 or not _transient(resp.status_code, body):
+                break
+            time.sleep(
+                _http.backoff_delay(
+                    attempt, _RETRY_BACKOFF, resp.headers.get("Retry-After")
+                )
+            )
+        resp.raise_for_status()
+        return _result(body)
+
 
-        data = data or {}
-        data["nonce"] = str(int(time.time() * 1000))
+class AsyncKrakenClient(_KrakenBase):
+    """Async Kraken client built on httpx.
 
-        post_data = urllib.parse.urlencode(data)
-        encoded = (data["nonce"] + post_data).encode()
-        message = path.encode() + hashlib.sha256(encoded).digest()
+    Mirrors KrakenClient's methods as coroutines and adds gather-based
+    helpers, so polling N pairs costs roughly one round trip instead of N.
+    At most ``max_concurrency`` requests are in flight at once. Use it as
+    an async context manager so the pool is closed when done.
+    """
 
-        signature = hmac.new(
-            base64.b64decode(self.api_secret), message, hashlib.sha512
+    def __init__(self, max_concurrency: int = 8):
+        super().__init__()
+        self._client = httpx.AsyncClient(
+            base_url=_API_BASE,
+            http2=_http.HTTP2,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
         )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
-        headers = {
-            "API-Key": self.api_key,
-            "API-Sign": base64.b64encode(signature.digest()).decode(),
-        }
-        resp = self.session.post(
-            f"{_API_BASE}{path}", data=data, headers=headers
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    # -- Public Market Data ----------------------------------------------------
+
+    async def get_server_time(self) -> dict:
+        """Get server time."""
+        return await self._public_get("/0/public/Time")
+
+    async def get_assets(self, assets: str | None = None) -> dict:
+        """Get asset information. See KrakenClient."""
+        params = {"asset": assets} if assets else {}
+        return await self._public_get("/0/public/Assets", params=params)
+
+    async def get_asset_pairs(self, pair: str | None = None) -> dict:
+        """Get tradable asset pairs. See KrakenClient."""
+        params = {"pair": pair} if pair else {}
+        return await self._public_get("/0/public/AssetPairs", params=params)
+
+    async def get_ticker(self, pair: str) -> dict:
+        """Get ticker information."""
+        return await self._public_get("/0/public/Ticker", params={"pair": pair})
+
+    async def get_tickers(self, pairs: list[str], fan_out: bool = False) -> dict:
+        """Get ticker information for several pairs.
+
+        Args:
+            pairs:   Asset pairs (e.g. ["XBTUSD", "ETHUSD"]).
+            fan_out: Send one request per pair concurrently instead of a
+                     single comma-joined request. Useful when one unknown
+                     pair should not fail the whole batch.
+
+        Returns:
+            Dict of ticker data keyed by pair name.
+        """
+        if not fan_out:
+            return await self.get_ticker(",".join(pairs))
+        return _merge(await asyncio.gather(*(self.get_ticker(p) for p in pairs)))
+
+    async def get_ohlc(
+        self,
+        pair: str,
+        interval: int = 1,
+        since: int | None = None,
+    ) -> dict:
+        """Get OHLC (candlestick) data. See KrakenClient."""
+        params: dict = {"pair": pair, "interval": interval}
+        if since:
+            params["since"] = since
+        return await self._public_get("/0/public/OHLC", params=params)
+
+    async def get_order_book(self, pair: str, count: int = 100) -> dict:
+        """Get order book."""
+        return await self._public_get(
+            "/0/public/Depth", params={"pair": pair, "count": count}
+        )
+
+    async def get_order_books(self, pairs: list[str], count: int = 100) -> dict:
+        """Get order books for several pairs concurrently, keyed by pair name."""
+        return _merge(
+            await asyncio.gather(*(self.get_order_book(p, count) for p in pairs))
+        )
+
+    async def get_recent_trades(self, pair: str, since: int | None = None) -> dict:
+        """Get recent trades. See KrakenClient."""
+        params: dict = {"pair": pair}
+        if since:
+            params["since"] = since
+        return await self._public_get("/0/public/Trades", params=params)
+
+    async def get_recent_spreads(self, pair: str, since: int | None = None) -> dict:
+        """Get recent spread data. See KrakenClient."""
+        params: dict = {"pair": pair}
+        if since:
+            params["since"] = since
+        return await self._public_get("/0/public/Spread", params=params)
+
+    # -- Private (Authenticated) -----------------------------------------------
+
+    async def get_balance(self) -> dict:
+        """Get account balance (requires auth)."""
+        return await self._private_post("/0/private/Balance")
+
+    async def get_trade_balance(self, asset: str = "ZUSD") -> dict:
+        """Get trade balance summary (requires auth)."""
+        return await self._private_post(
+            "/0/private/TradeBalance", data={"asset": asset}
         )
+
+    async def get_open_orders(self) -> dict:
+        """Get open orders (requires auth)."""
+        return await self._private_post("/0/private/OpenOrders")
+
+    async def get_closed_orders(self) -> dict:
+        """Get closed orders (requires auth)."""
+        return await self._private_post("/0/private/ClosedOrders")
+
+    async def get_trades_history(self) -> dict:
+        """Get trade history (requires auth)."""
+        return await self._private_post("/0/private/TradesHistory")
+
+    # -- internal helpers ------------------------------------------------------
+
+    async def _public_get(self, path: str, **kwargs) -> dict:
+        async with self._semaphore:
+            resp = await self._client.get(path, **kwargs)
+        resp.raise_for_status()
+        return _result(_http.loads(resp.content))
+
+    async def _private_post(self, path: str, data: dict | None = None) -> dict:
+        form = self._form(data)
+        for attempt in range(_RETRY_ATTEMPTS):
+            async with self._semaphore:
+                post_data, headers = self._sign(path, form)
+                resp = await self._client.post(path, content=post_data, headers=headers)
+            body = _http.loads(resp.content) if resp.is_success else None
+            if attempt == _RETRY_ATTEMPTS - 1 or not _transient(resp.status_code, body):
+                break
+            await asyncio.sleep(
+                _http.backoff_delay(
+                    attempt, _RETRY_BACKOFF, resp.headers.get("Retry-After")
+                )
+            )
         resp.raise_for_status()
-        body = resp.json()
-        if body.get("error"):
-            raise RuntimeError(f"Kraken API error: {body['error']}")
-        return body.get("result", body)
+        return _result(body)
@@ -54,17 +54,125 @@ Usage:
 
     # Add a comment to an issue
     lin.add_comment("ISSUE_UUID", body="Investigating now.")
+
+    # --- Async (full listings, several at once) ---
+    from goliath.integrations.linear import AsyncLinearClient
+
+    async with AsyncLinearClient() as alin:
+        issues, projects = await asyncio.gather(
+            alin.list_all_my_issues(), alin.list_all_projects()
+        )
 """
 
-import requests
+import asyncio
+
+import httpx
 
 from goliath import config
+from goliath.integrations import _http
 
 _API_URL = "https://api.linear.app/graphql"
+# Linear's maximum connection page size.
+_PAGE_SIZE = 250
+
+# GraphQL documents, built once at import; calls only vary the variables.
+_LIST_MY_ISSUES = """
+query($first: Int!, $after: String) {
+  viewer {
+    assignedIssues(first: $first, after: $after, orderBy: updatedAt) {
+      nodes { id identifier title state { name } priority priorityLabel
+              assignee { name } createdAt updatedAt }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
 
+_GET_ISSUE = """
+query($id: String!) {
+  issue(id: $id) {
+    id identifier title description state { id name }
+    priority priorityLabel assignee { id name }
+    project { id name } team { id name key }
+    labels { nodes { id name } }
+    createdAt updatedAt
+  }
+}
+"""
+
+_CREATE_ISSUE = """
+mutation($input: IssueCreateInput!) {
+  issueCreate(input: $input) {
+    success issue { id identifier title state { name } priority }
+  }
+}
+"""
+
+_UPDATE_ISSUE = """
+mutation($id: String!, $input: IssueUpdateInput!) {
+  issueUpdate(id: $id, input: $input) {
+    success issue { id identifier title state { name } }
+  }
+}
+"""
+
+_DELETE_ISSUE = """
+mutation($id: String!) { issueArchive(id: $id) { success } }
+"""
+
+_SEARCH_ISSUES = """
+query($query: String!, $first: Int!, $after: String) {
+  searchIssues(query: $query, first: $first, after: $after) {
+    nodes { id identifier title state { name } priority
+            assignee { name } createdAt }
+    pageInfo { endCursor hasNextPage }
+  }
+}
+"""
+
+_ADD_COMMENT = """
+mutation($input: CommentCreateInput!) {
+  commentCreate(input: $input) { success comment { id body createdAt } }
+}
+"""
+
+_LIST_TEAMS = """
+{ teams { nodes { id name key description } } }
+"""
+
+_LIST_PROJECTS = """
+query($first: Int!, $after: String) {
+  projects(first: $first, after: $after) {
+    nodes { id name description state startDate targetDate
+            lead { name } teams { nodes { name } } }
+    pageInfo { endCursor hasNextPage }
+  }
+}
+"""
+
+_LIST_WORKFLOW_STATES = """
+query($id: String!) {
+  team(id: $id) {
+    states { nodes { id name type position } }
+  }
+}
+"""
+
+
+def _data(body: dict) -> dict:
+    """Unwrap a GraphQL response, raising on any reported errors."""
+    if "errors" in body:
+        raise RuntimeError(f"Linear API error: {body['errors']}")
+    return body.get("data", body)
+
+
+def _update_input(fields: dict) -> dict:
+    """Build an IssueUpdateInput, skipping None so it leaves fields as they are."""
+    return {key: value for key, value in fields.items() if value is not None}
 
-class LinearClient:
-    """Linear GraphQL API client for issues, projects, and teams."""
+
+class _LinearBase:
+    """API-key check and headers shared by the sync and async clients."""
 
     def __init__(self):
         if not config.LINEAR_API_KEY:
@@ -73,12 +181,18 @@ class LinearClient:
                 "Add it to .env or export as an environment variable. "
                 "See integrations/linear.py for setup instructions."
             )
-
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._headers = {
             "Authorization": config.LINEAR_API_KEY,
             "Content-Type": "application/json",
-        })
+        }
+
+
+class LinearClient(_LinearBase, _http.SharedSessionClient):
+    """Linear GraphQL API client for issues, projects, and teams."""
+
+    def __init__(self):
+        super().__init__()
+        self.session = _http.shared_session()
 
     # -- Issues ------------------------------------------------------------
 
@@ -91,17 +205,7 @@ class LinearClient:
         Returns:
             List of issue dicts.
         """
-        query = """
-        query($first: Int!) {
-          viewer {
-            assignedIssues(first: $first, orderBy: updatedAt) {
-              nodes { id identifier title state { name } priority priorityLabel
-                      assignee { name } createdAt updatedAt }
-            }
-          }
-        }
-        """
-        data = self._query(query, {"first": first})
+        data = self._query(_LIST_MY_ISSUES, {"first": first})
         return data.get("viewer", {}).get("assignedIssues", {}).get("nodes", [])
 
     def get_issue(self, issue_id: str) -> dict:
@@ -113,18 +217,7 @@ class LinearClient:
         Returns:
             Issue dict.
         """
-        query = """
-        query($id: String!) {
-          issue(id: $id) {
-            id identifier title description state { id name }
-            priority priorityLabel assignee { id name }
-            project { id name } team { id name key }
-            labels { nodes { id name } }
-            createdAt updatedAt
-          }
-        }
-        """
-        return self._query(query, {"id": issue_id}).get("issue", {})
+        return self._query(_GET_ISSUE, {"id": issue_id}).get("issue", {})
 
     def create_issue(
         self,
@@ -152,26 +245,22 @@ class LinearClient:
         Returns:
             Dict with "success" and created "issue".
         """
-        input_fields = f'teamId: "{team_id}", title: "{_esc(title)}"'
+        issue_input: dict = {"teamId": team_id, "title": title}
         if description:
-            input_fields += f', description: "{_esc(description)}"'
+            issue_input["description"] = description
         if priority is not None:
-            input_fields += f", priority: {priority}"
+            issue_input["priority"] = priority
         if assignee_id:
-            input_fields += f', assigneeId: "{assignee_id}"'
+            issue_input["assigneeId"] = assignee_id
         if project_id:
-            input_fields += f', projectId: "{project_id}"'
+            issue_input["projectId"] = project_id
         if state_id:
-            input_fields += f', stateId: "{state_id}"'
+            issue_input["stateId"] = state_id
         if label_ids:
-            ids_str = ", ".join(f'"{lid}"' for lid in label_ids)
-            input_fields += f", labelIds: [{ids_str}]"
+            issue_input["labelIds"] = label_ids
 
-        query = (
-            "mutation { issueCreate(input: {%s}) { success issue "
-            "{ id identifier title state { name } priority } } }" % input_fields
-        )
-        return self._query(query).get("issueCreate", {})
+        data = self._query(_CREATE_ISSUE, {"input": issue_input})
+        return data.get("issueCreate", {})
 
     def update_issue(self, issue_id: str, **kwargs) -> dict:
         """Update an issue.
@@ -179,29 +268,16 @@ class LinearClient:
         Args:
             issue_id: Issue UUID.
             kwargs:   Fields to update (title, description, stateId, priority,
-                      assigneeId, projectId, labelIds, etc.).
+                      assigneeId, projectId, labelIds, etc.). None values
+                      are skipped and leave the field unchanged.
 
         Returns:
             Dict with "success" and updated "issue".
         """
-        parts = []
-        for key, val in kwargs.items():
-            if isinstance(val, str):
-                parts.append(f'{key}: "{_esc(val)}"')
-            elif isinstance(val, bool):
-                parts.append(f"{key}: {'true' if val else 'false'}")
-            elif isinstance(val, (int, float)):
-                parts.append(f"{key}: {val}")
-            elif isinstance(val, list):
-                items = ", ".join(f'"{v}"' for v in val)
-                parts.append(f"{key}: [{items}]")
-        input_str = ", ".join(parts)
-
-        query = (
-            'mutation { issueUpdate(id: "%s", input: {%s}) { success issue '
-            "{ id identifier title state { name } } } }" % (issue_id, input_str)
+        data = self._query(
+            _UPDATE_ISSUE, {"id": issue_id, "input": _update_input(kwargs)}
         )
-        return self._query(query).get("issueUpdate", {})
+        return data.get("issueUpdate", {})
 
     def delete_issue(self, issue_id: str) -> dict:
         """Delete (archive) an issue.
@@ -212,8 +288,7 @@ class LinearClient:
         Returns:
             Dict with "success".
         """
-        query = 'mutation { issueArchive(id: "%s") { success } }' % issue_id
-        return self._query(query).get("issueArchive", {})
+        return self._query(_DELETE_ISSUE, {"id": issue_id}).get("issueArchive", {})
 
     def search_issues(self, query_text: str, first: int = 25) -> list[dict]:
         """Search issues by text.
@@ -225,15 +300,7 @@ class LinearClient:
         Returns:
             List of issue dicts.
         """
-        query = """
-        query($query: String!, $first: Int!) {
-          searchIssues(query: $query, first: $first) {
-            nodes { id identifier title state { name } priority
-                    assignee { name } createdAt }
-          }
-        }
-        """
-        data = self._query(query, {"query": query_text, "first": first})
+        data = self._query(_SEARCH_ISSUES, {"query": query_text, "first": first})
         return data.get("searchIssues", {}).get("nodes", [])
 
     # -- Comments ----------------------------------------------------------
@@ -248,12 +315,8 @@ class LinearClient:
         Returns:
             Dict with "success" and created "comment".
         """
-        query = (
-            'mutation { commentCreate(input: {issueId: "%s", body: "%s"}) '
-            "{ success comment { id body createdAt } } }"
-            % (issue_id, _esc(body))
-        )
-        return self._query(query).get("commentCreate", {})
+        data = self._query(_ADD_COMMENT, {"input": {"issueId": issue_id, "body": body}})
+        return data.get("commentCreate", {})
 
     # -- Teams -------------------------------------------------------------
 
@@ -263,10 +326,7 @@ class LinearClient:
         Returns:
             List of team dicts.
         """
-        query = """
-        { teams { nodes { id name key description } } }
-        """
-        return self._query(query).get("teams", {}).get("nodes", [])
+        return self._query(_LIST_TEAMS).get("teams", {}).get("nodes", [])
 
     # -- Projects ----------------------------------------------------------
 
@@ -279,15 +339,8 @@ class LinearClient:
         Returns:
             List of project dicts.
         """
-        query = """
-        query($first: Int!) {
-          projects(first: $first) {
-            nodes { id name description state startDate targetDate
-                    lead { name } teams { nodes { name } } }
-          }
-        }
-        """
-        return self._query(query, {"first": first}).get("projects", {}).get("nodes", [])
+        data = self._query(_LIST_PROJECTS, {"first": first})
+        return data.get("projects", {}).get("nodes", [])
 
     # -- Workflow States ----------------------------------------------------
 
@@ -300,14 +353,7 @@ class LinearClient:
         Returns:
             List of state dicts with id, name, type, position.
         """
-        query = """
-        query($id: String!) {
-          team(id: $id) {
-            states { nodes { id name type position } }
-          }
-        }
-        """
-        data = self._query(query, {"id": team_id})
+        data = self._query(_LIST_WORKFLOW_STATES, {"id": team_id})
         return data.get("team", {}).get("states", {}).get("nodes", [])
 
     # -- internal helpers --------------------------------------------------
@@ -317,14 +363,172 @@ class LinearClient:
         payload: dict = {"query": query}
         if variables:
             payload["variables"] = variables
-        resp = self.session.post(_API_URL, json=payload)
+        resp = self.session.post(
+            _API_URL, data=_http.dumps(payload), headers=self._headers
+        )
         resp.raise_for_status()
-        body = resp.json()
-        if "errors" in body:
-            raise RuntimeError(f"Linear API error: {body['errors']}")
-        return body.get("data", body)
+        return _data(_http.loads(resp.content))
+
+
+class AsyncLinearClient(_LinearBase):
+    """Async Linear client built on httpx.
+
+    Mirrors LinearClient's methods as coroutines and adds ``list_all_*``
+    helpers that walk every page at Linear's maximum page size. Cursor
+    pages are inherently sequential, so the concurrency comes from running
+    several listings or lookups at once (e.g. with ``asyncio.gather``); at
+    most ``max_concurrency`` requests are in flight. Use it as an async
+    context manager so the pool is closed when done.
+    """
+
+    def __init__(self, max_concurrency: int = 8):
+        super().__init__()
+        self._client = httpx.AsyncClient(
+            http2=_http.HTTP2,
+            headers=self._headers,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    # -- Issues ------------------------------------------------------------
+
+    async def list_my_issues(self, first: int = 50) -> list[dict]:
+        """List issues assigned to the authenticated user."""
+        data = await self._query(_LIST_MY_ISSUES, {"first": first})
+        return data.get("viewer", {}).get("assignedIssues", {}).get("nodes", [])
+
+    async def list_all_my_issues(self) -> list[dict]:
+        """List every issue assigned to the authenticated user."""
+        return await self._paginate(_LIST_MY_ISSUES, {}, "viewer", "assignedIssues")
+
+    async def get_issue(self, issue_id: str) -> dict:
+        """Get an issue by UUID."""
+        return (await self._query(_GET_ISSUE, {"id": issue_id})).get("issue", {})
+
+    async def get_issues(self, issue_ids: list[str]) -> list[dict]:
+        """Get several issues concurrently."""
+        return list(await asyncio.gather(*(self.get_issue(i) for i in issue_ids)))
+
+    async def create_issue(
+        self,
+        team_id: str,
+        title: str,
+        description: str = "",
+        priority: int | None = None,
+        assignee_id: str | None = None,
+        project_id: str | None = None,
+        state_id: str | None = None,
+        label_ids: list[str] | None = None,
+    ) -> dict:
+        """Create an issue. See LinearClient."""
+        issue_input: dict = {"teamId": team_id, "title": title}
+        if description:
+            issue_input["description"] = description
+        if priority is not None:
+            issue_input["priority"] = priority
+        if assignee_id:
+            issue_input["assigneeId"] = assignee_id
+        if project_id:
+            issue_input["projectId"] = project_id
+        if state_id:
+            issue_input["stateId"] = state_id
+        if label_ids:
+            issue_input["labelIds"] = label_ids
+
+        data = await self._query(_CREATE_ISSUE, {"input": issue_input})
+        return data.get("issueCreate", {})
+
+    async def update_issue(self, issue_id: str, **kwargs) -> dict:
+        """Update an issue. See LinearClient."""
+        data = await self._query(
+            _UPDATE_ISSUE, {"id": issue_id, "input": _update_input(kwargs)}
+        )
+        return data.get("issueUpdate", {})
+
+    async def delete_issue(self, issue_id: str) -> dict:
+        """Delete (archive) an issue."""
+        data = await self._query(_DELETE_ISSUE, {"id": issue_id})
+        return data.get("issueArchive", {})
 
+    async def search_issues(self, query_text: str, first: int = 25) -> list[dict]:
+        """Search issues by text."""
+        data = await self._query(_SEARCH_ISSUES, {"query": query_text, "first": first})
+        return data.get("searchIssues", {}).get("nodes", [])
+
+    async def search_all_issues(self, query_text: str) -> list[dict]:
+        """Return every issue matching a text search."""
+        return await self._paginate(
+            _SEARCH_ISSUES, {"query": query_text}, "searchIssues"
+        )
+
+    # -- Comments ----------------------------------------------------------
+
+    async def add_comment(self, issue_id: str, body: str) -> dict:
+        """Add a comment to an issue."""
+        data = await self._query(
+            _ADD_COMMENT, {"input": {"issueId": issue_id, "body": body}}
+        )
+        return data.get("commentCreate", {})
+
+    # -- Teams -------------------------------------------------------------
+
+    async def list_teams(self) -> list[dict]:
+        """List all teams."""
+        return (await self._query(_LIST_TEAMS)).get("teams", {}).get("nodes", [])
+
+    # -- Projects ----------------------------------------------------------
+
+    async def list_projects(self, first: int = 50) -> list[dict]:
+        """List projects."""
+        data = await self._query(_LIST_PROJECTS, {"first": first})
+        return data.get("projects", {}).get("nodes", [])
+
+    async def list_all_projects(self) -> list[dict]:
+        """List every project."""
+        return await self._paginate(_LIST_PROJECTS, {}, "projects")
+
+    # -- Workflow States ----------------------------------------------------
+
+    async def list_workflow_states(self, team_id: str) -> list[dict]:
+        """List workflow states for a team."""
+        data = await self._query(_LIST_WORKFLOW_STATES, {"id": team_id})
+        return data.get("team", {}).get("states", {}).get("nodes", [])
+
+    # -- internal helpers --------------------------------------------------
+
+    async def _paginate(self, query: str, variables: dict, *path: str) -> list[dict]:
+        """Follow ``pageInfo.endCursor`` until ``hasNextPage`` is false."""
+        nodes: list[dict] = []
+        after = None
+        while True:
+            data = await self._query(
+                query, {**variables, "first": _PAGE_SIZE, "after": after}
+            )
+            for key in path:
+                data = data.get(key) or {}
+            nodes.extend(data.get("nodes", []))
+            page_info = data.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                return nodes
+            after = page_info["endCursor"]
+
+    async def _query(self, query: str, variables: dict | None = None) -> dict:
+        """Execute a GraphQL query against the Linear API."""
+        payload: dict = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        async with self._semaphore:
+            resp = await self._client.post(_API_URL, content=_http.dumps(payload))
+        resp.raise_for_status()
+        return _data(_http.loads(resp.content))
 
-def _esc(s: str) -> str:
-    """Escape a string for use inside a GraphQL string literal."""
-    return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -49,16 +49,44 @@ Usage:
     profile = li.get_profile()
 """
 
+import functools
+import mmap
+import urllib.parse
 from pathlib import Path
 
-import requests
-
 from goliath import config
+from goliath.integrations import _http
 
 _API_BASE = "https://api.linkedin.com"
-
-
-class LinkedInClient:
+_UPLOAD_MECHANISM = "com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest"
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_urn(urn: str) -> str:
+    """Percent-encode a URN for use as a path segment (cached for re-polls)."""
+    return urllib.parse.quote(urn, safe="")
+
+
+def _ugc_post(
+    author: str,
+    text: str,
+    visibility: str,
+    category: str,
+    media: dict | None = None,
+) -> dict:
+    """Build a ugcPosts request body."""
+    share: dict = {"shareCommentary": {"text": text}, "shareMediaCategory": category}
+    if media is not None:
+        share["media"] = [{"status": "READY", **media}]
+    return {
+        "author": author,
+        "lifecycleState": "PUBLISHED",
+        "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": visibility},
+        "specificContent": {"com.linkedin.ugc.ShareContent": share},
+    }
+
+
+class LinkedInClient(_http.SharedSessionClient):
     """LinkedIn API v2 client for sharing posts and managing profile."""
 
     def __init__(self):
@@ -75,14 +103,29 @@ class LinkedInClient:
             )
 
         self._person_id = config.LINKEDIN_PERSON_ID
-        self.session = requests.Session()
-        self.session.headers.update(
+        self._author_urn = f"urn:li:person:{self._person_id}"
+        # The image upload registration never changes for a given author,
+        # so it is serialised once.
+        self._register_image_payload = _http.dumps(
             {
-                "Authorization": f"Bearer {config.LINKEDIN_ACCESS_TOKEN}",
-                "X-Restli-Protocol-Version": "2.0.0",
-                "LinkedIn-Version": "202402",
+                "registerUploadRequest": {
+                    "owner": self._author_urn,
+                    "recipes": ["urn:li:digitalmediaRecipe:feedshare-image"],
+                    "serviceRelationships": [
+                        {
+                            "identifier": "urn:li:userGeneratedContent",
+                            "relationshipType": "OWNER",
+                        }
+                    ],
+                }
             }
         )
+        self.session = _http.shared_session()
+        self._headers = {
+            "Authorization": f"Bearer {config.LINKEDIN_ACCESS_TOKEN}",
+            "X-Restli-Protocol-Version": "2.0.0",
+            "LinkedIn-Version": "202402",
+        }
 
     # -- public API --------------------------------------------------------
 
@@ -92,9 +135,7 @@ class LinkedInClient:
         Returns:
             Profile data dict (name, email, picture).
         """
-        resp = self.session.get(f"{_API_BASE}/v2/userinfo")
-        resp.raise_for_status()
-        return resp.json()
+        return self._request("get", f"{_API_BASE}/v2/userinfo")
 
     def create_post(
         self,
@@ -112,32 +153,13 @@ class LinkedInClient:
         Returns:
             API response dict with the post URN.
         """
-        author = f"urn:li:person:{self._person_id}"
-        body: dict = {
-            "author": author,
-            "lifecycleState": "PUBLISHED",
-            "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": visibility},
-            "specificContent": {
-                "com.linkedin.ugc.ShareContent": {
-                    "shareCommentary": {"text": text},
-                    "shareMediaCategory": "NONE",
-                }
-            },
-        }
-
         if link_url:
-            share = body["specificContent"]["com.linkedin.ugc.ShareContent"]
-            share["shareMediaCategory"] = "ARTICLE"
-            share["media"] = [
-                {
-                    "status": "READY",
-                    "originalUrl": link_url,
-                }
-            ]
-
-        resp = self.session.post(f"{_API_BASE}/v2/ugcPosts", json=body)
-        resp.raise_for_status()
-        return resp.json()
+            body = _ugc_post(
+                self._author_urn, text, visibility, "ARTICLE", {"originalUrl": link_url}
+            )
+        else:
+            body = _ugc_post(self._author_urn, text, visibility, "NONE")
+        return self._request("post", f"{_API_BASE}/v2/ugcPosts", json=body)
 
     def create_image_post(
         self,
@@ -158,63 +180,41 @@ class LinkedInClient:
         path = Path(image_path)
         if not path.exists():
             raise FileNotFoundError(f"Image file not found: {image_path}")
+        if path.stat().st_size == 0:
+            raise ValueError(f"Image file is empty: {image_path}")
 
         # Step 1: Register the upload
-        owner = f"urn:li:person:{self._person_id}"
-        register_body = {
-            "registerUploadRequest": {
-                "owner": owner,
-                "recipes": ["urn:li:digitalmediaRecipe:feedshare-image"],
-                "serviceRelationships": [
-                    {
-                        "identifier": "urn:li:userGeneratedContent",
-                        "relationshipType": "OWNER",
-                    }
-                ],
-            }
-        }
-        reg_resp = self.session.post(
+        reg_data = self._request(
+            "post",
             f"{_API_BASE}/v2/assets?action=registerUpload",
-            json=register_body,
+            data=self._register_image_payload,
+            headers={"Content-Type": "application/json"},
         )
-        reg_resp.raise_for_status()
-        reg_data = reg_resp.json()
 
-        upload_url = reg_data["value"]["uploadMechanism"][
-            "com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest"
-        ]["uploadUrl"]
+        upload_url = reg_data["value"]["uploadMechanism"][_UPLOAD_MECHANISM][
+            "uploadUrl"
+        ]
         asset = reg_data["value"]["asset"]
 
-        # Step 2: Upload the image bytes
-        with open(path, "rb") as f:
+        # Step 2: Upload the image bytes. A memoryview over the mapped file
+        # is sent with a single sendall(); a file object would be read and
+        # written in small blocks. The upload host's reply is not JSON we
+        # need, so only its status is checked.
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
             up_resp = self.session.put(
                 upload_url,
-                data=f,
-                headers={"Content-Type": "application/octet-stream"},
+                data=view,
+                headers={**self._headers, "Content-Type": "application/octet-stream"},
             )
         up_resp.raise_for_status()
 
         # Step 3: Create the post with the uploaded asset
-        body = {
-            "author": owner,
-            "lifecycleState": "PUBLISHED",
-            "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": visibility},
-            "specificContent": {
-                "com.linkedin.ugc.ShareContent": {
-                    "shareCommentary": {"text": text},
-                    "shareMediaCategory": "IMAGE",
-                    "media": [
-                        {
-                            "status": "READY",
-                            "media": asset,
-                        }
-                    ],
-                }
-            },
-        }
-        resp = self.session.post(f"{_API_BASE}/v2/ugcPosts", json=body)
-        resp.raise_for_status()
-        return resp.json()
+        body = _ugc_post(self._author_urn, text, visibility, "IMAGE", {"media": asset})
+        return self._request("post", f"{_API_BASE}/v2/ugcPosts", json=body)
 
     def delete_post(self, post_urn: str) -> None:
         """Delete a post.
@@ -222,9 +222,8 @@ class LinkedInClient:
         Args:
             post_urn: The URN of the post (e.g. "urn:li:share:1234567890").
         """
-        encoded = post_urn.replace(":", "%3A")
-        resp = self.session.delete(f"{_API_BASE}/v2/ugcPosts/{encoded}")
-        resp.raise_for_status()
+        encoded = _encode_urn(post_urn)
+        self._request("delete", f"{_API_BASE}/v2/ugcPosts/{encoded}")
 
     def get_post_stats(self, post_urn: str) -> dict:
         """Get engagement statistics for a post.
@@ -235,9 +234,17 @@ class LinkedInClient:
         Returns:
             Dict with like count, comment count, share count, etc.
         """
-        encoded = post_urn.replace(":", "%3A")
-        resp = self.session.get(
-            f"{_API_BASE}/v2/socialActions/{encoded}",
-        )
+        encoded = _encode_urn(post_urn)
+        return self._request("get", f"{_API_BASE}/v2/socialActions/{encoded}")
+
+    # -- internal helpers --------------------------------------------------
+
+    def _request(self, method: str, url: str, **kwargs) -> dict:
+        """Send an authenticated request and decode the JSON reply, if any."""
+        _http.encode_json_kwarg(kwargs)
+        kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+        resp = getattr(self.session, method)(url, **kwargs)
         resp.raise_for_status()
-        return resp.json()
+        if not resp.content:
+            return {}
+        return _http.loads(resp.content)
@@ -48,18 +48,41 @@ Usage:
 
     # Get embed info for a Loom URL
     embed = loom.get_oembed("https://www.loom.com/share/abc123")
+
+    # --- Async (concurrent reads) ---
+    from goliath.integrations.loom import AsyncLoomClient
+
+    async with AsyncLoomClient() as aloom:
+        videos = await aloom.get_videos(["VIDEO_ID_1", "VIDEO_ID_2"])
 """
 
-import requests
+import asyncio
+from collections.abc import Iterator
+
+import httpx
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._cache import TTLCache
+from goliath.integrations._pagination import prefetch_pages
+from goliath.integrations._ratelimit import TokenBucket
 
 _API_BASE = "https://developer.loom.com/v1"
 _OEMBED_URL = "https://www.loom.com/v1/oembed"
 
+_RETRY_ATTEMPTS = 4
+_RETRY_BACKOFF = 0.5
 
-class LoomClient:
-    """Loom Public API client for videos, folders, and embeds."""
+# How long a listing page is served from memory before being refetched.
+_LIST_TTL = 60
+
+
+class _LoomBase:
+    """Token check and headers shared by the sync and async clients."""
+
+    # 100 requests/minute per workspace; shared by every sync and async
+    # instance so the two kinds of client cannot overspend it together.
+    _bucket = TokenBucket(rate=100, per=60.0)
 
     def __init__(self):
         if not config.LOOM_ACCESS_TOKEN:
@@ -68,23 +91,32 @@ class LoomClient:
                 "Add it to .env or export as an environment variable. "
                 "See integrations/loom.py for setup instructions."
             )
-
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._headers = {
             "Authorization": f"Bearer {config.LOOM_ACCESS_TOKEN}",
             "Content-Type": "application/json",
-        })
+        }
+
+
+class LoomClient(_LoomBase):
+    """Loom Public API client for videos, folders, and embeds."""
+
+    def __init__(self):
+        super().__init__()
+        self.session = _http.shared_session()
+        self._cache = TTLCache(maxsize=256, ttl=_LIST_TTL)
 
     # -- Videos ------------------------------------------------------------
 
     def list_videos(
-        self, limit: int = 25, cursor: str | None = None
+        self, limit: int = 25, cursor: str | None = None, use_cache: bool = True
     ) -> dict:
         """List videos in the workspace.
 
         Args:
-            limit:  Max results per page.
-            cursor: Pagination cursor from a previous response.
+            limit:     Max results per page.
+            cursor:    Pagination cursor from a previous response.
+            use_cache: Serve a page fetched within the last minute.
+                       Updates and deletes through this client drop it.
 
         Returns:
             Dict with "videos" list and optional "next_cursor".
@@ -92,7 +124,11 @@ class LoomClient:
         params: dict = {"limit": limit}
         if cursor:
             params["cursor"] = cursor
-        return self._get("/videos", params=params)
+        return self._get("/videos", use_cache=use_cache, params=params)
+
+    def iter_videos(self, limit: int = 100) -> Iterator[dict]:
+        """Yield every video in the workspace, across all (cached) pages."""
+        return self._iter_pages("/videos", "videos", limit)
 
     def get_video(self, video_id: str) -> dict:
         """Get a video by ID.
@@ -115,9 +151,15 @@ class LoomClient:
         Returns:
             Updated video dict.
         """
-        resp = self.session.patch(f"{_API_BASE}/videos/{video_id}", json=kwargs)
+        self._bucket.acquire()
+        resp = self.session.patch(
+            f"{_API_BASE}/videos/{video_id}",
+            data=_http.dumps(kwargs),
+            headers=self._headers,
+        )
         resp.raise_for_status()
-        return resp.json()
+        self._cache.pop_matching(lambda key: key[0] == "/videos")
+        return _http.loads(resp.content)
 
     def delete_video(self, video_id: str) -> None:
         """Delete a video.
@@ -125,8 +167,12 @@ class LoomClient:
         Args:
             video_id: Loom video ID.
         """
-        resp = self.session.delete(f"{_API_BASE}/videos/{video_id}")
+        self._bucket.acquire()
+        resp = self.session.delete(
+            f"{_API_BASE}/videos/{video_id}", headers=self._headers
+        )
         resp.raise_for_status()
+        self._cache.pop_matching(lambda key: key[0] == "/videos")
 
     # -- Transcripts -------------------------------------------------------
 
@@ -144,13 +190,14 @@ class LoomClient:
     # -- Folders -----------------------------------------------------------
 
     def list_folders(
-        self, limit: int = 25, cursor: str | None = None
+        self, limit: int = 25, cursor: str | None = None, use_cache: bool = True
     ) -> dict:
         """List folders in the workspace.
 
         Args:
-            limit:  Max results per page.
-            cursor: Pagination cursor.
+            limit:     Max results per page.
+            cursor:    Pagination cursor.
+            use_cache: Serve a page fetched within the last minute.
 
         Returns:
             Dict with "folders" list and optional "next_cursor".
@@ -158,7 +205,11 @@ class LoomClient:
         params: dict = {"limit": limit}
         if cursor:
             params["cursor"] = cursor
-        return self._get("/folders", params=params)
+        return self._get("/folders", use_cache=use_cache, params=params)
+
+    def iter_folders(self, limit: int = 100) -> Iterator[dict]:
+        """Yield every folder in the workspace, across all (cached) pages."""
+        return self._iter_pages("/folders", "folders", limit)
 
     def get_folder(self, folder_id: str) -> dict:
         """Get a folder by ID.
@@ -186,13 +237,152 @@ class LoomClient:
         params: dict = {"url": url}
         if maxwidth:
             params["maxwidth"] = maxwidth
-        resp = requests.get(_OEMBED_URL, params=params)
+        resp = self.session.get(_OEMBED_URL, params=params)
+        resp.raise_for_status()
+        return _http.loads(resp.content)
+
+    def cache_clear(self) -> None:
+        """Drop every cached listing page."""
+        self._cache.clear()
+
+    # -- internal helpers --------------------------------------------------
+
+    def _with_auth(self, kwargs: dict) -> dict:
+        """Merge the auth/API headers into a request's own headers."""
+        kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+        return kwargs
+
+    def _get(self, path: str, use_cache: bool = False, **kwargs) -> dict:
+        key = (path, tuple(sorted(kwargs.get("params", {}).items())))
+        if use_cache and (cached := self._cache.get(key)) is not None:
+            return cached
+        self._bucket.acquire()
+        resp = self.session.get(f"{_API_BASE}{path}", **self._with_auth(kwargs))
+        resp.raise_for_status()
+        body = _http.loads(resp.content)
+        if use_cache:
+            self._cache.set(key, body)
+        return body
+
+    def _iter_pages(self, path: str, key: str, limit: int) -> Iterator[dict]:
+        """Yield ``key`` items across cursor pages, prefetching the next one."""
+
+        def fetch(cursor: str):
+            params: dict = {"limit": limit}
+            if cursor:
+                params["cursor"] = cursor
+            page = self._get(path, use_cache=True, params=params)
+            return page.get(key, []), page.get("next_cursor")
+
+        return prefetch_pages(fetch, "")
+
+
+class AsyncLoomClient(_LoomBase):
+    """Async Loom client built on httpx.
+
+    Mirrors LoomClient's methods as coroutines and adds gather-based bulk
+    helpers. At most ``max_concurrency`` requests are in flight at once,
+    and every request draws from the same 100/minute budget as
+    LoomClient; 429s are retried after Retry-After. Use it as an async
+    context manager so the pool is closed when done.
+    """
+
+    def __init__(self, max_concurrency: int = 16):
+        super().__init__()
+        # Auth is set on the client once, so httpx encodes it at
+        # construction instead of merging a header dict into every request.
+        self._client = httpx.AsyncClient(
+            base_url=_API_BASE,
+            http2=_http.HTTP2,
+            headers=self._headers,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    # -- Videos ------------------------------------------------------------
+
+    async def list_videos(self, limit: int = 25, cursor: str | None = None) -> dict:
+        """List videos in the workspace. See LoomClient."""
+        params: dict = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        return await self._request("GET", "/videos", params=params)
+
+    async def get_video(self, video_id: str) -> dict:
+        """Get a video by ID."""
+        return await self._request("GET", f"/videos/{video_id}")
+
+    async def get_videos(self, video_ids: list[str]) -> list[dict]:
+        """Get several videos concurrently."""
+        return list(await asyncio.gather(*(self.get_video(v) for v in video_ids)))
+
+    async def update_video(self, video_id: str, **kwargs) -> dict:
+        """Update video metadata."""
+        return await self._request("PATCH", f"/videos/{video_id}", json=kwargs)
+
+    async def delete_video(self, video_id: str) -> None:
+        """Delete a video."""
+        await self._request("DELETE", f"/videos/{video_id}")
+
+    # -- Transcripts -------------------------------------------------------
+
+    async def get_transcript(self, video_id: str) -> dict:
+        """Get the transcript for a video."""
+        return await self._request("GET", f"/videos/{video_id}/transcript")
+
+    # -- Folders -----------------------------------------------------------
+
+    async def list_folders(self, limit: int = 25, cursor: str | None = None) -> dict:
+        """List folders in the workspace. See LoomClient."""
+        params: dict = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        return await self._request("GET", "/folders", params=params)
+
+    async def get_folder(self, folder_id: str) -> dict:
+        """Get a folder by ID."""
+        return await self._request("GET", f"/folders/{folder_id}")
+
+    # -- oEmbed ------------------------------------------------------------
+
+    async def get_oembed(self, url: str, maxwidth: int | None = None) -> dict:
+        """Get oEmbed data for a Loom share URL (sent without credentials)."""
+        params: dict = {"url": url}
+        if maxwidth:
+            params["maxwidth"] = maxwidth
+        request = self._client.build_request("GET", _OEMBED_URL, params=params)
+        request.headers.pop("Authorization", None)
+        resp = await self._client.send(request)
         resp.raise_for_status()
-        return resp.json()
+        return _http.loads(resp.content)
 
     # -- internal helpers --------------------------------------------------
 
-    def _get(self, path: str, **kwargs) -> dict:
-        resp = self.session.get(f"{_API_BASE}{path}", **kwargs)
+    async def _request(self, method: str, path: str, **kwargs) -> dict:
+        _http.encode_json_kwarg(kwargs)
+        kwargs["content"] = kwargs.pop("data", None)
+        async with self._semaphore:
+            for attempt in range(_RETRY_ATTEMPTS):
+                await self._bucket.acquire_async()
+                resp = await self._client.request(method, path, **kwargs)
+                if resp.status_code != 429 or attempt == _RETRY_ATTEMPTS - 1:
+                    break
+                await asyncio.sleep(
+                    _http.backoff_delay(
+                        attempt, _RETRY_BACKOFF, resp.headers.get("Retry-After")
+                    )
+                )
         resp.raise_for_status()
-        return resp.json()
+        if resp.status_code == 204 or not resp.content:
+            return {"status": "ok"}
+        return _http.loads(resp.content)
@@ -38,22 +38,131 @@ Usage:
     # Add a subscriber
     mc.add_subscriber(list_id="abc123", email="user@example.com", first_name="Jane")
 
+    # Bulk import (up to 500 members per request)
+    mc.add_subscribers("abc123", [{"email": "a@x.com"}, {"email": "b@x.com", "first_name": "Bo"}])
+
     # Create a campaign
     campaign = mc.create_campaign(list_id="abc123", subject="Newsletter", from_name="GOLIATH")
 
     # Send a campaign
     mc.send_campaign(campaign_id="xyz789")
+
+    # --- Async (concurrent reads) ---
+    from goliath.integrations.mailchimp import AsyncMailchimpClient
+
+    async with AsyncMailchimpClient() as amc:
+        members = await amc.get_subscribers("abc123", ["a@x.com", "b@x.com"])
 """
 
+import asyncio
+import base64
+import functools
 import hashlib
+from collections.abc import Iterable
 
+import httpx
 import requests
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._cache import TTLCache
 
+_RETRY_ATTEMPTS = 4
+_RETRY_BACKOFF = 0.5
 
-class MailchimpClient:
-    """Mailchimp Marketing API client for audiences, campaigns, and subscribers."""
+# How long a listing page is served from memory before being refetched.
+_LIST_TTL = 60
+
+# Most members Mailchimp accepts in one batch-subscribe request.
+_BATCH_SIZE = 500
+
+
+@functools.lru_cache(maxsize=4096)
+def _subscriber_hash(email: str) -> str:
+    """Mailchimp's member ID: the MD5 of the lower-cased email address.
+
+    Cached, since a get/update/delete sequence on one subscriber would
+    otherwise hash the same address each time.
+    """
+    return hashlib.md5(email.lower().encode(), usedforsecurity=False).hexdigest()
+
+
+# Fresh MD5 state to copy from: cheaper than a constructor call per email.
+_MD5 = hashlib.md5(usedforsecurity=False)
+
+
+def _bulk_hash(emails: Iterable[str]) -> list[str]:
+    """Subscriber hashes for many addresses, in order.
+
+    Bypasses the ``_subscriber_hash`` cache, which a large import would
+    only churn, and copies one prepared MD5 object per address.
+    """
+    hashes = []
+    for email in emails:
+        md5 = _MD5.copy()
+        md5.update(email.lower().encode())
+        hashes.append(md5.hexdigest())
+    return hashes
+
+
+def _member(
+    email: str,
+    status: str = "subscribed",
+    first_name: str | None = None,
+    last_name: str | None = None,
+    **kwargs,
+) -> dict:
+    """Build a list-member body for add_subscriber."""
+    merge_fields = {}
+    if first_name:
+        merge_fields["FNAME"] = first_name
+    if last_name:
+        merge_fields["LNAME"] = last_name
+
+    data = {
+        "email_address": email,
+        "status": status,
+        **kwargs,
+    }
+    if merge_fields:
+        data["merge_fields"] = merge_fields
+    return data
+
+
+def _member_batches(subscribers: list[dict], update_existing: bool) -> list[dict]:
+    """Split subscriber dicts into batch-subscribe bodies for add_subscribers."""
+    return [
+        {
+            "members": [_member(**sub) for sub in subscribers[i : i + _BATCH_SIZE]],
+            "update_existing": update_existing,
+        }
+        for i in range(0, len(subscribers), _BATCH_SIZE)
+    ]
+
+
+def _campaign(
+    list_id: str,
+    subject: str,
+    from_name: str,
+    reply_to: str | None,
+    campaign_type: str,
+) -> dict:
+    """Build a campaign body for create_campaign."""
+    data = {
+        "type": campaign_type,
+        "recipients": {"list_id": list_id},
+        "settings": {
+            "subject_line": subject,
+            "from_name": from_name,
+        },
+    }
+    if reply_to:
+        data["settings"]["reply_to"] = reply_to
+    return data
+
+
+class _MailchimpBase:
+    """Credential checks shared by the sync and async clients."""
 
     def __init__(self):
         if not config.MAILCHIMP_API_KEY:
@@ -69,9 +178,20 @@ class MailchimpClient:
             )
 
         self._base = f"https://{config.MAILCHIMP_SERVER_PREFIX}.api.mailchimp.com/3.0"
-        self.session = requests.Session()
-        self.session.auth = ("anystring", config.MAILCHIMP_API_KEY)
-        self.session.headers.update({"Content-Type": "application/json"})
+        # Basic auth with any username; encoded once rather than per request.
+        creds = base64.b64encode(
+            f"anystring:{config.MAILCHIMP_API_KEY}".encode()
+        ).decode()
+        self._headers = {"Authorization": f"Basic {creds}"}
+
+
+class MailchimpClient(_MailchimpBase):
+    """Mailchimp Marketing API client for audiences, campaigns, and subscribers."""
+
+    def __init__(self):
+        super().__init__()
+        self.session = _http.shared_session()
+        self._cache = TTLCache(maxsize=256, ttl=_LIST_TTL)
 
     # -- Audiences (Lists) -------------------------------------------------
 
@@ -121,21 +241,37 @@ class MailchimpClient:
         Returns:
             Subscriber dict.
         """
-        merge_fields = {}
-        if first_name:
-            merge_fields["FNAME"] = first_name
-        if last_name:
-            merge_fields["LNAME"] = last_name
-
-        data = {
-            "email_address": email,
-            "status": status,
-            **kwargs,
-        }
-        if merge_fields:
-            data["merge_fields"] = merge_fields
+        data = _member(email, status, first_name, last_name, **kwargs)
+        result = self._post(f"/lists/{list_id}/members", json=data)
+        self._invalidate(f"/lists/{list_id}/members")
+        return result
+
+    def add_subscribers(
+        self,
+        list_id: str,
+        subscribers: list[dict],
+        update_existing: bool = True,
+    ) -> list[dict]:
+        """Add or update many subscribers, 500 per request.
 
-        return self._post(f"/lists/{list_id}/members", json=data)
+        Args:
+            list_id:         Audience/list ID.
+            subscribers:     Dicts with an "email" key and optionally
+                             "status", "first_name", "last_name" and any
+                             field add_subscriber accepts as a kwarg.
+            update_existing: Update members already on the list instead of
+                             reporting them as errors.
+
+        Returns:
+            One batch result per request, each with "new_members",
+            "updated_members" and "errors".
+        """
+        results = [
+            self._post(f"/lists/{list_id}", json=body)
+            for body in _member_batches(subscribers, update_existing)
+        ]
+        self._invalidate(f"/lists/{list_id}/members")
+        return results
 
     def get_subscriber(self, list_id: str, email: str) -> dict:
         """Get a subscriber by email.
@@ -147,7 +283,7 @@ class MailchimpClient:
         Returns:
             Subscriber dict.
         """
-        subscriber_hash = hashlib.md5(email.lower().encode()).hexdigest()
+        subscriber_hash = _subscriber_hash(email)
         return self._get(f"/lists/{list_id}/members/{subscriber_hash}")
 
     def update_subscriber(self, list_id: str, email: str, **kwargs) -> dict:
@@ -161,8 +297,10 @@ class MailchimpClient:
         Returns:
             Updated subscriber dict.
         """
-        subscriber_hash = hashlib.md5(email.lower().encode()).hexdigest()
-        return self._patch(f"/lists/{list_id}/members/{subscriber_hash}", json=kwargs)
+        subscriber_hash = _subscriber_hash(email)
+        result = self._patch(f"/lists/{list_id}/members/{subscriber_hash}", json=kwargs)
+        self._invalidate(f"/lists/{list_id}/members")
+        return result
 
     def delete_subscriber(self, list_id: str, email: str) -> None:
         """Permanently delete a subscriber.
@@ -171,21 +309,28 @@ class MailchimpClient:
             list_id: Audience/list ID.
             email:   Subscriber email address.
         """
-        subscriber_hash = hashlib.md5(email.lower().encode()).hexdigest()
-        resp = self.session.delete(
-            f"{self._base}/lists/{list_id}/members/{subscriber_hash}"
-        )
-        resp.raise_for_status()
+        subscriber_hash = _subscriber_hash(email)
+        self._send("delete", f"/lists/{list_id}/members/{subscriber_hash}")
+        self._invalidate(f"/lists/{list_id}/members")
 
     def list_subscribers(
-        self, list_id: str, count: int = 10, status: str | None = None
+        self,
+        list_id: str,
+        count: int = 10,
+        status: str | None = None,
+        offset: int = 0,
+        use_cache: bool = True,
     ) -> list[dict]:
         """List subscribers in an audience.
 
         Args:
-            list_id: Audience/list ID.
-            count:   Number of subscribers to return.
-            status:  Filter by status (subscribed, unsubscribed, etc.).
+            list_id:   Audience/list ID.
+            count:     Number of subscribers to return.
+            status:    Filter by status (subscribed, unsubscribed, etc.).
+            offset:    Number of subscribers to skip, for paging.
+            use_cache: Serve a page fetched within the last minute.
+                       Subscriber writes to the list through this client
+                       drop it.
 
         Returns:
             List of subscriber dicts.
@@ -193,7 +338,12 @@ class MailchimpClient:
         params: dict = {"count": count}
         if status:
             params["status"] = status
-        return self._get(f"/lists/{list_id}/members", params=params).get("members", [])
+        if offset:
+            params["offset"] = offset
+        page = self._get(
+            f"/lists/{list_id}/members", use_cache=use_cache, params=params
+        )
+        return page.get("members", [])
 
     # -- Campaigns ---------------------------------------------------------
 
@@ -217,17 +367,10 @@ class MailchimpClient:
         Returns:
             Campaign dict with id and web_id.
         """
-        data = {
-            "type": campaign_type,
-            "recipients": {"list_id": list_id},
-            "settings": {
-                "subject_line": subject,
-                "from_name": from_name,
-            },
-        }
-        if reply_to:
-            data["settings"]["reply_to"] = reply_to
-        return self._post("/campaigns", json=data)
+        data = _campaign(list_id, subject, from_name, reply_to, campaign_type)
+        result = self._post("/campaigns", json=data)
+        self._invalidate("/campaigns")
+        return result
 
     def set_campaign_content(self, campaign_id: str, html: str) -> dict:
         """Set the HTML content for a campaign.
@@ -239,7 +382,9 @@ class MailchimpClient:
         Returns:
             Content dict.
         """
-        return self._put(f"/campaigns/{campaign_id}/content", json={"html": html})
+        result = self._put(f"/campaigns/{campaign_id}/content", json={"html": html})
+        self._invalidate("/campaigns")
+        return result
 
     def send_campaign(self, campaign_id: str) -> None:
         """Send a campaign.
@@ -247,15 +392,19 @@ class MailchimpClient:
         Args:
             campaign_id: Mailchimp campaign ID.
         """
-        resp = self.session.post(f"{self._base}/campaigns/{campaign_id}/actions/send")
-        resp.raise_for_status()
+        self._send("post", f"/campaigns/{campaign_id}/actions/send")
+        self._invalidate("/campaigns")
 
-    def list_campaigns(self, count: int = 10, status: str | None = None) -> list[dict]:
+    def list_campaigns(
+        self, count: int = 10, status: str | None = None, use_cache: bool = True
+    ) -> list[dict]:
         """List campaigns.
 
         Args:
-            count:  Number of campaigns to return.
-            status: Filter by status ("save", "paused", "schedule", "sending", "sent").
+            count:     Number of campaigns to return.
+            status:    Filter by status ("save", "paused", "schedule", "sending", "sent").
+            use_cache: Serve a page fetched within the last minute.
+                       Campaign writes through this client drop it.
 
         Returns:
             List of campaign dicts.
@@ -263,26 +412,209 @@ class MailchimpClient:
         params: dict = {"count": count}
         if status:
             params["status"] = status
-        return self._get("/campaigns", params=params).get("campaigns", [])
+        page = self._get("/campaigns", use_cache=use_cache, params=params)
+        return page.get("campaigns", [])
+
+    def cache_clear(self) -> None:
+        """Drop every cached listing page."""
+        self._cache.clear()
 
     # -- internal helpers --------------------------------------------------
 
-    def _get(self, path: str, **kwargs) -> dict:
-        resp = self.session.get(f"{self._base}{path}", **kwargs)
+    def _invalidate(self, path: str) -> None:
+        self._cache.pop_matching(lambda key: key[0] == path)
+
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        _http.encode_json_kwarg(kwargs)
+        kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+        resp = getattr(self.session, method)(f"{self._base}{path}", **kwargs)
         resp.raise_for_status()
-        return resp.json()
+        return resp
+
+    def _get(self, path: str, use_cache: bool = False, **kwargs) -> dict:
+        key = (path, tuple(sorted(kwargs.get("params", {}).items())))
+        if use_cache and (cached := self._cache.get(key)) is not None:
+            return cached
+        body = _http.loads(self._send("get", path, **kwargs).content)
+        if use_cache:
+            self._cache.set(key, body)
+        return body
 
     def _post(self, path: str, **kwargs) -> dict:
-        resp = self.session.post(f"{self._base}{path}", **kwargs)
-        resp.raise_for_status()
-        return resp.json()
+        return _http.loads(self._send("post", path, **kwargs).content)
 
     def _patch(self, path: str, **kwargs) -> dict:
-        resp = self.session.patch(f"{self._base}{path}", **kwargs)
-        resp.raise_for_status()
-        return resp.json()
+        return _http.loads(self._send("patch", path, **kwargs).content)
 
     def _put(self, path: str, **kwargs) -> dict:
-        resp = self.session.put(f"{self._base}{path}", **kwargs)
+        return _http.loads(self._send("put", path, **kwargs).content)
+
+
+class AsyncMailchimpClient(_MailchimpBase):
+    """Async Mailchimp client built on httpx.
+
+    Mirrors MailchimpClient's methods as coroutines and adds gather-based
+    bulk helpers. Mailchimp allows 10 simultaneous connections per user
+    and answers the 11th with a 429, so by default at most 10 requests
+    are in flight; any 429 that still arrives is retried after
+    Retry-After. With h2 installed those requests are multiplexed over
+    a single HTTP/2 connection instead of one socket each. Use it as an
+    async context manager so the pool is closed when done.
+    """
+
+    def __init__(self, max_concurrency: int = 10):
+        super().__init__()
+        self._client = httpx.AsyncClient(
+            base_url=self._base,
+            http2=_http.HTTP2,
+            headers=self._headers,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    # -- Audiences (Lists) -------------------------------------------------
+
+    async def list_audiences(self, count: int = 10) -> list[dict]:
+        """List audiences (mailing lists)."""
+        resp = await self._request("GET", "/lists", params={"count": count})
+        return resp.get("lists", [])
+
+    async def get_audience(self, list_id: str) -> dict:
+        """Get a single audience by ID."""
+        return await self._request("GET", f"/lists/{list_id}")
+
+    # -- Subscribers (Members) ---------------------------------------------
+
+    async def add_subscriber(
+        self,
+        list_id: str,
+        email: str,
+        status: str = "subscribed",
+        first_name: str | None = None,
+        last_name: str | None = None,
+        **kwargs,
+    ) -> dict:
+        """Add a subscriber to an audience. See MailchimpClient."""
+        data = _member(email, status, first_name, last_name, **kwargs)
+        return await self._request("POST", f"/lists/{list_id}/members", json=data)
+
+    async def add_subscribers(
+        self,
+        list_id: str,
+        subscribers: list[dict],
+        update_existing: bool = True,
+    ) -> list[dict]:
+        """Add or update many subscribers, sending the batches concurrently."""
+        return list(
+            await asyncio.gather(
+                *(
+                    self._request("POST", f"/lists/{list_id}", json=body)
+                    for body in _member_batches(subscribers, update_existing)
+                )
+            )
+        )
+
+    async def get_subscriber(self, list_id: str, email: str) -> dict:
+        """Get a subscriber by email."""
+        subscriber_hash = _subscriber_hash(email)
+        return await self._request("GET", f"/lists/{list_id}/members/{subscriber_hash}")
+
+    async def get_subscribers(self, list_id: str, emails: list[str]) -> list[dict]:
+        """Get several subscribers concurrently."""
+        return list(
+            await asyncio.gather(
+                *(
+                    self._request("GET", f"/lists/{list_id}/members/{h}")
+                    for h in _bulk_hash(emails)
+                )
+            )
+        )
+
+    async def update_subscriber(self, list_id: str, email: str, **kwargs) -> dict:
+        """Update a subscriber."""
+        subscriber_hash = _subscriber_hash(email)
+        return await self._request(
+            "PATCH", f"/lists/{list_id}/members/{subscriber_hash}", json=kwargs
+        )
+
+    async def delete_subscriber(self, list_id: str, email: str) -> None:
+        """Permanently delete a subscriber."""
+        subscriber_hash = _subscriber_hash(email)
+        await self._request("DELETE", f"/lists/{list_id}/members/{subscriber_hash}")
+
+    async def list_subscribers(
+        self, list_id: str, count: int = 10, status: str | None = None
+    ) -> list[dict]:
+        """List subscribers in an audience."""
+        params: dict = {"count": count}
+        if status:
+            params["status"] = status
+        resp = await self._request("GET", f"/lists/{list_id}/members", params=params)
+        return resp.get("members", [])
+
+    # -- Campaigns ---------------------------------------------------------
+
+    async def create_campaign(
+        self,
+        list_id: str,
+        subject: str,
+        from_name: str,
+        reply_to: str | None = None,
+        campaign_type: str = "regular",
+    ) -> dict:
+        """Create an email campaign. See MailchimpClient."""
+        data = _campaign(list_id, subject, from_name, reply_to, campaign_type)
+        return await self._request("POST", "/campaigns", json=data)
+
+    async def set_campaign_content(self, campaign_id: str, html: str) -> dict:
+        """Set the HTML content for a campaign."""
+        return await self._request(
+            "PUT", f"/campaigns/{campaign_id}/content", json={"html": html}
+        )
+
+    async def send_campaign(self, campaign_id: str) -> None:
+        """Send a campaign."""
+        await self._request("POST", f"/campaigns/{campaign_id}/actions/send")
+
+    async def list_campaigns(
+        self, count: int = 10, status: str | None = None
+    ) -> list[dict]:
+        """List campaigns."""
+        params: dict = {"count": count}
+        if status:
+            params["status"] = status
+        resp = await self._request("GET", "/campaigns", params=params)
+        return resp.get("campaigns", [])
+
+    # -- internal helpers --------------------------------------------------
+
+    async def _request(self, method: str, path: str, **kwargs) -> dict:
+        _http.encode_json_kwarg(kwargs)
+        kwargs["content"] = kwargs.pop("data", None)
+        async with self._semaphore:
+            for attempt in range(_RETRY_ATTEMPTS):
+                resp = await self._client.request(method, path, **kwargs)
+                if resp.status_code != 429 or attempt == _RETRY_ATTEMPTS - 1:
+                    break
+                await asyncio.sleep(
+                    _http.backoff_delay(
+                        attempt, _RETRY_BACKOFF, resp.headers.get("Retry-After")
+                    )
+                )
         resp.raise_for_status()
-        return resp.json()
+        if resp.status_code == 204 or not resp.content:
+            return {"status": "ok"}
+        return _http.loads(resp.content)
@@ -50,17 +50,53 @@ Usage:
         content="<h1>Weekly Update</h1><p>Progress on all fronts.</p>",
         content_format="html",
     )
+
+    # --- Async ---
+    from goliath.integrations.medium import AsyncMediumClient
+
+    async with AsyncMediumClient() as amed:
+        me, pubs = await asyncio.gather(amed.get_me(), amed.list_publications())
 """
 
-import requests
+import asyncio
+
+import httpx
 
 from goliath import config
+from goliath.integrations import _http
 
 _API_BASE = "https://api.medium.com/v1"
 
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 1.0
+
+
+def _post_body(
+    title: str,
+    content: str,
+    content_format: str,
+    publish_status: str,
+    tags: list[str] | None,
+    canonical_url: str | None,
+    **kwargs,
+) -> dict:
+    """Build a create-post body; Medium accepts at most 5 tags."""
+    data: dict = {
+        "title": title,
+        "contentFormat": content_format,
+        "content": content,
+        "publishStatus": publish_status,
+        **kwargs,
+    }
+    if tags:
+        data["tags"] = tags[:5]
+    if canonical_url:
+        data["canonicalUrl"] = canonical_url
+    return data
+
 
-class MediumClient:
-    """Medium API client for publishing and managing posts."""
+class _MediumBase:
+    """Token check and headers shared by the sync and async clients."""
 
     def __init__(self):
         if not config.MEDIUM_ACCESS_TOKEN:
@@ -70,14 +106,21 @@ class MediumClient:
                 "See integrations/medium.py for setup instructions."
             )
 
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._headers = {
             "Authorization": f"Bearer {config.MEDIUM_ACCESS_TOKEN}",
             "Content-Type": "application/json",
             "Accept": "application/json",
-        })
+        }
         self._user_id: str | None = None
 
+
+class MediumClient(_MediumBase):
+    """Medium API client for publishing and managing posts."""
+
+    def __init__(self):
+        super().__init__()
+        self.session = _http.shared_session()
+
     # -- User --------------------------------------------------------------
 
     def get_me(self) -> dict:
@@ -121,18 +164,15 @@ class MediumClient:
         Returns:
             Created post dict with id, title, url, etc.
         """
-        data: dict = {
-            "title": title,
-            "contentFormat": content_format,
-            "content": content,
-            "publishStatus": publish_status,
+        data = _post_body(
+            title,
+            content,
+            content_format,
+            publish_status,
+            tags,
+            canonical_url,
             **kwargs,
-        }
-        if tags:
-            data["tags"] = tags[:5]
-        if canonical_url:
-            data["canonicalUrl"] = canonical_url
-
+        )
         return self._post(f"/users/{self.user_id}/posts", json=data)
 
     # -- Publications ------------------------------------------------------
@@ -171,30 +211,155 @@ class MediumClient:
         Returns:
             Created post dict.
         """
-        data: dict = {
-            "title": title,
-            "contentFormat": content_format,
-            "content": content,
-            "publishStatus": publish_status,
+        data = _post_body(
+            title,
+            content,
+            content_format,
+            publish_status,
+            tags,
+            canonical_url,
             **kwargs,
-        }
-        if tags:
-            data["tags"] = tags[:5]
-        if canonical_url:
-            data["canonicalUrl"] = canonical_url
-
+        )
         return self._post(f"/publications/{publication_id}/posts", json=data)
 
     # -- internal helpers --------------------------------------------------
 
+    def _with_auth(self, kwargs: dict) -> dict:
+        """Merge the auth/API headers into a request's own headers."""
+        kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+        return kwargs
+
     def _get(self, path: str, **kwargs) -> dict | list:
-        resp = self.session.get(f"{_API_BASE}{path}", **kwargs)
+        resp = self.session.get(f"{_API_BASE}{path}", **self._with_auth(kwargs))
         resp.raise_for_status()
-        body = resp.json()
+        body = _http.loads(resp.content)
         return body.get("data", body)
 
     def _post(self, path: str, **kwargs) -> dict:
-        resp = self.session.post(f"{_API_BASE}{path}", **kwargs)
+        _http.encode_json_kwarg(kwargs)
+        resp = self.session.post(f"{_API_BASE}{path}", **self._with_auth(kwargs))
+        resp.raise_for_status()
+        body = _http.loads(resp.content)
+        return body.get("data", body)
+
+
+class AsyncMediumClient(_MediumBase):
+    """Async Medium client built on httpx.
+
+    Mirrors MediumClient's methods as coroutines. The user ID is fetched
+    once on first need and cached, as in the sync client. At most
+    ``max_concurrency`` requests run at a time, and 429s are retried
+    after Retry-After. With h2 installed the concurrent requests are
+    multiplexed over a single HTTP/2 connection. Use it as an async
+    context manager so the pool is closed when done.
+    """
+
+    def __init__(self, max_concurrency: int = 4):
+        super().__init__()
+        # Auth is set on the client once, so httpx encodes it at
+        # construction instead of merging a header dict into every request.
+        self._client = httpx.AsyncClient(
+            base_url=_API_BASE,
+            http2=_http.HTTP2,
+            headers=self._headers,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    # -- User --------------------------------------------------------------
+
+    async def get_me(self) -> dict:
+        """Get the authenticated user's profile."""
+        return await self._request("GET", "/me")
+
+    async def get_user_id(self) -> str:
+        """Fetch and cache the authenticated user's ID."""
+        if self._user_id is None:
+            self._user_id = (await self.get_me())["id"]
+        return self._user_id
+
+    # -- Posts -------------------------------------------------------------
+
+    async def create_post(
+        self,
+        title: str,
+        content: str,
+        content_format: str = "markdown",
+        publish_status: str = "draft",
+        tags: list[str] | None = None,
+        canonical_url: str | None = None,
+        **kwargs,
+    ) -> dict:
+        """Create a post under the authenticated user. See MediumClient."""
+        data = _post_body(
+            title,
+            content,
+            content_format,
+            publish_status,
+            tags,
+            canonical_url,
+            **kwargs,
+        )
+        user_id = await self.get_user_id()
+        return await self._request("POST", f"/users/{user_id}/posts", json=data)
+
+    # -- Publications ------------------------------------------------------
+
+    async def list_publications(self) -> list[dict]:
+        """List publications the authenticated user contributes to."""
+        user_id = await self.get_user_id()
+        return await self._request("GET", f"/users/{user_id}/publications")
+
+    async def create_publication_post(
+        self,
+        publication_id: str,
+        title: str,
+        content: str,
+        content_format: str = "markdown",
+        publish_status: str = "draft",
+        tags: list[str] | None = None,
+        canonical_url: str | None = None,
+        **kwargs,
+    ) -> dict:
+        """Create a post under a publication. See MediumClient."""
+        data = _post_body(
+            title,
+            content,
+            content_format,
+            publish_status,
+            tags,
+            canonical_url,
+            **kwargs,
+        )
+        return await self._request(
+            "POST", f"/publications/{publication_id}/posts", json=data
+        )
+
+    # -- internal helpers --------------------------------------------------
+
+    async def _request(self, method: str, path: str, **kwargs) -> dict | list:
+        _http.encode_json_kwarg(kwargs)
+        kwargs["content"] = kwargs.pop("data", None)
+        async with self._semaphore:
+            for attempt in range(_RETRY_ATTEMPTS):
+                resp = await self._client.request(method, path, **kwargs)
+                if resp.status_code != 429 or attempt == _RETRY_ATTEMPTS - 1:
+                    break
+                await asyncio.sleep(
+                    _http.backoff_delay(
+                        attempt, _RETRY_BACKOFF, resp.headers.get("Retry-After")
+                    )
+                )
         resp.raise_for_status()
-        body = resp.json()
+        body = _http.loads(resp.content)
         return body.get("data", body)
@@ -45,27 +45,64 @@ Usage:
     # Query top events (requires service account)
     top = mp.top_events(event_type="general", limit=10)
 
-    # Export raw events
-    data = mp.export_events(from_date="2025-01-01", to_date="2025-01-31")
+    # Export raw events (streamed one event at a time)
+    for ev in mp.export_events(from_date="2025-01-01", to_date="2025-01-31"):
+        print(ev["event"])
 
     # User profile: set properties
     mp.set_user("user-123", {"$name": "Alice", "plan": "pro"})
+
+    # --- Async ---
+    from goliath.integrations.mixpanel import AsyncMixpanelClient
+
+    async with AsyncMixpanelClient() as amp:
+        # Queued and sent in batches of up to 50; leaving the block flushes.
+        await amp.track(distinct_id="user-123", event="Purchase")
+        await amp.set_user("user-123", {"plan": "pro"})
 """
 
+import asyncio
 import base64
 import json
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
 
-import requests
+import httpx
 
 from goliath import config
+from goliath.integrations import _http
+from goliath.integrations._ratelimit import TokenBucket
 
 _TRACK_URL = "https://api.mixpanel.com"
 _QUERY_BASE = "https://mixpanel.com/api/2.0"
 _EXPORT_BASE = "https://data.mixpanel.com/api/2.0"
 
+# Fixed endpoints, joined once here rather than formatted on every call.
+_TRACK_ENDPOINT = f"{_TRACK_URL}/track"
+_ENGAGE_ENDPOINT = f"{_TRACK_URL}/engage"
+_EXPORT_ENDPOINT = f"{_EXPORT_BASE}/export"
+_TOP_EVENTS_ENDPOINT = f"{_QUERY_BASE}/events/top"
 
-class MixpanelClient:
-    """Mixpanel API client for event tracking and analytics queries."""
+_RETRY_ATTEMPTS = 4
+_RETRY_BACKOFF = 0.5
+
+# /track and /engage accept at most 50 events or profile updates per request.
+_BATCH_SIZE = 50
+
+
+def _export_params(from_date: str, to_date: str, event: str | None) -> dict:
+    params: dict = {"from_date": from_date, "to_date": to_date}
+    if event:
+        params["event"] = json.dumps([event])
+    return params
+
+
+class _MixpanelBase:
+    """Credentials and payload builders shared by the sync and async clients."""
+
+    # The query and export APIs allow 60 calls/hour per project; ingestion
+    # is not request-limited. Shared by every sync and async instance.
+    _query_bucket = TokenBucket(rate=60, per=3600.0)
 
     def __init__(self):
         if not config.MIXPANEL_PROJECT_TOKEN:
@@ -83,8 +120,60 @@ class MixpanelClient:
         self._sa_secret = (
             getattr(config, "MIXPANEL_SERVICE_ACCOUNT_SECRET", "") or ""
         )
+        # The credentials never change, so encode the header once.
+        self._sa_headers: dict | None = None
+        if self._sa_user and self._sa_secret:
+            creds = base64.b64encode(
+                f"{self._sa_user}:{self._sa_secret}".encode()
+            ).decode()
+            self._sa_headers = {"Authorization": f"Basic {creds}"}
+
+    def _event(self, distinct_id: str, event: str, properties: dict | None) -> dict:
+        # The caller's dict is copied (queued events must not see later
+        # mutations), but a bare event skips building an empty one first.
+        if properties is None:
+            props = {"distinct_id": distinct_id, "token": self.token}
+        else:
+            props = properties.copy()
+            props["distinct_id"] = distinct_id
+            props["token"] = self.token
+        return {"event": event, "properties": props}
+
+    def _stamp(self, events: list[dict]) -> list[dict]:
+        for ev in events:
+            ev.setdefault("properties", {})["token"] = self.token
+        return events
+
+    def _profile_set(self, distinct_id: str, properties: dict) -> dict:
+        return {
+            "$token": self.token,
+            "$distinct_id": distinct_id,
+            "$set": properties,
+        }
+
+    def _sa_auth_headers(self) -> dict:
+        """Return the Basic auth headers for the service account (read-only)."""
+        if self._sa_headers is None:
+            raise RuntimeError(
+                "Service account credentials required for query APIs. "
+                "Set MIXPANEL_SERVICE_ACCOUNT_USER and "
+                "MIXPANEL_SERVICE_ACCOUNT_SECRET."
+            )
+        return self._sa_headers
+
+    def _query_headers(self, headers: dict) -> dict:
+        headers.update(self._sa_auth_headers())
+        if self.project_id:
+            headers["X-Mixpanel-Project-Id"] = self.project_id
+        return headers
+
 
-        self.session = requests.Session()
+class MixpanelClient(_MixpanelBase):
+    """Mixpanel API client for event tracking and analytics queries."""
+
+    def __init__(self):
+        super().__init__()
+        self.session = _http.shared_session()
 
     # -- Event Tracking --------------------------------------------------------
 
@@ -104,18 +193,14 @@ class MixpanelClient:
         Returns:
             Tracking result.
         """
-        props = dict(properties or {})
-        props["distinct_id"] = distinct_id
-        props["token"] = self.token
-
-        payload = [{"event": event, "properties": props}]
+        payload = [self._event(distinct_id, event, properties)]
         resp = self.session.post(
-            f"{_TRACK_URL}/track",
-            json=payload,
+            _TRACK_ENDPOINT,
+            data=_http.dumps(payload),
             headers={"Content-Type": "application/json"},
         )
         resp.raise_for_status()
-        return resp.json()
+        return _http.loads(resp.content)
 
     def track_batch(self, events: list[dict]) -> dict:
         """Track multiple events.
@@ -127,16 +212,13 @@ class MixpanelClient:
         Returns:
             Tracking result.
         """
-        for ev in events:
-            ev.setdefault("properties", {})["token"] = self.token
-
         resp = self.session.post(
-            f"{_TRACK_URL}/track",
-            json=events,
+            _TRACK_ENDPOINT,
+            data=_http.dumps(self._stamp(events)),
             headers={"Content-Type": "application/json"},
         )
         resp.raise_for_status()
-        return resp.json()
+        return _http.loads(resp.content)
 
     # -- User Profiles ---------------------------------------------------------
 
@@ -150,18 +232,14 @@ class MixpanelClient:
         Returns:
             API result.
         """
-        payload = [{
-            "$token": self.token,
-            "$distinct_id": distinct_id,
-            "$set": properties,
-        }]
+        payload = [self._profile_set(distinct_id, properties)]
         resp = self.session.post(
-            f"{_TRACK_URL}/engage",
-            json=payload,
+            _ENGAGE_ENDPOINT,
+            data=_http.dumps(payload),
             headers={"Content-Type": "application/json"},
         )
         resp.raise_for_status()
-        return resp.json()
+        return _http.loads(resp.content)
 
     # -- Query APIs (require service account) ----------------------------------
 
@@ -180,60 +258,264 @@ class MixpanelClient:
             Top events dict.
         """
         params: dict = {"type": event_type, "limit": limit}
-        return self._query_get("/events/top", params=params)
+        return self._query_get(_TOP_EVENTS_ENDPOINT, params=params)
 
     def export_events(
         self,
         from_date: str,
         to_date: str,
         event: str | None = None,
-    ) -> list[dict]:
+    ) -> Iterator[dict]:
         """Export raw event data.
 
+        The export is newline-delimited JSON that can run to gigabytes,
+        so it is streamed and parsed one line at a time rather than read
+        into memory whole.
+
         Args:
             from_date: Start date (YYYY-MM-DD).
             to_date:   End date (YYYY-MM-DD).
             event:     Filter by event name.
 
         Returns:
-            List of event dicts.
+            Iterator of event dicts, yielded as they arrive.
         """
-        params: dict = {"from_date": from_date, "to_date": to_date}
-        if event:
-            params["event"] = json.dumps([event])
+        headers = self._sa_auth_headers()
+        return self._iter_export(_export_params(from_date, to_date, event), headers)
+
+    # -- internal helpers ------------------------------------------------------
+
+    def _iter_export(self, params: dict, headers: dict) -> Iterator[dict]:
+        self._query_bucket.acquire()
+        with self.session.get(
+            _EXPORT_ENDPOINT, params=params, headers=headers, stream=True
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if line:
+                    yield _http.loads(line)
+
+    def _query_get(self, url: str, **kwargs) -> dict:
+        """GET against the query API with service account auth."""
+        headers = self._query_headers(kwargs.pop("headers", {}))
+        self._query_bucket.acquire()
+        resp = self.session.get(url, headers=headers, **kwargs)
+        resp.raise_for_status()
+        return _http.loads(resp.content)
+
+
+class AsyncMixpanelClient(_MixpanelBase):
+    """Async Mixpanel client built on httpx.
 
-        resp = self.session.get(
-            f"{_EXPORT_BASE}/export",
+    Mirrors MixpanelClient's methods as coroutines. The ingestion, query
+    and export APIs live on different hosts, so requests use absolute
+    URLs over one shared pool; with h2 installed each host is reached
+    over a single multiplexed HTTP/2 connection. At most ``max_concurrency`` requests are
+    in flight at once, query and export calls draw from the same hourly
+    budget as MixpanelClient, and 429s are retried after Retry-After.
+
+    ``track`` and ``set_user`` only queue their payload: a background
+    task sends each queue (/track and /engage) in POSTs of up to 50 as
+    soon as 50 are waiting or every ``flush_interval`` seconds, whichever
+    comes first. A batch that fails in the background is passed to
+    ``on_error(items, exc)`` if given; otherwise the error is raised by
+    the next ``flush``. Use it as an async context manager so the queues
+    are flushed and the pool closed when done.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        flush_interval: float = 0.5,
+        on_error: Callable[[list[dict], Exception], None] | None = None,
+    ):
+        super().__init__()
+        self._client = httpx.AsyncClient(
+            http2=_http.HTTP2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.flush_interval = flush_interval
+        self._on_error = on_error
+        self._queues: dict[str, deque] = {
+            _TRACK_ENDPOINT: deque(),
+            _ENGAGE_ENDPOINT: deque(),
+        }
+        self._batch_ready = asyncio.Event()
+        self._drain_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._flush_error: Exception | None = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Flush queued payloads, stop the flusher and close the pool."""
+        try:
+            await self.flush()
+        finally:
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                self._flush_task = None
+            await self._client.aclose()
+
+    # -- Event Tracking --------------------------------------------------------
+
+    async def track(
+        self,
+        distinct_id: str,
+        event: str,
+        properties: dict | None = None,
+    ) -> None:
+        """Queue a single event for the next batched send."""
+        self._enqueue(_TRACK_ENDPOINT, self._event(distinct_id, event, properties))
+
+    async def flush(self) -> None:
+        """Send every queued event and profile update now, 50 per request.
+
+        Waits for a background send already in progress. Without an
+        ``on_error`` callback, raises the first error from any flush since
+        the last call.
+        """
+        await self._drain()
+        error, self._flush_error = self._flush_error, None
+        if error is not None:
+            raise error
+
+    async def track_batch(self, events: list[dict]) -> dict:
+        """Track multiple events in one request."""
+        return await self._request("POST", _TRACK_ENDPOINT, json=self._stamp(events))
+
+    # -- User Profiles ---------------------------------------------------------
+
+    async def set_user(self, distinct_id: str, properties: dict) -> None:
+        """Queue a profile update for the next batched send to /engage."""
+        self._enqueue(_ENGAGE_ENDPOINT, self._profile_set(distinct_id, properties))
+
+    async def set_user_now(self, distinct_id: str, properties: dict) -> dict:
+        """Set user profile properties in a request of its own.
+
+        For callers that need the API's confirmation before moving on.
+        """
+        payload = [self._profile_set(distinct_id, properties)]
+        return await self._request("POST", _ENGAGE_ENDPOINT, json=payload)
+
+    # -- Query APIs (require service account) ----------------------------------
+
+    async def top_events(
+        self,
+        event_type: str = "general",
+        limit: int = 10,
+    ) -> dict:
+        """Get top events."""
+        params: dict = {"type": event_type, "limit": limit}
+        return await self._request(
+            "GET",
+            _TOP_EVENTS_ENDPOINT,
+            limited=True,
             params=params,
-            headers=self._sa_auth_headers(),
+            headers=self._query_headers({}),
         )
-        resp.raise_for_status()
-        lines = resp.text.strip().split("\n")
-        return [json.loads(line) for line in lines if line]
+
+    async def export_events(
+        self,
+        from_date: str,
+        to_date: str,
+        event: str | None = None,
+    ) -> AsyncIterator[dict]:
+        """Stream raw event data, yielding each event as its line arrives.
+
+        Use with ``async for``. A 429 before the body starts is retried
+        after Retry-After.
+        """
+        params = _export_params(from_date, to_date, event)
+        headers = self._sa_auth_headers()
+        for attempt in range(_RETRY_ATTEMPTS):
+            await self._query_bucket.acquire_async()
+            async with (
+                self._semaphore,
+                self._client.stream(
+                    "GET", _EXPORT_ENDPOINT, params=params, headers=headers
+                ) as resp,
+            ):
+                if resp.status_code != 429 or attempt == _RETRY_ATTEMPTS - 1:
+                    resp.raise_for_status()
+                    async for line in resp.aiter_lines():
+                        if line:
+                            yield _http.loads(line)
+                    return
+                delay = _http.backoff_delay(
+                    attempt, _RETRY_BACKOFF, resp.headers.get("Retry-After")
+                )
+            await asyncio.sleep(delay)
 
     # -- internal helpers ------------------------------------------------------
 
-    def _sa_auth_headers(self) -> dict:
-        """Build Basic auth headers from service account credentials."""
-        if not self._sa_user or not self._sa_secret:
-            raise RuntimeError(
-                "Service account credentials required for query APIs. "
-                "Set MIXPANEL_SERVICE_ACCOUNT_USER and "
-                "MIXPANEL_SERVICE_ACCOUNT_SECRET."
+    async def _flusher(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self._drain()
+
+    def _enqueue(self, url: str, item: dict) -> None:
+        queue = self._queues[url]
+        queue.append(item)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flusher())
+        if len(queue) >= _BATCH_SIZE:
+            self._batch_ready.set()
+
+    async def _drain(self) -> None:
+        async with self._drain_lock:
+            for url, queue in self._queues.items():
+                while queue:
+                    size = min(len(queue), _BATCH_SIZE)
+                    batch = [queue.popleft() for _ in range(size)]
+                    try:
+                        await self._request("POST", url, json=batch)
+                    # Not just httpx errors: an unserialisable property or a
+                    # non-JSON reply must not kill the background flusher.
+                    except Exception as exc:  # noqa: BLE001
+                        if self._on_error is not None:
+                            self._on_error(batch, exc)
+                        elif self._flush_error is None:
+                            self._flush_error = exc
+
+    async def _request(
+        self, method: str, url: str, limited: bool = False, **kwargs
+    ) -> dict:
+        _http.encode_json_kwarg(kwargs)
+        kwargs["content"] = kwargs.pop("data", None)
+        resp = await self._send(method, url, limited, **kwargs)
+        return _http.loads(resp.content)
+
+    async def _send(
+        self, method: str, url: str, limited: bool = False, **kwargs
+    ) -> httpx.Response:
+        """Send under the semaphore, retrying 429s after Retry-After.
+
+        ``limited`` requests (query and export) also take a token from
+        the hourly bucket before each attempt. The token is taken before
+        entering the semaphore, so queries waiting out the budget never
+        hold slots that /track and /engage flushes need.
+        """
+        for attempt in range(_RETRY_ATTEMPTS):
+            if limited:
+                await self._query_bucket.acquire_async()
+            async with self._semaphore:
+                resp = await self._client.request(method, url, **kwargs)
+            if resp.status_code != 429 or attempt == _RETRY_ATTEMPTS - 1:
+                break
+            await asyncio.sleep(
+                _http.backoff_delay(
+                    attempt, _RETRY_BACKOFF, resp.headers.get("Retry-After")
+                )
             )
-        creds = base64.b64encode(
-            f"{self._sa_user}:{self._sa_secret}".encode()
-        ).decode()
-        return {"Authorization": f"Basic {creds}"}
-
-    def _query_get(self, path: str, **kwargs) -> dict:
-        """GET against the query API with service account auth."""
-        headers = kwargs.pop("headers", {})
-        headers.update(self._sa_auth_headers())
-        if self.project_id:
-            headers["X-Mixpanel-Project-Id"] = self.project_id
-        resp = self.session.get(
-            f"{_QUERY_BASE}{path}", headers=headers, **kwargs
-        )
         resp.raise_for_status()
-        return resp.json()
+        return resp
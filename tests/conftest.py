@@ -0,0 +1,13 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from goliath.integrations import _http
+
+
+@pytest.fixture(autouse=True)
+def _fresh_shared_session():
+    """Give each test its own shared HTTP session so patched ones never leak."""
+    _http._shared_session = None
+    yield
+    _http._shared_session = None
@@ -1,6 +1,8 @@
 """Tests for batch 2 integrations: Pinterest, TikTok, Spotify, Zoom, Calendly,
 HubSpot, Salesforce, WordPress, Webflow, PayPal."""
 
+import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -677,7 +679,7 @@ class TestHubSpotClient:
         with pytest.raises(RuntimeError, match="HUBSPOT_ACCESS_TOKEN"):
             HubSpotClient()
 
-    @patch("goliath.integrations.hubspot.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.hubspot.config")
     def test_headers_set(self, mock_config, mock_requests):
         mock_config.HUBSPOT_ACCESS_TOKEN = "hs_tok"
@@ -685,16 +687,48 @@ class TestHubSpotClient:
         from goliath.integrations.hubspot import HubSpotClient
 
         client = HubSpotClient()
-        call_kwargs = client.session.headers.update.call_args[0][0]
-        assert call_kwargs["Authorization"] == "Bearer hs_tok"
+        client.session.get.return_value.content = b'{"id": "d_1"}'
+        client.get_deal("d_1")
+        headers = client.session.get.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer hs_tok"
+        # Credentials travel per request, never on the shared session.
+        client.session.headers.update.assert_not_called()
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.hubspot.config")
+    def test_429_retried_only_by_client(self, mock_config, mock_requests):
+        mock_config.HUBSPOT_ACCESS_TOKEN = "hs_tok"
+
+        from goliath.integrations.hubspot import HubSpotClient
+
+        client = HubSpotClient()
+        prefix, adapter = client.session.mount.call_args.args
+        assert prefix == "https://api.hubapi.com/"
+        assert not adapter.max_retries.is_retry("GET", 429)
+        assert adapter.max_retries.is_retry("GET", 503)
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.hubspot.config")
+    def test_context_manager_leaves_shared_session_open(
+        self, mock_config, mock_requests
+    ):
+        mock_config.HUBSPOT_ACCESS_TOKEN = "hs_tok"
 
-    @patch("goliath.integrations.hubspot.requests")
+        from goliath.integrations.hubspot import HubSpotClient
+
+        with HubSpotClient() as client:
+            pass
+        client.session.close.assert_not_called()
+
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.hubspot.config")
     def test_create_contact(self, mock_config, mock_requests):
         mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"id": "ct_1", "properties": {"email": "j@x.com"}}
+        mock_resp.content = json.dumps(
+            {"id": "ct_1", "properties": {"email": "j@x.com"}}
+        ).encode()
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.hubspot import HubSpotClient
@@ -709,13 +743,154 @@ class TestHubSpotClient:
         )
         assert payload["properties"]["email"] == "j@x.com"
 
-    @patch("goliath.integrations.hubspot.requests")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.hubspot.config")
+    def test_batch_create_chunks_by_100(self, mock_config, mock_requests):
+        mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
+
+        def fake_post(url, **kwargs):
+            inputs = kwargs["json"]["inputs"]
+            resp = MagicMock()
+            resp.content = json.dumps(
+                {"results": [{"id": str(i)} for i, _ in enumerate(inputs)]}
+            ).encode()
+            return resp
+
+        mock_requests.Session.return_value.post.side_effect = fake_post
+
+        from goliath.integrations.hubspot import HubSpotClient
+
+        client = HubSpotClient()
+        created = client.batch_create_contacts(
+            [{"email": f"u{i}@x.com"} for i in range(250)]
+        )
+
+        assert len(created) == 250
+        calls = client.session.post.call_args_list
+        assert sorted(len(c.kwargs["json"]["inputs"]) for c in calls) == [50, 100, 100]
+        assert all(c.args[0].endswith("/objects/contacts/batch/create") for c in calls)
+        assert calls[0].kwargs["json"]["inputs"][0] == {
+            "properties": {"email": "u0@x.com"}
+        }
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.hubspot.config")
+    def test_batch_read_and_delete(self, mock_config, mock_requests):
+        mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
+
+        read_resp = MagicMock(content=b"{}")
+        read_resp.content = json.dumps({"results": [{"id": "d1"}]}).encode()
+        mock_requests.Session.return_value.post.side_effect = [
+            read_resp,
+            MagicMock(status_code=204, content=b""),
+        ]
+
+        from goliath.integrations.hubspot import HubSpotClient
+
+        client = HubSpotClient()
+        assert client.batch_read_deals(["d1"], properties=["amount"]) == [{"id": "d1"}]
+        client.batch_delete_deals(["d1"])
+
+        read_call, delete_call = client.session.post.call_args_list
+        assert read_call.kwargs["json"] == {
+            "inputs": [{"id": "d1"}],
+            "properties": ["amount"],
+        }
+        assert delete_call.args[0].endswith("/objects/deals/batch/archive")
+
+    @patch("goliath.integrations.hubspot.time")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.hubspot.config")
+    def test_bulk_retries_throttled_calls(self, mock_config, mock_requests, mock_time):
+        mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
+
+        def fake_post(url, **kwargs):
+            email = kwargs["json"]["properties"]["email"]
+            if email == "b@x.com" and not throttled_once:
+                throttled_once.append(email)
+                return MagicMock(status_code=429, headers={"Retry-After": "2"})
+            resp = MagicMock(status_code=201)
+            resp.content = json.dumps({"email": email}).encode()
+            return resp
+
+        throttled_once: list = []
+        mock_requests.Session.return_value.post.side_effect = fake_post
+
+        from goliath.integrations.hubspot import HubSpotClient
+
+        client = HubSpotClient()
+        emails = ["a@x.com", "b@x.com", "c@x.com"]
+        results = client.bulk(client.create_contact, [{"email": e} for e in emails])
+
+        assert [r["email"] for r in results] == emails
+        assert client.session.post.call_count == 4
+        mock_time.sleep.assert_called_once_with(2.0)
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.hubspot.config")
+    def test_bulk_of_chunked_batches_does_not_deadlock(
+        self, mock_config, mock_requests
+    ):
+        mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
+
+        def fake_post(url, **kwargs):
+            resp = MagicMock()
+            resp.content = json.dumps({"results": kwargs["json"]["inputs"]}).encode()
+            return resp
+
+        mock_requests.Session.return_value.post.side_effect = fake_post
+
+        from goliath.integrations.hubspot import HubSpotClient
+
+        client = HubSpotClient()
+        # More outer calls than the initial window of 4, each needing
+        # three 100-record chunks of its own.
+        groups = [[{"n": f"{g}-{i}"} for i in range(250)] for g in range(6)]
+        results: list = []
+        runner = threading.Thread(
+            target=lambda: results.extend(
+                client.bulk(client.batch_create_contacts, groups)
+            ),
+            daemon=True,
+        )
+        runner.start()
+        runner.join(timeout=10)
+
+        assert not runner.is_alive(), "nested bulk() deadlocked"
+        assert [len(r) for r in results] == [250] * 6
+        assert results[5][249] == {"properties": {"n": "5-249"}}
+        assert client.session.post.call_count == 18
+
+    @patch("goliath.integrations.hubspot.time")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.hubspot.config")
+    def test_post_retries_429_with_jittered_backoff(
+        self, mock_config, mock_requests, mock_time
+    ):
+        mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
+
+        ok = MagicMock(status_code=200)
+        ok.content = json.dumps({"id": "deal_1"}).encode()
+        mock_requests.Session.return_value.post.side_effect = [
+            MagicMock(status_code=429, headers={}),
+            MagicMock(status_code=429, headers={}),
+            ok,
+        ]
+
+        from goliath.integrations.hubspot import HubSpotClient
+
+        assert HubSpotClient().create_deal({"dealname": "x"}) == {"id": "deal_1"}
+        first, second = (c.args[0] for c in mock_time.sleep.call_args_list)
+        assert 0.5 <= first <= 1.0
+        assert 1.0 <= second <= 2.0
+
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.hubspot.config")
     def test_search_contacts(self, mock_config, mock_requests):
         mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"results": [{"id": "ct_1"}]}
+        mock_resp.content = json.dumps({"results": [{"id": "ct_1"}]}).encode()
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.hubspot import HubSpotClient
@@ -727,13 +902,48 @@ class TestHubSpotClient:
         url = client.session.post.call_args[0][0]
         assert "/contacts/search" in url
 
-    @patch("goliath.integrations.hubspot.requests")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.hubspot.config")
+    def test_search_contacts_bulk(self, mock_config, mock_requests):
+        mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
+
+        first, second = MagicMock(), MagicMock()
+        first.content = json.dumps(
+            {
+                "results": [{"id": "1", "properties": {"email": "a@x.com"}}],
+                "paging": {"next": {"after": "1"}},
+            }
+        ).encode()
+        second.content = json.dumps(
+            {"results": [{"id": "2", "properties": {"email": "b@x.com"}}]}
+        ).encode()
+        mock_requests.Session.return_value.post.side_effect = [first, second]
+
+        from goliath.integrations.hubspot import HubSpotClient
+
+        client = HubSpotClient()
+        found = client.search_contacts_bulk(["A@x.com", "b@x.com", "missing@x.com"])
+
+        assert {k: v["id"] for k, v in found.items()} == {
+            "a@x.com": "1",
+            "b@x.com": "2",
+        }
+        first_call, second_call = client.session.post.call_args_list
+        body = first_call.kwargs["json"]
+        assert body["filterGroups"][0]["filters"][0] == {
+            "propertyName": "email",
+            "operator": "IN",
+            "values": ["a@x.com", "b@x.com", "missing@x.com"],
+        }
+        assert second_call.kwargs["json"]["after"] == "1"
+
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.hubspot.config")
     def test_create_deal(self, mock_config, mock_requests):
         mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"id": "deal_1"}
+        mock_resp.content = json.dumps({"id": "deal_1"}).encode()
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.hubspot import HubSpotClient
@@ -748,15 +958,15 @@ class TestHubSpotClient:
         )
         assert payload["properties"]["dealname"] == "Big Deal"
 
-    @patch("goliath.integrations.hubspot.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.hubspot.config")
     def test_list_companies(self, mock_config, mock_requests):
         mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "results": [{"id": "co_1", "properties": {"name": "Acme"}}]
-        }
+        }).encode()
         mock_requests.Session.return_value.get.return_value = mock_resp
 
         from goliath.integrations.hubspot import HubSpotClient
@@ -770,7 +980,7 @@ class TestHubSpotClient:
         )
         assert params["limit"] == 5
 
-    @patch("goliath.integrations.hubspot.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.hubspot.config")
     def test_delete_contact(self, mock_config, mock_requests):
         mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
@@ -787,13 +997,13 @@ class TestHubSpotClient:
         url = client.session.delete.call_args[0][0]
         assert "/objects/contacts/ct_1" in url
 
-    @patch("goliath.integrations.hubspot.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.hubspot.config")
     def test_update_contact(self, mock_config, mock_requests):
         mock_config.HUBSPOT_ACCESS_TOKEN = "tok"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"id": "ct_1"}
+        mock_resp.content = json.dumps({"id": "ct_1"}).encode()
         mock_requests.Session.return_value.patch.return_value = mock_resp
 
         from goliath.integrations.hubspot import HubSpotClient
@@ -1,8 +1,11 @@
 """Tests for batch 3 integrations: Asana, Monday.com, Zendesk, Intercom,
 Twitch, Snapchat, Medium, Substack, Cloudflare, Firebase."""
 
+import asyncio
+import json
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 
@@ -395,25 +398,31 @@ class TestIntercomClient:
         with pytest.raises(RuntimeError, match="INTERCOM_ACCESS_TOKEN"):
             IntercomClient()
 
-    @patch("goliath.integrations.intercom.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.intercom.config")
     def test_headers_set(self, mock_config, mock_requests):
         mock_config.INTERCOM_ACCESS_TOKEN = "ic_tok"
 
         from goliath.integrations.intercom import IntercomClient
 
+        mock_requests.Session.return_value.get.return_value.content = b"{}"
         client = IntercomClient()
-        call_kwargs = client.session.headers.update.call_args[0][0]
-        assert call_kwargs["Authorization"] == "Bearer ic_tok"
-        assert call_kwargs["Intercom-Version"] == "2.10"
-
-    @patch("goliath.integrations.intercom.requests")
+        client.get_contact("ct_1")
+        headers = client.session.get.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer ic_tok"
+        assert headers["Intercom-Version"] == "2.10"
+        # Auth is per request; the shared session carries no credentials.
+        client.session.headers.update.assert_not_called()
+
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.intercom.config")
     def test_create_contact(self, mock_config, mock_requests):
         mock_config.INTERCOM_ACCESS_TOKEN = "tok"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"id": "ct_1", "email": "jane@example.com"}
+        mock_resp.content = json.dumps(
+            {"id": "ct_1", "email": "jane@example.com"}
+        ).encode()
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.intercom import IntercomClient
@@ -424,19 +433,19 @@ class TestIntercomClient:
         assert contact["id"] == "ct_1"
         url = client.session.post.call_args[0][0]
         assert "/contacts" in url
-        payload = client.session.post.call_args.kwargs.get(
-            "json", client.session.post.call_args[1].get("json", {})
-        )
+        payload = json.loads(client.session.post.call_args[1]["data"])
         assert payload["email"] == "jane@example.com"
         assert payload["role"] == "user"
 
-    @patch("goliath.integrations.intercom.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.intercom.config")
     def test_send_message(self, mock_config, mock_requests):
         mock_config.INTERCOM_ACCESS_TOKEN = "tok"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"type": "admin_message", "id": "msg_1"}
+        mock_resp.content = json.dumps(
+            {"type": "admin_message", "id": "msg_1"}
+        ).encode()
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.intercom import IntercomClient
@@ -448,19 +457,19 @@ class TestIntercomClient:
 
         url = client.session.post.call_args[0][0]
         assert "/messages" in url
-        payload = client.session.post.call_args.kwargs.get(
-            "json", client.session.post.call_args[1].get("json", {})
-        )
+        payload = json.loads(client.session.post.call_args[1]["data"])
         assert payload["body"] == "Hello!"
         assert payload["from"]["id"] == "admin_1"
 
-    @patch("goliath.integrations.intercom.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.intercom.config")
     def test_search_contacts(self, mock_config, mock_requests):
         mock_config.INTERCOM_ACCESS_TOKEN = "tok"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"data": [{"id": "ct_1", "email": "jane@x.com"}]}
+        mock_resp.content = json.dumps(
+            {"data": [{"id": "ct_1", "email": "jane@x.com"}]}
+        ).encode()
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.intercom import IntercomClient
@@ -470,13 +479,15 @@ class TestIntercomClient:
 
         assert len(results) == 1
 
-    @patch("goliath.integrations.intercom.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.intercom.config")
     def test_reply_to_conversation(self, mock_config, mock_requests):
         mock_config.INTERCOM_ACCESS_TOKEN = "tok"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"id": "conv_1", "type": "conversation"}
+        mock_resp.content = json.dumps(
+            {"id": "conv_1", "type": "conversation"}
+        ).encode()
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.intercom import IntercomClient
@@ -489,13 +500,13 @@ class TestIntercomClient:
         url = client.session.post.call_args[0][0]
         assert "/conversations/conv_1/reply" in url
 
-    @patch("goliath.integrations.intercom.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.intercom.config")
     def test_list_tags(self, mock_config, mock_requests):
         mock_config.INTERCOM_ACCESS_TOKEN = "tok"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"data": [{"id": "t1", "name": "VIP"}]}
+        mock_resp.content = json.dumps({"data": [{"id": "t1", "name": "VIP"}]}).encode()
         mock_requests.Session.return_value.get.return_value = mock_resp
 
         from goliath.integrations.intercom import IntercomClient
@@ -506,6 +517,132 @@ class TestIntercomClient:
         assert len(tags) == 1
         assert tags[0]["name"] == "VIP"
 
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.intercom.config")
+    def test_iter_contacts_follows_cursor(self, mock_config, mock_requests):
+        mock_config.INTERCOM_ACCESS_TOKEN = "tok"
+        pages = {
+            None: {
+                "data": [{"id": "c1"}],
+                "pages": {"next": {"starting_after": "cur2"}},
+            },
+            "cur2": {"data": [{"id": "c2"}], "pages": {"next": None}},
+        }
+
+        def fake_get(url, params, headers):
+            resp = MagicMock()
+            resp.content = json.dumps(pages[params.get("starting_after")]).encode()
+            return resp
+
+        mock_requests.Session.return_value.get.side_effect = fake_get
+
+        from goliath.integrations.intercom import IntercomClient
+
+        contacts = list(IntercomClient().iter_contacts(per_page=1))
+        assert [c["id"] for c in contacts] == ["c1", "c2"]
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.intercom.config")
+    def test_iter_conversations_single_page(self, mock_config, mock_requests):
+        mock_config.INTERCOM_ACCESS_TOKEN = "tok"
+        mock_resp = MagicMock()
+        mock_resp.content = json.dumps({"conversations": [{"id": "cv1"}]}).encode()
+        mock_requests.Session.return_value.get.return_value = mock_resp
+
+        from goliath.integrations.intercom import IntercomClient
+
+        client = IntercomClient()
+        assert list(client.iter_conversations()) == [{"id": "cv1"}]
+        assert client.session.get.call_count == 1
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.intercom.config")
+    def test_tag_contacts_bulk(self, mock_config, mock_requests):
+        mock_config.INTERCOM_ACCESS_TOKEN = "tok"
+
+        def fake_post(url, **kwargs):
+            resp = MagicMock()
+            resp.content = json.dumps({"contact": url.split("/")[-2]}).encode()
+            return resp
+
+        mock_requests.Session.return_value.post.side_effect = fake_post
+
+        from goliath.integrations.intercom import IntercomClient
+
+        client = IntercomClient()
+        results = client.tag_contacts_bulk(["c1", "c2", "c3"], tag_id="t9")
+
+        assert [r["contact"] for r in results] == ["c1", "c2", "c3"]
+        bodies = [json.loads(c[1]["data"]) for c in client.session.post.call_args_list]
+        assert bodies == [{"id": "t9"}] * 3
+
+    @patch("goliath.integrations.intercom.config")
+    def test_async_tag_contacts_bulk(self, mock_config):
+        mock_config.INTERCOM_ACCESS_TOKEN = "tok"
+
+        from goliath.integrations.intercom import AsyncIntercomClient
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            tag_id = json.loads(request.content)["id"]
+            contact = request.url.path.split("/")[2]
+            return httpx.Response(200, json={"id": tag_id, "contact": contact})
+
+        async def run():
+            async with AsyncIntercomClient() as client:
+                client._client = httpx.AsyncClient(
+                    base_url="https://api.intercom.io",
+                    headers=client._headers,
+                    transport=httpx.MockTransport(handler),
+                )
+                return await client.tag_contacts_bulk(["c1", "c2", "c3"], tag_id="t9")
+
+        results = asyncio.run(run())
+        assert [r["contact"] for r in results] == ["c1", "c2", "c3"]
+        assert all(r["id"] == "t9" for r in results)
+        assert seen[0].headers["Authorization"] == "Bearer tok"
+        assert seen[0].headers["Intercom-Version"] == "2.10"
+
+    @patch("goliath.integrations.intercom.config")
+    def test_async_retries_429_and_honours_rate_limit_headers(self, mock_config):
+        mock_config.INTERCOM_ACCESS_TOKEN = "tok"
+
+        from goliath.integrations.intercom import AsyncIntercomClient
+
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(
+                200,
+                json={"id": "c1"},
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1"},
+            ),
+            httpx.Response(200, json={"id": "c2"}),
+        ]
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        async def run():
+            async with AsyncIntercomClient() as client:
+                client._client = httpx.AsyncClient(
+                    base_url="https://api.intercom.io",
+                    transport=httpx.MockTransport(lambda r: responses.pop(0)),
+                )
+                first = await client.get_contact("c1")
+                second = await client.get_contact("c2")
+                return first, second
+
+        with (
+            patch("goliath.integrations.intercom.asyncio.sleep", fake_sleep),
+            patch("goliath.integrations.intercom.time.time", return_value=0.5),
+        ):
+            first, second = asyncio.run(run())
+        assert (first["id"], second["id"]) == ("c1", "c2")
+        assert sleeps == [0.0, 0.5]
+
 
 # ---------------------------------------------------------------------------
 # Twitch
@@ -730,26 +867,29 @@ class TestMediumClient:
         with pytest.raises(RuntimeError, match="MEDIUM_ACCESS_TOKEN"):
             MediumClient()
 
-    @patch("goliath.integrations.medium.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.medium.config")
     def test_headers_set(self, mock_config, mock_requests):
         mock_config.MEDIUM_ACCESS_TOKEN = "med_tok"
+        mock_requests.Session.return_value.get.return_value.content = b"{}"
 
         from goliath.integrations.medium import MediumClient
 
         client = MediumClient()
-        call_kwargs = client.session.headers.update.call_args[0][0]
+        client.get_me()
+        call_kwargs = client.session.get.call_args.kwargs["headers"]
         assert call_kwargs["Authorization"] == "Bearer med_tok"
+        client.session.headers.update.assert_not_called()
 
-    @patch("goliath.integrations.medium.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.medium.config")
     def test_get_me(self, mock_config, mock_requests):
         mock_config.MEDIUM_ACCESS_TOKEN = "tok"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
-            "data": {"id": "u1", "username": "writer", "name": "Jane"}
-        }
+        mock_resp.content = json.dumps(
+            {"data": {"id": "u1", "username": "writer", "name": "Jane"}}
+        ).encode()
         mock_requests.Session.return_value.get.return_value = mock_resp
 
         from goliath.integrations.medium import MediumClient
@@ -761,18 +901,18 @@ class TestMediumClient:
         url = client.session.get.call_args[0][0]
         assert "/me" in url
 
-    @patch("goliath.integrations.medium.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.medium.config")
     def test_create_post(self, mock_config, mock_requests):
         mock_config.MEDIUM_ACCESS_TOKEN = "tok"
 
         # First call: get_me (for user_id), Second call: create_post
         me_resp = MagicMock()
-        me_resp.json.return_value = {"data": {"id": "u1"}}
+        me_resp.content = b'{"data": {"id": "u1"}}'
         post_resp = MagicMock()
-        post_resp.json.return_value = {
+        post_resp.content = json.dumps({
             "data": {"id": "post_1", "title": "My Post", "url": "https://medium.com/@writer/my-post"}
-        }
+        }).encode()
         mock_requests.Session.return_value.get.return_value = me_resp
         mock_requests.Session.return_value.post.return_value = post_resp
 
@@ -790,22 +930,20 @@ class TestMediumClient:
         assert post["title"] == "My Post"
         url = client.session.post.call_args[0][0]
         assert "/users/u1/posts" in url
-        payload = client.session.post.call_args.kwargs.get(
-            "json", client.session.post.call_args[1].get("json", {})
-        )
+        payload = json.loads(client.session.post.call_args.kwargs["data"])
         assert payload["contentFormat"] == "markdown"
         assert payload["publishStatus"] == "draft"
         assert payload["tags"] == ["ai", "automation"]
 
-    @patch("goliath.integrations.medium.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.medium.config")
     def test_tags_limited_to_five(self, mock_config, mock_requests):
         mock_config.MEDIUM_ACCESS_TOKEN = "tok"
 
         me_resp = MagicMock()
-        me_resp.json.return_value = {"data": {"id": "u1"}}
+        me_resp.content = b'{"data": {"id": "u1"}}'
         post_resp = MagicMock()
-        post_resp.json.return_value = {"data": {"id": "post_1"}}
+        post_resp.content = b'{"data": {"id": "post_1"}}'
         mock_requests.Session.return_value.get.return_value = me_resp
         mock_requests.Session.return_value.post.return_value = post_resp
 
@@ -816,11 +954,68 @@ class TestMediumClient:
             title="Test", content="Body", tags=["a", "b", "c", "d", "e", "f", "g"]
         )
 
-        payload = client.session.post.call_args.kwargs.get(
-            "json", client.session.post.call_args[1].get("json", {})
-        )
+        payload = json.loads(client.session.post.call_args.kwargs["data"])
         assert len(payload["tags"]) == 5
 
+    @patch("goliath.integrations.medium.config")
+    def test_async_caches_user_id(self, mock_config):
+        mock_config.MEDIUM_ACCESS_TOKEN = "tok"
+
+        from goliath.integrations.medium import AsyncMediumClient
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.url.path.endswith("/me"):
+                return httpx.Response(200, json={"data": {"id": "u1"}})
+            if request.method == "POST":
+                return httpx.Response(200, json={"data": json.loads(request.content)})
+            return httpx.Response(200, json={"data": [{"id": "pub1"}]})
+
+        async def run():
+            async with AsyncMediumClient() as client:
+                client._client = httpx.AsyncClient(
+                    base_url="https://api.medium.com/v1",
+                    headers=client._headers,
+                    transport=httpx.MockTransport(handler),
+                )
+                post = await client.create_post("T", "Body", tags=list("abcdefg"))
+                pubs = await client.list_publications()
+                return post, pubs
+
+        post, pubs = asyncio.run(run())
+        assert post["tags"] == ["a", "b", "c", "d", "e"]
+        assert pubs == [{"id": "pub1"}]
+        assert [r.url.path for r in seen] == [
+            "/v1/me",
+            "/v1/users/u1/posts",
+            "/v1/users/u1/publications",
+        ]
+        assert all(r.headers["Authorization"] == "Bearer tok" for r in seen)
+
+    @patch("goliath.integrations.medium.config")
+    def test_async_retries_after_429(self, mock_config):
+        mock_config.MEDIUM_ACCESS_TOKEN = "tok"
+
+        from goliath.integrations.medium import AsyncMediumClient
+
+        replies = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"data": {"id": "u1"}}),
+        ]
+
+        async def run():
+            async with AsyncMediumClient() as client:
+                client._client = httpx.AsyncClient(
+                    base_url="https://api.medium.com/v1",
+                    transport=httpx.MockTransport(lambda request: replies.pop(0)),
+                )
+                return await client.get_me()
+
+        assert asyncio.run(run()) == {"id": "u1"}
+        assert replies == []
+
 
 # ---------------------------------------------------------------------------
 # Substack
@@ -1080,7 +1275,7 @@ class TestFirebaseClient:
         with pytest.raises(RuntimeError, match="FIREBASE_PROJECT_ID"):
             FirebaseClient()
 
-    @patch("goliath.integrations.firebase.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.firebase.config")
     def test_firestore_base_url(self, mock_config, mock_requests):
         mock_config.FIREBASE_PROJECT_ID = "my-project"
@@ -1093,7 +1288,7 @@ class TestFirebaseClient:
         client = FirebaseClient()
         assert "my-project" in client._firestore_base
 
-    @patch("goliath.integrations.firebase.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.firebase.config")
     def test_set_document(self, mock_config, mock_requests):
         mock_config.FIREBASE_PROJECT_ID = "proj"
@@ -1102,12 +1297,11 @@ class TestFirebaseClient:
         mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.status_code = 200
+        mock_resp.content = json.dumps({
             "name": "projects/proj/databases/(default)/documents/users/u1",
             "fields": {"name": {"stringValue": "Jane"}, "age": {"integerValue": "30"}},
-        }
-        mock_resp.status_code = 200
-        mock_resp.content = b'{"name": "..."}'
+        }).encode()
         mock_requests.Session.return_value.request.return_value = mock_resp
 
         from goliath.integrations.firebase import FirebaseClient
@@ -1118,7 +1312,7 @@ class TestFirebaseClient:
         assert doc["name"] == "Jane"
         assert doc["age"] == 30
 
-    @patch("goliath.integrations.firebase.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.firebase.config")
     def test_get_document(self, mock_config, mock_requests):
         mock_config.FIREBASE_PROJECT_ID = "proj"
@@ -1127,12 +1321,11 @@ class TestFirebaseClient:
         mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.status_code = 200
+        mock_resp.content = json.dumps({
             "name": "projects/proj/databases/(default)/documents/users/u1",
             "fields": {"email": {"stringValue": "jane@example.com"}},
-        }
-        mock_resp.status_code = 200
-        mock_resp.content = b'{"name": "..."}'
+        }).encode()
         mock_requests.Session.return_value.request.return_value = mock_resp
 
         from goliath.integrations.firebase import FirebaseClient
@@ -1143,7 +1336,7 @@ class TestFirebaseClient:
         assert doc["email"] == "jane@example.com"
         assert doc["_id"] == "u1"
 
-    @patch("goliath.integrations.firebase.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.firebase.config")
     def test_encode_fields(self, mock_config, mock_requests):
         mock_config.FIREBASE_PROJECT_ID = "proj"
@@ -1171,7 +1364,7 @@ class TestFirebaseClient:
         assert "arrayValue" in encoded["tags"]
         assert "mapValue" in encoded["meta"]
 
-    @patch("goliath.integrations.firebase.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.firebase.config")
     def test_decode_document(self, mock_config, mock_requests):
         mock_config.FIREBASE_PROJECT_ID = "proj"
@@ -1205,7 +1398,104 @@ class TestFirebaseClient:
         assert result["bool_field"] is False
         assert result["arr_field"] == ["a", 1]
 
-    @patch("goliath.integrations.firebase.requests")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.firebase.config")
+    def test_set_document_raw_skips_encoding(self, mock_config, mock_requests):
+        mock_config.FIREBASE_PROJECT_ID = "proj"
+        mock_config.FIREBASE_API_KEY = ""
+        mock_config.FIREBASE_DATABASE_URL = ""
+        mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
+
+        fields = {"name": {"stringValue": "Jane"}}
+        mock_resp = MagicMock(status_code=200)
+        mock_resp.content = json.dumps({"name": "c/u1", "fields": fields}).encode()
+        mock_requests.Session.return_value.request.return_value = mock_resp
+
+        from goliath.integrations.firebase import FirebaseClient
+
+        client = FirebaseClient()
+        doc = client.set_document("users", "u1", fields, raw=True)
+
+        sent = json.loads(client.session.request.call_args.kwargs["data"])
+        assert sent == {"fields": fields}
+        assert doc["name"] == "Jane"
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.firebase.config")
+    def test_get_document_raw_copies_without_codec(self, mock_config, mock_requests):
+        mock_config.FIREBASE_PROJECT_ID = "proj"
+        mock_config.FIREBASE_API_KEY = ""
+        mock_config.FIREBASE_DATABASE_URL = ""
+        mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
+
+        stored = {"name": "c/u1", "fields": {"tags": {"arrayValue": {}}}}
+        mock_resp = MagicMock(status_code=200, content=json.dumps(stored).encode())
+        mock_requests.Session.return_value.request.return_value = mock_resp
+
+        from goliath.integrations.firebase import FirebaseClient
+
+        client = FirebaseClient()
+        with (
+            patch.object(FirebaseClient, "_decode_document") as decode,
+            patch.object(FirebaseClient, "_encode_fields") as encode,
+        ):
+            src = client.get_document("users", "u1", raw=True)
+            client.set_document("backup", "u1", src["fields"], raw=True)
+
+        assert src == stored
+        encode.assert_not_called()
+        assert decode.call_count == 1  # only set_document's response
+        assert len(client._cache) == 0
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.firebase.config")
+    def test_iter_documents_follows_page_tokens(self, mock_config, mock_requests):
+        mock_config.FIREBASE_PROJECT_ID = "proj"
+        mock_config.FIREBASE_API_KEY = ""
+        mock_config.FIREBASE_DATABASE_URL = ""
+        mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
+
+        pages = {
+            None: {
+                "documents": [{"name": "c/d0", "fields": {}}],
+                "nextPageToken": "t1",
+            },
+            "t1": {
+                "documents": [{"name": "c/d1", "fields": {}}],
+                "nextPageToken": "t2",
+            },
+            "t2": {"documents": [{"name": "c/d2", "fields": {}}]},
+        }
+
+        def request(method, url, headers=None, params=None):
+            body = pages[params.get("pageToken")]
+            return MagicMock(status_code=200, content=json.dumps(body).encode())
+
+        mock_requests.Session.return_value.request.side_effect = request
+
+        from goliath.integrations.firebase import FirebaseClient
+
+        client = FirebaseClient()
+        ids = [doc["_id"] for doc in client.iter_documents("c", page_size=1)]
+
+        assert ids == ["d0", "d1", "d2"]
+        assert client.session.request.call_count == 3
+
+    def test_encode_decode_round_trip_nested(self):
+        from goliath.integrations.firebase import FirebaseClient
+
+        data = {"rows": [{"id": 1, "ok": True}, [None, 2.5]], "m": {"n": {"s": "x"}}}
+        encoded = FirebaseClient._encode_fields(data)
+
+        assert encoded["rows"]["arrayValue"]["values"][0] == {
+            "mapValue": {
+                "fields": {"id": {"integerValue": "1"}, "ok": {"booleanValue": True}}
+            }
+        }
+        decoded = FirebaseClient._decode_document({"name": "c/d", "fields": encoded})
+        assert decoded == {"_id": "d", **data}
+
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.firebase.config")
     def test_auth_sign_up(self, mock_config, mock_requests):
         mock_config.FIREBASE_PROJECT_ID = "proj"
@@ -1230,7 +1520,7 @@ class TestFirebaseClient:
         url = client.session.post.call_args[0][0]
         assert "signUp" in url
 
-    @patch("goliath.integrations.firebase.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.firebase.config")
     def test_rtdb_requires_database_url(self, mock_config, mock_requests):
         mock_config.FIREBASE_PROJECT_ID = "proj"
@@ -1244,7 +1534,7 @@ class TestFirebaseClient:
         with pytest.raises(RuntimeError, match="FIREBASE_DATABASE_URL"):
             client.rtdb_get("/test")
 
-    @patch("goliath.integrations.firebase.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.firebase.config")
     def test_rtdb_set(self, mock_config, mock_requests):
         mock_config.FIREBASE_PROJECT_ID = "proj"
@@ -1264,3 +1554,283 @@ class TestFirebaseClient:
         assert result["text"] == "Hello"
         url = client.session.put.call_args[0][0]
         assert "messages/msg1.json" in url
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.firebase.config")
+    def test_rtdb_url_normalizes_slashes_and_appends_token(
+        self, mock_config, mock_requests
+    ):
+        mock_config.FIREBASE_PROJECT_ID = "proj"
+        mock_config.FIREBASE_API_KEY = ""
+        mock_config.FIREBASE_DATABASE_URL = "https://proj-default-rtdb.firebaseio.com/"
+        mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
+
+        from goliath.integrations.firebase import FirebaseClient
+
+        client = FirebaseClient()
+        base = "https://proj-default-rtdb.firebaseio.com"
+        assert client._rtdb_url("/messages/msg1/") == f"{base}/messages/msg1.json"
+
+        client._creds = MagicMock(valid=True, token="tok")
+        assert client._rtdb_url("messages") == f"{base}/messages.json?auth=tok"
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.firebase.config")
+    def test_set_documents_uses_commit_batches(self, mock_config, mock_requests):
+        mock_config.FIREBASE_PROJECT_ID = "proj"
+        mock_config.FIREBASE_API_KEY = ""
+        mock_config.FIREBASE_DATABASE_URL = ""
+        mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
+
+        def request(method, url, headers=None, data=None):
+            writes = json.loads(data)["writes"]
+            return MagicMock(
+                status_code=200,
+                content=json.dumps({"writeResults": [{}] * len(writes)}).encode(),
+            )
+
+        mock_requests.Session.return_value.request.side_effect = request
+
+        from goliath.integrations.firebase import FirebaseClient
+
+        client = FirebaseClient()
+        docs = {f"d{i}": {"n": i} for i in range(1200)}
+        results = client.set_documents("items", docs)
+
+        calls = client.session.request.call_args_list
+        assert len(calls) == 3
+        bodies = [json.loads(c.kwargs["data"]) for c in calls]
+        assert [len(b["writes"]) for b in bodies] == [500, 500, 200]
+        assert calls[0].args[1].endswith("/documents:commit")
+        first = bodies[0]["writes"][0]["update"]
+        assert first["name"] == "projects/proj/databases/(default)/documents/items/d0"
+        assert first["fields"] == {"n": {"integerValue": "0"}}
+        assert len(results) == 1200
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.firebase.config")
+    def test_set_documents_splits_on_413(self, mock_config, mock_requests):
+        mock_config.FIREBASE_PROJECT_ID = "proj"
+        mock_config.FIREBASE_API_KEY = ""
+        mock_config.FIREBASE_DATABASE_URL = ""
+        mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
+
+        import requests
+
+        from goliath.integrations.firebase import FirebaseClient
+
+        mock_requests.HTTPError = requests.HTTPError
+        too_large = MagicMock(status_code=413)
+
+        def request(method, url, headers=None, data=None):
+            writes = json.loads(data)["writes"]
+            resp = MagicMock(
+                status_code=200,
+                content=json.dumps({"writeResults": [{}] * len(writes)}).encode(),
+            )
+            if len(writes) > 2:
+                resp.raise_for_status.side_effect = requests.HTTPError(
+                    response=too_large
+                )
+            return resp
+
+        mock_requests.Session.return_value.request.side_effect = request
+
+        client = FirebaseClient()
+        results = client.set_documents("items", {f"d{i}": {"n": i} for i in range(4)})
+
+        calls = client.session.request.call_args_list
+        assert [len(json.loads(c.kwargs["data"])["writes"]) for c in calls] == [4, 2, 2]
+        assert len(results) == 4
+
+    @patch("goliath.integrations.firebase.time")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.firebase.config")
+    def test_set_documents_parallel_retries_conflict(
+        self, mock_config, mock_requests, mock_time
+    ):
+        mock_config.FIREBASE_PROJECT_ID = "proj"
+        mock_config.FIREBASE_API_KEY = ""
+        mock_config.FIREBASE_DATABASE_URL = ""
+        mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
+
+        import requests
+
+        from goliath.integrations.firebase import FirebaseClient
+
+        mock_requests.HTTPError = requests.HTTPError
+        conflicts = {"d1": 1}
+
+        def request(method, url, headers=None, data=None):
+            doc_id = url.rsplit("/", 1)[-1]
+            doc = {
+                "name": f"projects/proj/databases/(default)/documents/items/{doc_id}",
+                "fields": json.loads(data)["fields"],
+            }
+            resp = MagicMock(status_code=200, content=json.dumps(doc).encode())
+            if conflicts.get(doc_id):
+                conflicts[doc_id] -= 1
+                resp.raise_for_status.side_effect = requests.HTTPError(
+                    response=MagicMock(status_code=409)
+                )
+            return resp
+
+        mock_requests.Session.return_value.request.side_effect = request
+
+        client = FirebaseClient()
+        docs = client.set_documents_parallel(
+            "items", {"d0": {"n": 0}, "d1": {"n": 1}}, workers=2
+        )
+
+        assert [d["_id"] for d in docs] == ["d0", "d1"]
+        assert client.session.request.call_count == 3
+        mock_time.sleep.assert_called_once()
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.firebase.config")
+    def test_access_token_refreshed_when_expired(self, mock_config, mock_requests):
+        mock_config.FIREBASE_PROJECT_ID = "proj"
+        mock_config.FIREBASE_API_KEY = ""
+        mock_config.FIREBASE_DATABASE_URL = ""
+        mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
+
+        from goliath.integrations.firebase import FirebaseClient
+
+        client = FirebaseClient()
+        assert client._access_token is None
+
+        creds = MagicMock(valid=True, token="tok-1")
+        client._creds = creds
+        assert client._access_token == "tok-1"
+        creds.refresh.assert_not_called()
+
+        def refresh(request):
+            creds.valid = True
+            creds.token = "tok-2"
+
+        creds.valid = False
+        creds.refresh.side_effect = refresh
+        assert client._access_token == "tok-2"
+        creds.refresh.assert_called_once()
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.firebase.config")
+    def test_get_documents_batch_get_uses_cache(self, mock_config, mock_requests):
+        mock_config.FIREBASE_PROJECT_ID = "proj"
+        mock_config.FIREBASE_API_KEY = ""
+        mock_config.FIREBASE_DATABASE_URL = ""
+        mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
+
+        root = "projects/proj/databases/(default)/documents/users"
+
+        def request(method, url, headers=None, data=None):
+            names = json.loads(data)["documents"]
+            found = [{"found": {"name": n, "fields": {}}} for n in names]
+            return MagicMock(status_code=200, content=json.dumps(found).encode())
+
+        mock_requests.Session.return_value.request.side_effect = request
+
+        from goliath.integrations.firebase import FirebaseClient
+
+        client = FirebaseClient()
+        ids = [f"u{i}" for i in range(150)]
+        docs = client.get_documents("users", ids)
+
+        assert [d["_id"] for d in docs] == ids
+        calls = client.session.request.call_args_list
+        assert calls[0].args[:2] == ("POST", client._firestore_base + ":batchGet")
+        sizes = [len(json.loads(c.kwargs["data"])["documents"]) for c in calls]
+        assert sizes == [100, 50]
+        assert json.loads(calls[0].kwargs["data"])["documents"][0] == f"{root}/u0"
+
+        client.get_documents("users", ["u1", "u200"])
+        last = json.loads(client.session.request.call_args.kwargs["data"])
+        assert last["documents"] == [f"{root}/u200"]
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.firebase.config")
+    def test_get_document_cached_until_write(self, mock_config, mock_requests):
+        mock_config.FIREBASE_PROJECT_ID = "proj"
+        mock_config.FIREBASE_API_KEY = ""
+        mock_config.FIREBASE_DATABASE_URL = ""
+        mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
+
+        mock_resp = MagicMock(status_code=200)
+        mock_resp.content = json.dumps(
+            {
+                "name": "projects/proj/databases/(default)/documents/users/u1",
+                "fields": {"name": {"stringValue": "Jane"}},
+            }
+        ).encode()
+        mock_requests.Session.return_value.request.return_value = mock_resp
+
+        from goliath.integrations.firebase import FirebaseClient
+
+        client = FirebaseClient()
+        client.get_document("users", "u1")
+        client.get_document("users", "u1")
+        assert client.session.request.call_count == 1
+
+        client.get_document("users", "u1", use_cache=False)
+        assert client.session.request.call_count == 2
+
+        client.delete_document("users", "u1")
+        client.get_document("users", "u1")
+        assert client.session.request.call_count == 4
+
+    @patch("goliath.integrations.firebase.config")
+    def test_async_get_documents_batch_get(self, mock_config):
+        mock_config.FIREBASE_PROJECT_ID = "proj"
+        mock_config.FIREBASE_API_KEY = ""
+        mock_config.FIREBASE_DATABASE_URL = ""
+        mock_config.FIREBASE_SERVICE_ACCOUNT_FILE = ""
+
+        from goliath.integrations.firebase import AsyncFirebaseClient
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            names = json.loads(request.content)["documents"]
+            # batchGet answers in arbitrary order, with missing docs flagged.
+            return httpx.Response(
+                200,
+                json=[
+                    {"found": {"name": n, "fields": {"n": {"integerValue": n[-1]}}}}
+                    if not n.endswith("u9")
+                    else {"missing": n}
+                    for n in reversed(names)
+                ],
+            )
+
+        async def run():
+            async with AsyncFirebaseClient() as client:
+                client._client = httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)
+                )
+                return await client.get_documents("users", ["u1", "u9", "u2"])
+
+        docs = asyncio.run(run())
+        assert [d["_id"] for d in docs] == ["u1", "u2"]
+        assert [d["n"] for d in docs] == [1, 2]
+        assert len(seen) == 1
+        assert seen[0].url.path.endswith("/documents:batchGet")
+
+    def test_found_documents_keeps_empty_documents(self):
+        from goliath.integrations.firebase import FirebaseClient
+
+        root = "projects/proj/databases/(default)/documents/users"
+        empty = {"name": f"{root}/u2", "createTime": "2024-01-01T00:00:00Z"}
+        docs = FirebaseClient._found_documents(
+            [
+                {
+                    "found": {
+                        "name": f"{root}/u1",
+                        "fields": {"a": {"integerValue": "1"}},
+                    }
+                },
+                {"found": empty},
+                {"missing": f"{root}/u3"},
+            ]
+        )
+        assert docs == {"u1": {"_id": "u1", "a": 1}, "u2": empty}
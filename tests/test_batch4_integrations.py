@@ -1,6 +1,8 @@
 """Tests for batch 4 integrations: Notion AI, Perplexity Search, Brave Search,
 Wikipedia, Weather, News API, Google Maps, Yelp, OpenSea, Binance."""
 
+import json
+import sqlite3
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -626,15 +628,16 @@ class TestGoogleMapsClient:
         with pytest.raises(RuntimeError, match="GOOGLE_MAPS_API_KEY"):
             GoogleMapsClient()
 
-    @patch("goliath.integrations.google_maps.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.google_maps.config")
     def test_geocode(self, mock_config, mock_requests):
         mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "results": [{"formatted_address": "1600 Amphitheatre Parkway", "geometry": {"location": {"lat": 37.42, "lng": -122.08}}}]
-        }
+        }).encode()
         mock_requests.Session.return_value.get.return_value = mock_resp
 
         from goliath.integrations.google_maps import GoogleMapsClient
@@ -644,17 +647,21 @@ class TestGoogleMapsClient:
 
         assert len(results) == 1
         url = client.session.get.call_args[0][0]
-        assert "/geocode/json" in url
+        assert url.endswith("/geocode/json?key=gm_key")
+        assert client.session.get.call_args.kwargs["params"] == {
+            "address": "1600 Amphitheatre Parkway"
+        }
 
-    @patch("goliath.integrations.google_maps.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.google_maps.config")
     def test_reverse_geocode(self, mock_config, mock_requests):
         mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "results": [{"formatted_address": "Mountain View, CA"}]
-        }
+        }).encode()
         mock_requests.Session.return_value.get.return_value = mock_resp
 
         from goliath.integrations.google_maps import GoogleMapsClient
@@ -668,15 +675,16 @@ class TestGoogleMapsClient:
         )
         assert "37.42,-122.08" in params["latlng"]
 
-    @patch("goliath.integrations.google_maps.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.google_maps.config")
     def test_nearby_search(self, mock_config, mock_requests):
         mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "results": [{"name": "Blue Bottle Coffee", "rating": 4.5}]
-        }
+        }).encode()
         mock_requests.Session.return_value.get.return_value = mock_resp
 
         from goliath.integrations.google_maps import GoogleMapsClient
@@ -688,15 +696,51 @@ class TestGoogleMapsClient:
         url = client.session.get.call_args[0][0]
         assert "/place/nearbysearch/json" in url
 
-    @patch("goliath.integrations.google_maps.requests")
+    @patch("goliath.integrations.google_maps.time")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.google_maps.config")
+    def test_iter_nearby_follows_page_tokens(
+        self, mock_config, mock_requests, mock_time
+    ):
+        mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
+        mock_time.monotonic.return_value = 100.0
+
+        pages = [
+            {"status": "OK", "results": [{"name": "A"}], "next_page_token": "t1"},
+            {"status": "INVALID_REQUEST"},
+            {"status": "OK", "results": [{"name": "B"}]},
+        ]
+        responses = []
+        for page in pages:
+            resp = MagicMock()
+            resp.content = json.dumps(page).encode()
+            responses.append(resp)
+        mock_requests.Session.return_value.get.side_effect = responses
+
+        from goliath.integrations.google_maps import GoogleMapsClient
+
+        client = GoogleMapsClient()
+        names = [p["name"] for p in client.iter_nearby(lat=1.0, lng=2.0, keyword="tea")]
+
+        assert names == ["A", "B"]
+        params = [c.kwargs["params"] for c in client.session.get.call_args_list]
+        assert "pagetoken" not in params[0]
+        assert params[1]["pagetoken"] == params[2]["pagetoken"] == "t1"
+        assert params[2]["keyword"] == "tea"
+        # Waited out the token delay, then backed off once on INVALID_REQUEST.
+        assert [c.args[0] for c in mock_time.sleep.call_args_list] == [2.0, 1.0]
+
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.google_maps.config")
     def test_directions(self, mock_config, mock_requests):
         mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "routes": [{"legs": [{"distance": {"text": "216 mi"}, "duration": {"text": "3 hours 45 mins"}}]}]
-        }
+        }).encode()
         mock_requests.Session.return_value.get.return_value = mock_resp
 
         from goliath.integrations.google_maps import GoogleMapsClient
@@ -708,15 +752,16 @@ class TestGoogleMapsClient:
         url = client.session.get.call_args[0][0]
         assert "/directions/json" in url
 
-    @patch("goliath.integrations.google_maps.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.google_maps.config")
     def test_distance_matrix(self, mock_config, mock_requests):
         mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "rows": [{"elements": [{"distance": {"text": "216 mi"}, "status": "OK"}]}]
-        }
+        }).encode()
         mock_requests.Session.return_value.get.return_value = mock_resp
 
         from goliath.integrations.google_maps import GoogleMapsClient
@@ -735,15 +780,107 @@ class TestGoogleMapsClient:
         )
         assert params["origins"] == "New York, NY"
 
-    @patch("goliath.integrations.google_maps.requests")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.google_maps.config")
+    def test_distance_matrix_bulk_tiles_and_stitches(self, mock_config, mock_requests):
+        mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
+
+        def fake_get(url, params, **kwargs):
+            origins = params["origins"].split("|")
+            destinations = params["destinations"].split("|")
+            resp = MagicMock()
+            resp.content = json.dumps(
+                {
+                    "status": "OK",
+                    "origin_addresses": origins,
+                    "destination_addresses": destinations,
+                    "rows": [
+                        {"elements": [{"pair": f"{o}->{d}"} for d in destinations]}
+                        for o in origins
+                    ],
+                }
+            ).encode()
+            return resp
+
+        mock_requests.Session.return_value.get.side_effect = fake_get
+
+        from goliath.integrations.google_maps import GoogleMapsClient
+
+        origins = [f"o{i}" for i in range(30)]
+        destinations = [f"d{j}" for j in range(7)]
+        matrix = GoogleMapsClient().distance_matrix_bulk(origins, destinations)
+
+        # 30 origins -> 25 + 5 rows; 100 // 25 = 4 columns -> 4 + 3.
+        assert mock_requests.Session.return_value.get.call_count == 4
+        for call in mock_requests.Session.return_value.get.call_args_list:
+            params = call.kwargs["params"]
+            size = len(params["origins"].split("|")) * len(
+                params["destinations"].split("|")
+            )
+            assert size <= 100
+        assert matrix["status"] == "OK"
+        assert matrix["origin_addresses"] == origins
+        assert matrix["destination_addresses"] == destinations
+        assert [e["pair"] for e in matrix["rows"][29]["elements"]] == [
+            f"o29->d{j}" for j in range(7)
+        ]
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.google_maps.config")
+    def test_distance_matrix_bulk_pads_failed_and_short_blocks(
+        self, mock_config, mock_requests
+    ):
+        mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
+
+        def fake_get(url, params, **kwargs):
+            origins = params["origins"].split("|")
+            destinations = params["destinations"].split("|")
+            resp = MagicMock()
+            if destinations[0] == "d0":
+                # First column block fails outright.
+                body = {"status": "OVER_QUERY_LIMIT"}
+            else:
+                # Second column block drops its last element per row.
+                body = {
+                    "status": "OK",
+                    "rows": [
+                        {"elements": [{"pair": f"{o}->{d}"} for d in destinations[:-1]]}
+                        for o in origins
+                    ],
+                }
+            resp.content = json.dumps(body).encode()
+            return resp
+
+        mock_requests.Session.return_value.get.side_effect = fake_get
+
+        from goliath.integrations.google_maps import GoogleMapsClient
+
+        with patch("goliath.integrations.google_maps.time"):
+            matrix = GoogleMapsClient().distance_matrix_bulk(
+                [f"o{i}" for i in range(30)], [f"d{j}" for j in range(7)]
+            )
+
+        assert matrix["status"] == "OVER_QUERY_LIMIT"
+        for i, row in enumerate(matrix["rows"]):
+            assert row["elements"] == [
+                *[{"status": "OVER_QUERY_LIMIT"}] * 4,
+                {"pair": f"o{i}->d4"},
+                {"pair": f"o{i}->d5"},
+                {"status": "UNKNOWN_ERROR"},
+            ]
+
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.google_maps.config")
     def test_autocomplete(self, mock_config, mock_requests):
         mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "predictions": [{"description": "Starbucks, Times Square"}]
-        }
+        }).encode()
         mock_requests.Session.return_value.get.return_value = mock_resp
 
         from goliath.integrations.google_maps import GoogleMapsClient
@@ -755,6 +892,150 @@ class TestGoogleMapsClient:
         url = client.session.get.call_args[0][0]
         assert "/place/autocomplete/json" in url
 
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.google_maps.config")
+    def test_disk_cache_hit_skips_request(self, mock_config, mock_requests, tmp_path):
+        mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = str(tmp_path / "gm.sqlite3")
+
+        mock_resp = MagicMock(headers={})
+        mock_resp.content = json.dumps(
+            {"status": "OK", "results": [{"place_id": "p1"}]}
+        ).encode()
+        mock_requests.Session.return_value.get.return_value = mock_resp
+
+        from goliath.integrations.google_maps import GoogleMapsClient
+
+        with GoogleMapsClient() as client:
+            assert client.geocode("Paris")[0]["place_id"] == "p1"
+        # Closing releases the client's cache file, not the shared session.
+        with pytest.raises(sqlite3.ProgrammingError):
+            len(client._cache)
+        client.session.close.assert_not_called()
+        # A new client (and rotated key) still reads the persisted entry.
+        mock_config.GOOGLE_MAPS_API_KEY = "other_key"
+        assert GoogleMapsClient().geocode("Paris")[0]["place_id"] == "p1"
+        assert mock_requests.Session.return_value.get.call_count == 1
+
+        GoogleMapsClient(cache=False).geocode("Paris")
+        assert mock_requests.Session.return_value.get.call_count == 2
+
+    @patch("goliath.integrations.google_maps.time")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.google_maps.config")
+    def test_over_query_limit_is_retried(self, mock_config, mock_requests, mock_time):
+        mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
+
+        throttled, ok = MagicMock(), MagicMock()
+        throttled.content = json.dumps({"status": "OVER_QUERY_LIMIT"}).encode()
+        ok.content = json.dumps(
+            {"status": "OK", "results": [{"place_id": "p"}]}
+        ).encode()
+        mock_requests.Session.return_value.get.side_effect = [throttled, ok]
+
+        from goliath.integrations.google_maps import GoogleMapsClient
+
+        assert GoogleMapsClient().geocode("Paris") == [{"place_id": "p"}]
+        mock_time.sleep.assert_called_once()
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.google_maps.config")
+    def test_expired_entry_revalidated_with_etag(
+        self, mock_config, mock_requests, tmp_path
+    ):
+        import time as real_time
+
+        mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = str(tmp_path / "gm.sqlite3")
+
+        first = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        first.content = json.dumps(
+            {"status": "OK", "result": {"name": "Cafe"}}
+        ).encode()
+        not_modified = MagicMock(status_code=304, headers={}, content=b"")
+        mock_requests.Session.return_value.get.side_effect = [first, not_modified]
+
+        from goliath.integrations.google_maps import GoogleMapsClient
+
+        assert GoogleMapsClient().place_details("p1")["name"] == "Cafe"
+        with patch("goliath.integrations._cache.time") as mock_time:
+            mock_time.time.return_value = real_time.time() + 31 * 24 * 60 * 60
+            client = GoogleMapsClient()
+            assert client.place_details("p1")["name"] == "Cafe"
+            # The 304 re-armed the entry, so it is fresh again.
+            (key,) = client._memory._data
+            assert client._cache.get_entry(client._disk_key(key))[1]
+
+        conditional = mock_requests.Session.return_value.get.call_args_list[1]
+        assert conditional.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.google_maps.config")
+    def test_memory_cache_without_disk(self, mock_config, mock_requests):
+        mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
+
+        mock_resp = MagicMock()
+        mock_resp.content = json.dumps(
+            {"status": "OK", "result": {"name": "Cafe"}}
+        ).encode()
+        mock_requests.Session.return_value.get.return_value = mock_resp
+
+        from goliath.integrations.google_maps import GoogleMapsClient
+
+        client = GoogleMapsClient()
+        for _ in range(3):
+            assert client.place_details("p1")["name"] == "Cafe"
+        client.place_details("p1", fields="name")
+
+        assert client._cache is None
+        assert client.session.get.call_count == 2
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.google_maps.config")
+    def test_normalized_text_search_shares_cache(self, mock_config, mock_requests):
+        mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ""
+
+        mock_resp = MagicMock()
+        mock_resp.content = json.dumps(
+            {"status": "OK", "results": [{"name": "Joe's"}]}
+        ).encode()
+        mock_requests.Session.return_value.get.return_value = mock_resp
+
+        from goliath.integrations.google_maps import GoogleMapsClient
+
+        client = GoogleMapsClient(normalize_queries=True)
+        client.text_search("Pizza in NYC")
+        assert client.text_search("nyc pizza!")["results"][0]["name"] == "Joe's"
+        client.text_search("pizza near Boston")
+
+        sent = [c.kwargs["params"]["query"] for c in client.session.get.call_args_list]
+        assert sent == ["Pizza in NYC", "pizza near Boston"]
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.google_maps.config")
+    def test_disk_cache_skips_paging_and_errors(self, mock_config, mock_requests):
+        mock_config.GOOGLE_MAPS_API_KEY = "gm_key"
+        mock_config.GOOGLE_MAPS_CACHE_PATH = ":memory:"
+
+        mock_resp = MagicMock()
+        mock_resp.content = json.dumps(
+            {"status": "OK", "results": [], "next_page_token": "t"}
+        ).encode()
+        mock_requests.Session.return_value.get.return_value = mock_resp
+
+        from goliath.integrations.google_maps import GoogleMapsClient
+
+        client = GoogleMapsClient()
+        client.text_search("pizza")
+        client.text_search("pizza", page_token="t")
+        mock_resp.content = json.dumps({"status": "REQUEST_DENIED"}).encode()
+        client.geocode("Paris")
+        assert len(client._cache) == 0
+        assert client.session.get.call_count == 3
+
 
 # ---------------------------------------------------------------------------
 # Yelp
@@ -1,8 +1,12 @@
 """Tests for batch 5 integrations: Vercel, Sentry, Datadog, PagerDuty,
 Mixpanel, Segment, Algolia, Contentful, Plaid, ClickUp."""
 
+import asyncio
+import json
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 
@@ -462,7 +466,7 @@ class TestMixpanelClient:
         with pytest.raises(RuntimeError, match="MIXPANEL_PROJECT_TOKEN"):
             MixpanelClient()
 
-    @patch("goliath.integrations.mixpanel.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.mixpanel.config")
     def test_track_event(self, mock_config, mock_requests):
         mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
@@ -471,7 +475,7 @@ class TestMixpanelClient:
         mock_config.MIXPANEL_SERVICE_ACCOUNT_SECRET = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = 1
+        mock_resp.content = b"1"
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.mixpanel import MixpanelClient
@@ -485,7 +489,7 @@ class TestMixpanelClient:
         url = client.session.post.call_args[0][0]
         assert "/track" in url
 
-    @patch("goliath.integrations.mixpanel.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.mixpanel.config")
     def test_track_includes_token(self, mock_config, mock_requests):
         mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
@@ -494,7 +498,7 @@ class TestMixpanelClient:
         mock_config.MIXPANEL_SERVICE_ACCOUNT_SECRET = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = 1
+        mock_resp.content = b"1"
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.mixpanel import MixpanelClient
@@ -502,12 +506,20 @@ class TestMixpanelClient:
         client = MixpanelClient()
         client.track(distinct_id="u1", event="Click")
 
-        payload = client.session.post.call_args.kwargs.get(
-            "json", client.session.post.call_args[1].get("json", [])
-        )
+        payload = json.loads(client.session.post.call_args.kwargs["data"])
         assert payload[0]["properties"]["token"] == "mp_tok"
 
-    @patch("goliath.integrations.mixpanel.requests")
+        props = {"page": "/"}
+        event = client._event("u2", "View", props)
+        assert event["properties"] == {
+            "page": "/",
+            "distinct_id": "u2",
+            "token": "mp_tok",
+        }
+        assert props == {"page": "/"}
+        assert event["properties"] is not props
+
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.mixpanel.config")
     def test_set_user(self, mock_config, mock_requests):
         mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
@@ -516,7 +528,7 @@ class TestMixpanelClient:
         mock_config.MIXPANEL_SERVICE_ACCOUNT_SECRET = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = 1
+        mock_resp.content = b"1"
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.mixpanel import MixpanelClient
@@ -528,7 +540,7 @@ class TestMixpanelClient:
         url = client.session.post.call_args[0][0]
         assert "/engage" in url
 
-    @patch("goliath.integrations.mixpanel.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.mixpanel.config")
     def test_sa_auth_missing_raises(self, mock_config, mock_requests):
         mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
@@ -542,7 +554,7 @@ class TestMixpanelClient:
         with pytest.raises(RuntimeError, match="Service account"):
             client.top_events()
 
-    @patch("goliath.integrations.mixpanel.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.mixpanel.config")
     def test_track_batch(self, mock_config, mock_requests):
         mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
@@ -551,7 +563,7 @@ class TestMixpanelClient:
         mock_config.MIXPANEL_SERVICE_ACCOUNT_SECRET = ""
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = 1
+        mock_resp.content = b"1"
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.mixpanel import MixpanelClient
@@ -565,6 +577,235 @@ class TestMixpanelClient:
 
         assert result == 1
 
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.mixpanel.config")
+    def test_export_events_streams_lines(self, mock_config, mock_requests):
+        mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
+        mock_config.MIXPANEL_PROJECT_ID = ""
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_USER = "sa"
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_SECRET = "secret"
+
+        mock_resp = mock_requests.Session.return_value.get.return_value.__enter__
+        mock_resp.return_value.iter_lines.return_value = iter(
+            [b'{"event": "A"}', b"", b'{"event": "B"}']
+        )
+
+        from goliath.integrations.mixpanel import MixpanelClient
+
+        client = MixpanelClient()
+        events = client.export_events("2025-01-01", "2025-01-31", event="A")
+        client.session.get.assert_not_called()
+
+        assert next(events) == {"event": "A"}
+        assert list(events) == [{"event": "B"}]
+        call = client.session.get.call_args
+        assert call.kwargs["stream"] is True
+        assert call.kwargs["headers"] is client._sa_auth_headers()
+        assert call.kwargs["params"]["event"] == '["A"]'
+
+    @patch("goliath.integrations.mixpanel.config")
+    def test_async_track_and_export(self, mock_config):
+        mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
+        mock_config.MIXPANEL_PROJECT_ID = ""
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_USER = "sa"
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_SECRET = "secret"
+
+        from goliath.integrations.mixpanel import AsyncMixpanelClient
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.url.host == "data.mixpanel.com":
+                return httpx.Response(200, content=b'{"event": "A"}\n{"event": "B"}\n')
+            return httpx.Response(200, json=1)
+
+        async def run():
+            async with AsyncMixpanelClient() as client:
+                client._client = httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)
+                )
+                await client.track("u1", "Click", {"page": "/"})
+                await client.flush()
+                exported = client.export_events("2025-01-01", "2025-01-02")
+                return [e async for e in exported]
+
+        events = asyncio.run(run())
+        assert events == [{"event": "A"}, {"event": "B"}]
+        assert json.loads(seen[0].content) == [
+            {
+                "event": "Click",
+                "properties": {"page": "/", "distinct_id": "u1", "token": "mp_tok"},
+            }
+        ]
+        assert seen[1].headers["Authorization"].startswith("Basic ")
+
+    @patch("goliath.integrations.mixpanel.config")
+    def test_async_queries_waiting_on_budget_do_not_block_ingestion(self, mock_config):
+        mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
+        mock_config.MIXPANEL_PROJECT_ID = "123"
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_USER = "sa"
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_SECRET = "secret"
+
+        from goliath.integrations.mixpanel import AsyncMixpanelClient
+
+        class ExhaustedBucket:
+            def __init__(self):
+                self.refilled = asyncio.Event()
+
+            async def acquire_async(self):
+                await self.refilled.wait()
+
+        def handler(request):
+            return httpx.Response(200, json=1)
+
+        async def run():
+            async with AsyncMixpanelClient(max_concurrency=2) as client:
+                client._client = httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)
+                )
+                client._query_bucket = ExhaustedBucket()
+                queries = [asyncio.create_task(client.top_events()) for _ in range(4)]
+                await asyncio.sleep(0)
+                await client.track("u1", "Click")
+                await asyncio.wait_for(client.flush(), timeout=1)
+                sent_while_waiting = not any(q.done() for q in queries)
+                client._query_bucket.refilled.set()
+                await asyncio.gather(*queries)
+                return sent_while_waiting
+
+        assert asyncio.run(run())
+
+    @patch("goliath.integrations.mixpanel.config")
+    def test_async_track_batches_by_size_and_time(self, mock_config):
+        mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
+        mock_config.MIXPANEL_PROJECT_ID = ""
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_USER = ""
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_SECRET = ""
+
+        from goliath.integrations.mixpanel import AsyncMixpanelClient
+
+        batches = []
+
+        def handler(request):
+            batches.append(json.loads(request.content))
+            return httpx.Response(200, json=1)
+
+        async def run():
+            client = AsyncMixpanelClient(flush_interval=0.01)
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            await client.track("u1", "Solo")
+            await asyncio.sleep(0.05)
+            timed = len(batches)
+            for i in range(120):
+                await client.track("u1", f"E{i}")
+            await client.aclose()
+            return timed
+
+        timed = asyncio.run(run())
+        assert timed == 1
+        assert [len(b) for b in batches] == [1, 50, 50, 20]
+        assert [e["event"] for b in batches[1:] for e in b] == [
+            f"E{i}" for i in range(120)
+        ]
+
+    @patch("goliath.integrations.mixpanel.config")
+    def test_async_set_user_batches_with_track(self, mock_config):
+        mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
+        mock_config.MIXPANEL_PROJECT_ID = ""
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_USER = ""
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_SECRET = ""
+
+        from goliath.integrations.mixpanel import AsyncMixpanelClient
+
+        posts = []
+
+        def handler(request):
+            posts.append((request.url.path, json.loads(request.content)))
+            return httpx.Response(200, json=1)
+
+        async def run():
+            async with AsyncMixpanelClient() as client:
+                client._client = httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)
+                )
+                for i in range(3):
+                    await client.track(f"u{i}", "Signup")
+                    await client.set_user(f"u{i}", {"plan": "pro"})
+                assert posts == []
+                return await client.set_user_now("u9", {"plan": "free"})
+
+        assert asyncio.run(run()) == 1
+        assert [(path, len(body)) for path, body in posts] == [
+            ("/engage", 1),
+            ("/track", 3),
+            ("/engage", 3),
+        ]
+        assert posts[2][1][0] == {
+            "$token": "mp_tok",
+            "$distinct_id": "u0",
+            "$set": {"plan": "pro"},
+        }
+
+    @patch("goliath.integrations.mixpanel.config")
+    def test_async_failed_batches(self, mock_config):
+        mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
+        mock_config.MIXPANEL_PROJECT_ID = ""
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_USER = ""
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_SECRET = ""
+
+        from goliath.integrations.mixpanel import AsyncMixpanelClient
+
+        failed = []
+        transport = httpx.MockTransport(lambda request: httpx.Response(400))
+
+        async def run():
+            async with AsyncMixpanelClient(
+                on_error=lambda events, exc: failed.append((events, exc))
+            ) as client:
+                client._client = httpx.AsyncClient(transport=transport)
+                await client.track("u1", "Lost")
+            client = AsyncMixpanelClient()
+            client._client = httpx.AsyncClient(transport=transport)
+            await client.track("u1", "Lost")
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.flush()
+            await client.aclose()
+
+        asyncio.run(run())
+        assert [e["event"] for e in failed[0][0]] == ["Lost"]
+        assert isinstance(failed[0][1], httpx.HTTPStatusError)
+
+    @patch("goliath.integrations.mixpanel.config")
+    def test_async_flusher_survives_non_http_errors(self, mock_config):
+        mock_config.MIXPANEL_PROJECT_TOKEN = "mp_tok"
+        mock_config.MIXPANEL_PROJECT_ID = ""
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_USER = ""
+        mock_config.MIXPANEL_SERVICE_ACCOUNT_SECRET = ""
+
+        from goliath.integrations.mixpanel import AsyncMixpanelClient
+
+        sent = []
+
+        def handler(request):
+            sent.extend(e["event"] for e in json.loads(request.content))
+            return httpx.Response(200, json=1)
+
+        async def run():
+            client = AsyncMixpanelClient(flush_interval=0.01)
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            await client.track("u1", "Bad", {"amount": Decimal("1.5")})
+            await asyncio.sleep(0.05)
+            with pytest.raises(TypeError):
+                await client.flush()
+            await client.track("u1", "Good")
+            await asyncio.sleep(0.05)
+            sent_in_background = list(sent)
+            await client.aclose()
+            return sent_in_background
+
+        assert asyncio.run(run()) == ["Good"]
+
 
 # ---------------------------------------------------------------------------
 # Segment
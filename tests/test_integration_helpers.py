@@ -0,0 +1,329 @@
+"""Tests for the shared integration helpers (_http, _cache, _pagination, _ratelimit)."""
+
+import asyncio
+import importlib.util
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from goliath.integrations import _http
+from goliath.integrations._cache import DiskCache, SingleFlight, TTLCache
+from goliath.integrations._pagination import prefetch_pages
+from goliath.integrations._ratelimit import AdaptiveConcurrency, TokenBucket
+
+# ---------------------------------------------------------------------------
+# JSON helpers
+# ---------------------------------------------------------------------------
+
+
+class TestJsonHelpers:
+    def test_round_trip(self):
+        data = {"a": 1, "b": [True, None, "x"], "c": {"d": 1.5}}
+        encoded = _http.dumps(data)
+        assert isinstance(encoded, bytes)
+        assert _http.loads(encoded) == data
+
+    def test_loads_accepts_str(self):
+        assert _http.loads('{"ok": true}') == {"ok": True}
+
+    def test_stdlib_fallback(self):
+        with patch.object(_http, "orjson", None):
+            encoded = _http.dumps({"a": [1, 2]})
+            assert encoded == b'{"a":[1,2]}'
+            assert _http.loads(encoded) == {"a": [1, 2]}
+
+    def test_backoff_delay(self):
+        assert _http.backoff_delay(3, 1.0, retry_after="7") == 7.0
+        for attempt in range(4):
+            delay = _http.backoff_delay(attempt, 0.5, retry_after="Wed, 21 Oct 2015")
+            assert 0.25 * 2**attempt <= delay <= 0.5 * 2**attempt
+
+    def test_encode_json_kwarg(self):
+        kwargs = _http.encode_json_kwarg({"json": {"a": 1}, "headers": {"X": "y"}})
+        assert "json" not in kwargs
+        assert _http.loads(kwargs["data"]) == {"a": 1}
+        assert kwargs["headers"] == {"Content-Type": "application/json", "X": "y"}
+        assert _http.encode_json_kwarg({"params": {"q": 1}}) == {"params": {"q": 1}}
+
+    def test_accept_encoding_matches_decoders(self):
+        encodings = _http.ACCEPT_ENCODING.split(", ")
+        assert "gzip" in encodings
+        has_brotli = any(importlib.util.find_spec(m) for m in ("brotli", "brotlicffi"))
+        assert ("br" in encodings) == has_brotli
+
+    def test_http2_enabled_only_with_h2(self):
+        assert _http.HTTP2 == (importlib.util.find_spec("h2") is not None)
+
+    def test_mount_pooled_adapter(self):
+        session = requests.Session()
+        _http.mount_pooled_adapter(session)
+        adapter = session.get_adapter("https://api.github.com")
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 3
+        assert 429 in adapter.max_retries.status_forcelist
+        assert not adapter.max_retries.is_retry("POST", 503)
+
+        _http.mount_pooled_adapter(
+            session, prefix="https://api.example.com/", retry_statuses=(503,)
+        )
+        adapter = session.get_adapter("https://api.example.com/v1")
+        assert not adapter.max_retries.is_retry("GET", 429)
+        assert session.get_adapter("https://other.example.com") is not adapter
+
+
+# ---------------------------------------------------------------------------
+# prefetch_pages
+# ---------------------------------------------------------------------------
+
+
+class TestPrefetchPages:
+    def test_yields_all_pages_in_order(self):
+        pages = {0: ([1, 2], 1), 1: ([3], 2), 2: ([4, 5], None)}
+        assert list(prefetch_pages(pages.__getitem__, 0)) == [1, 2, 3, 4, 5]
+
+    def test_next_page_requested_before_items_yielded(self):
+        requested = []
+
+        def fetch(cursor):
+            requested.append(cursor)
+            return [cursor], (cursor + 1 if cursor < 2 else None)
+
+        items = prefetch_pages(fetch, 0)
+        assert next(items) == 0
+        items.close()
+        assert requested == [0, 1]
+
+    def test_fetch_error_raised_from_iterator(self):
+        def fetch(cursor):
+            if cursor:
+                raise RuntimeError("page failed")
+            return ["a"], 1
+
+        items = prefetch_pages(fetch, 0)
+        assert next(items) == "a"
+        with pytest.raises(RuntimeError, match="page failed"):
+            next(items)
+
+
+# ---------------------------------------------------------------------------
+# TokenBucket
+# ---------------------------------------------------------------------------
+
+
+class FakeClock:
+    """Stand-in for time.monotonic/time.sleep that advances on sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    def _bucket(self, clock: FakeClock, rate: float, per: float) -> TokenBucket:
+        with patch("goliath.integrations._ratelimit.time", clock):
+            return TokenBucket(rate=rate, per=per)
+
+    def test_burst_up_to_rate_without_blocking(self):
+        clock = FakeClock()
+        bucket = self._bucket(clock, rate=5, per=1.0)
+        with patch("goliath.integrations._ratelimit.time", clock):
+            for _ in range(5):
+                bucket.acquire()
+        assert clock.sleeps == []
+
+    def test_blocks_once_empty(self):
+        clock = FakeClock()
+        bucket = self._bucket(clock, rate=30, per=60.0)
+        with patch("goliath.integrations._ratelimit.time", clock):
+            for _ in range(31):
+                bucket.acquire()
+        # One token refills every 2 seconds at 30/minute.
+        assert clock.sleeps == [2.0]
+
+    def test_sleeps_without_holding_the_lock(self):
+        clock = FakeClock()
+        bucket = self._bucket(clock, rate=1, per=2.0)
+        held = []
+        advance = clock.sleep
+
+        def sleep(seconds):
+            held.append(bucket._lock.locked())
+            advance(seconds)
+
+        clock.sleep = sleep
+        with patch("goliath.integrations._ratelimit.time", clock):
+            bucket.acquire()
+            bucket.acquire()
+        assert held == [False]
+        assert clock.sleeps == [2.0]
+
+    def test_refills_over_time(self):
+        clock = FakeClock()
+        bucket = self._bucket(clock, rate=2, per=1.0)
+        with patch("goliath.integrations._ratelimit.time", clock):
+            bucket.acquire()
+            bucket.acquire()
+            clock.now += 1.0
+            bucket.acquire()
+            bucket.acquire()
+        assert clock.sleeps == []
+
+    def test_observe_caps_tokens_and_waits_for_reset(self):
+        clock = FakeClock()
+        bucket = self._bucket(clock, rate=100, per=10.0)
+        with patch("goliath.integrations._ratelimit.time", clock):
+            bucket.observe(remaining=2)
+            bucket.acquire()
+            bucket.acquire()
+            assert clock.sleeps == []
+            bucket.observe(remaining=0, reset_after=3.0)
+            bucket.acquire()
+        assert clock.sleeps == [pytest.approx(3.0)]
+
+    def test_acquire_async_queues_waiters_in_order(self):
+        clock = FakeClock()
+        bucket = self._bucket(clock, rate=2, per=1.0)
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        async def run():
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+
+        with (
+            patch("goliath.integrations._ratelimit.time", clock),
+            patch("goliath.integrations._ratelimit.asyncio.sleep", fake_sleep),
+        ):
+            asyncio.run(run())
+        # Two burst through; each later caller waits one more half-second slot.
+        assert sleeps == [0.5, 1.0, 1.5]
+        assert clock.sleeps == []
+
+
+class TestAdaptiveConcurrency:
+    def test_additive_increase_multiplicative_decrease(self):
+        with patch("goliath.integrations._ratelimit.time", FakeClock()):
+            limiter = AdaptiveConcurrency(initial=4, max_limit=8)
+            for _ in range(4):
+                limiter.release(limiter.acquire())
+            assert 4.9 < limiter.limit < 5.0
+            limiter.release(limiter.acquire(), overloaded=True)
+            assert limiter.limit < 2.5
+            for _ in range(3):
+                limiter.release(limiter.acquire(), overloaded=True)
+        assert limiter.limit == 1.0
+
+    def test_slow_calls_hold_the_window(self):
+        clock = FakeClock()
+        with patch("goliath.integrations._ratelimit.time", clock):
+            limiter = AdaptiveConcurrency(initial=2)
+            started = limiter.acquire()
+            clock.now += 0.1
+            limiter.release(started)
+            grown = limiter.limit
+            started = limiter.acquire()
+            clock.now += 1.0
+            limiter.release(started)
+        assert limiter.limit == grown
+
+
+# ---------------------------------------------------------------------------
+# TTLCache
+# ---------------------------------------------------------------------------
+
+
+class TestTTLCache:
+    def test_fresh_then_stale(self):
+        clock = FakeClock()
+        with patch("goliath.integrations._cache.time", clock):
+            cache = TTLCache(maxsize=4, ttl=10)
+            cache.set("k", "v")
+            assert cache.get("k") == "v"
+            clock.now = 11
+            assert cache.get("k") is None
+            assert cache.get_entry("k") == ("v", False)
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_pop_matching_and_clear(self):
+        cache = TTLCache()
+        cache.set(("/x", ()), 1)
+        cache.set(("/x", (("ref", "main"),)), 2)
+        cache.set(("/y", ()), 3)
+        cache.pop_matching(lambda key: key[0] == "/x")
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestDiskCache:
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "sub" / "cache.sqlite3")
+        DiskCache(path, ttl=60).set("k", {"a": [1, 2]})
+        assert DiskCache(path, ttl=60).get("k") == {"a": [1, 2]}
+
+    def test_fresh_then_stale(self):
+        clock = FakeClock()
+        with patch("goliath.integrations._cache.time") as mock_time:
+            mock_time.time = clock.monotonic
+            cache = DiskCache(":memory:", ttl=10)
+            cache.set("k", "v")
+            assert cache.get("k") == "v"
+            clock.now = 11
+            assert cache.get("k") is None
+            assert cache.get_entry("k") == ("v", False)
+            cache.clear()
+            assert len(cache) == 0
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return {"ok": True}
+
+        async def run():
+            flight = SingleFlight()
+            results = await asyncio.gather(*(flight.run("k", fetch) for _ in range(5)))
+            assert len(flight) == 0
+            again = await flight.run("k", fetch)
+            return results, again
+
+        results, again = asyncio.run(run())
+        assert all(r is results[0] for r in results)
+        assert again == {"ok": True}
+        assert len(calls) == 2
+
+    def test_error_propagates_to_every_waiter(self):
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        async def run():
+            flight = SingleFlight()
+            return await asyncio.gather(
+                flight.run("k", fail), flight.run("k", fail), return_exceptions=True
+            )
+
+        errors = asyncio.run(run())
+        assert [type(e) for e in errors] == [ValueError, ValueError]
@@ -1,5 +1,6 @@
 """Tests for new integrations: YouTube, LinkedIn, Shopify, Stripe, Twilio."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -180,7 +181,7 @@ class TestLinkedInClient:
         with pytest.raises(RuntimeError, match="LINKEDIN_PERSON_ID"):
             LinkedInClient()
 
-    @patch("goliath.integrations.linkedin.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.linkedin.config")
     def test_headers_set(self, mock_config, mock_requests):
         mock_config.LINKEDIN_ACCESS_TOKEN = "tok123"
@@ -188,22 +189,24 @@ class TestLinkedInClient:
 
         from goliath.integrations.linkedin import LinkedInClient
 
+        mock_requests.Session.return_value.get.return_value.content = b"{}"
+
         client = LinkedInClient()
-        headers = client.session.headers
-        headers.update.assert_called_once()
-        call_kwargs = headers.update.call_args[0][0]
-        assert call_kwargs["Authorization"] == "Bearer tok123"
-        assert "X-Restli-Protocol-Version" in call_kwargs
-        assert "LinkedIn-Version" in call_kwargs
-
-    @patch("goliath.integrations.linkedin.requests")
+        client.get_profile()
+        headers = client.session.get.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer tok123"
+        assert "X-Restli-Protocol-Version" in headers
+        assert "LinkedIn-Version" in headers
+        assert "Authorization" not in client.session.headers
+
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.linkedin.config")
     def test_create_text_post(self, mock_config, mock_requests):
         mock_config.LINKEDIN_ACCESS_TOKEN = "tok"
         mock_config.LINKEDIN_PERSON_ID = "person123"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"id": "urn:li:share:1"}
+        mock_resp.content = b'{"id": "urn:li:share:1"}'
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.linkedin import LinkedInClient
@@ -212,20 +215,20 @@ class TestLinkedInClient:
         client.create_post("Hello LinkedIn!")
 
         call_args = client.session.post.call_args
-        payload = call_args.kwargs.get("json", call_args[1].get("json", {}))
+        payload = json.loads(call_args.kwargs["data"])
         assert payload["author"] == "urn:li:person:person123"
         share = payload["specificContent"]["com.linkedin.ugc.ShareContent"]
         assert share["shareCommentary"]["text"] == "Hello LinkedIn!"
         assert share["shareMediaCategory"] == "NONE"
 
-    @patch("goliath.integrations.linkedin.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.linkedin.config")
     def test_create_link_post(self, mock_config, mock_requests):
         mock_config.LINKEDIN_ACCESS_TOKEN = "tok"
         mock_config.LINKEDIN_PERSON_ID = "person123"
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"id": "urn:li:share:2"}
+        mock_resp.content = b'{"id": "urn:li:share:2"}'
         mock_requests.Session.return_value.post.return_value = mock_resp
 
         from goliath.integrations.linkedin import LinkedInClient
@@ -234,12 +237,12 @@ class TestLinkedInClient:
         client.create_post("Check this out", link_url="https://example.com")
 
         call_args = client.session.post.call_args
-        payload = call_args.kwargs.get("json", call_args[1].get("json", {}))
+        payload = json.loads(call_args.kwargs["data"])
         share = payload["specificContent"]["com.linkedin.ugc.ShareContent"]
         assert share["shareMediaCategory"] == "ARTICLE"
         assert share["media"][0]["originalUrl"] == "https://example.com"
 
-    @patch("goliath.integrations.linkedin.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.linkedin.config")
     def test_image_post_file_not_found(self, mock_config, mock_requests):
         mock_config.LINKEDIN_ACCESS_TOKEN = "tok"
@@ -251,7 +254,63 @@ class TestLinkedInClient:
         with pytest.raises(FileNotFoundError):
             client.create_image_post("Look!", "/nonexistent/photo.jpg")
 
-    @patch("goliath.integrations.linkedin.requests")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.linkedin.config")
+    def test_image_post_uploads_file_bytes(self, mock_config, mock_requests, tmp_path):
+        mock_config.LINKEDIN_ACCESS_TOKEN = "tok"
+        mock_config.LINKEDIN_PERSON_ID = "pid"
+        image = tmp_path / "photo.jpg"
+        image.write_bytes(b"\xff\xd8jpeg-bytes")
+
+        mock_session = mock_requests.Session.return_value
+        register = MagicMock()
+        register.content = json.dumps(
+            {
+                "value": {
+                    "asset": "urn:li:digitalmediaAsset:1",
+                    "uploadMechanism": {
+                        "com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest": {
+                            "uploadUrl": "https://upload.example/abc"
+                        }
+                    },
+                }
+            }
+        ).encode()
+        created = MagicMock()
+        created.content = b'{"id": "urn:li:share:3"}'
+        mock_session.post.side_effect = [register, created]
+        uploaded = []
+
+        def fake_put(url, data=None, headers=None):
+            uploaded.append((url, bytes(data), headers))
+            resp = MagicMock()
+            resp.content = b"<html>Created</html>"
+            return resp
+
+        mock_session.put.side_effect = fake_put
+
+        from goliath.integrations.linkedin import LinkedInClient
+
+        client = LinkedInClient()
+        assert client.create_image_post("Look!", str(image)) == {"id": "urn:li:share:3"}
+        url, body, headers = uploaded[0]
+        assert url == "https://upload.example/abc"
+        assert body == b"\xff\xd8jpeg-bytes"
+        assert headers["Content-Type"] == "application/octet-stream"
+        assert headers["Authorization"] == "Bearer tok"
+        register_call, post_call = mock_session.post.call_args_list
+        register = json.loads(register_call.kwargs["data"])
+        assert register["registerUploadRequest"]["owner"] == "urn:li:person:pid"
+        payload = json.loads(post_call.kwargs["data"])
+        assert payload["author"] == "urn:li:person:pid"
+        share = payload["specificContent"]["com.linkedin.ugc.ShareContent"]
+        assert share["shareMediaCategory"] == "IMAGE"
+        assert share["media"][0] == {
+            "status": "READY",
+            "media": "urn:li:digitalmediaAsset:1",
+        }
+
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.linkedin.config")
     def test_delete_post_encodes_urn(self, mock_config, mock_requests):
         mock_config.LINKEDIN_ACCESS_TOKEN = "tok"
@@ -259,6 +318,7 @@ class TestLinkedInClient:
 
         mock_resp = MagicMock()
         mock_resp.status_code = 204
+        mock_resp.content = b""
         mock_requests.Session.return_value.delete.return_value = mock_resp
 
         from goliath.integrations.linkedin import LinkedInClient
@@ -269,6 +329,23 @@ class TestLinkedInClient:
         url = client.session.delete.call_args[0][0]
         assert "urn%3Ali%3Ashare%3A123" in url
 
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.linkedin.config")
+    def test_post_stats_encodes_reserved_chars(self, mock_config, mock_requests):
+        mock_config.LINKEDIN_ACCESS_TOKEN = "tok"
+        mock_config.LINKEDIN_PERSON_ID = "pid"
+        mock_requests.Session.return_value.get.return_value.content = b"{}"
+
+        from goliath.integrations.linkedin import LinkedInClient
+
+        client = LinkedInClient()
+        client.get_post_stats("urn:li:comment:(urn:li:activity:1,2)")
+
+        url = client.session.get.call_args[0][0]
+        assert url.endswith(
+            "/v2/socialActions/urn%3Ali%3Acomment%3A%28urn%3Ali%3Aactivity%3A1%2C2%29"
+        )
+
 
 # ---------------------------------------------------------------------------
 # Shopify
@@ -1,10 +1,177 @@
-"""Tests for remaining integrations: GitHub, Gmail, Notion, Scraper, ImageGen."""
-
+"""Tests for remaining integrations: Dropbox, Etherscan, Figma, GitHub, Gmail,
+Notion, Scraper, ImageGen, Jira, Kraken, Linear, Loom, Mailchimp."""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import io
+import json
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 
+# ---------------------------------------------------------------------------
+# Dropbox
+# ---------------------------------------------------------------------------
+
+
+class TestDropboxClient:
+    @patch("goliath.integrations.dropbox.config")
+    def test_missing_token_raises(self, mock_config):
+        mock_config.DROPBOX_ACCESS_TOKEN = ""
+
+        from goliath.integrations.dropbox import DropboxClient
+
+        with pytest.raises(RuntimeError, match="DROPBOX_ACCESS_TOKEN"):
+            DropboxClient()
+
+    @patch("goliath.integrations.dropbox.requests")
+    @patch("goliath.integrations.dropbox.config")
+    def test_list_folder_follows_cursor(self, mock_config, mock_requests):
+        mock_config.DROPBOX_ACCESS_TOKEN = "dbx_tok"
+        first, second = MagicMock(), MagicMock()
+        first.content = (
+            b'{"entries": [{"name": "a"}], "has_more": true, "cursor": "c1"}'
+        )
+        second.content = b'{"entries": [{"name": "b"}], "has_more": false}'
+        mock_requests.Session.return_value.post.side_effect = [first, second]
+
+        from goliath.integrations.dropbox import DropboxClient
+
+        client = DropboxClient()
+        assert [e["name"] for e in client.list_folder("/Docs")] == ["a", "b"]
+        last = client.session.post.call_args
+        assert last.args[0].endswith("/files/list_folder/continue")
+        assert last.kwargs["json"] == {"cursor": "c1"}
+
+    @patch("goliath.integrations.dropbox.requests")
+    @patch("goliath.integrations.dropbox.config")
+    def test_upload_api_arg_header_is_ascii(self, mock_config, mock_requests, tmp_path):
+        mock_config.DROPBOX_ACCESS_TOKEN = "dbx_tok"
+        mock_requests.post.return_value.content = json.dumps(
+            {"name": "résumé.pdf"}
+        ).encode()
+        local = tmp_path / "cv.pdf"
+        local.write_bytes(b"%PDF")
+
+        from goliath.integrations.dropbox import DropboxClient
+
+        result = DropboxClient().upload(str(local), "/résumé.pdf")
+        assert result == {"name": "résumé.pdf"}
+        header = mock_requests.post.call_args.kwargs["headers"]["Dropbox-API-Arg"]
+        assert header.isascii()
+        assert json.loads(header)["path"] == "/résumé.pdf"
+
+
+# ---------------------------------------------------------------------------
+# Etherscan
+# ---------------------------------------------------------------------------
+
+
+class TestEtherscanClient:
+    @patch("goliath.integrations.etherscan.config")
+    def test_missing_key_raises(self, mock_config):
+        mock_config.ETHERSCAN_API_KEY = ""
+
+        from goliath.integrations.etherscan import EtherscanClient
+
+        with pytest.raises(RuntimeError, match="ETHERSCAN_API_KEY"):
+            EtherscanClient()
+
+    @patch("goliath.integrations.etherscan.requests")
+    @patch("goliath.integrations.etherscan.config")
+    def test_result_unwrapped(self, mock_config, mock_requests):
+        mock_config.ETHERSCAN_API_KEY = "es_key"
+        mock_config.ETHERSCAN_BASE_URL = ""
+        mock_requests.Session.return_value.get.return_value.content = (
+            b'{"status":"1","message":"OK","result":"42"}'
+        )
+
+        from goliath.integrations.etherscan import EtherscanClient
+
+        client = EtherscanClient()
+        assert client.get_balance("0xabc") == "42"
+        params = client.session.get.call_args.kwargs["params"]
+        assert params["apikey"] == "es_key"
+        assert params["action"] == "balance"
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            b'{"status":"0","message":"NOTOK","result":"Invalid API Key"}',
+            b'{"status": "0", "message": "NOTOK", "result": "Invalid API Key"}',
+            b'{"message":"NOTOK","result":"Invalid API Key","status":"0"}',
+            b'{"note":"' + b"x" * 64 + b'","status":"0","message":"NOTOK",'
+            b'"result":"Invalid API Key"}',
+        ],
+    )
+    @patch("goliath.integrations.etherscan.requests")
+    @patch("goliath.integrations.etherscan.config")
+    def test_error_envelope_raises(self, mock_config, mock_requests, raw):
+        mock_config.ETHERSCAN_API_KEY = "es_key"
+        mock_config.ETHERSCAN_BASE_URL = ""
+        mock_requests.Session.return_value.get.return_value.content = raw
+
+        from goliath.integrations.etherscan import EtherscanClient
+
+        with pytest.raises(RuntimeError, match="NOTOK — Invalid API Key"):
+            EtherscanClient().get_balance("0xabc")
+
+    @patch("goliath.integrations.etherscan.requests")
+    @patch("goliath.integrations.etherscan.config")
+    def test_no_transactions_is_empty_result(self, mock_config, mock_requests):
+        mock_config.ETHERSCAN_API_KEY = "es_key"
+        mock_config.ETHERSCAN_BASE_URL = ""
+        mock_requests.Session.return_value.get.return_value.content = (
+            b'{"status": "0", "message": "No transactions found", "result": []}'
+        )
+
+        from goliath.integrations.etherscan import EtherscanClient
+
+        assert EtherscanClient().get_transactions("0xabc") == []
+
+
+# ---------------------------------------------------------------------------
+# Figma
+# ---------------------------------------------------------------------------
+
+
+class TestFigmaClient:
+    @patch("goliath.integrations.figma.config")
+    def test_missing_token_raises(self, mock_config):
+        mock_config.FIGMA_ACCESS_TOKEN = ""
+
+        from goliath.integrations.figma import FigmaClient
+
+        with pytest.raises(RuntimeError, match="FIGMA_ACCESS_TOKEN"):
+            FigmaClient()
+
+    @patch("goliath.integrations.figma.requests")
+    @patch("goliath.integrations.figma.config")
+    def test_get_file_and_comments(self, mock_config, mock_requests):
+        mock_config.FIGMA_ACCESS_TOKEN = "fig_tok"
+        file_resp, comments_resp = MagicMock(), MagicMock()
+        file_resp.content = b'{"name": "Design", "document": {"id": "0:0"}}'
+        comments_resp.content = b'{"comments": [{"id": "c1"}]}'
+        mock_requests.Session.return_value.get.side_effect = [file_resp, comments_resp]
+
+        from goliath.integrations.figma import FigmaClient
+
+        client = FigmaClient()
+        assert client.get_file("KEY", depth=1)["name"] == "Design"
+        assert client.session.get.call_args.kwargs["params"] == {"depth": 1}
+        assert client.get_comments("KEY") == [{"id": "c1"}]
+        assert client.session.get.call_args.args[0].endswith("/files/KEY/comments")
+        client.session.headers.update.assert_called_once_with(
+            {"X-Figma-Token": "fig_tok"}
+        )
+
+
 # ---------------------------------------------------------------------------
 # GitHub
 # ---------------------------------------------------------------------------
@@ -29,9 +196,30 @@ class TestGitHubClient:
         from goliath.integrations.github import GitHubClient
 
         client = GitHubClient()
-        assert "Bearer ghp_test123" in client.session.headers["Authorization"]
+        assert client._headers["Authorization"] == "Bearer ghp_test123"
+        assert "Authorization" not in client.session.headers
         assert client.owner == "testuser"
 
+    @patch("goliath.integrations.github.config")
+    def test_clients_share_session_with_per_request_auth(self, mock_config):
+        mock_config.GITHUB_TOKEN = "ghp_default"
+        mock_config.GITHUB_OWNER = ""
+
+        from goliath.integrations.github import GitHubClient
+
+        first = GitHubClient(token="ghp_one")
+        second = GitHubClient(token="ghp_two")
+        assert first.session is second.session
+
+        first.session.get = MagicMock(
+            return_value=MagicMock(status_code=200, content=b"{}")
+        )
+        first.get_repo("o/a", use_cache=False)
+        second.get_repo("o/b", use_cache=False)
+        calls = first.session.get.call_args_list
+        sent = [c.kwargs["headers"]["Authorization"] for c in calls]
+        assert sent == ["Bearer ghp_one", "Bearer ghp_two"]
+
     @patch("goliath.integrations.github.config")
     def test_list_repos(self, mock_config):
         mock_config.GITHUB_TOKEN = "ghp_test"
@@ -42,7 +230,7 @@ class TestGitHubClient:
         client = GitHubClient()
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = [{"name": "repo1"}, {"name": "repo2"}]
+        mock_resp.content = b'[{"name": "repo1"}, {"name": "repo2"}]'
         client.session.get = MagicMock(return_value=mock_resp)
 
         repos = client.list_repos()
@@ -60,11 +248,11 @@ class TestGitHubClient:
         client = GitHubClient()
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"number": 42, "title": "Bug"}
+        mock_resp.content = b'{"number": 42, "title": "Bug"}'
         client.session.post = MagicMock(return_value=mock_resp)
 
         client.create_issue("owner/repo", title="Bug", body="It broke", labels=["bug"])
-        payload = client.session.post.call_args.kwargs["json"]
+        payload = json.loads(client.session.post.call_args.kwargs["data"])
         assert payload["title"] == "Bug"
         assert payload["labels"] == ["bug"]
 
@@ -78,11 +266,11 @@ class TestGitHubClient:
         client = GitHubClient()
 
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"name": "new-repo", "private": True}
+        mock_resp.content = b'{"name": "new-repo", "private": true}'
         client.session.post = MagicMock(return_value=mock_resp)
 
         client.create_repo("new-repo", description="Test", private=True)
-        payload = client.session.post.call_args.kwargs["json"]
+        payload = json.loads(client.session.post.call_args.kwargs["data"])
         assert payload["private"] is True
 
     @patch("goliath.integrations.github.config")
@@ -103,6 +291,212 @@ class TestGitHubClient:
         url = client.session.post.call_args[0][0]
         assert "actions/workflows/build.yml/dispatches" in url
 
+    @patch("goliath.integrations.github.config")
+    def test_get_repo_cached_and_revalidated_with_etag(self, mock_config):
+        mock_config.GITHUB_TOKEN = "ghp_test"
+        mock_config.GITHUB_OWNER = ""
+
+        from goliath.integrations.github import GitHubClient
+
+        client = GitHubClient()
+
+        ok = MagicMock(
+            status_code=200, headers={"ETag": '"abc"'}, content=b'{"name": "repo"}'
+        )
+        not_modified = MagicMock(status_code=304, headers={})
+        client.session.get = MagicMock(side_effect=[ok, not_modified])
+
+        assert client.get_repo("o/repo") == {"name": "repo"}
+        assert client.get_repo("o/repo") == {"name": "repo"}
+        assert client.session.get.call_count == 1
+
+        client._cache.ttl = 0
+        client._cache.set(("/repos/o/repo", ()), ('"abc"', {"name": "repo"}))
+        assert client.get_repo("o/repo") == {"name": "repo"}
+        headers = client.session.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+
+    @patch("goliath.integrations.github.config")
+    def test_create_or_update_file_skips_decoding_existing(self, mock_config):
+        mock_config.GITHUB_TOKEN = "ghp_test"
+        mock_config.GITHUB_OWNER = ""
+
+        from goliath.integrations.github import GitHubClient
+
+        client = GitHubClient()
+        existing = MagicMock(
+            status_code=200, content=b'{"sha": "abc123", "content": "!!not-base64"}'
+        )
+        client.session.get = MagicMock(return_value=existing)
+        client.session.put = MagicMock(
+            return_value=MagicMock(status_code=200, content=b'{"commit": {}}')
+        )
+
+        client.create_or_update_file("o/r", "a.md", "hello", "update")
+
+        payload = json.loads(client.session.put.call_args.kwargs["data"])
+        assert payload["sha"] == "abc123"
+
+    @patch("goliath.integrations.github.config")
+    def test_iter_issues_follows_link_header(self, mock_config):
+        mock_config.GITHUB_TOKEN = "ghp_test"
+        mock_config.GITHUB_OWNER = ""
+
+        from goliath.integrations.github import GitHubClient
+
+        client = GitHubClient()
+        next_url = "https://api.github.com/repositories/1/issues?page=2"
+        first = MagicMock(
+            content=b'[{"number": 1}, {"number": 2}]',
+            links={"next": {"url": next_url}},
+        )
+        last = MagicMock(content=b'[{"number": 3}]', links={})
+        client.session.get = MagicMock(side_effect=[first, last])
+
+        numbers = [issue["number"] for issue in client.iter_issues("o/r")]
+
+        assert numbers == [1, 2, 3]
+        calls = client.session.get.call_args_list
+        assert calls[0].kwargs["params"] == {"state": "open", "per_page": 100}
+        assert calls[1].args[0] == next_url
+        assert calls[1].kwargs["params"] is None
+
+    @patch("goliath.integrations.github.config")
+    def test_get_file_raw_uses_raw_media_type(self, mock_config):
+        mock_config.GITHUB_TOKEN = "ghp_test"
+        mock_config.GITHUB_OWNER = ""
+
+        from goliath.integrations.github import GitHubClient
+
+        client = GitHubClient()
+        client.session.get = MagicMock(
+            return_value=MagicMock(status_code=200, content=b"\x89PNG\r\n")
+        )
+
+        data = client.get_file_raw("o/r", "logo.png", ref="main")
+
+        assert data == b"\x89PNG\r\n"
+        call = client.session.get.call_args
+        assert call.args[0].endswith("/repos/o/r/contents/logo.png")
+        assert call.kwargs["params"] == {"ref": "main"}
+        assert call.kwargs["headers"]["Accept"] == "application/vnd.github.raw"
+
+    @patch("goliath.integrations.github.config")
+    def test_get_file_leaves_cached_body_untouched(self, mock_config):
+        mock_config.GITHUB_TOKEN = "ghp_test"
+        mock_config.GITHUB_OWNER = ""
+
+        from goliath.integrations.github import GitHubClient
+
+        client = GitHubClient()
+        client.session.get = MagicMock(
+            return_value=MagicMock(
+                status_code=200, headers={}, content=b'{"sha": "s1", "content": "aGk="}'
+            )
+        )
+
+        assert client.get_file("o/r", "a.md")["decoded_content"] == "hi"
+        meta = client.get_file("o/r", "a.md", include_content=False)
+
+        assert meta == {"sha": "s1", "content": "aGk="}
+        assert client.session.get.call_count == 1
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.github.config")
+    def test_context_manager_leaves_shared_session_open(
+        self, mock_config, mock_requests
+    ):
+        mock_config.GITHUB_TOKEN = "ghp_test"
+        mock_config.GITHUB_OWNER = ""
+
+        from goliath.integrations.github import GitHubClient
+
+        with GitHubClient() as client:
+            client._cache.set("k", {"cached": True})
+        client.session.close.assert_not_called()
+        assert len(client._cache) == 0
+
+    @patch("goliath.integrations.github.config")
+    def test_async_get_repos_concurrent(self, mock_config):
+        mock_config.GITHUB_TOKEN = "ghp_test"
+        mock_config.GITHUB_OWNER = ""
+
+        from goliath.integrations.github import AsyncGitHubClient
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            name = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"name": name})
+
+        async def run():
+            async with AsyncGitHubClient() as client:
+                client._client = httpx.AsyncClient(
+                    base_url="https://api.github.com",
+                    headers=client._headers,
+                    transport=httpx.MockTransport(handler),
+                )
+                return await client.get_repos(["o/a", "o/b", "o/c"])
+
+        repos = asyncio.run(run())
+        assert [r["name"] for r in repos] == ["a", "b", "c"]
+        assert len(seen) == 3
+        assert seen[0].headers["Authorization"] == "Bearer ghp_test"
+
+    @patch("goliath.integrations.github.config")
+    def test_async_identical_reads_coalesced(self, mock_config):
+        mock_config.GITHUB_TOKEN = "ghp_test"
+        mock_config.GITHUB_OWNER = ""
+
+        from goliath.integrations.github import AsyncGitHubClient
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            name = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"name": name})
+
+        async def run():
+            async with AsyncGitHubClient() as client:
+                client._client = httpx.AsyncClient(
+                    base_url="https://api.github.com",
+                    transport=httpx.MockTransport(handler),
+                )
+                repos = await client.get_repos(["o/a", "o/a", "o/b", "o/a"])
+                assert len(client._inflight) == 0
+                return repos
+
+        repos = asyncio.run(run())
+        assert [r["name"] for r in repos] == ["a", "a", "b", "a"]
+        assert sorted(r.url.path for r in seen) == ["/repos/o/a", "/repos/o/b"]
+
+    @patch("goliath.integrations.github.config")
+    def test_async_coalesced_get_file_returns_separate_dicts(self, mock_config):
+        mock_config.GITHUB_TOKEN = "ghp_test"
+        mock_config.GITHUB_OWNER = ""
+
+        from goliath.integrations.github import AsyncGitHubClient
+
+        def handler(request):
+            return httpx.Response(200, json={"sha": "s1", "content": "aGk="})
+
+        async def run():
+            async with AsyncGitHubClient() as client:
+                client._client = httpx.AsyncClient(
+                    base_url="https://api.github.com",
+                    transport=httpx.MockTransport(handler),
+                )
+                return await asyncio.gather(
+                    client.get_file("o/r", "a.md"),
+                    client.get_file("o/r", "a.md", include_content=False),
+                )
+
+        full, meta = asyncio.run(run())
+        assert full["decoded_content"] == "hi"
+        assert meta == {"sha": "s1", "content": "aGk="}
+
 
 # ---------------------------------------------------------------------------
 # Gmail
@@ -136,9 +530,7 @@ class TestGmailClient:
         mock_config.GMAIL_ADDRESS = "sender@gmail.com"
         mock_config.GMAIL_APP_PASSWORD = "app-pass"
 
-        mock_server = MagicMock()
-        mock_smtplib.SMTP.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_smtplib.SMTP.return_value.__exit__ = MagicMock(return_value=False)
+        mock_server = mock_smtplib.SMTP.return_value
 
         from goliath.integrations.gmail import GmailClient
 
@@ -147,10 +539,10 @@ class TestGmailClient:
 
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once_with("sender@gmail.com", "app-pass")
-        mock_server.sendmail.assert_called_once()
-        call_args = mock_server.sendmail.call_args[0]
-        assert call_args[0] == "sender@gmail.com"
-        assert "recipient@example.com" in call_args[1]
+        mock_server.send_message.assert_called_once()
+        call_kwargs = mock_server.send_message.call_args.kwargs
+        assert call_kwargs["from_addr"] == "sender@gmail.com"
+        assert "recipient@example.com" in call_kwargs["to_addrs"]
 
     @patch("goliath.integrations.gmail.config")
     def test_attachment_not_found(self, mock_config):
@@ -174,9 +566,7 @@ class TestGmailClient:
         mock_config.GMAIL_ADDRESS = "sender@gmail.com"
         mock_config.GMAIL_APP_PASSWORD = "app-pass"
 
-        mock_server = MagicMock()
-        mock_smtplib.SMTP.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_smtplib.SMTP.return_value.__exit__ = MagicMock(return_value=False)
+        mock_server = mock_smtplib.SMTP.return_value
 
         from goliath.integrations.gmail import GmailClient
 
@@ -188,11 +578,87 @@ class TestGmailClient:
             cc="c@example.com",
         )
 
-        recipients = mock_server.sendmail.call_args[0][1]
+        recipients = mock_server.send_message.call_args.kwargs["to_addrs"]
         assert "a@example.com" in recipients
         assert "b@example.com" in recipients
         assert "c@example.com" in recipients
 
+    @patch("goliath.integrations.gmail.smtplib")
+    @patch("goliath.integrations.gmail.config")
+    def test_send_with_attachment(self, mock_config, mock_smtplib, tmp_path):
+        mock_config.GMAIL_ADDRESS = "sender@gmail.com"
+        mock_config.GMAIL_APP_PASSWORD = "app-pass"
+        report = tmp_path / "report.pdf"
+        report.write_bytes(b"%PDF-1.4 data")
+
+        from goliath.integrations.gmail import GmailClient
+
+        client = GmailClient()
+        client.send(
+            to="r@example.com",
+            subject="Files",
+            body="<p>See attached</p>",
+            html=True,
+            attachments=[str(report)],
+        )
+
+        msg = mock_smtplib.SMTP.return_value.send_message.call_args.args[0]
+        assert msg.get_body().get_content_type() == "text/html"
+        (part,) = msg.iter_attachments()
+        assert part.get_content_type() == "application/pdf"
+        assert part.get_filename() == "report.pdf"
+        assert part.get_content() == b"%PDF-1.4 data"
+        # Serialized by send_message's BytesGenerator, never as a str.
+        mock_smtplib.SMTP.return_value.sendmail.assert_not_called()
+
+    @patch("goliath.integrations.gmail.smtplib")
+    @patch("goliath.integrations.gmail.config")
+    def test_send_many_reuses_connection(self, mock_config, mock_smtplib):
+        mock_config.GMAIL_ADDRESS = "sender@gmail.com"
+        mock_config.GMAIL_APP_PASSWORD = "app-pass"
+
+        mock_server = mock_smtplib.SMTP.return_value
+        mock_server.noop.return_value = (250, b"OK")
+
+        from goliath.integrations.gmail import GmailClient
+
+        with GmailClient() as client:
+            client.send_many(
+                [
+                    {"to": f"r{i}@example.com", "subject": "Hi", "body": "Hello"}
+                    for i in range(3)
+                ]
+            )
+            client.send(to="last@example.com", subject="Hi", body="Bye")
+
+        mock_smtplib.SMTP.assert_called_once()
+        mock_server.login.assert_called_once()
+        assert mock_server.send_message.call_count == 4
+        mock_server.quit.assert_called_once()
+
+    @patch("goliath.integrations.gmail.smtplib")
+    @patch("goliath.integrations.gmail.config")
+    def test_reconnects_when_noop_fails(self, mock_config, mock_smtplib):
+        import smtplib
+
+        mock_config.GMAIL_ADDRESS = "sender@gmail.com"
+        mock_config.GMAIL_APP_PASSWORD = "app-pass"
+        mock_smtplib.SMTPException = smtplib.SMTPException
+
+        stale, fresh = MagicMock(), MagicMock()
+        stale.noop.side_effect = smtplib.SMTPServerDisconnected()
+        mock_smtplib.SMTP.side_effect = [stale, fresh]
+
+        from goliath.integrations.gmail import GmailClient
+
+        client = GmailClient()
+        client.send(to="a@example.com", subject="1", body="one")
+        client.send(to="a@example.com", subject="2", body="two")
+
+        assert mock_smtplib.SMTP.call_count == 2
+        stale.close.assert_called_once()
+        fresh.send_message.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # Notion
@@ -461,6 +927,116 @@ class TestImageGenClient:
         assert isinstance(results, list)
         assert len(results) == 3
 
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.imagegen.OpenAI")
+    @patch("goliath.integrations.imagegen.config")
+    def test_generate_and_save_streams_to_disk(
+        self, mock_config, mock_openai_cls, mock_requests, tmp_path
+    ):
+        mock_config.OPENAI_API_KEY = "sk-test"
+        mock_config.IMAGEGEN_DEFAULT_MODEL = "dall-e-3"
+
+        mock_img = MagicMock(url="https://oai.com/img.png", revised_prompt=None)
+        mock_client = MagicMock()
+        mock_client.images.generate.return_value = MagicMock(data=[mock_img])
+        mock_openai_cls.return_value = mock_client
+
+        mock_resp = (
+            mock_requests.Session.return_value.get.return_value.__enter__.return_value
+        )
+        mock_resp.raw = io.BytesIO(b"\x89PNGdata")
+
+        from goliath.integrations.imagegen import ImageGenClient
+
+        path = ImageGenClient().generate_and_save(
+            "sunset", str(tmp_path / "out" / "a.png")
+        )
+
+        assert path.read_bytes() == b"\x89PNGdata"
+        assert mock_requests.Session.return_value.get.call_args.kwargs["stream"] is True
+        assert mock_resp.raw.decode_content is True
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.imagegen.OpenAI")
+    @patch("goliath.integrations.imagegen.config")
+    def test_generate_and_save_all(
+        self, mock_config, mock_openai_cls, mock_requests, tmp_path
+    ):
+        mock_config.OPENAI_API_KEY = "sk-test"
+        mock_config.IMAGEGEN_DEFAULT_MODEL = "dall-e-2"
+
+        imgs = [
+            MagicMock(url=f"https://oai.com/img{i}.png", revised_prompt=None)
+            for i in range(3)
+        ]
+        mock_client = MagicMock()
+        mock_client.images.generate.return_value = MagicMock(data=imgs)
+        mock_openai_cls.return_value = mock_client
+
+        def fake_get(url, **kwargs):
+            resp = MagicMock()
+            resp.__enter__.return_value.raw = io.BytesIO(b"png")
+            return resp
+
+        mock_requests.Session.return_value.get.side_effect = fake_get
+
+        from goliath.integrations.imagegen import ImageGenClient
+
+        paths = ImageGenClient().generate_and_save_all(
+            "art", str(tmp_path), n=3, model="dall-e-2"
+        )
+
+        assert [p.name for p in paths] == ["image_0.png", "image_1.png", "image_2.png"]
+        assert all(p.read_bytes() == b"png" for p in paths)
+        fetched = sorted(
+            c.args[0] for c in mock_requests.Session.return_value.get.call_args_list
+        )
+        assert fetched == [f"https://oai.com/img{i}.png" for i in range(3)]
+
+    @patch("goliath.integrations.imagegen.OpenAI")
+    @patch("goliath.integrations.imagegen.config")
+    def test_invalid_size_rejected_locally(self, mock_config, mock_openai_cls):
+        mock_config.OPENAI_API_KEY = "sk-test"
+        mock_config.IMAGEGEN_DEFAULT_MODEL = "dall-e-3"
+        mock_client = MagicMock()
+        mock_openai_cls.return_value = mock_client
+
+        from goliath.integrations.imagegen import ImageGenClient
+
+        client = ImageGenClient()
+        with pytest.raises(ValueError, match="Invalid size '512x512' for dall-e-3"):
+            client.generate("sunset", size="512x512")
+        with pytest.raises(ValueError, match="dall-e-2"):
+            client.variation(image="/nonexistent/img.png", size="1792x1024")
+        mock_client.images.generate.assert_not_called()
+
+    @patch("goliath.integrations.imagegen.OpenAI")
+    @patch("goliath.integrations.imagegen.config")
+    def test_invalid_n_quality_and_style_rejected_locally(
+        self, mock_config, mock_openai_cls
+    ):
+        mock_config.OPENAI_API_KEY = "sk-test"
+        mock_config.IMAGEGEN_DEFAULT_MODEL = "dall-e-3"
+        mock_client = MagicMock()
+        mock_openai_cls.return_value = mock_client
+
+        from goliath.integrations.imagegen import ImageGenClient
+
+        client = ImageGenClient()
+        with pytest.raises(ValueError, match="Invalid n 2 for dall-e-3"):
+            client.generate("sunset", n=2)
+        with pytest.raises(ValueError, match="Invalid quality 'ultra' for dall-e-3"):
+            client.generate("sunset", quality="ultra")
+        with pytest.raises(ValueError, match="Invalid style 'moody' for dall-e-3"):
+            client.generate("sunset", style="moody")
+        with pytest.raises(ValueError, match="Invalid n 11 for dall-e-2"):
+            client.variation(image="/nonexistent/img.png", n=11)
+        mock_client.images.generate.assert_not_called()
+
+        # dall-e-2 ignores quality and style, so they are not checked.
+        client.generate("sunset", model="dall-e-2", n=3, quality="ultra")
+        mock_client.images.generate.assert_called_once()
+
     @patch("goliath.integrations.imagegen.OpenAI")
     @patch("goliath.integrations.imagegen.config")
     def test_edit_file_not_found(self, mock_config, mock_openai_cls):
@@ -474,6 +1050,36 @@ class TestImageGenClient:
         with pytest.raises(FileNotFoundError, match="Image not found"):
             client.edit(image="/nonexistent/img.png", prompt="add rainbow")
 
+    @patch("goliath.integrations.imagegen.OpenAI")
+    @patch("goliath.integrations.imagegen.config")
+    def test_edit_closes_files(self, mock_config, mock_openai_cls, tmp_path):
+        mock_config.OPENAI_API_KEY = "sk-test"
+        mock_config.IMAGEGEN_DEFAULT_MODEL = "dall-e-3"
+        mock_client = MagicMock()
+        mock_client.images.edit.return_value = MagicMock(
+            data=[MagicMock(url="https://oai.com/e.png")]
+        )
+        mock_openai_cls.return_value = mock_client
+        image = tmp_path / "img.png"
+        mask = tmp_path / "mask.png"
+        image.write_bytes(b"img")
+        mask.write_bytes(b"mask")
+
+        from goliath.integrations.imagegen import ImageGenClient
+
+        client = ImageGenClient()
+        with pytest.raises(FileNotFoundError, match="Mask not found"):
+            client.edit(
+                image=str(image), prompt="x", mask=str(tmp_path / "missing.png")
+            )
+        mock_client.images.edit.assert_not_called()
+
+        result = client.edit(image=str(image), prompt="add rainbow", mask=str(mask))
+
+        assert result["url"] == "https://oai.com/e.png"
+        sent = mock_client.images.edit.call_args.kwargs
+        assert sent["image"].closed and sent["mask"].closed
+
     @patch("goliath.integrations.imagegen.OpenAI")
     @patch("goliath.integrations.imagegen.config")
     def test_variation_file_not_found(self, mock_config, mock_openai_cls):
@@ -486,3 +1092,993 @@ class TestImageGenClient:
         client = ImageGenClient()
         with pytest.raises(FileNotFoundError, match="Image not found"):
             client.variation(image="/nonexistent/img.png")
+
+
+# ---------------------------------------------------------------------------
+# Jira
+# ---------------------------------------------------------------------------
+
+
+def _jira_config(mock_config):
+    mock_config.JIRA_URL = "https://acme.atlassian.net"
+    mock_config.JIRA_EMAIL = "dev@acme.test"
+    mock_config.JIRA_API_TOKEN = "jira_tok"
+
+
+class TestJiraClient:
+    @patch("goliath.integrations.jira.config")
+    def test_missing_token_raises(self, mock_config):
+        mock_config.JIRA_API_TOKEN = ""
+
+        from goliath.integrations.jira import JiraClient
+
+        with pytest.raises(RuntimeError, match="JIRA_API_TOKEN"):
+            JiraClient()
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.jira.config")
+    def test_shared_session_with_per_request_auth(self, mock_config, mock_requests):
+        _jira_config(mock_config)
+        mock_session = mock_requests.Session.return_value
+        mock_session.get.return_value.content = b"[]"
+
+        from goliath.integrations.jira import JiraClient
+
+        with JiraClient() as first, JiraClient() as second:
+            assert first.session is second.session
+            first.list_projects()
+        auth = mock_session.get.call_args.kwargs["headers"]["Authorization"]
+        assert auth == "Basic ZGV2QGFjbWUudGVzdDpqaXJhX3Rvaw=="
+
+    def test_adf(self):
+        from goliath.integrations.jira import _adf
+
+        assert _adf("hi") == {
+            "type": "doc",
+            "version": 1,
+            "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": "hi"}]}
+            ],
+        }
+        assert _adf("")["content"] == [{"type": "paragraph", "content": []}]
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.jira.config")
+    def test_create_issue_without_description(self, mock_config, mock_requests):
+        _jira_config(mock_config)
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+        mock_session.post.return_value.content = b'{"key": "PROJ-1"}'
+
+        from goliath.integrations.jira import JiraClient
+
+        client = JiraClient()
+        assert client.create_issue("PROJ", "Bug") == {"key": "PROJ-1"}
+        fields = json.loads(mock_session.post.call_args[1]["data"])["fields"]
+        assert "description" not in fields
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.jira.config")
+    def test_add_comment_uses_adf(self, mock_config, mock_requests):
+        _jira_config(mock_config)
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+        mock_session.post.return_value.content = b'{"id": "10"}'
+
+        from goliath.integrations.jira import JiraClient, _adf
+
+        client = JiraClient()
+        client.add_comment("PROJ-1", "On it")
+        first = mock_session.post.call_args[1]["data"]
+        assert json.loads(first) == {"body": _adf("On it")}
+        assert mock_session.post.call_args[1]["headers"]["Content-Type"] == (
+            "application/json"
+        )
+        client.add_comment("PROJ-2", "On it")
+        assert mock_session.post.call_args[1]["data"] is first
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.jira.config")
+    def test_iter_search_pages_with_start_at(self, mock_config, mock_requests):
+        _jira_config(mock_config)
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+        bodies = []
+
+        def fake_post(url, **kwargs):
+            body = json.loads(kwargs["data"])
+            bodies.append(body)
+            start = body["startAt"]
+            stop = min(start + body["maxResults"], 5)
+            issues = [{"key": f"P-{i}"} for i in range(start, stop)]
+            resp = MagicMock(status_code=200)
+            resp.content = json.dumps({"issues": issues, "total": 5}).encode()
+            return resp
+
+        mock_session.post.side_effect = fake_post
+
+        from goliath.integrations.jira import JiraClient
+
+        client = JiraClient()
+        keys = [i["key"] for i in client.iter_search("project = P", page_size=2)]
+        assert keys == ["P-0", "P-1", "P-2", "P-3", "P-4"]
+        assert sorted(b["startAt"] for b in bodies) == [0, 2, 4]
+
+        bodies.clear()
+        assert len(client.search("project = P", max_results=3)) == 3
+        assert [b["maxResults"] for b in bodies] == [3]
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.jira.config")
+    def test_get_issues_bulk_uses_one_jql_query(self, mock_config, mock_requests):
+        _jira_config(mock_config)
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+        issues = [{"key": "P-2"}, {"key": "P-1"}]
+        mock_session.post.return_value.content = json.dumps(
+            {"issues": issues, "total": 2}
+        ).encode()
+
+        from goliath.integrations.jira import JiraClient
+
+        result = JiraClient().get_issues_bulk(["P-1", "P-2", "P-1"], fields="summary")
+        assert [i["key"] for i in result] == ["P-1", "P-2"]
+        body = json.loads(mock_session.post.call_args[1]["data"])
+        assert body["jql"] == "key in (P-1,P-2)"
+        assert body["fields"] == ["summary"]
+        mock_session.get.assert_not_called()
+
+    @patch("goliath.integrations.jira.config")
+    def test_get_issues_bulk_falls_back_per_key(self, mock_config):
+        _jira_config(mock_config)
+        import requests
+
+        from goliath.integrations.jira import JiraClient
+
+        def http_error(status):
+            return requests.HTTPError(response=MagicMock(status_code=status))
+
+        def get_issue(key, fields=None):
+            if key == "P-9":
+                raise http_error(404)
+            return {"key": key}
+
+        client = JiraClient()
+        with (
+            patch.object(client, "iter_search", side_effect=http_error(400)),
+            patch.object(client, "get_issue", side_effect=get_issue),
+        ):
+            result = client.get_issues_bulk(["P-1", "P-9", "P-3"])
+        assert [i["key"] for i in result] == ["P-1", "P-3"]
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.jira.config")
+    def test_transition_by_name_caches_per_workflow(self, mock_config, mock_requests):
+        _jira_config(mock_config)
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+        fields = {
+            "project": {"key": "P"},
+            "issuetype": {"id": "10001"},
+            "status": {"id": "1"},
+        }
+        transitions = [
+            {"id": "21", "name": "In Progress"},
+            {"id": "31", "name": "Done"},
+        ]
+        mock_session.get.return_value.content = json.dumps(
+            {"key": "P-1", "fields": fields, "transitions": transitions}
+        ).encode()
+        mock_session.post.return_value.status_code = 204
+
+        from goliath.integrations.jira import JiraClient
+
+        client = JiraClient()
+        client.transition_by_name("P-1", "in progress")
+        client.transition_by_name({"key": "P-2", "fields": fields}, "Done")
+
+        assert mock_session.get.call_count == 1
+        assert mock_session.get.call_args[1]["params"]["expand"] == "transitions"
+        posts = [
+            (c[0][0].rsplit("/", 2)[-2], json.loads(c[1]["data"])["transition"]["id"])
+            for c in mock_session.post.call_args_list
+        ]
+        assert posts == [("P-1", "21"), ("P-2", "31")]
+
+        with pytest.raises(ValueError, match="no transition named 'Reopen'"):
+            client.transition_by_name({"key": "P-3", "fields": fields}, "Reopen")
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.jira.config")
+    def test_no_content_calls_release_connection(self, mock_config, mock_requests):
+        _jira_config(mock_config)
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+
+        from goliath.integrations.jira import JiraClient
+
+        client = JiraClient()
+        client.delete_issue("P-1")
+        client.assign_issue("P-1", account_id="acc")
+
+        assert mock_session.delete.call_args[1]["stream"] is True
+        assert mock_session.put.call_args[1]["stream"] is True
+        raw = mock_session.put.return_value.raw
+        raw.drain_conn.assert_called_once()
+        raw.release_conn.assert_called_once()
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.jira.config")
+    def test_rate_limit_headers_tighten_bucket(self, mock_config, mock_requests):
+        _jira_config(mock_config)
+        mock_session = MagicMock()
+        mock_requests.Session.return_value = mock_session
+        near = MagicMock(status_code=200, content=b"[]")
+        near.headers = {"X-RateLimit-NearLimit": "true"}
+        limited = MagicMock(status_code=429)
+        limited.headers = {"Retry-After": "7"}
+        limited.raise_for_status.side_effect = RuntimeError("429")
+        mock_session.get.side_effect = [near, limited]
+
+        from goliath.integrations.jira import JiraClient
+
+        client = JiraClient()
+        with patch.object(JiraClient, "_bucket") as bucket:
+            bucket.rate = 100
+            client.list_projects()
+            with pytest.raises(RuntimeError, match="429"):
+                client.list_projects()
+        assert bucket.acquire.call_count == 2
+        assert bucket.observe.call_args_list[0].args == (20.0,)
+        assert bucket.observe.call_args_list[1].args == (0, 7.0)
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.jira.config")
+    def test_search_columns_and_interning(self, mock_config, mock_requests):
+        _jira_config(mock_config)
+        issues = [
+            {
+                "key": "P-1",
+                "fields": {"summary": "a", "status": {"name": "In Progress"}},
+            },
+            {"key": "P-2", "fields": {"status": {"name": "In Progress"}}},
+        ]
+        mock_requests.Session.return_value.post.return_value.content = json.dumps(
+            {"issues": issues, "total": 2}
+        ).encode()
+
+        from goliath.integrations.jira import JiraClient
+
+        client = JiraClient()
+        columns = client.search_columns("project = P", fields="summary, status")
+        assert columns == {
+            "key": ["P-1", "P-2"],
+            "summary": ["a", None],
+            "status": [{"name": "In Progress"}, {"name": "In Progress"}],
+        }
+        first, second = client.search("project = P")
+        assert first["fields"]["status"]["name"] is second["fields"]["status"]["name"]
+
+
+# ---------------------------------------------------------------------------
+# Kraken
+# ---------------------------------------------------------------------------
+
+_KRAKEN_SECRET = base64.b64encode(b"kraken-test-secret").decode()
+
+
+def _kraken_signature(path: str, data: dict) -> str:
+    """Reference API-Sign computed straight from Kraken's documented scheme."""
+    post_data = urllib.parse.urlencode(data)
+    digest = hashlib.sha256((data["nonce"] + post_data).encode()).digest()
+    key = base64.b64decode(_KRAKEN_SECRET)
+    mac = hmac.new(key, path.encode() + digest, hashlib.sha512)
+    return base64.b64encode(mac.digest()).decode()
+
+
+class TestKrakenClient:
+    @patch("goliath.integrations.kraken.config")
+    def test_invalid_secret_raises(self, mock_config):
+        mock_config.KRAKEN_API_KEY = "key"
+        mock_config.KRAKEN_API_SECRET = "not base64!"
+
+        from goliath.integrations.kraken import KrakenClient
+
+        with pytest.raises(RuntimeError, match="KRAKEN_API_SECRET"):
+            KrakenClient()
+
+    @patch("goliath.integrations.kraken.config")
+    def test_private_requires_credentials(self, mock_config):
+        mock_config.KRAKEN_API_KEY = ""
+        mock_config.KRAKEN_API_SECRET = ""
+
+        from goliath.integrations.kraken import KrakenClient
+
+        with pytest.raises(RuntimeError, match="KRAKEN_API_KEY"):
+            KrakenClient().get_balance()
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.kraken.config")
+    def test_private_post_signature(self, mock_config, mock_requests):
+        mock_config.KRAKEN_API_KEY = "key"
+        mock_config.KRAKEN_API_SECRET = _KRAKEN_SECRET
+        mock_session = mock_requests.Session.return_value
+        mock_session.post.return_value.status_code = 200
+        mock_session.post.return_value.content = json.dumps(
+            {"error": [], "result": {"ZUSD": "10.0"}}
+        ).encode()
+
+        from goliath.integrations.kraken import KrakenClient
+
+        client = KrakenClient()
+        assert client.get_trade_balance() == {"ZUSD": "10.0"}
+        assert client.get_balance() == {"ZUSD": "10.0"}
+        # A second call on the same path must not reuse mutated HMAC state.
+        assert client.get_balance() == {"ZUSD": "10.0"}
+        for call, path in zip(
+            mock_session.post.call_args_list,
+            ["/0/private/TradeBalance", "/0/private/Balance", "/0/private/Balance"],
+            strict=True,
+        ):
+            headers = call.kwargs["headers"]
+            assert headers["API-Key"] == "key"
+            data = dict(urllib.parse.parse_qsl(call.kwargs["data"].decode()))
+            assert headers["API-Sign"] == _kraken_signature(path, data)
+            assert headers["Content-Type"] == "application/x-www-form-urlencoded"
+
+    @patch("goliath.integrations.kraken.time.sleep")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.kraken.config")
+    def test_private_post_retries_with_fresh_nonce(
+        self, mock_config, mock_requests, mock_sleep
+    ):
+        mock_config.KRAKEN_API_KEY = "key"
+        mock_config.KRAKEN_API_SECRET = _KRAKEN_SECRET
+        rejected = MagicMock(status_code=200, ok=True, headers={})
+        rejected.content = b'{"error": ["EAPI:Invalid nonce"]}'
+        accepted = MagicMock(status_code=200, ok=True, headers={})
+        accepted.content = b'{"error": [], "result": {"ZUSD": "5"}}'
+        mock_session = mock_requests.Session.return_value
+        mock_session.post.side_effect = [rejected, accepted]
+
+        from goliath.integrations.kraken import KrakenClient
+
+        client = KrakenClient()
+        assert client.get_trade_balance("ZEUR") == {"ZUSD": "5"}
+        mock_sleep.assert_called_once()
+        first, second = (
+            dict(urllib.parse.parse_qsl(c.kwargs["data"].decode()))
+            for c in mock_session.post.call_args_list
+        )
+        assert first["asset"] == second["asset"] == "ZEUR"
+        assert int(second["nonce"]) > int(first["nonce"])
+        headers = mock_session.post.call_args.kwargs["headers"]
+        assert headers["API-Sign"] == _kraken_signature(
+            "/0/private/TradeBalance", second
+        )
+
+    @patch("goliath.integrations.kraken.time.sleep")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.kraken.config")
+    def test_private_post_does_not_retry_permanent_errors(
+        self, mock_config, mock_requests, mock_sleep
+    ):
+        mock_config.KRAKEN_API_KEY = "key"
+        mock_config.KRAKEN_API_SECRET = _KRAKEN_SECRET
+        denied = MagicMock(status_code=200, ok=True, headers={})
+        denied.content = b'{"error": ["EGeneral:Permission denied"]}'
+        mock_requests.Session.return_value.post.return_value = denied
+
+        from goliath.integrations.kraken import KrakenClient
+
+        with pytest.raises(RuntimeError, match="Permission denied"):
+            KrakenClient().get_balance()
+        mock_sleep.assert_not_called()
+
+    @patch("goliath.integrations.kraken.config")
+    def test_nonces_strictly_increase_across_clients(self, mock_config):
+        mock_config.KRAKEN_API_KEY = "key"
+        mock_config.KRAKEN_API_SECRET = _KRAKEN_SECRET
+
+        from goliath.integrations.kraken import KrakenClient
+
+        clients = [KrakenClient(), KrakenClient()]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            nonces = list(pool.map(lambda i: clients[i % 2]._next_nonce(), range(200)))
+        assert len(set(nonces)) == 200
+        assert clients[0]._next_nonce() > max(nonces)
+
+        with patch("goliath.integrations.kraken.time.time_ns") as time_ns:
+            time_ns.return_value = (max(nonces) + 10_000) * 1_000_000
+            assert clients[1]._next_nonce() == max(nonces) + 10_000
+
+    @patch("goliath.integrations.kraken.config")
+    def test_sync_and_async_clients_share_nonce_counter(self, mock_config):
+        mock_config.KRAKEN_API_KEY = "key"
+        mock_config.KRAKEN_API_SECRET = _KRAKEN_SECRET
+
+        from goliath.integrations.kraken import (
+            AsyncKrakenClient,
+            KrakenClient,
+            _KrakenBase,
+        )
+
+        sync_client, async_client = KrakenClient(), AsyncKrakenClient()
+        with patch("goliath.integrations.kraken.time.time_ns") as time_ns:
+            # Every call lands in the same millisecond.
+            time_ns.return_value = (_KrakenBase._nonce + 1) * 1_000_000
+            nonces = [
+                client._next_nonce()
+                for _ in range(5)
+                for client in (sync_client, async_client)
+            ]
+        assert nonces == sorted(set(nonces))
+        assert "_nonce" not in vars(KrakenClient)
+        assert "_nonce" not in vars(AsyncKrakenClient)
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.kraken.config")
+    def test_get_tickers_single_request(self, mock_config, mock_requests):
+        mock_config.KRAKEN_API_KEY = ""
+        mock_config.KRAKEN_API_SECRET = ""
+        mock_session = mock_requests.Session.return_value
+        mock_session.get.return_value.content = b'{"error": [], "result": {}}'
+
+        from goliath.integrations.kraken import KrakenClient
+
+        KrakenClient().get_tickers(["XBTUSD", "ETHUSD"])
+        mock_session.get.assert_called_once()
+        assert mock_session.get.call_args.kwargs["params"] == {"pair": "XBTUSD,ETHUSD"}
+
+    @patch("goliath.integrations.kraken.config")
+    def test_asset_pairs_cached_and_revalidated(self, mock_config):
+        mock_config.KRAKEN_API_KEY = ""
+        mock_config.KRAKEN_API_SECRET = ""
+
+        from goliath.integrations.kraken import KrakenClient
+
+        client = KrakenClient()
+        ok = MagicMock(
+            status_code=200,
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            content=b'{"error": [], "result": {"XXBTZUSD": {"base": "XXBT"}}}',
+        )
+        not_modified = MagicMock(status_code=304, headers={})
+        client.session = MagicMock()
+        client.session.get.side_effect = [ok, not_modified]
+
+        pairs = client.get_asset_pairs()
+        assert pairs == {"XXBTZUSD": {"base": "XXBT"}}
+        assert client.get_asset_pairs() is pairs
+        assert client.session.get.call_count == 1
+        (validators, _), _ = client._cache.get_entry(("/0/public/AssetPairs", ()))
+        assert validators == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+
+        client._cache.ttl = 0
+        client._cache.set(
+            ("/0/public/AssetPairs", ()),
+            ({"If-None-Match": '"v1"'}, pairs),
+        )
+        assert client.get_asset_pairs() is pairs
+        headers = client.session.get.call_args.kwargs["headers"]
+        assert headers == {"If-None-Match": '"v1"'}
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.kraken.config")
+    def test_ohlc_and_trades_arrays(self, mock_config, mock_requests):
+        np = pytest.importorskip("numpy")
+        mock_config.KRAKEN_API_KEY = ""
+        mock_config.KRAKEN_API_SECRET = ""
+        candle = [
+            1688671200,
+            "30306.1",
+            "30306.2",
+            "30305.7",
+            "30305.8",
+            "30306.0",
+            "3.39",
+            23,
+        ]
+        trade = ["30306.1", "0.5", 1688671200.123, "b", "l", "", 101]
+        ohlc, trades = MagicMock(), MagicMock()
+        ohlc.content = json.dumps(
+            {"error": [], "result": {"XXBTZUSD": [candle, candle], "last": 1688671200}}
+        ).encode()
+        trades.content = json.dumps(
+            {"error": [], "result": {"XXBTZUSD": [trade], "last": "1688671200123"}}
+        ).encode()
+        mock_requests.Session.return_value.get.side_effect = [ohlc, trades]
+
+        from goliath.integrations.kraken import KrakenClient
+
+        client = KrakenClient()
+        candles, last = client.get_ohlc_array("XBTUSD", interval=60)
+        assert candles.shape == (2, 8)
+        assert candles.dtype == np.float64
+        assert candles[0, 4] == 30305.8
+        assert last == 1688671200
+        rows, last = client.get_recent_trades_array("XBTUSD")
+        assert rows.tolist() == [[30306.1, 0.5, 1688671200.123]]
+        assert last == "1688671200123"
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.kraken.config")
+    def test_arrays_require_numpy(self, mock_config, mock_requests):
+        mock_config.KRAKEN_API_KEY = ""
+        mock_config.KRAKEN_API_SECRET = ""
+        mock_requests.Session.return_value.get.return_value.content = (
+            b'{"error": [], "result": {"XXBTZUSD": [], "last": 0}}'
+        )
+
+        from goliath.integrations.kraken import KrakenClient
+
+        with (
+            patch.dict("sys.modules", {"numpy": None}),
+            pytest.raises(RuntimeError, match="numpy is required"),
+        ):
+            KrakenClient().get_ohlc_array("XBTUSD")
+
+    @patch("goliath.integrations.kraken.config")
+    def test_async_fan_out_and_signing(self, mock_config):
+        mock_config.KRAKEN_API_KEY = "key"
+        mock_config.KRAKEN_API_SECRET = _KRAKEN_SECRET
+
+        from goliath.integrations.kraken import AsyncKrakenClient
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.method == "POST":
+                return httpx.Response(200, json={"error": [], "result": {"ZUSD": "1"}})
+            pair = request.url.params["pair"]
+            return httpx.Response(200, json={"error": [], "result": {pair: {"c": []}}})
+
+        async def run():
+            async with AsyncKrakenClient() as client:
+                client._client = httpx.AsyncClient(
+                    base_url="https://api.kraken.com",
+                    transport=httpx.MockTransport(handler),
+                )
+                tickers = await client.get_tickers(["XBTUSD", "ETHUSD"], fan_out=True)
+                joined = await client.get_tickers(["XBTUSD", "ETHUSD"])
+                balance = await client.get_balance()
+                return tickers, joined, balance
+
+        tickers, joined, balance = asyncio.run(run())
+        assert set(tickers) == {"XBTUSD", "ETHUSD"}
+        assert list(joined) == ["XBTUSD,ETHUSD"]
+        assert balance == {"ZUSD": "1"}
+        post = seen[-1]
+        data = dict(urllib.parse.parse_qsl(post.content.decode()))
+        expected = _kraken_signature("/0/private/Balance", data)
+        assert post.headers["API-Sign"] == expected
+
+
+# ---------------------------------------------------------------------------
+# Linear
+# ---------------------------------------------------------------------------
+
+
+class TestLinearClient:
+    @patch("goliath.integrations.linear.config")
+    def test_missing_key_raises(self, mock_config):
+        mock_config.LINEAR_API_KEY = ""
+
+        from goliath.integrations.linear import LinearClient
+
+        with pytest.raises(RuntimeError, match="LINEAR_API_KEY"):
+            LinearClient()
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.linear.config")
+    def test_mutations_send_variables(self, mock_config, mock_requests):
+        mock_config.LINEAR_API_KEY = "lin_key"
+        mock_session = mock_requests.Session.return_value
+        mock_session.post.return_value.content = json.dumps(
+            {"data": {"issueCreate": {"success": True}}}
+        ).encode()
+
+        from goliath.integrations.linear import LinearClient
+
+        client = LinearClient()
+        title = 'Quote " and \\ backslash\nnewline'
+        assert client.create_issue("team-1", title, priority=2) == {"success": True}
+
+        call = mock_session.post.call_args
+        assert call.kwargs["headers"]["Authorization"] == "lin_key"
+        payload = json.loads(call.kwargs["data"])
+        assert "$input" in payload["query"]
+        assert title not in payload["query"]
+        assert payload["variables"] == {
+            "input": {"teamId": "team-1", "title": title, "priority": 2}
+        }
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.linear.config")
+    def test_update_issue_skips_none_fields(self, mock_config, mock_requests):
+        mock_config.LINEAR_API_KEY = "lin_key"
+        mock_session = mock_requests.Session.return_value
+        mock_session.post.return_value.content = json.dumps(
+            {"data": {"issueUpdate": {"success": True}}}
+        ).encode()
+
+        from goliath.integrations.linear import LinearClient
+
+        LinearClient().update_issue(
+            "issue-1", title="New", assigneeId=None, labelIds=["l1"]
+        )
+        payload = json.loads(mock_session.post.call_args.kwargs["data"])
+        assert payload["variables"] == {
+            "id": "issue-1",
+            "input": {"title": "New", "labelIds": ["l1"]},
+        }
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.linear.config")
+    def test_graphql_errors_raise(self, mock_config, mock_requests):
+        mock_config.LINEAR_API_KEY = "lin_key"
+        mock_requests.Session.return_value.post.return_value.content = (
+            b'{"errors": [{"message": "bad"}]}'
+        )
+
+        from goliath.integrations.linear import LinearClient
+
+        with pytest.raises(RuntimeError, match="Linear API error"):
+            LinearClient().add_comment("issue-1", "hi")
+
+    @patch("goliath.integrations.linear.config")
+    def test_async_list_all_follows_cursors(self, mock_config):
+        mock_config.LINEAR_API_KEY = "lin_key"
+
+        from goliath.integrations.linear import AsyncLinearClient
+
+        seen = []
+
+        def handler(request):
+            variables = json.loads(request.content)["variables"]
+            seen.append(variables)
+            last = variables.get("after") is not None
+            page = {
+                "nodes": [{"id": "b" if last else "a"}],
+                "pageInfo": {
+                    "endCursor": "c2" if last else "c1",
+                    "hasNextPage": not last,
+                },
+            }
+            if "query" in variables:
+                return httpx.Response(200, json={"data": {"searchIssues": page}})
+            return httpx.Response(
+                200, json={"data": {"viewer": {"assignedIssues": page}}}
+            )
+
+        async def run():
+            async with AsyncLinearClient() as client:
+                client._client = httpx.AsyncClient(
+                    headers=client._headers, transport=httpx.MockTransport(handler)
+                )
+                return await asyncio.gather(
+                    client.list_all_my_issues(), client.search_all_issues("bug")
+                )
+
+        mine, found = asyncio.run(run())
+        assert [i["id"] for i in mine] == ["a", "b"]
+        assert [i["id"] for i in found] == ["a", "b"]
+        assert all(v["first"] == 250 for v in seen)
+        assert sorted(v["after"] or "" for v in seen) == ["", "", "c1", "c1"]
+
+
+# ---------------------------------------------------------------------------
+# Loom
+# ---------------------------------------------------------------------------
+
+
+class TestLoomClient:
+    @patch("goliath.integrations.loom.config")
+    def test_missing_token_raises(self, mock_config):
+        mock_config.LOOM_ACCESS_TOKEN = ""
+
+        from goliath.integrations.loom import AsyncLoomClient, LoomClient
+
+        with pytest.raises(RuntimeError, match="LOOM_ACCESS_TOKEN"):
+            LoomClient()
+        with pytest.raises(RuntimeError, match="LOOM_ACCESS_TOKEN"):
+            AsyncLoomClient()
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.loom.config")
+    def test_shared_session_with_per_request_auth(self, mock_config, mock_requests):
+        mock_config.LOOM_ACCESS_TOKEN = "loom_tok"
+        mock_session = mock_requests.Session.return_value
+        mock_session.get.return_value.content = b'{"id": "v1"}'
+
+        from goliath.integrations.loom import LoomClient
+
+        first, second = LoomClient(), LoomClient()
+        assert first.session is second.session
+        first.get_video("v1")
+        assert mock_session.get.call_args.kwargs["headers"]["Authorization"] == (
+            "Bearer loom_tok"
+        )
+        second.get_oembed("https://www.loom.com/share/abc")
+        assert "headers" not in mock_session.get.call_args.kwargs
+        mock_session.headers.update.assert_not_called()
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.loom.config")
+    def test_list_pages_cached_until_write(self, mock_config, mock_requests):
+        mock_config.LOOM_ACCESS_TOKEN = "loom_tok"
+        mock_session = mock_requests.Session.return_value
+        pages = {
+            None: b'{"videos": [{"id": "v1"}], "next_cursor": "c1"}',
+            "c1": b'{"videos": [{"id": "v2"}]}',
+        }
+
+        def get(url, params=None, **kwargs):
+            return MagicMock(content=pages[params.get("cursor")])
+
+        mock_session.get.side_effect = get
+        mock_session.patch.return_value.content = b"{}"
+
+        from goliath.integrations.loom import LoomClient
+
+        client = LoomClient()
+        assert [v["id"] for v in client.iter_videos(limit=25)] == ["v1", "v2"]
+        assert client.list_videos()["next_cursor"] == "c1"
+        assert mock_session.get.call_count == 2
+
+        client.update_video("v1", title="New")
+        client.list_videos()
+        client.list_videos(use_cache=False)
+        assert mock_session.get.call_count == 4
+
+    @patch("goliath.integrations.loom.config")
+    def test_async_get_videos_and_update(self, mock_config):
+        mock_config.LOOM_ACCESS_TOKEN = "loom_tok"
+
+        from goliath.integrations.loom import AsyncLoomClient
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.method == "DELETE":
+                return httpx.Response(204)
+            if request.method == "PATCH":
+                return httpx.Response(200, json=json.loads(request.content))
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[1]})
+
+        async def run():
+            async with AsyncLoomClient() as client:
+                client._client = httpx.AsyncClient(
+                    base_url="https://developer.loom.com/v1",
+                    headers=client._headers,
+                    transport=httpx.MockTransport(handler),
+                )
+                videos = await client.get_videos(["v1", "v2"])
+                updated = await client.update_video("v1", title="New")
+                await client.delete_video("v2")
+                await client.get_oembed("https://www.loom.com/share/abc")
+                return videos, updated
+
+        videos, updated = asyncio.run(run())
+        assert [v["id"] for v in videos] == ["v1", "v2"]
+        assert updated == {"title": "New"}
+        api, oembed = seen[:-1], seen[-1]
+        assert all(r.headers["Authorization"] == "Bearer loom_tok" for r in api)
+        assert [r.method for r in api] == ["GET", "GET", "PATCH", "DELETE"]
+        assert oembed.url.host == "www.loom.com"
+        assert "Authorization" not in oembed.headers
+
+
+# ---------------------------------------------------------------------------
+# Mailchimp
+# ---------------------------------------------------------------------------
+
+
+class TestMailchimpClient:
+    @patch("goliath.integrations.mailchimp.config")
+    def test_missing_key_raises(self, mock_config):
+        mock_config.MAILCHIMP_API_KEY = ""
+
+        from goliath.integrations.mailchimp import AsyncMailchimpClient
+
+        with pytest.raises(RuntimeError, match="MAILCHIMP_API_KEY"):
+            AsyncMailchimpClient()
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.mailchimp.config")
+    def test_subscriber_hash_computed_once_per_email(self, mock_config, mock_requests):
+        mock_config.MAILCHIMP_API_KEY = "key-us1"
+        mock_config.MAILCHIMP_SERVER_PREFIX = "us1"
+
+        from goliath.integrations.mailchimp import MailchimpClient, _subscriber_hash
+
+        mock_session = mock_requests.Session.return_value
+        mock_session.get.return_value.content = b"{}"
+        mock_session.patch.return_value.content = b"{}"
+        _subscriber_hash.cache_clear()
+        client = MailchimpClient()
+        client.get_subscriber("list1", "Repeat@Example.com")
+        client.update_subscriber("list1", "Repeat@Example.com", status="unsubscribed")
+        client.delete_subscriber("list1", "Repeat@Example.com")
+
+        info = _subscriber_hash.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+        expected = hashlib.md5(b"repeat@example.com").hexdigest()
+        assert client.session.delete.call_args[0][0].endswith(f"/members/{expected}")
+
+    def test_bulk_hash_matches_subscriber_hash(self):
+        from goliath.integrations.mailchimp import _bulk_hash, _subscriber_hash
+
+        emails = ["A@x.com", "b@X.com", "a@x.com"]
+        assert _bulk_hash(emails) == [_subscriber_hash(e) for e in emails]
+        assert _bulk_hash(iter([])) == []
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.mailchimp.config")
+    def test_list_pages_cached_per_list(self, mock_config, mock_requests):
+        mock_config.MAILCHIMP_API_KEY = "key-us1"
+        mock_config.MAILCHIMP_SERVER_PREFIX = "us1"
+        mock_session = mock_requests.Session.return_value
+        mock_session.get.return_value.content = b'{"members": [{"id": "m1"}]}'
+        mock_session.post.return_value.content = b"{}"
+
+        from goliath.integrations.mailchimp import MailchimpClient
+
+        client = MailchimpClient()
+        client.list_subscribers("list1")
+        client.list_subscribers("list1")
+        client.list_subscribers("list2")
+        client.list_subscribers("list1", offset=10)
+        assert mock_session.get.call_count == 3
+        assert mock_session.get.call_args.kwargs["params"] == {
+            "count": 10,
+            "offset": 10,
+        }
+        auth = mock_session.get.call_args.kwargs["headers"]["Authorization"]
+        assert auth == "Basic " + base64.b64encode(b"anystring:key-us1").decode()
+
+        client.add_subscriber("list2", "new@example.com")
+        client.list_subscribers("list1")
+        client.list_subscribers("list2")
+        assert mock_session.get.call_count == 4
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.mailchimp.config")
+    def test_add_subscribers_batches_of_500(self, mock_config, mock_requests):
+        mock_config.MAILCHIMP_API_KEY = "key-us1"
+        mock_config.MAILCHIMP_SERVER_PREFIX = "us1"
+
+        from goliath.integrations.mailchimp import MailchimpClient
+
+        mock_session = mock_requests.Session.return_value
+        mock_session.get.return_value.content = b'{"members": []}'
+        mock_session.post.return_value.content = b'{"total_created": 1}'
+        client = MailchimpClient()
+        client.list_subscribers("list1")
+        subs = [{"email": f"{i}@example.com"} for i in range(1001)]
+        subs[0].update(first_name="Ann", status="pending", tags=["vip"])
+        results = client.add_subscribers("list1", subs, update_existing=False)
+
+        assert results == [{"total_created": 1}] * 3
+        calls = mock_session.post.call_args_list
+        assert {c.args[0] for c in calls} == {
+            "https://us1.api.mailchimp.com/3.0/lists/list1"
+        }
+        bodies = [json.loads(c.kwargs["data"]) for c in calls]
+        assert [len(b["members"]) for b in bodies] == [500, 500, 1]
+        assert not any(b["update_existing"] for b in bodies)
+        assert bodies[0]["members"][0] == {
+            "email_address": "0@example.com",
+            "status": "pending",
+            "tags": ["vip"],
+            "merge_fields": {"FNAME": "Ann"},
+        }
+        assert bodies[2]["members"] == [
+            {"email_address": "1000@example.com", "status": "subscribed"}
+        ]
+        client.list_subscribers("list1")
+        assert mock_session.get.call_count == 2
+
+    @patch("goliath.integrations.mailchimp.config")
+    def test_async_add_subscribers_sends_batches_concurrently(self, mock_config):
+        mock_config.MAILCHIMP_API_KEY = "key-us1"
+        mock_config.MAILCHIMP_SERVER_PREFIX = "us1"
+
+        from goliath.integrations.mailchimp import AsyncMailchimpClient
+
+        def handler(request):
+            body = json.loads(request.content)
+            return httpx.Response(200, json={"total_created": len(body["members"])})
+
+        async def run():
+            async with AsyncMailchimpClient() as client:
+                client._client = httpx.AsyncClient(
+                    base_url=client._base, transport=httpx.MockTransport(handler)
+                )
+                subs = [{"email": f"{i}@example.com"} for i in range(1200)]
+                return await client.add_subscribers("list1", subs)
+
+        results = asyncio.run(run())
+        assert [r["total_created"] for r in results] == [500, 500, 200]
+
+    @patch("goliath.integrations.mailchimp.config")
+    def test_async_add_and_get_subscribers(self, mock_config):
+        mock_config.MAILCHIMP_API_KEY = "key-us1"
+        mock_config.MAILCHIMP_SERVER_PREFIX = "us1"
+
+        from goliath.integrations.mailchimp import AsyncMailchimpClient
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.method == "POST":
+                return httpx.Response(200, json=json.loads(request.content))
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[1]})
+
+        async def run():
+            async with AsyncMailchimpClient() as client:
+                client._client = httpx.AsyncClient(
+                    base_url=client._base,
+                    headers=client._headers,
+                    transport=httpx.MockTransport(handler),
+                )
+                added = await client.add_subscriber(
+                    "list1", "A@Example.com", first_name="Ann"
+                )
+                members = await client.get_subscribers(
+                    "list1", ["A@Example.com", "b@example.com"]
+                )
+                return added, members
+
+        added, members = asyncio.run(run())
+        assert added == {
+            "email_address": "A@Example.com",
+            "status": "subscribed",
+            "merge_fields": {"FNAME": "Ann"},
+        }
+        assert [m["id"] for m in members] == [
+            hashlib.md5(b"a@example.com").hexdigest(),
+            hashlib.md5(b"b@example.com").hexdigest(),
+        ]
+        assert (
+            str(seen[0].url) == "https://us1.api.mailchimp.com/3.0/lists/list1/members"
+        )
+        expected = base64.b64encode(b"anystring:key-us1").decode()
+        assert all(r.headers["Authorization"] == f"Basic {expected}" for r in seen)
+
+    @patch("goliath.integrations.mailchimp.config")
+    def test_async_caps_concurrency_and_retries_429(self, mock_config):
+        mock_config.MAILCHIMP_API_KEY = "key-us1"
+        mock_config.MAILCHIMP_SERVER_PREFIX = "us1"
+
+        from goliath.integrations.mailchimp import AsyncMailchimpClient
+
+        state = {"in_flight": 0, "peak": 0, "throttled": False}
+
+        async def handler(request):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.001)
+            state["in_flight"] -= 1
+            if not state["throttled"]:
+                state["throttled"] = True
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"id": "m"})
+
+        async def run():
+            async with AsyncMailchimpClient(max_concurrency=3) as client:
+                client._client = httpx.AsyncClient(
+                    base_url=client._base, transport=httpx.MockTransport(handler)
+                )
+                emails = [f"{i}@example.com" for i in range(12)]
+                return await client.get_subscribers("list1", emails)
+
+        members = asyncio.run(run())
+        assert len(members) == 12
+        assert state["peak"] == 3
@@ -1,5 +1,8 @@
 """Tests for social/messaging integrations: X, Instagram, Discord, Telegram, Slack, WhatsApp, Reddit."""
 
+import json
+import threading
+import time
 import unittest.mock
 from unittest.mock import MagicMock, patch
 
@@ -114,31 +117,327 @@ class TestInstagramClient:
         with pytest.raises(RuntimeError, match="INSTAGRAM_USER_ID"):
             InstagramClient()
 
-    @patch("goliath.integrations.instagram.requests")
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.instagram.config")
     def test_post_image(self, mock_config, mock_requests):
         mock_config.INSTAGRAM_ACCESS_TOKEN = "token"
         mock_config.INSTAGRAM_USER_ID = "user1"
 
         container_resp = MagicMock()
-        container_resp.json.return_value = {"id": "container_1"}
+        container_resp.content = json.dumps({"id": "container_1"}).encode()
         publish_resp = MagicMock()
-        publish_resp.json.return_value = {"id": "media_1"}
-        mock_requests.post.side_effect = [container_resp, publish_resp]
+        publish_resp.content = json.dumps({"id": "media_1"}).encode()
+        mock_requests.Session.return_value.post.side_effect = [
+            container_resp,
+            publish_resp,
+        ]
+        mock_requests.Session.return_value.get.return_value.status_code = 200
+        mock_requests.Session.return_value.get.return_value.content = (
+            b'{"status_code": "FINISHED"}'
+        )
 
         from goliath.integrations.instagram import InstagramClient
 
-        client = InstagramClient()
+        client = InstagramClient(validate_media=False)
         result = client.post_image("https://example.com/img.jpg", caption="Test")
 
         assert result["id"] == "media_1"
-        assert mock_requests.post.call_count == 2
+        assert mock_requests.Session.return_value.post.call_count == 2
         # Verify token is in Authorization header, not body
-        for call in mock_requests.post.call_args_list:
+        for call in mock_requests.Session.return_value.post.call_args_list:
             headers = call.kwargs.get("headers", {})
             assert "Bearer" in headers.get("Authorization", "")
 
-    @patch("goliath.integrations.instagram.requests")
+    def test_poll_schedule_by_media_type(self):
+        from goliath.integrations.instagram import (
+            _IMAGE_POLL,
+            _VIDEO_POLL,
+            _poll_schedule,
+        )
+
+        assert (
+            _poll_schedule({"image_url": "u", "is_carousel_item": "true"})
+            is _IMAGE_POLL
+        )
+        assert _poll_schedule({"video_url": "u", "media_type": "VIDEO"}) is _VIDEO_POLL
+        assert _poll_schedule({"video_url": "u", "media_type": "REELS"}) is _VIDEO_POLL
+        assert _IMAGE_POLL.initial < _VIDEO_POLL.initial
+        assert _IMAGE_POLL.cap < _VIDEO_POLL.cap
+
+    def test_graph_usage_headers(self):
+        from goliath.integrations.instagram import _graph_usage
+
+        assert _graph_usage({}) is None
+        assert _graph_usage({"X-App-Usage": "not json"}) is None
+        assert _graph_usage(
+            {"X-App-Usage": '{"call_count": 40, "total_time": 55}'}
+        ) == (
+            55.0,
+            0.0,
+        )
+        buc = '{"17841": [{"call_count": 96, "estimated_time_to_regain_access": 2}]}'
+        assert _graph_usage({"X-Business-Use-Case-Usage": buc}) == (96.0, 120.0)
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.instagram.config")
+    def test_media_url_checked_before_container(self, mock_config, mock_requests):
+        mock_config.INSTAGRAM_ACCESS_TOKEN = "token"
+        mock_config.INSTAGRAM_USER_ID = "user1"
+        session = mock_requests.Session.return_value
+        session.head.return_value = MagicMock(status_code=404, ok=False, headers={})
+
+        from goliath.integrations.instagram import InstagramClient
+
+        with pytest.raises(ValueError, match="returned HTTP 404"):
+            InstagramClient().post_image("https://example.com/missing.jpg")
+        session.post.assert_not_called()
+        assert "headers" not in session.head.call_args.kwargs
+
+        session.head.return_value = MagicMock(
+            status_code=200, ok=True, headers={"Content-Type": "text/html"}
+        )
+        with pytest.raises(ValueError, match="expected video"):
+            InstagramClient().post_video("https://example.com/page")
+
+        session.head.return_value = MagicMock(
+            status_code=200,
+            ok=True,
+            headers={"Content-Type": "image/jpeg", "Content-Length": str(9 << 20)},
+        )
+        with pytest.raises(ValueError, match="at most"):
+            InstagramClient().post_carousel(
+                [{"image_url": "https://example.com/a.jpg"}] * 2
+            )
+        session.post.assert_not_called()
+
+        session.post.side_effect = RuntimeError("reached create")
+        inconclusive = [
+            MagicMock(status_code=405, ok=False, headers={}),
+            # S3/GCS URLs presigned for GET refuse HEAD.
+            MagicMock(status_code=403, ok=False, headers={}),
+            MagicMock(
+                status_code=200,
+                ok=True,
+                headers={"Content-Type": "application/octet-stream"},
+            ),
+        ]
+        for resp in inconclusive:
+            session.head.return_value = resp
+            with pytest.raises(RuntimeError, match="reached create"):
+                InstagramClient().post_image("https://example.com/media.jpg")
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.instagram.config")
+    def test_post_carousel_creates_children_concurrently(
+        self, mock_config, mock_requests
+    ):
+        mock_config.INSTAGRAM_ACCESS_TOKEN = "token"
+        mock_config.INSTAGRAM_USER_ID = "user1"
+
+        def fake_post(url, headers, data):
+            resp = MagicMock()
+            if url.endswith("/media_publish"):
+                resp.content = json.dumps({"id": "media_1"}).encode()
+            elif data.get("media_type") == "CAROUSEL":
+                resp.content = json.dumps({"id": "carousel_1"}).encode()
+            else:
+                resp.content = json.dumps(
+                    {"id": "c_" + (data.get("image_url") or data["video_url"])[-5:]}
+                ).encode()
+            return resp
+
+        mock_requests.Session.return_value.post.side_effect = fake_post
+        mock_requests.Session.return_value.get.return_value.content = json.dumps(
+            {"status_code": "FINISHED"}
+        ).encode()
+
+        from goliath.integrations.instagram import InstagramClient
+
+        client = InstagramClient(validate_media=False)
+        result = client.post_carousel(
+            [
+                {"image_url": "https://example.com/1.jpg"},
+                {"video_url": "https://example.com/2.mp4"},
+                {"image_url": "https://example.com/3.jpg"},
+            ],
+            caption="Trip",
+        )
+
+        assert result["id"] == "media_1"
+        carousel_call = next(
+            c
+            for c in mock_requests.Session.return_value.post.call_args_list
+            if c.kwargs["data"].get("media_type") == "CAROUSEL"
+        )
+        assert carousel_call.kwargs["data"]["children"] == "c_1.jpg,c_2.mp4,c_3.jpg"
+        assert mock_requests.Session.return_value.get.call_count == 3
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.instagram.config")
+    def test_post_carousels_batches_every_step(self, mock_config, mock_requests):
+        mock_config.INSTAGRAM_ACCESS_TOKEN = "token"
+        mock_config.INSTAGRAM_USER_ID = "user1"
+
+        def fake_post(url, headers, data):
+            resp = MagicMock()
+            if url.endswith("/media_publish"):
+                resp.content = json.dumps({"id": "pub_" + data["creation_id"]}).encode()
+            elif data.get("media_type") == "CAROUSEL":
+                resp.content = json.dumps({"id": data["caption"]}).encode()
+            else:
+                resp.content = json.dumps({"id": data["image_url"][2:]}).encode()
+            return resp
+
+        mock_requests.Session.return_value.post.side_effect = fake_post
+        mock_requests.Session.return_value.get.return_value.content = json.dumps(
+            {"status_code": "FINISHED"}
+        ).encode()
+
+        from goliath.integrations.instagram import InstagramClient
+
+        results = InstagramClient(validate_media=False).post_carousels(
+            [
+                {
+                    "items": [{"image_url": "u/a1.jpg"}, {"image_url": "u/a2.jpg"}],
+                    "caption": "A",
+                },
+                {
+                    "items": [{"image_url": "u/b1.jpg"}, {"image_url": "u/b2.jpg"}],
+                    "caption": "B",
+                },
+            ]
+        )
+
+        assert results == [{"id": "pub_A"}, {"id": "pub_B"}]
+        carousels = {
+            c.kwargs["data"]["caption"]: c.kwargs["data"]["children"]
+            for c in mock_requests.Session.return_value.post.call_args_list
+            if c.kwargs["data"].get("media_type") == "CAROUSEL"
+        }
+        assert carousels == {"A": "a1.jpg,a2.jpg", "B": "b1.jpg,b2.jpg"}
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.instagram.config")
+    def test_post_carousels_validates_before_sending(self, mock_config, mock_requests):
+        mock_config.INSTAGRAM_ACCESS_TOKEN = "token"
+        mock_config.INSTAGRAM_USER_ID = "user1"
+
+        from goliath.integrations.instagram import InstagramClient
+
+        client = InstagramClient()
+        with pytest.raises(ValueError, match="image_url"):
+            client.post_carousels(
+                [
+                    {"items": [{"image_url": "a"}, {"image_url": "b"}]},
+                    {"items": [{"image_url": "c"}, {"caption": "oops"}]},
+                ]
+            )
+        client.session.post.assert_not_called()
+
+    @patch("goliath.integrations.instagram._signals")
+    @patch("goliath.integrations.instagram.time")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.instagram.config")
+    def test_wait_for_processing_backs_off(
+        self, mock_config, mock_requests, mock_time, mock_signals
+    ):
+        mock_config.INSTAGRAM_ACCESS_TOKEN = "token"
+        mock_config.INSTAGRAM_USER_ID = "user1"
+        mock_time.monotonic.return_value = 0.0
+        wake = mock_signals.register.return_value
+        wake.wait.return_value = False
+
+        def status(code):
+            resp = MagicMock(status_code=200)
+            resp.content = json.dumps({"status_code": code}).encode()
+            return resp
+
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "7"})
+        mock_requests.Session.return_value.get.side_effect = [
+            status("IN_PROGRESS"),
+            status("IN_PROGRESS"),
+            throttled,
+            status("IN_PROGRESS"),
+            status("FINISHED"),
+        ]
+
+        from goliath.integrations.instagram import InstagramClient
+
+        InstagramClient()._wait_for_processing("c1")
+
+        delays = [c.args[0] for c in wake.wait.call_args_list]
+        assert 0.25 <= delays[0] <= 0.5
+        assert 0.5 <= delays[1] <= 1.0
+        assert delays[2] == 7.0
+        assert 2.0 <= delays[3] <= 4.0
+
+    @patch("goliath.integrations.instagram._signals")
+    @patch("goliath.integrations.instagram.time")
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.instagram.config")
+    def test_wait_for_processing_times_out(
+        self, mock_config, mock_requests, mock_time, mock_signals
+    ):
+        mock_config.INSTAGRAM_ACCESS_TOKEN = "token"
+        mock_config.INSTAGRAM_USER_ID = "user1"
+        wake = mock_signals.register.return_value
+        wake.wait.return_value = False
+        mock_time.monotonic.side_effect = [0.0, 5.0, 11.0]
+        mock_requests.Session.return_value.get.return_value.status_code = 200
+        mock_requests.Session.return_value.get.return_value.content = json.dumps(
+            {"status_code": "IN_PROGRESS"}
+        ).encode()
+
+        from goliath.integrations.instagram import InstagramClient
+
+        with pytest.raises(TimeoutError, match="10s"):
+            InstagramClient()._wait_for_processing("c1", timeout=10)
+        # The last wait is trimmed to the remaining budget.
+        assert wake.wait.call_args_list[-1].args[0] <= 5.0
+        mock_signals.unregister.assert_called_once_with("c1")
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.instagram.config")
+    def test_notify_container_cuts_wait_short(self, mock_config, mock_requests):
+        mock_config.INSTAGRAM_ACCESS_TOKEN = "token"
+        mock_config.INSTAGRAM_USER_ID = "user1"
+        statuses = iter(["IN_PROGRESS", "FINISHED"])
+
+        from goliath.integrations.instagram import InstagramClient
+
+        def fake_get(url, **kwargs):
+            status = next(statuses)
+            if status == "IN_PROGRESS":
+                # The wait is registered by now; signal once the poll sleeps.
+                threading.Timer(0.05, InstagramClient.notify_container, ["c1"]).start()
+            resp = MagicMock(status_code=200)
+            resp.content = json.dumps({"status_code": status}).encode()
+            return resp
+
+        mock_requests.Session.return_value.get.side_effect = fake_get
+
+        from goliath.integrations.instagram import _PollSchedule
+
+        started = time.monotonic()
+        InstagramClient()._wait_for_processing(
+            "c1", schedule=_PollSchedule(initial=60.0, cap=60.0)
+        )
+        assert time.monotonic() - started < 5
+
+    @patch("goliath.integrations._http.requests")
+    @patch("goliath.integrations.instagram.config")
+    def test_uses_shared_session(self, mock_config, mock_requests):
+        mock_config.INSTAGRAM_ACCESS_TOKEN = "token"
+        mock_config.INSTAGRAM_USER_ID = "user1"
+
+        from goliath.integrations.instagram import InstagramClient
+
+        with InstagramClient() as first, InstagramClient() as second:
+            assert first.session is second.session
+        first.session.headers.update.assert_not_called()
+        first.session.close.assert_not_called()
+
+    @patch("goliath.integrations._http.requests")
     @patch("goliath.integrations.instagram.config")
     def test_carousel_min_items(self, mock_config, mock_requests):
         mock_config.INSTAGRAM_ACCESS_TOKEN = "token"